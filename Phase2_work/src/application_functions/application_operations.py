@@ -11,20 +11,20 @@ from mysql.connector import Error as MySQLError
 
 from src.utils.logging_utils import log_info, log_error
 from src.user_functions.view_based_operations import require_permission, Role, Entity
-from src.utils.sql_file_parsers import read_sql_helper
+from src.utils.sql_registry import get_sql, get_statements
 
 # SQL Script Paths
-CREATE_SCRIPT = "src/db_crud/applications/create_application.sql"
-DELETE_BY_APP_ID_SCRIPT = "src/db_crud/applications/delete_application_by_id.sql"
-DELETE_BY_USER_GRANT_SCRIPT = "src/db_crud/applications/delete_application_by_grant_and_user.sql"
-DELETE_BY_USER_SCRIPT = "src/db_crud/applications/delete_application_by_user.sql"
-DELETE_BY_GRANT_SCRIPT = "src/db_crud/applications/delete_application_by_grant.sql"
-DELETE_ALL_SCRIPT = "src/db_crud/applications/delete_application.sql"
-SELECT_BY_APP_ID_SCRIPT = "src/db_crud/applications/select_application_by_id.sql"
-SELECT_BY_USER_SCRIPT = "src/db_crud/applications/select_application_by_user.sql"
-SELECT_BY_GRANT_SCRIPT = "src/db_crud/applications/select_application_by_grant.sql"
-SELECT_BY_STATUS_SCRIPT = "src/db_crud/applications/select_application_by_status.sql"
-UPDATE_STATUS_SCRIPT = "src/db_crud/applications/update_application_status.sql"
+CREATE_SCRIPT = "applications/create_application"
+DELETE_BY_APP_ID_SCRIPT = "applications/delete_application_by_id"
+DELETE_BY_USER_GRANT_SCRIPT = "applications/delete_application_by_grant_and_user"
+DELETE_BY_USER_SCRIPT = "applications/delete_application_by_user"
+DELETE_BY_GRANT_SCRIPT = "applications/delete_application_by_grant"
+DELETE_ALL_SCRIPT = "applications/delete_application"
+SELECT_BY_APP_ID_SCRIPT = "applications/select_application_by_id"
+SELECT_BY_USER_SCRIPT = "applications/select_application_by_user"
+SELECT_BY_GRANT_SCRIPT = "applications/select_application_by_grant"
+SELECT_BY_STATUS_SCRIPT = "applications/select_application_by_status"
+UPDATE_STATUS_SCRIPT = "applications/update_application_status"
 
 
 class ApplicationOperationError(Exception):
@@ -61,7 +61,7 @@ def create_application(role: Role, user_id: str, resource_owner_id: str, cursor,
     }
 
     try:
-        sql_script = read_sql_helper(CREATE_SCRIPT)
+        sql_script = get_sql(CREATE_SCRIPT, params)
         cursor.execute(sql_script, params)
         return None
     except MySQLError as e:
@@ -94,7 +94,7 @@ def read_application_by_id(role: Role, user_id: str, resource_owner_id: str, cur
     params = {"application_id": application_id}
 
     try:
-        sql_script = read_sql_helper(SELECT_BY_APP_ID_SCRIPT)
+        sql_script = get_sql(SELECT_BY_APP_ID_SCRIPT, params)
         cursor.execute(sql_script, params)
         return cursor.fetchone()
     except MySQLError as e:
@@ -125,7 +125,7 @@ def read_applications_by_user(role: Role, user_id: str, resource_owner_id: str,
     params = {"user_id": user_id}
 
     try:
-        sql_script = read_sql_helper(SELECT_BY_USER_SCRIPT)
+        sql_script = get_sql(SELECT_BY_USER_SCRIPT, params)
         cursor.execute(sql_script, params)
         return cursor.fetchall()
     except MySQLError as e:
@@ -160,7 +160,7 @@ def read_applications_by_grant(role: Role, user_id: str, resource_owner_id: str,
     params = {"grant_id": grant_id}
 
     try:
-        sql_script = read_sql_helper(SELECT_BY_GRANT_SCRIPT)
+        sql_script = get_sql(SELECT_BY_GRANT_SCRIPT, params)
         cursor.execute(sql_script, params)
         return cursor.fetchall()
     except MySQLError as e:
@@ -193,7 +193,7 @@ def read_applications_by_status(role: Role, user_id: str, resource_owner_id: str
     params = {"status": status}
 
     try:
-        sql_script = read_sql_helper(SELECT_BY_STATUS_SCRIPT)
+        sql_script = get_sql(SELECT_BY_STATUS_SCRIPT, params)
         cursor.execute(sql_script, params)
         return cursor.fetchall()
     except MySQLError as e:
@@ -230,7 +230,7 @@ def update_application_status(role: Role, user_id: str, resource_owner_id: str,
     }
 
     try:
-        sql_script = read_sql_helper(UPDATE_STATUS_SCRIPT)
+        sql_script = get_sql(UPDATE_STATUS_SCRIPT, params)
         cursor.execute(sql_script, params)
         return None
     except MySQLError as e:
@@ -263,7 +263,7 @@ def delete_application_by_id(role: Role, user_id: str, resource_owner_id: str, c
     params = {"application_id": application_id}
 
     try:
-        sql_script = read_sql_helper(DELETE_BY_APP_ID_SCRIPT)
+        sql_script = get_sql(DELETE_BY_APP_ID_SCRIPT, params)
         cursor.execute(sql_script, params)
         return None
     except MySQLError as e:
@@ -299,7 +299,7 @@ def delete_application_by_user_and_grant(role: Role, user_id: str, resource_owne
     }
 
     try:
-        sql_script = read_sql_helper(DELETE_BY_USER_GRANT_SCRIPT)
+        sql_script = get_sql(DELETE_BY_USER_GRANT_SCRIPT, params)
         cursor.execute(sql_script, params)
         return None
     except MySQLError as e:
@@ -330,7 +330,7 @@ def delete_applications_by_user(role: Role, user_id: str, resource_owner_id: str
     params = {"user_id": user_id}
 
     try:
-        sql_script = read_sql_helper(DELETE_BY_USER_SCRIPT)
+        sql_script = get_sql(DELETE_BY_USER_SCRIPT, params)
         cursor.execute(sql_script, params)
         return None
     except MySQLError as e:
@@ -365,7 +365,7 @@ def delete_applications_by_grant(role: Role, user_id: str, resource_owner_id: st
     params = {"grant_id": grant_id}
 
     try:
-        sql_script = read_sql_helper(DELETE_BY_GRANT_SCRIPT)
+        sql_script = get_sql(DELETE_BY_GRANT_SCRIPT, params)
         cursor.execute(sql_script, params)
         return None
     except MySQLError as e:
@@ -397,7 +397,7 @@ def delete_all_applications(role: Role, user_id: str, resource_owner_id: str, cu
     _ = role, user_id, resource_owner_id  # linter ignore
 
     try:
-        sql_script = read_sql_helper(DELETE_ALL_SCRIPT)
+        sql_script = get_sql(DELETE_ALL_SCRIPT)
         cursor.execute(sql_script)
         log_info("WARNING: All applications have been deleted from the database")
         return None
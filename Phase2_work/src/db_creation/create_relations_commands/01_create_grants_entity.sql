@@ -6,7 +6,7 @@
 */
 
 create table Grants (
-    grant_id BINARY(16) PRIMARY KEY DEFAULT (UUID_TO_BIN(UUID())),
+    grant_id BINARY(16) PRIMARY KEY DEFAULT (UUID_TO_BIN(UUID(), 1)),
     grant_title varchar(255),
     -- Need to check opportunity_number constraints on grants.gov but can't right now because it is down for maintenance
     opportunity_number varchar(250) NOT NULL UNIQUE, 
@@ -26,4 +26,22 @@ create table Grants (
     last_update_date date
 );
 
-CREATE INDEX idx_grants_research_field ON Grants (research_field);
\ No newline at end of file
+CREATE INDEX idx_grants_research_field ON Grants (research_field);
+
+-- Sort orders offered by /api/public/search_grants (ORDER BY column, grant_id); a page reads
+-- only its own rows of the index, and a keyset cursor (column, grant_id) > (key, id) starts
+-- the read at the previous page's last row instead of skipping OFFSET rows.
+-- The date indexes end with award_max_amount, so a date range or date sort combined with an
+-- award bound (closes_within=30&award_max_gte=500000) is filtered inside the index before
+-- any row is read
+CREATE INDEX idx_grants_title_id ON Grants (grant_title, grant_id);
+CREATE INDEX idx_grants_date_posted_id_award ON Grants (date_posted, grant_id, award_max_amount);
+CREATE INDEX idx_grants_date_closed_id_award ON Grants (date_closed, grant_id, award_max_amount);
+
+-- Amount range filters of /api/public/search_grants (award_max_gte, award_min_lte, funding_gte, ...)
+CREATE INDEX idx_grants_award_max ON Grants (award_max_amount);
+CREATE INDEX idx_grants_award_min ON Grants (award_min_amount);
+CREATE INDEX idx_grants_program_funding ON Grants (program_funding);
+
+-- Keyword search in /api/public/search_grants (MATCH(grant_title, description) AGAINST ...)
+CREATE FULLTEXT INDEX ft_grants_title_description ON Grants (grant_title, description);
@@ -6,7 +6,7 @@
 */
 
 CREATE TABLE Users (
-    user_id BINARY(16) PRIMARY KEY DEFAULT (UUID_TO_BIN(UUID())),
+    user_id BINARY(16) PRIMARY KEY DEFAULT (UUID_TO_BIN(UUID(), 1)),
     email VARCHAR(100) UNIQUE NOT NULL,
 
     -- Composite attribute: Name = (f_name, m_name, l_name)
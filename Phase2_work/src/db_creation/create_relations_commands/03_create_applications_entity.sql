@@ -5,7 +5,7 @@
   Description: The Applications entity
 */
 CREATE TABLE Applications (
-    application_id BINARY(16) PRIMARY KEY DEFAULT (UUID_TO_BIN(UUID())),
+    application_id BINARY(16) PRIMARY KEY DEFAULT (UUID_TO_BIN(UUID(), 1)),
 
     user_id BINARY(16),
     grant_id BINARY(16) NOT NULL,
@@ -6,7 +6,7 @@
 */
 
 CREATE TABLE Documents (
-    document_id BINARY(16) PRIMARY KEY DEFAULT (UUID_TO_BIN(UUID())),
+    document_id BINARY(16) PRIMARY KEY DEFAULT (UUID_TO_BIN(UUID(), 1)),
     document_name VARCHAR(50) NOT NULL,
     document_type VARCHAR(10) NOT NULL,
     document_size INT UNSIGNED NOT NULL,
@@ -13,7 +13,7 @@
 */
 
 CREATE TABLE InternalDeadlines (
-    internal_deadline_id BINARY(16) PRIMARY KEY DEFAULT (UUID_TO_BIN(UUID())),
+    internal_deadline_id BINARY(16) PRIMARY KEY DEFAULT (UUID_TO_BIN(UUID(), 1)),
 
     application_id BINARY(16) NOT NULL,
     deadline_name VARCHAR(255) NOT NULL,
@@ -0,0 +1,30 @@
+/*
+    Grant Change Log
+    Version: 19 October 2026
+    Author: Colby Wirth
+    Description: One row per insert, update or delete of a Grants row, written by the triggers below
+                 so every writer (the ingest pipeline, deletion of archived grants, manual edits) is
+                 covered.  The API's in-memory search index (Phase3_work/api/search_index.py) reads
+                 the rows after the last change_id it applied and re-indexes only those grants.
+
+                 No foreign key: the row for a deleted grant has to outlive the grant.
+                 Rows older than a week are pruned by the daily maintenance job.
+*/
+
+CREATE TABLE GrantChangeLog (
+    change_id BIGINT UNSIGNED AUTO_INCREMENT PRIMARY KEY,
+    grant_id BINARY(16) NOT NULL,
+    change_type ENUM('upsert', 'delete') NOT NULL,
+    changed_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX idx_grant_change_log_changed_at ON GrantChangeLog (changed_at);
+
+CREATE TRIGGER trg_grants_after_insert AFTER INSERT ON Grants FOR EACH ROW
+    INSERT INTO GrantChangeLog (grant_id, change_type) VALUES (NEW.grant_id, 'upsert');
+
+CREATE TRIGGER trg_grants_after_update AFTER UPDATE ON Grants FOR EACH ROW
+    INSERT INTO GrantChangeLog (grant_id, change_type) VALUES (NEW.grant_id, 'upsert');
+
+CREATE TRIGGER trg_grants_after_delete AFTER DELETE ON Grants FOR EACH ROW
+    INSERT INTO GrantChangeLog (grant_id, change_type) VALUES (OLD.grant_id, 'delete');
@@ -0,0 +1,22 @@
+/*
+    Grant Similarities
+    Version: 19 October 2026
+    Author: Colby Wirth
+    Description: The top-k most similar open grants for every open grant, by cosine similarity of
+                 TF-IDF vectors over title, description and eligibility.  Rewritten in full by
+                 system_functions/compute_grant_similarities.py after each ingest; read by
+                 /api/public/grant/<grant_id>/similar with one primary key range lookup.
+
+                 Rows of deleted grants go with them (ON DELETE CASCADE).
+*/
+
+CREATE TABLE GrantSimilarities (
+    grant_id BINARY(16) NOT NULL,
+    similarity_rank TINYINT UNSIGNED NOT NULL,
+    similar_grant_id BINARY(16) NOT NULL,
+    score FLOAT NOT NULL,
+
+    PRIMARY KEY (grant_id, similarity_rank),
+    FOREIGN KEY (grant_id) REFERENCES Grants(grant_id) ON DELETE CASCADE,
+    FOREIGN KEY (similar_grant_id) REFERENCES Grants(grant_id) ON DELETE CASCADE
+);
@@ -0,0 +1,53 @@
+/*
+    Saved Searches
+    Version: 19 October 2026
+    Author: Colby Wirth
+    Description: Searches a user saved, and the grants each one matched after being saved.
+
+                 - SavedSearches.query_string is the normalized /api/public/search_grants query
+                   (src/utils/percolator.py normalize_query).  created_change_id is the
+                   GrantChangeLog position when it was saved; only later grant changes match it.
+                 - After each ingest, system_functions/percolate_saved_searches.py matches only
+                   the grants changed since its last run (SavedSearchPercolation.change_id)
+                   against every saved search, and adds the new matches to SavedSearchMatches.
+                 - SavedSearchMatches is the user's inbox: match_id grows with every match, so
+                   (user_id, match_id) returns the newest matches of a user, and the next page,
+                   with one index range.  A grant is listed once per search.
+
+                 Searches, matches and the inbox go with the user, the search or the grant
+                 (ON DELETE CASCADE).
+*/
+
+CREATE TABLE SavedSearches (
+    search_id BINARY(16) PRIMARY KEY DEFAULT (UUID_TO_BIN(UUID(), 1)),
+    user_id BINARY(16) NOT NULL,
+    name VARCHAR(100) NOT NULL,
+    query_string VARCHAR(2000) NOT NULL,
+    created_change_id BIGINT UNSIGNED NOT NULL DEFAULT 0,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    FOREIGN KEY (user_id) REFERENCES Users(user_id) ON DELETE CASCADE
+);
+
+CREATE INDEX idx_saved_searches_user ON SavedSearches (user_id, created_at);
+
+CREATE TABLE SavedSearchMatches (
+    match_id BIGINT UNSIGNED AUTO_INCREMENT PRIMARY KEY,
+    search_id BINARY(16) NOT NULL,
+    user_id BINARY(16) NOT NULL,
+    grant_id BINARY(16) NOT NULL,
+    matched_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    UNIQUE KEY unique_search_grant (search_id, grant_id),
+    FOREIGN KEY (search_id) REFERENCES SavedSearches(search_id) ON DELETE CASCADE,
+    FOREIGN KEY (user_id) REFERENCES Users(user_id) ON DELETE CASCADE,
+    FOREIGN KEY (grant_id) REFERENCES Grants(grant_id) ON DELETE CASCADE
+);
+
+CREATE INDEX idx_saved_search_matches_inbox ON SavedSearchMatches (user_id, match_id);
+
+-- The GrantChangeLog position percolation has reached (one row)
+CREATE TABLE SavedSearchPercolation (
+    percolator_id TINYINT UNSIGNED PRIMARY KEY,
+    change_id BIGINT UNSIGNED NOT NULL
+);
@@ -0,0 +1,47 @@
+/*
+    User Grant Feed
+    Version: 19 October 2026
+    Author: Colby Wirth
+    Description: Each user's recommended open grants, scored against their research fields,
+                 institution and past applications (src/utils/recommendations.py).
+
+                 - UserGrantFeed holds at most FEED_SIZE rows per user: the grant, its score
+                   (0-1000 points) and a bitmask of the reasons it scored.
+                 - After each ingest, system_functions/refresh_user_grant_feed.py re-scores only
+                   the grants changed since its last run (UserGrantFeedPosition.change_id), and
+                   rebuilds in full only the users whose profile changed
+                   (UserGrantFeedProfiles.profile_digest).  Grants that closed are removed.
+
+                 Rows go with the user or the grant (ON DELETE CASCADE).
+*/
+
+CREATE TABLE UserGrantFeed (
+    user_id BINARY(16) NOT NULL,
+    grant_id BINARY(16) NOT NULL,
+    score SMALLINT UNSIGNED NOT NULL,
+    reasons TINYINT UNSIGNED NOT NULL,
+
+    PRIMARY KEY (user_id, grant_id),
+    FOREIGN KEY (user_id) REFERENCES Users(user_id) ON DELETE CASCADE,
+    FOREIGN KEY (grant_id) REFERENCES Grants(grant_id) ON DELETE CASCADE
+);
+
+-- GET /api/user/feed: a user's grants best first, and the next page, with one index range
+CREATE INDEX idx_user_grant_feed_rank ON UserGrantFeed (user_id, score, grant_id);
+-- refreshing a changed grant removes its rows for every user first
+CREATE INDEX idx_user_grant_feed_grant ON UserGrantFeed (grant_id);
+
+-- The profile each user's feed was built from; a user whose profile changed is rebuilt in full
+CREATE TABLE UserGrantFeedProfiles (
+    user_id BINARY(16) PRIMARY KEY,
+    profile_digest CHAR(16) NOT NULL,
+    refreshed_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+
+    FOREIGN KEY (user_id) REFERENCES Users(user_id) ON DELETE CASCADE
+);
+
+-- The GrantChangeLog position the feed has reached (one row)
+CREATE TABLE UserGrantFeedPosition (
+    feed_id TINYINT UNSIGNED PRIMARY KEY,
+    change_id BIGINT UNSIGNED NOT NULL
+);
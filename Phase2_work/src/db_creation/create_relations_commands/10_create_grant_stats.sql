@@ -0,0 +1,35 @@
+/*
+    Grant Statistics
+    Version: 19 October 2026
+    Author: Colby Wirth
+    Description: Running totals of Grants for the landing page (src/utils/grant_stats.py), so
+                 /api/public/aggregate-grants, /fetch_grant_count and /grant-stats read one row
+                 instead of aggregating every grant.
+
+                 - GrantStats holds one row (stats_id 1): the number of grants, how many are
+                   open, and their total program funding.
+                 - GrantFieldStats holds the same per research field ('' for grants without one).
+                 - The ingest and the purge of old grants add their changes in the same
+                   transaction as the write.  Grants that close are moved from open to closed
+                   once a day by system_functions/refresh_grant_stats.py (GrantStats.open_as_of).
+*/
+
+CREATE TABLE GrantStats (
+    stats_id TINYINT UNSIGNED PRIMARY KEY,
+    grant_count BIGINT NOT NULL,
+    open_count BIGINT NOT NULL,
+    program_funding BIGINT NOT NULL,
+    -- grants closing on or after this date are counted as open
+    open_as_of DATE NOT NULL,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+);
+
+CREATE TABLE GrantFieldStats (
+    research_field VARCHAR(250) PRIMARY KEY,
+    grant_count BIGINT NOT NULL,
+    open_count BIGINT NOT NULL,
+    program_funding BIGINT NOT NULL
+);
+
+INSERT INTO GrantStats (stats_id, grant_count, open_count, program_funding, open_as_of)
+VALUES (1, 0, 0, 0, CURDATE());
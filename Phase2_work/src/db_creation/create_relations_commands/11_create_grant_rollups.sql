@@ -0,0 +1,26 @@
+/*
+    Grant Rollups
+    Version: 19 October 2026
+    Author: Colby Wirth
+    Description: Monthly grant counts and program funding for /api/public/analytics
+                 (src/utils/grant_rollups.py), so the analytics routes never group Grants.
+
+                 - One row per dimension (month, provider, research_field), month posted and
+                   value, holding the number of grants and their total program funding.
+                 - Rebuilt from Grants after each ingest by
+                   system_functions/rebuild_grant_rollups.py, emptied and refilled in one
+                   transaction.
+*/
+
+CREATE TABLE GrantRollups (
+    dimension ENUM('month', 'provider', 'research_field') NOT NULL,
+    -- first day of the month the grants were posted in
+    month_posted DATE NOT NULL,
+    -- the provider or research field; '' for the month totals and for grants without one
+    value VARCHAR(255) NOT NULL,
+    grant_count INT UNSIGNED NOT NULL,
+    program_funding BIGINT UNSIGNED NOT NULL,
+
+    -- a date range of one dimension is one range of the key
+    PRIMARY KEY (dimension, month_posted, value)
+);
@@ -0,0 +1,23 @@
+/*
+    Query Flights
+    Version: 19 October 2026
+    Author: Colby Wirth
+    Description: Responses shared between API worker processes by request coalescing
+                 (Phase3_work/api/single_flight.py, GG_SINGLE_FLIGHT_DB=1).
+
+                 - The first worker to take the MySQL named lock of a cache key runs the route
+                   and stores its 200 response here; the others, waiting on the same lock, read it
+                   instead of running the route again.
+                 - Rows live GG_SINGLE_FLIGHT_DB_TTL seconds (expires_at).  Keys include the
+                   ingest generation, so a stored response is never served for newer grant data.
+*/
+
+CREATE TABLE QueryFlights (
+    -- api.single_flight.flight_digest() of the response cache key (generation, path, query)
+    flight_key CHAR(32) PRIMARY KEY,
+    body MEDIUMBLOB NOT NULL,
+    expires_at TIMESTAMP(3) NOT NULL
+);
+
+-- each store first drops the expired rows
+CREATE INDEX idx_query_flights_expires ON QueryFlights (expires_at);
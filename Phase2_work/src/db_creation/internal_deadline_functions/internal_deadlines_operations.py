@@ -11,15 +11,15 @@ from mysql.connector import Error as MySQLError
 
 from src.utils.logging_utils import log_error
 from src.user_functions.view_based_operations import require_permission, Role, Entity
-from src.utils.sql_file_parsers import read_sql_helper
+from src.utils.sql_registry import get_sql, get_statements
 
 
-CREATE_SCRIPT = "src/db_crud/internal_deadlines/create_internal_deadlines.sql"
-DELETE_SCRIPT = "src/db_crud/internal_deadlines/delete_internal_deadlines.sql"
-SELECT_SCRIPT = "src/db_crud/internal_deadlines/select_internal_deadlines_by_uuid.sql"
-UPDATE_SCRIPT = "src/db_crud/internal_deadlines/update_internal_deadlines.sql"
-SELECT_BY_EARLIEST_SCRIPT = "src/db_crud/internal_deadlines/select_internal_deadlines_by_earliest.sql"
-SELECT_BY_NEXT_SCRIPT = "src/db_crud/internal_deadlines/select_internal_deadlines_by_next.sql"
+CREATE_SCRIPT = "internal_deadlines/create_internal_deadlines"
+DELETE_SCRIPT = "internal_deadlines/delete_internal_deadlines"
+SELECT_SCRIPT = "internal_deadlines/select_internal_deadlines_by_uuid"
+UPDATE_SCRIPT = "internal_deadlines/update_internal_deadlines"
+SELECT_BY_EARLIEST_SCRIPT = "internal_deadlines/select_internal_deadlines_by_earliest"
+SELECT_BY_NEXT_SCRIPT = "internal_deadlines/select_internal_deadlines_by_next"
 
 
 class InternalDeadlineOperationError(Exception):
@@ -30,7 +30,8 @@ class InternalDeadlineOperationError(Exception):
 @require_permission('create', Entity.APPLICATION_DEADLINES)
 def create_internal_deadline(role: Role, user_id: str, resource_owner_id: str, cursor,
                             deadline_name: str, deadline_date, 
-                            application_id: str) -> None | InternalDeadlineOperationError | MySQLError:
+                            application_id: str, task_description: str | None = None,
+                            completed: bool | None = None) -> None | InternalDeadlineOperationError | MySQLError:
     """
     Create a new internal deadline in the database.
 
@@ -42,6 +43,8 @@ def create_internal_deadline(role: Role, user_id: str, resource_owner_id: str, c
         deadline_name (str): Name of the deadline
         deadline_date: Date and time of the deadline
         application_id (str): Associated application ID
+        task_description (str, optional): Detailed description of the task
+        completed (bool, optional): Completion flag (defaults to FALSE in the script)
 
     Returns:
         None on success, InternalDeadlineOperationError on logical/user failure,
@@ -52,11 +55,13 @@ def create_internal_deadline(role: Role, user_id: str, resource_owner_id: str, c
     params = {
         "deadline_name": deadline_name,
         "deadline_date": deadline_date,
-        "application_id": application_id
+        "application_id": application_id,
+        "task_description": task_description,
+        "completed": completed
     }
 
     try:
-        sql_script = read_sql_helper(CREATE_SCRIPT)
+        sql_script = get_sql(CREATE_SCRIPT, params)
         cursor.execute(sql_script, params)
         return None
     except MySQLError as e:
@@ -88,7 +93,7 @@ def read_internal_deadline_by_uuid(role: Role, user_id: str, resource_owner_id:
     _ = role, user_id, resource_owner_id  # linter ignore
 
     try:
-        sql_script = read_sql_helper(SELECT_SCRIPT)
+        sql_script = get_sql(SELECT_SCRIPT, (internal_deadline_id,))
         cursor.execute(sql_script, (internal_deadline_id,))
         return cursor.fetchone()
     except MySQLError as e:
@@ -118,7 +123,7 @@ def read_internal_deadlines_by_earliest(role: Role, user_id: str, resource_owner
     _ = role, user_id, resource_owner_id  # linter ignore
 
     try:
-        sql_script = read_sql_helper(SELECT_BY_EARLIEST_SCRIPT)
+        sql_script = get_sql(SELECT_BY_EARLIEST_SCRIPT)
         cursor.execute(sql_script)
         return cursor.fetchall()
     except MySQLError as e:
@@ -148,7 +153,7 @@ def read_internal_deadlines_by_next(role: Role, user_id: str, resource_owner_id:
     _ = role, user_id, resource_owner_id  # linter ignore
 
     try:
-        sql_script = read_sql_helper(SELECT_BY_NEXT_SCRIPT)
+        sql_script = get_sql(SELECT_BY_NEXT_SCRIPT)
         cursor.execute(sql_script)
         return cursor.fetchall()
     except MySQLError as e:
@@ -173,7 +178,8 @@ def update_internal_deadline(role: Role, user_id: str, resource_owner_id: str, c
         resource_owner_id (str): UUID of the resource owner (used by decorator)
         cursor: MySQL cursor object for executing queries
         internal_deadline_id (str): UUID of the internal deadline to update
-        **fields: Keyword arguments for fields to update (deadline_name, deadline_date, application_id)
+        **fields: Keyword arguments for fields to update (deadline_name, deadline_date, application_id,
+                 task_description, completed)
 
     Returns:
         None on success, InternalDeadlineOperationError on failure.
@@ -185,11 +191,13 @@ def update_internal_deadline(role: Role, user_id: str, resource_owner_id: str, c
         "internal_deadline_id": internal_deadline_id,
         "deadline_name": fields.get("deadline_name"),
         "deadline_date": fields.get("deadline_date"),
-        "application_id": fields.get("application_id")
+        "application_id": fields.get("application_id"),
+        "task_description": fields.get("task_description"),
+        "completed": fields.get("completed")
     }
 
     try:
-        sql_script = read_sql_helper(UPDATE_SCRIPT)
+        sql_script = get_sql(UPDATE_SCRIPT, params)
         cursor.execute(sql_script, params)
         return None
     except MySQLError as e:
@@ -222,7 +230,7 @@ def delete_internal_deadline(role: Role, user_id: str, resource_owner_id: str, c
     _ = role, user_id, resource_owner_id  # for linter
 
     try:
-        sql_script = read_sql_helper(DELETE_SCRIPT)
+        sql_script = get_sql(DELETE_SCRIPT, (internal_deadline_id,))
         cursor.execute(sql_script, (internal_deadline_id,))
         return None
     except MySQLError as e:
@@ -10,8 +10,8 @@ INSERT INTO Applications (
     status,
     application_date
 ) VALUES (
-    UUID_TO_BIN(%(user_id)s),
-    UUID_TO_BIN(%(grant_id)s),
+    UUID_TO_BIN(%(user_id)s, 1),
+    UUID_TO_BIN(%(grant_id)s, 1),
     TRIM(%(status)s),
     %(application_date)s
 );
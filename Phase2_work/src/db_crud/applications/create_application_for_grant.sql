@@ -0,0 +1,35 @@
+/*
+Create Application For An Existing Grant
+Version: 19 October 2026
+Author: Colby Wirth
+Description: Insert an application whose id is generated by the caller.
+             The row is inserted only if the grant exists, so rowcount 0 means "grant not found";
+             a second application by the same user for the same grant fails on unique_user_grant.
+Parameters:
+    - application_id: UUID string generated by the caller (required)
+    - user_id: UUID string of the applicant (required)
+    - grant_id: UUID string of the grant (required)
+    - submission_status: 'started' or 'submitted' (required)
+    - status: review status, e.g. 'pending' (required)
+    - application_date: date of the application (required)
+    - submitted_at: submission timestamp, NULL unless submitted (optional)
+*/
+INSERT INTO Applications (
+    application_id,
+    user_id,
+    grant_id,
+    submission_status,
+    status,
+    application_date,
+    submitted_at
+)
+SELECT
+    UUID_TO_BIN(%(application_id)s, 1),
+    UUID_TO_BIN(%(user_id)s, 1),
+    g.grant_id,
+    %(submission_status)s,
+    TRIM(%(status)s),
+    %(application_date)s,
+    %(submitted_at)s
+FROM Grants g
+WHERE g.grant_id = UUID_TO_BIN(%(grant_id)s, 1);
@@ -8,4 +8,4 @@ Description:
         - grant_id: The unique identifier of the grant (required)
 */
 DELETE FROM Applications
-WHERE grant_id = UUID_TO_BIN(%(grant_id)s);
+WHERE grant_id = UUID_TO_BIN(%(grant_id)s, 1);
@@ -9,5 +9,5 @@ Description:
 */
 
 DELETE FROM Applications
-WHERE user_id = UUID_TO_BIN(%(user_id)s) AND grant_id = UUID_TO_BIN(%(grant_id)s);
+WHERE user_id = UUID_TO_BIN(%(user_id)s, 1) AND grant_id = UUID_TO_BIN(%(grant_id)s, 1);
 
@@ -8,4 +8,4 @@ Description:
     - application_id: The unique identifier of the application to be deleted (required)
 */
 DELETE FROM Applications
-WHERE application_id = UUID_TO_BIN(%(application_id)s); 
+WHERE application_id = UUID_TO_BIN(%(application_id)s, 1); 
@@ -8,5 +8,5 @@ Description:
         - user_id: The unique identifier of the user (required)
 */
 DELETE FROM Applications
-WHERE user_id = UUID_TO_BIN(%(user_id)s);
+WHERE user_id = UUID_TO_BIN(%(user_id)s, 1);
 
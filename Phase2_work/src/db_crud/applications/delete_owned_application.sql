@@ -0,0 +1,12 @@
+/*
+Owner-Scoped Application Deletion
+Version: 19 October 2026
+Author: Colby Wirth
+Description: Delete an application only if it belongs to the given user.
+             rowcount 0 means the application does not exist or belongs to someone else.
+Parameters:
+    - application_id: The UUID string of the application (required)
+    - user_id: The UUID string of the requesting user (required)
+*/
+DELETE FROM Applications
+WHERE application_id = UUID_TO_BIN(%(application_id)s, 1) AND user_id = UUID_TO_BIN(%(user_id)s, 1);
@@ -9,9 +9,9 @@ Returns:
     All columns with UUIDs converted to string format
 */
 SELECT
-    BIN_TO_UUID(application_id) AS application_id,
-    BIN_TO_UUID(user_id) AS user_id,
-    BIN_TO_UUID(grant_id) AS grant_id,
+    BIN_TO_UUID(application_id, 1) AS application_id,
+    BIN_TO_UUID(user_id, 1) AS user_id,
+    BIN_TO_UUID(grant_id, 1) AS grant_id,
     status,
     application_date
 FROM Applications
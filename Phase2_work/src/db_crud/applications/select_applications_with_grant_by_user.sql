@@ -0,0 +1,24 @@
+/*
+Application Selection Script for Applications Table
+Version: 19 October 2026
+Author: Colby Wirth
+Description: Select a user's applications joined with the title of the grant applied to.
+             Hot API statement; executed through the prepared statement cache.
+Parameters:
+    - user_id: The UUID string of the user (required, positional)
+Returns:
+    application_id, user_id, grant_id, submission_status, status, application_date, grant_name
+    newest application first
+*/
+SELECT
+    BIN_TO_UUID(a.application_id, 1) AS application_id,
+    BIN_TO_UUID(a.user_id, 1) AS user_id,
+    BIN_TO_UUID(a.grant_id, 1) AS grant_id,
+    a.submission_status,
+    a.status,
+    DATE_FORMAT(a.application_date, '%Y-%m-%d') AS application_date,
+    g.grant_title AS grant_name
+FROM Applications a
+JOIN Grants g ON a.grant_id = g.grant_id
+WHERE a.user_id = UUID_TO_BIN(%s, 1)
+ORDER BY a.application_date DESC;
@@ -0,0 +1,28 @@
+/*
+    select_dashboard_applications.sql
+    Author: Colby Wirth
+    Version: 19 October 2026
+    Description: A user's applications with the title and close date of the grant applied to,
+        for GET /api/user/dashboard (one range of idx_application_user, then grant primary keys).
+
+    Parameters:
+        - user_id: The UUID string of the user (required, positional)
+
+    Returns:
+        application_id, grant_id, submission_status, status, application_date,
+        internal_deadline, grant_title, date_closed, newest application first
+*/
+
+SELECT
+    BIN_TO_UUID(a.application_id, 1) AS application_id,
+    BIN_TO_UUID(a.grant_id, 1) AS grant_id,
+    a.submission_status,
+    a.status,
+    DATE_FORMAT(a.application_date, '%Y-%m-%d') AS application_date,
+    DATE_FORMAT(a.internal_deadline, '%Y-%m-%d') AS internal_deadline,
+    g.grant_title,
+    DATE_FORMAT(g.date_closed, '%Y-%m-%d') AS date_closed
+FROM Applications a
+JOIN Grants g ON a.grant_id = g.grant_id
+WHERE a.user_id = UUID_TO_BIN(%s, 1)
+ORDER BY a.application_date DESC, a.application_id;
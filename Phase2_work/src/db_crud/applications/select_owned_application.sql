@@ -0,0 +1,26 @@
+/*
+Owner-Scoped Application Selection
+Version: 19 October 2026
+Author: Colby Wirth
+Description: Select one application with its grant title, only if it belongs to the given user.
+             No row means the application does not exist or belongs to someone else.
+Parameters:
+    - application_id: The UUID string of the application (required, positional)
+    - user_id: The UUID string of the requesting user (required, positional)
+Returns:
+    application_id, user_id, grant_id, submission_status, status, application_date, grant_name,
+    internal_deadline, notes
+*/
+SELECT
+    BIN_TO_UUID(a.application_id, 1) AS application_id,
+    BIN_TO_UUID(a.user_id, 1) AS user_id,
+    BIN_TO_UUID(a.grant_id, 1) AS grant_id,
+    a.submission_status,
+    a.status,
+    DATE_FORMAT(a.application_date, '%Y-%m-%d') AS application_date,
+    g.grant_title AS grant_name,
+    DATE_FORMAT(a.internal_deadline, '%Y-%m-%d') AS internal_deadline,
+    a.notes
+FROM Applications a
+JOIN Grants g ON a.grant_id = g.grant_id
+WHERE a.application_id = UUID_TO_BIN(%s, 1) AND a.user_id = UUID_TO_BIN(%s, 1);
@@ -0,0 +1,17 @@
+/*
+Owner-Scoped Application State
+Version: 19 October 2026
+Author: Colby Wirth
+Description: Select the submission status of an application and the closing date of its grant,
+             only if the application belongs to the given user.  Used to check uploads and to
+             explain why a conditional task write matched no rows.
+Parameters:
+    - application_id: The UUID string of the application (required, positional)
+    - user_id: The UUID string of the requesting user (required, positional)
+Returns:
+    submission_status, date_closed
+*/
+SELECT a.submission_status, g.date_closed
+FROM Applications a
+JOIN Grants g ON a.grant_id = g.grant_id
+WHERE a.application_id = UUID_TO_BIN(%s, 1) AND a.user_id = UUID_TO_BIN(%s, 1);
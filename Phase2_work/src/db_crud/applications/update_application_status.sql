@@ -10,4 +10,4 @@ Parameters:
 UPDATE Applications
 SET 
     status = TRIM(%(status)s)
-WHERE application_id = UUID_TO_BIN(%(application_id)s);
\ No newline at end of file
+WHERE application_id = UUID_TO_BIN(%(application_id)s, 1);
\ No newline at end of file
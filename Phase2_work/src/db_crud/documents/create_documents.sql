@@ -37,5 +37,5 @@ INSERT INTO Documents (
     TRIM(%(document_type)s),
     %(document_size)s,
     %(upload_date)s,
-    UUID_TO_BIN(%(application_id)s)
+    UUID_TO_BIN(%(application_id)s, 1)
 );
\ No newline at end of file
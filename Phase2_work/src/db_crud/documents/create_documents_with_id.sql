@@ -0,0 +1,32 @@
+/*
+    create_documents_with_id.sql
+    Author: Colby Wirth
+    Version: 19 October 2026
+    Description: Insert a document whose id is generated by the caller, so the id is known
+        without reading it back.  Run with executemany() to insert every file of an upload
+        in one multi-row statement.
+
+    Parameters:
+        - document_id: UUID string generated by the caller (required)
+        - document_name: Name of the document (required)
+        - document_type: Type of the document (required)
+        - document_size: Size of the document in bytes (required)
+        - upload_date: Date and time when the document was uploaded (required)
+        - application_id: Associated application ID (required)
+*/
+
+INSERT INTO Documents (
+    document_id,
+    document_name,
+    document_type,
+    document_size,
+    upload_date,
+    application_id
+) VALUES (
+    UUID_TO_BIN(%(document_id)s, 1),
+    TRIM(%(document_name)s),
+    TRIM(%(document_type)s),
+    %(document_size)s,
+    %(upload_date)s,
+    UUID_TO_BIN(%(application_id)s, 1)
+);
@@ -11,4 +11,4 @@
 */
 
 DELETE FROM Documents
-WHERE document_id = UUID_TO_BIN(%s);
+WHERE document_id = UUID_TO_BIN(%s, 1);
@@ -0,0 +1,19 @@
+/*
+    delete_owned_document.sql
+    Author: Colby Wirth
+    Version: 19 October 2026
+    Description: Delete a document only if its application belongs to the requesting user.
+        rowcount 0 means not found or not owned.
+
+    Parameters:
+        - document_id: UUID string of the document (required)
+        - application_id: UUID string of the application (required)
+        - user_id: UUID string of the requesting user (required)
+*/
+
+DELETE d
+FROM Documents d
+JOIN Applications a ON a.application_id = d.application_id
+WHERE d.document_id = UUID_TO_BIN(%(document_id)s, 1)
+  AND d.application_id = UUID_TO_BIN(%(application_id)s, 1)
+  AND a.user_id = UUID_TO_BIN(%(user_id)s, 1);
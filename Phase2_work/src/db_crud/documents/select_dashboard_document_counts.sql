@@ -0,0 +1,23 @@
+/*
+    select_dashboard_document_counts.sql
+    Author: Colby Wirth
+    Version: 19 October 2026
+    Description: Document counts of every application of a user, in one grouped pass over their
+        documents (idx_application_user, then idx_application_upload), for
+        GET /api/user/dashboard.  Applications without documents have no row.
+
+    Parameters:
+        - user_id: The UUID string of the user (required, positional)
+
+    Returns:
+        application_id, document_count, last_upload
+*/
+
+SELECT
+    BIN_TO_UUID(a.application_id, 1) AS application_id,
+    COUNT(*) AS document_count,
+    MAX(doc.upload_date) AS last_upload
+FROM Applications a
+JOIN Documents doc ON doc.application_id = a.application_id
+WHERE a.user_id = UUID_TO_BIN(%s, 1)
+GROUP BY a.application_id;
@@ -14,11 +14,11 @@
 */
 
 SELECT 
-    BIN_TO_UUID(document_id) AS document_id,
+    BIN_TO_UUID(document_id, 1) AS document_id,
     document_name,
     document_type,
     document_size,
     upload_date,
-    BIN_TO_UUID(application_id) AS application_id
+    BIN_TO_UUID(application_id, 1) AS application_id
 FROM Documents
-WHERE document_id = UUID_TO_BIN(%s);
+WHERE document_id = UUID_TO_BIN(%s, 1);
@@ -0,0 +1,22 @@
+/*
+    select_owned_document.sql
+    Author: Colby Wirth
+    Version: 19 October 2026
+    Description: Select the name of a document only if its application belongs to the
+        requesting user.  No row means not found or not owned.
+
+    Parameters:
+        - document_id: The UUID string of the document (required, positional)
+        - application_id: The UUID string of the application (required, positional)
+        - user_id: The UUID string of the requesting user (required, positional)
+
+    Returns:
+        document_name
+*/
+
+SELECT d.document_name
+FROM Documents d
+JOIN Applications a ON a.application_id = d.application_id
+WHERE d.document_id = UUID_TO_BIN(%s, 1)
+  AND d.application_id = UUID_TO_BIN(%s, 1)
+  AND a.user_id = UUID_TO_BIN(%s, 1);
@@ -0,0 +1,26 @@
+/*
+    select_owned_documents.sql
+    Author: Colby Wirth
+    Version: 19 October 2026
+    Description: Select the documents of an application together with the ownership check.
+        No rows: the application does not exist or belongs to someone else.
+        One row with a NULL document_id: the application is owned but has no documents.
+
+    Parameters:
+        - application_id: The UUID string of the application (required, positional)
+        - user_id: The UUID string of the requesting user (required, positional)
+
+    Returns:
+        document_id, document_name, document_type, document_size, upload_date, newest first
+*/
+
+SELECT
+    BIN_TO_UUID(d.document_id, 1) AS document_id,
+    d.document_name,
+    d.document_type,
+    d.document_size,
+    d.upload_date
+FROM Applications a
+LEFT JOIN Documents d ON d.application_id = a.application_id
+WHERE a.application_id = UUID_TO_BIN(%s, 1) AND a.user_id = UUID_TO_BIN(%s, 1)
+ORDER BY d.upload_date DESC;
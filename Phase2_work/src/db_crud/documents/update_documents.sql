@@ -23,9 +23,9 @@ SET
     upload_date = COALESCE(%(upload_date)s, upload_date),
     application_id = COALESCE(
         CASE 
-            WHEN %(application_id)s IS NOT NULL THEN UUID_TO_BIN(%(application_id)s)
+            WHEN %(application_id)s IS NOT NULL THEN UUID_TO_BIN(%(application_id)s, 1)
             ELSE NULL
         END, 
         application_id
     )
-WHERE document_id = UUID_TO_BIN(%(document_id)s);
+WHERE document_id = UUID_TO_BIN(%(document_id)s, 1);
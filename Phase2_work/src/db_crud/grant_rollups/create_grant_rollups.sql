@@ -0,0 +1,20 @@
+/*
+  create_grant_rollups.sql
+  Author: Colby Wirth
+  Version: 19 October 2026
+  Description: Insert one GrantRollups row (sent in batches with executemany).  Values the column
+               collation treats as equal ('NSF' and 'nsf ') share one row, so a second row adds to it.
+
+  Parameters:
+    - dimension: 'month', 'provider' or 'research_field' (required)
+    - month_posted: First day of the month (required)
+    - value: The provider or research field, '' for none (required)
+    - grant_count: Number of grants (required)
+    - program_funding: Their total program funding (required)
+*/
+
+INSERT INTO GrantRollups (dimension, month_posted, value, grant_count, program_funding)
+VALUES (%s, %s, %s, %s, %s)
+ON DUPLICATE KEY UPDATE
+    grant_count = grant_count + VALUES(grant_count),
+    program_funding = program_funding + VALUES(program_funding);
@@ -0,0 +1,9 @@
+/*
+  delete_grant_rollups.sql
+  Author: Colby Wirth
+  Version: 19 October 2026
+  Description: Empty GrantRollups before it is refilled (in the same transaction, so readers
+               keep seeing the previous rollups until the commit)
+*/
+
+DELETE FROM GrantRollups;
@@ -0,0 +1,19 @@
+/*
+  select_grant_rollup_months.sql
+  Author: Colby Wirth
+  Version: 19 October 2026
+  Description: Grant count and program funding of each month in a range (one range of the
+               primary key)
+
+  Parameters:
+    - from: First month, as its first day (required)
+    - to: Last month, as its first day (required)
+
+  Returns:
+    month_posted, grant_count, program_funding
+*/
+
+SELECT month_posted, grant_count, program_funding
+FROM GrantRollups
+WHERE dimension = 'month' AND month_posted BETWEEN %s AND %s
+ORDER BY month_posted;
@@ -0,0 +1,23 @@
+/*
+  select_grant_rollup_values.sql
+  Author: Colby Wirth
+  Version: 19 October 2026
+  Description: Grant count and program funding per provider or research field over a range of
+               months, most funding first (one range of the primary key, summed per value)
+
+  Parameters:
+    - dimension: 'provider' or 'research_field' (required)
+    - from: First month, as its first day (required)
+    - to: Last month, as its first day (required)
+    - limit: Maximum number of values (required)
+
+  Returns:
+    value, grant_count, program_funding
+*/
+
+SELECT value, SUM(grant_count) AS grant_count, SUM(program_funding) AS program_funding
+FROM GrantRollups
+WHERE dimension = %s AND month_posted BETWEEN %s AND %s
+GROUP BY value
+ORDER BY program_funding DESC, grant_count DESC, value
+LIMIT %s;
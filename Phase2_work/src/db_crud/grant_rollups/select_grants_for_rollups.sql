@@ -0,0 +1,14 @@
+/*
+  select_grants_for_rollups.sql
+  Author: Colby Wirth
+  Version: 19 October 2026
+  Description: The columns of every posted grant that GrantRollups sums, read by
+               system_functions/rebuild_grant_rollups.py
+
+  Returns:
+    date_posted, provider, research_field, program_funding
+*/
+
+SELECT date_posted, provider, research_field, program_funding
+FROM Grants
+WHERE date_posted IS NOT NULL;
@@ -0,0 +1,15 @@
+/*
+  create_grant_similarities.sql
+  Author: Colby Wirth
+  Version: 19 October 2026
+  Description: Store one neighbor of a grant
+
+  Parameters:
+    - grant_id: The grant (binary)
+    - similarity_rank: 1 for the most similar neighbor
+    - similar_grant_id: The neighbor (binary)
+    - score: Cosine similarity, 0 to 1
+*/
+
+INSERT INTO GrantSimilarities (grant_id, similarity_rank, similar_grant_id, score)
+VALUES (%s, %s, %s, %s);
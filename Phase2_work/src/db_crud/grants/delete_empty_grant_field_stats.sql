@@ -0,0 +1,8 @@
+/*
+  delete_empty_grant_field_stats.sql
+  Author: Colby Wirth
+  Version: 19 October 2026
+  Description: Drop the research fields no grant has any more
+*/
+
+DELETE FROM GrantFieldStats WHERE grant_count = 0;
@@ -0,0 +1,12 @@
+/*
+  delete_grant_changes_before.sql
+  Author: Colby Wirth
+  Version: 19 October 2026
+  Description: Prune GrantChangeLog rows older than the given number of days
+
+  Parameters:
+    - days: Age in days past which change rows are deleted (required)
+*/
+
+DELETE FROM GrantChangeLog
+WHERE changed_at < NOW() - INTERVAL %s DAY;
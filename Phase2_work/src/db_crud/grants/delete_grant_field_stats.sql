@@ -0,0 +1,8 @@
+/*
+  delete_grant_field_stats.sql
+  Author: Colby Wirth
+  Version: 19 October 2026
+  Description: Empty GrantFieldStats before it is rebuilt
+*/
+
+DELETE FROM GrantFieldStats;
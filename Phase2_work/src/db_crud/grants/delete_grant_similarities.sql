@@ -0,0 +1,9 @@
+/*
+  delete_grant_similarities.sql
+  Author: Colby Wirth
+  Version: 19 October 2026
+  Description: Empty GrantSimilarities before it is refilled (in the same transaction, so readers
+               keep seeing the previous neighbors until the commit)
+*/
+
+DELETE FROM GrantSimilarities;
@@ -9,4 +9,4 @@
 */
 
 DELETE FROM Grants
-WHERE grant_id = UUID_TO_BIN(%s)
\ No newline at end of file
+WHERE grant_id = UUID_TO_BIN(%s, 1)
\ No newline at end of file
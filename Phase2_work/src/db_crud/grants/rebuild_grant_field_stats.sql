@@ -0,0 +1,15 @@
+/*
+  rebuild_grant_field_stats.sql
+  Author: Colby Wirth
+  Version: 19 October 2026
+  Description: Recompute the per research field statistics from Grants (one grouped scan)
+*/
+
+INSERT INTO GrantFieldStats (research_field, grant_count, open_count, program_funding)
+SELECT
+    COALESCE(research_field, ''),
+    COUNT(*),
+    SUM(date_closed IS NULL OR date_closed >= CURDATE()),
+    COALESCE(SUM(program_funding), 0)
+FROM Grants
+GROUP BY COALESCE(research_field, '');
@@ -0,0 +1,15 @@
+/*
+  rebuild_grant_stats.sql
+  Author: Colby Wirth
+  Version: 19 October 2026
+  Description: Recompute the grant totals from Grants (one scan)
+*/
+
+REPLACE INTO GrantStats (stats_id, grant_count, open_count, program_funding, open_as_of)
+SELECT
+    1,
+    COUNT(*),
+    COALESCE(SUM(date_closed IS NULL OR date_closed >= CURDATE()), 0),
+    COALESCE(SUM(program_funding), 0),
+    CURDATE()
+FROM Grants;
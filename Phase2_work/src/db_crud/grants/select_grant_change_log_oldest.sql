@@ -0,0 +1,13 @@
+/*
+  select_grant_change_log_oldest.sql
+  Author: Colby Wirth
+  Version: 19 October 2026
+  Description: The oldest GrantChangeLog position still kept (older rows are pruned), so a reader
+               can tell whether changes it has not applied yet were pruned
+
+  Returns:
+    The lowest change_id, or NULL when the log is empty
+*/
+
+SELECT MIN(change_id) AS change_id
+FROM GrantChangeLog;
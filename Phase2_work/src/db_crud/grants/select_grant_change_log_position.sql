@@ -0,0 +1,13 @@
+/*
+  select_grant_change_log_position.sql
+  Author: Colby Wirth
+  Version: 19 October 2026
+  Description: The newest GrantChangeLog position, read before a full index build so changes made
+               during the build are replayed afterwards
+
+  Returns:
+    The highest change_id, or 0 when the log is empty
+*/
+
+SELECT COALESCE(MAX(change_id), 0) AS change_id
+FROM GrantChangeLog;
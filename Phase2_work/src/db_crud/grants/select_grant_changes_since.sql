@@ -0,0 +1,33 @@
+/*
+  select_grant_changes_since.sql
+  Author: Colby Wirth
+  Version: 19 October 2026
+  Description: Grants changed after a given change log position, with their current values
+
+  Parameters:
+    - change_id: The last GrantChangeLog.change_id already applied (required)
+    - limit: The maximum number of changes to return (required)
+
+  Returns:
+    change_id, grant_id and the same columns as select_grants_for_search_index; the grant columns
+    are NULL when the grant no longer exists
+*/
+
+SELECT
+    c.change_id,
+    BIN_TO_UUID(c.grant_id, 1) AS grant_id,
+    g.grant_title,
+    g.description,
+    g.provider,
+    g.research_field,
+    g.opportunity_number,
+    g.date_posted,
+    g.date_closed,
+    g.award_max_amount,
+    g.award_min_amount,
+    g.program_funding
+FROM GrantChangeLog AS c
+LEFT JOIN Grants AS g ON g.grant_id = c.grant_id
+WHERE c.change_id > %s
+ORDER BY c.change_id
+LIMIT %s;
@@ -0,0 +1,19 @@
+/*
+  select_grant_closings.sql
+  Author: Colby Wirth
+  Version: 19 October 2026
+  Description: The number of grants per research field that closed in a date range; one range of
+               idx_grants_date_closed_id_award
+
+  Parameters:
+    - from: First close date, inclusive (required)
+    - to: Last close date, exclusive (required)
+
+  Returns:
+    research_field, count
+*/
+
+SELECT research_field, COUNT(*)
+FROM Grants
+WHERE date_closed >= %s AND date_closed < %s
+GROUP BY research_field;
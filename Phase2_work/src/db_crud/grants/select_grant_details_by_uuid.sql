@@ -0,0 +1,35 @@
+/*
+  select_grant_details_by_uuid.sql
+  Author: Colby Wirth
+  Version: 19 October 2026
+  Description: Select the details shown on the grant page for one grant.
+               Hot API statement; executed through the prepared statement cache.
+
+  Parameters:
+    - grant_id: The UUID string of the grant (required, positional)
+
+  Returns:
+    One row with the grant's columns and dates formatted as YYYY-MM-DD
+*/
+
+SELECT
+    BIN_TO_UUID(grant_id, 1) AS grant_id,
+    grant_title,
+    opportunity_number,
+    description,
+    research_field,
+    expected_award_count,
+    eligibility,
+    award_max_amount,
+    award_min_amount,
+    program_funding,
+    provider,
+    link_to_source,
+    point_of_contact,
+    DATE_FORMAT(date_posted, '%Y-%m-%d') AS date_posted,
+    DATE_FORMAT(archive_date, '%Y-%m-%d') AS archive_date,
+    DATE_FORMAT(date_closed, '%Y-%m-%d') AS date_closed,
+    DATE_FORMAT(last_update_date, '%Y-%m-%d') AS last_update_date
+FROM Grants
+WHERE grant_id = UUID_TO_BIN(%s, 1)
+LIMIT 1;
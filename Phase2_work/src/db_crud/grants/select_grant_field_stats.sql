@@ -0,0 +1,13 @@
+/*
+  select_grant_field_stats.sql
+  Author: Colby Wirth
+  Version: 19 October 2026
+  Description: The statistics of every research field, most grants first
+
+  Returns:
+    research_field, grant_count, open_count, program_funding
+*/
+
+SELECT research_field, grant_count, open_count, program_funding
+FROM GrantFieldStats
+ORDER BY grant_count DESC, research_field;
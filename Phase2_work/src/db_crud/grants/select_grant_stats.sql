@@ -0,0 +1,13 @@
+/*
+  select_grant_stats.sql
+  Author: Colby Wirth
+  Version: 19 October 2026
+  Description: The grant totals (one primary key lookup)
+
+  Returns:
+    grant_count, open_count, closed_count, program_funding, open_as_of
+*/
+
+SELECT grant_count, open_count, grant_count - open_count AS closed_count, program_funding, open_as_of
+FROM GrantStats
+WHERE stats_id = 1;
@@ -0,0 +1,17 @@
+/*
+  select_grant_stats_columns.sql
+  Author: Colby Wirth
+  Version: 19 October 2026
+  Description: The columns of a grant the statistics count, by opportunity number; also tells the
+               ingest whether the grant is already stored
+
+  Parameters:
+    - opportunity_number: The grants.gov opportunity number (required)
+
+  Returns:
+    research_field, program_funding, date_closed, or no row
+*/
+
+SELECT research_field, program_funding, date_closed
+FROM Grants
+WHERE opportunity_number = %s;
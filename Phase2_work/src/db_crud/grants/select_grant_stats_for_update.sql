@@ -0,0 +1,11 @@
+/*
+  select_grant_stats_for_update.sql
+  Author: Colby Wirth
+  Version: 19 October 2026
+  Description: Lock the grant statistics for the rest of the transaction (src/utils/grant_stats.py)
+
+  Returns:
+    open_as_of, or no row before the statistics were built
+*/
+
+SELECT open_as_of FROM GrantStats WHERE stats_id = 1 FOR UPDATE;
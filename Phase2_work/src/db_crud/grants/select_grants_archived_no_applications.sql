@@ -1,17 +1,18 @@
 /*
   select_grants_archived_no_applications.sql
   Author: James Tedder
-  Version: 15 November 2025
+  Version: 19 October 2026
   Description: Select the grants that have been archived and have no applications
 
   Returns:
-    All of the grants that have been archived and have no applications associated with them
+    grant_id and the columns the grant statistics count (research_field, program_funding,
+    date_closed) of every grant that has been archived and has no applications
 */
 
-SELECT BIN_TO_UUID(grant_id) as grant_id
+SELECT BIN_TO_UUID(grant_id, 1) as grant_id, research_field, program_funding, date_closed
 FROM Grants as g
 WHERE g.archive_date < CURDATE() 
     AND g.grant_id NOT IN (
         SELECT grant_id
-        FROM applications
-        )
\ No newline at end of file
+        FROM Applications
+        )
@@ -9,7 +9,7 @@
     All of the grants that have the opportunity number
 */
 
-SELECT BIN_TO_UUID(grant_id) as grant_id,
+SELECT BIN_TO_UUID(grant_id, 1) as grant_id,
     grant_title,
     opportunity_number,
     description,
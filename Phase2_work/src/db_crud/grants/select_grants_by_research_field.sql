@@ -11,7 +11,7 @@
     All columns of the Grants table for every instance with the research field
 */
 
-SELECT BIN_TO_UUID(grant_id) as grant_id,
+SELECT BIN_TO_UUID(grant_id, 1) as grant_id,
     grant_title,
     opportunity_number,
     description,
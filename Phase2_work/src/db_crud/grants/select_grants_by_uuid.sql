@@ -12,7 +12,7 @@
 */
 
 SELECT
-    BIN_TO_UUID(grant_id) as grant_id,
+    BIN_TO_UUID(grant_id, 1) as grant_id,
     grant_title,
     opportunity_number,
     description,
@@ -30,4 +30,4 @@ SELECT
     date_closed,
     last_update_date
 FROM Grants
-WHERE grant_id = UUID_TO_BIN(%s);
\ No newline at end of file
+WHERE grant_id = UUID_TO_BIN(%s, 1);
\ No newline at end of file
@@ -0,0 +1,25 @@
+/*
+  select_grants_for_search_index.sql
+  Author: Colby Wirth
+  Version: 19 October 2026
+  Description: Every grant's searchable text and sort/filter/facet columns, read once when the API
+               builds its in-memory search index
+
+  Returns:
+    grant_id, grant_title, description, provider, research_field, opportunity_number,
+    date_posted, date_closed, award_max_amount, award_min_amount, program_funding for every grant
+*/
+
+SELECT
+    BIN_TO_UUID(grant_id, 1) AS grant_id,
+    grant_title,
+    description,
+    provider,
+    research_field,
+    opportunity_number,
+    date_posted,
+    date_closed,
+    award_max_amount,
+    award_min_amount,
+    program_funding
+FROM Grants;
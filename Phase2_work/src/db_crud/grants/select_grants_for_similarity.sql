@@ -0,0 +1,14 @@
+/*
+  select_grants_for_similarity.sql
+  Author: Colby Wirth
+  Version: 19 October 2026
+  Description: The text of every open grant (no close date, or closing today or later), read by
+               system_functions/compute_grant_similarities.py
+
+  Returns:
+    grant_id (binary), grant_title, description, eligibility
+*/
+
+SELECT grant_id, grant_title, description, eligibility
+FROM Grants
+WHERE date_closed IS NULL OR date_closed >= CURDATE();
@@ -8,7 +8,7 @@
     All of the grants that are open
 */
 
-SELECT BIN_TO_UUID(grant_id) as grant_id,
+SELECT BIN_TO_UUID(grant_id, 1) as grant_id,
     grant_title,
     opportunity_number,
     description,
@@ -0,0 +1,20 @@
+/*
+  select_research_fields_containing.sql
+  Author: Colby Wirth
+  Version: 19 October 2026
+  Description: The distinct research fields of Grants that contain a search string, so
+               search_grants can filter Grants with research_field IN (...) on
+               idx_grants_research_field instead of a LIKE '%value%' scan of every grant.
+               Only the index is read (a covering scan of one entry per grant at most, skipping
+               duplicates), and it is always current with Grants
+
+  Parameters:
+    - %s: LIKE pattern, '%value%' with the wildcards of value escaped
+
+  Returns:
+    research_field
+*/
+
+SELECT DISTINCT research_field
+FROM Grants
+WHERE research_field LIKE %s;
@@ -0,0 +1,26 @@
+/*
+  select_similar_grants.sql
+  Author: Colby Wirth
+  Version: 19 October 2026
+  Description: The precomputed most similar grants of a grant, best first
+
+  Parameters:
+    - grant_id: The UUID of the grant (required)
+    - limit: The maximum number of neighbors to return (required)
+
+  Returns:
+    grant_id, grant_title, provider, research_field, date_closed, score of each neighbor
+*/
+
+SELECT
+    BIN_TO_UUID(g.grant_id, 1) AS grant_id,
+    g.grant_title,
+    g.provider,
+    g.research_field,
+    DATE_FORMAT(g.date_closed, '%Y-%m-%d') AS date_closed,
+    s.score
+FROM GrantSimilarities AS s
+JOIN Grants AS g ON g.grant_id = s.similar_grant_id
+WHERE s.grant_id = UUID_TO_BIN(%s, 1)
+ORDER BY s.similarity_rank
+LIMIT %s;
@@ -0,0 +1,35 @@
+/*
+  select_suggest_terms.sql
+  Author: Colby Wirth
+  Version: 19 October 2026
+  Description: Everything /api/public/suggest can complete, with a popularity weight, read when the
+               API (re)builds its in-memory prefix index
+
+  Returns:
+    kind, text, grant_id (NULL for providers and research fields), weight
+    - title, opportunity_number: one row per grant, weighted 1 + the grant's applications
+    - provider, research_field: one row per distinct value, weighted by its number of grants
+*/
+
+WITH popularity AS (
+    SELECT g.grant_id, g.grant_title, g.opportunity_number, 1 + COUNT(a.application_id) AS weight
+    FROM Grants AS g
+    LEFT JOIN Applications AS a ON a.grant_id = g.grant_id
+    GROUP BY g.grant_id
+)
+SELECT 'title' AS kind, grant_title AS text, BIN_TO_UUID(grant_id, 1) AS grant_id, weight
+FROM popularity
+WHERE grant_title IS NOT NULL
+UNION ALL
+SELECT 'opportunity_number', opportunity_number, BIN_TO_UUID(grant_id, 1), weight
+FROM popularity
+UNION ALL
+SELECT 'provider', provider, NULL, COUNT(*)
+FROM Grants
+WHERE provider IS NOT NULL AND provider <> ''
+GROUP BY provider
+UNION ALL
+SELECT 'research_field', research_field, NULL, COUNT(*)
+FROM Grants
+WHERE research_field IS NOT NULL AND research_field <> ''
+GROUP BY research_field;
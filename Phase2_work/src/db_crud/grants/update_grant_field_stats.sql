@@ -0,0 +1,20 @@
+/*
+  update_grant_field_stats.sql
+  Author: Colby Wirth
+  Version: 19 October 2026
+  Description: Add the net change of a write to one research field's statistics, creating the
+               field's row the first time it is seen
+
+  Parameters:
+    - research_field: The research field, '' for grants without one (required)
+    - grant_count: Change in the number of grants (required)
+    - open_count: Change in the number of open grants (required)
+    - program_funding: Change in the total program funding (required)
+*/
+
+INSERT INTO GrantFieldStats (research_field, grant_count, open_count, program_funding)
+VALUES (%s, %s, %s, %s)
+ON DUPLICATE KEY UPDATE
+    grant_count = grant_count + VALUES(grant_count),
+    open_count = open_count + VALUES(open_count),
+    program_funding = program_funding + VALUES(program_funding);
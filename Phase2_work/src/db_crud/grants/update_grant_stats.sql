@@ -0,0 +1,17 @@
+/*
+  update_grant_stats.sql
+  Author: Colby Wirth
+  Version: 19 October 2026
+  Description: Add the net change of a write to the grant totals
+
+  Parameters:
+    - grant_count: Change in the number of grants (required)
+    - open_count: Change in the number of open grants (required)
+    - program_funding: Change in the total program funding (required)
+*/
+
+UPDATE GrantStats
+SET grant_count = grant_count + %s,
+    open_count = open_count + %s,
+    program_funding = program_funding + %s
+WHERE stats_id = 1;
@@ -0,0 +1,11 @@
+/*
+  update_grant_stats_open_as_of.sql
+  Author: Colby Wirth
+  Version: 19 October 2026
+  Description: Record the date the open counts are correct for
+
+  Parameters:
+    - open_as_of: The date (required)
+*/
+
+UPDATE GrantStats SET open_as_of = %s WHERE stats_id = 1;
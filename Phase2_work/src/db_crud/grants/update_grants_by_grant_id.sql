@@ -42,4 +42,4 @@ UPDATE Grants
         archive_date = COALESCE(%(archive_date)s, archive_date),
         date_closed = COALESCE(%(date_closed)s, date_closed),
         last_update_date = COALESCE(%(last_update_date)s, last_update_date)
-WHERE grant_id = UUID_TO_BIN(%(grant_id)s);
\ No newline at end of file
+WHERE grant_id = UUID_TO_BIN(%(grant_id)s, 1);
\ No newline at end of file
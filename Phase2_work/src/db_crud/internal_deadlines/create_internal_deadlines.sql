@@ -33,7 +33,7 @@ INSERT INTO InternalDeadlines (
     task_description,
     completed
 ) VALUES (
-    UUID_TO_BIN(%(application_id)s),
+    UUID_TO_BIN(%(application_id)s, 1),
     TRIM(%(deadline_name)s),
     %(deadline_date)s,
     %(task_description)s,
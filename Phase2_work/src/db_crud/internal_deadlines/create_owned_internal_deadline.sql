@@ -0,0 +1,43 @@
+/*
+    create_owned_internal_deadline.sql
+    Author: Colby Wirth
+    Version: 19 October 2026
+    Description: Insert a task for an application in one statement, only if
+        - the application belongs to the requesting user,
+        - the application is still 'started', and
+        - the deadline is not after the grant's closing date.
+    rowcount 0 means one of the conditions failed.
+
+    Parameters:
+        - internal_deadline_id: UUID string generated by the caller (required)
+        - application_id: UUID string of the application (required)
+        - user_id: UUID string of the requesting user (required)
+        - deadline_name: Name of the task (required)
+        - task_description: Description of the task (optional)
+        - deadline_date: Due date of the task (required)
+        - created_at: Creation timestamp, also used as updated_at (required)
+*/
+
+INSERT INTO InternalDeadlines (
+    internal_deadline_id,
+    application_id,
+    deadline_name,
+    task_description,
+    deadline_date,
+    created_at,
+    updated_at
+)
+SELECT
+    UUID_TO_BIN(%(internal_deadline_id)s, 1),
+    a.application_id,
+    %(deadline_name)s,
+    %(task_description)s,
+    %(deadline_date)s,
+    %(created_at)s,
+    %(created_at)s
+FROM Applications a
+JOIN Grants g ON a.grant_id = g.grant_id
+WHERE a.application_id = UUID_TO_BIN(%(application_id)s, 1)
+  AND a.user_id = UUID_TO_BIN(%(user_id)s, 1)
+  AND a.submission_status = 'started'
+  AND (g.date_closed IS NULL OR %(deadline_date)s <= g.date_closed);
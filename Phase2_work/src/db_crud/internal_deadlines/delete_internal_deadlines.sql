@@ -11,4 +11,4 @@
 */
 
 DELETE FROM InternalDeadlines
-WHERE internal_deadline_id = UUID_TO_BIN(%s);
+WHERE internal_deadline_id = UUID_TO_BIN(%s, 1);
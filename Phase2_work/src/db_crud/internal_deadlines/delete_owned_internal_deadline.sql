@@ -0,0 +1,20 @@
+/*
+    delete_owned_internal_deadline.sql
+    Author: Colby Wirth
+    Version: 19 October 2026
+    Description: Delete a task only if its application belongs to the requesting user and is
+        still 'started'.  rowcount 0 means one of the conditions failed.
+
+    Parameters:
+        - internal_deadline_id: UUID string of the task (required)
+        - application_id: UUID string of the application (required)
+        - user_id: UUID string of the requesting user (required)
+*/
+
+DELETE d
+FROM InternalDeadlines d
+JOIN Applications a ON a.application_id = d.application_id
+WHERE d.internal_deadline_id = UUID_TO_BIN(%(internal_deadline_id)s, 1)
+  AND d.application_id = UUID_TO_BIN(%(application_id)s, 1)
+  AND a.user_id = UUID_TO_BIN(%(user_id)s, 1)
+  AND a.submission_status = 'started';
@@ -0,0 +1,27 @@
+/*
+    select_dashboard_task_counts.sql
+    Author: Colby Wirth
+    Version: 19 October 2026
+    Description: Task counts of every application of a user, in one grouped pass over their
+        tasks (idx_application_user, then idx_deadline_application), for GET /api/user/dashboard.
+        Applications without tasks have no row.
+
+    Parameters:
+        - user_id: The UUID string of the user (required, positional)
+
+    Returns:
+        application_id, task_count, completed_count, overdue_count (open tasks due before
+        today), next_deadline (earliest open task due today or later)
+*/
+
+SELECT
+    BIN_TO_UUID(a.application_id, 1) AS application_id,
+    COUNT(*) AS task_count,
+    SUM(d.completed) AS completed_count,
+    SUM(NOT d.completed AND d.deadline_date < CURDATE()) AS overdue_count,
+    DATE_FORMAT(MIN(CASE WHEN NOT d.completed AND d.deadline_date >= CURDATE() THEN d.deadline_date END),
+                '%Y-%m-%d') AS next_deadline
+FROM Applications a
+JOIN InternalDeadlines d ON d.application_id = a.application_id
+WHERE a.user_id = UUID_TO_BIN(%s, 1)
+GROUP BY a.application_id;
@@ -14,8 +14,8 @@
 */
 
 SELECT
-    BIN_TO_UUID(internal_deadline_id) AS internal_deadline_id,
-    BIN_TO_UUID(application_id) AS application_id,
+    BIN_TO_UUID(internal_deadline_id, 1) AS internal_deadline_id,
+    BIN_TO_UUID(application_id, 1) AS application_id,
     deadline_name,
     DATE_FORMAT(deadline_date, '%Y-%m-%d') AS deadline_date,
     task_description,
@@ -23,5 +23,5 @@ SELECT
     created_at,
     updated_at
 FROM InternalDeadlines
-WHERE application_id = UUID_TO_BIN(%s)
+WHERE application_id = UUID_TO_BIN(%s, 1)
 ORDER BY deadline_date ASC;
@@ -8,8 +8,8 @@
 */
 
 SELECT
-    BIN_TO_UUID(internal_deadline_id) AS internal_deadline_id,
-    BIN_TO_UUID(application_id) AS application_id,
+    BIN_TO_UUID(internal_deadline_id, 1) AS internal_deadline_id,
+    BIN_TO_UUID(application_id, 1) AS application_id,
     deadline_name,
     deadline_date,
     task_description,
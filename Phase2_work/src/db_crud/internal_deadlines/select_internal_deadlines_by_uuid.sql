@@ -14,8 +14,8 @@
 */
 
 SELECT
-    BIN_TO_UUID(internal_deadline_id) AS internal_deadline_id,
-    BIN_TO_UUID(application_id) AS application_id,
+    BIN_TO_UUID(internal_deadline_id, 1) AS internal_deadline_id,
+    BIN_TO_UUID(application_id, 1) AS application_id,
     deadline_name,
     deadline_date,
     task_description,
@@ -23,4 +23,4 @@ SELECT
     created_at,
     updated_at
 FROM InternalDeadlines
-WHERE internal_deadline_id = UUID_TO_BIN(%s);
+WHERE internal_deadline_id = UUID_TO_BIN(%s, 1);
@@ -0,0 +1,30 @@
+/*
+    select_owned_internal_deadlines.sql
+    Author: Colby Wirth
+    Version: 19 October 2026
+    Description: Select the tasks of an application together with the ownership check.
+        No rows: the application does not exist or belongs to someone else.
+        One row with a NULL task_id: the application is owned but has no tasks.
+
+    Parameters:
+        - application_id: The UUID string of the application (required, positional)
+        - user_id: The UUID string of the requesting user (required, positional)
+
+    Returns:
+        task_id, application_id, deadline_name, task_description, deadline, completed,
+        created_at, updated_at ordered by deadline
+*/
+
+SELECT
+    BIN_TO_UUID(d.internal_deadline_id, 1) AS task_id,
+    BIN_TO_UUID(a.application_id, 1) AS application_id,
+    d.deadline_name,
+    d.task_description,
+    DATE_FORMAT(d.deadline_date, '%Y-%m-%d') AS deadline,
+    d.completed,
+    d.created_at,
+    d.updated_at
+FROM Applications a
+LEFT JOIN InternalDeadlines d ON d.application_id = a.application_id
+WHERE a.application_id = UUID_TO_BIN(%s, 1) AND a.user_id = UUID_TO_BIN(%s, 1)
+ORDER BY d.deadline_date ASC;
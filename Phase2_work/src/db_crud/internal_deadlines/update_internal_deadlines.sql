@@ -34,9 +34,9 @@ SET
     completed = COALESCE(%(completed)s, completed),
     application_id = COALESCE(
         CASE
-            WHEN %(application_id)s IS NOT NULL THEN UUID_TO_BIN(%(application_id)s)
+            WHEN %(application_id)s IS NOT NULL THEN UUID_TO_BIN(%(application_id)s, 1)
             ELSE NULL
         END,
         application_id
     )
-WHERE internal_deadline_id = UUID_TO_BIN(%(internal_deadline_id)s);
+WHERE internal_deadline_id = UUID_TO_BIN(%(internal_deadline_id)s, 1);
@@ -0,0 +1,14 @@
+/*
+  create_query_flight.sql
+  Author: Colby Wirth
+  Version: 19 October 2026
+  Description: Store a response for the other workers, replacing an expired one
+
+  Parameters:
+    - flight_key: Digest of the cache key (required)
+    - body: The response body (required)
+    - ttl: Seconds the response is kept (required)
+*/
+
+REPLACE INTO QueryFlights (flight_key, body, expires_at)
+VALUES (%s, %s, NOW(3) + INTERVAL %s SECOND);
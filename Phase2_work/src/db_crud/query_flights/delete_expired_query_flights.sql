@@ -0,0 +1,8 @@
+/*
+  delete_expired_query_flights.sql
+  Author: Colby Wirth
+  Version: 19 October 2026
+  Description: Drop expired shared responses, a few at a time (idx_query_flights_expires)
+*/
+
+DELETE FROM QueryFlights WHERE expires_at <= NOW(3) LIMIT 100;
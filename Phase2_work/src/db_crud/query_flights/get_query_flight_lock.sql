@@ -0,0 +1,15 @@
+/*
+  get_query_flight_lock.sql
+  Author: Colby Wirth
+  Version: 19 October 2026
+  Description: Take the MySQL named lock of a cache key, waiting for the worker holding it
+
+  Parameters:
+    - name: gg_flight_ and the digest of the cache key (required)
+    - timeout: Seconds to wait (required)
+
+  Returns:
+    1 when granted, 0 on timeout
+*/
+
+SELECT GET_LOCK(%s, %s);
@@ -0,0 +1,11 @@
+/*
+  release_query_flight_lock.sql
+  Author: Colby Wirth
+  Version: 19 October 2026
+  Description: Release the MySQL named lock of a cache key
+
+  Parameters:
+    - name: gg_flight_ and the digest of the cache key (required)
+*/
+
+SELECT RELEASE_LOCK(%s);
@@ -0,0 +1,14 @@
+/*
+  select_query_flight.sql
+  Author: Colby Wirth
+  Version: 19 October 2026
+  Description: The response another worker stored for a cache key, unless it expired
+
+  Parameters:
+    - flight_key: Digest of the cache key (required)
+
+  Returns:
+    body, or no row
+*/
+
+SELECT body FROM QueryFlights WHERE flight_key = %s AND expires_at > NOW(3);
@@ -16,7 +16,7 @@ ON DUPLICATE KEY UPDATE research_field_id = LAST_INSERT_ID(research_field_id);
 
 -- Map user to research field (convert UUID string back to binary)
 INSERT INTO UserResearchFields (user_id, research_field_id)
-VALUES (UUID_TO_BIN(%(user_id)s), LAST_INSERT_ID())
+VALUES (UUID_TO_BIN(%(user_id)s, 1), LAST_INSERT_ID())
 ON DUPLICATE KEY UPDATE user_id = user_id;
 
 -- Return the ID of the inserted or existing research field
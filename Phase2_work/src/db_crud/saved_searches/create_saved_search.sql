@@ -0,0 +1,22 @@
+/*
+  create_saved_search.sql
+  Author: Colby Wirth
+  Version: 19 October 2026
+  Description: Save a search for a user.  It records the current GrantChangeLog position, so
+               percolation matches it only against grants changed after it was saved.
+
+  Parameters:
+    - search_id: UUID string generated by the caller (required)
+    - user_id: UUID string of the owner (required)
+    - name: Display name (required)
+    - query_string: Normalized search_grants query string (required)
+*/
+
+INSERT INTO SavedSearches (search_id, user_id, name, query_string, created_change_id)
+SELECT
+    UUID_TO_BIN(%(search_id)s, 1),
+    UUID_TO_BIN(%(user_id)s, 1),
+    %(name)s,
+    %(query_string)s,
+    COALESCE(MAX(change_id), 0)
+FROM GrantChangeLog;
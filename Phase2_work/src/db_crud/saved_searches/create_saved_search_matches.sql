@@ -0,0 +1,16 @@
+/*
+  create_saved_search_matches.sql
+  Author: Colby Wirth
+  Version: 19 October 2026
+  Description: Add a grant to a user's inbox for one saved search.  A grant changed again after
+               it matched is already listed and is skipped, as is a match whose search or grant
+               was deleted while percolation ran (IGNORE).
+
+  Parameters:
+    - search_id: The UUID string of the saved search (required)
+    - user_id: The UUID string of its owner (required)
+    - grant_id: The UUID string of the matching grant (required)
+*/
+
+INSERT IGNORE INTO SavedSearchMatches (search_id, user_id, grant_id)
+VALUES (UUID_TO_BIN(%s, 1), UUID_TO_BIN(%s, 1), UUID_TO_BIN(%s, 1));
@@ -0,0 +1,14 @@
+/*
+  delete_owned_saved_search.sql
+  Author: Colby Wirth
+  Version: 19 October 2026
+  Description: Delete a saved search, and its inbox entries, only if it belongs to the user.
+               rowcount 0 means the search does not exist or belongs to someone else.
+
+  Parameters:
+    - search_id: The UUID string of the saved search (required)
+    - user_id: The UUID string of the requesting user (required)
+*/
+
+DELETE FROM SavedSearches
+WHERE search_id = UUID_TO_BIN(%(search_id)s, 1) AND user_id = UUID_TO_BIN(%(user_id)s, 1);
@@ -0,0 +1,11 @@
+/*
+  select_percolation_position.sql
+  Author: Colby Wirth
+  Version: 19 October 2026
+  Description: The last GrantChangeLog change_id saved search percolation has applied
+
+  Returns:
+    change_id, or no row before the first run
+*/
+
+SELECT change_id FROM SavedSearchPercolation WHERE percolator_id = 1;
@@ -0,0 +1,33 @@
+/*
+  select_saved_search_inbox.sql
+  Author: Colby Wirth
+  Version: 19 October 2026
+  Description: A page of a user's saved search inbox, newest match first.  One range of
+               idx_saved_search_matches_inbox (user_id, match_id), then primary key lookups of
+               the grant and the search for each row of the page.
+
+  Parameters:
+    - user_id: The UUID string of the user (required)
+    - match_id: Only matches older than this one; the last match_id of the previous page, or
+                18446744073709551615 for the first page (required)
+    - limit: The page size (required)
+
+  Returns:
+    match_id, search_id, search name, grant_id, grant_title, provider, date_closed, matched_at
+*/
+
+SELECT
+    m.match_id,
+    BIN_TO_UUID(m.search_id, 1) AS search_id,
+    s.name AS search_name,
+    BIN_TO_UUID(m.grant_id, 1) AS grant_id,
+    g.grant_title,
+    g.provider,
+    DATE_FORMAT(g.date_closed, '%Y-%m-%d') AS date_closed,
+    m.matched_at
+FROM SavedSearchMatches AS m
+JOIN Grants AS g ON g.grant_id = m.grant_id
+JOIN SavedSearches AS s ON s.search_id = m.search_id
+WHERE m.user_id = UUID_TO_BIN(%s, 1) AND m.match_id < %s
+ORDER BY m.match_id DESC
+LIMIT %s;
@@ -0,0 +1,21 @@
+/*
+  select_saved_searches_by_user.sql
+  Author: Colby Wirth
+  Version: 19 October 2026
+  Description: A user's saved searches, newest first
+
+  Parameters:
+    - user_id: The UUID string of the user (required)
+
+  Returns:
+    search_id, name, query_string, created_at
+*/
+
+SELECT
+    BIN_TO_UUID(search_id, 1) AS search_id,
+    name,
+    query_string,
+    created_at
+FROM SavedSearches
+WHERE user_id = UUID_TO_BIN(%s, 1)
+ORDER BY created_at DESC;
@@ -0,0 +1,16 @@
+/*
+  select_saved_searches_for_percolation.sql
+  Author: Colby Wirth
+  Version: 19 October 2026
+  Description: Every saved search, read once per percolation run to build the query index
+
+  Returns:
+    search_id, user_id, query_string, created_change_id
+*/
+
+SELECT
+    BIN_TO_UUID(search_id, 1) AS search_id,
+    BIN_TO_UUID(user_id, 1) AS user_id,
+    query_string,
+    created_change_id
+FROM SavedSearches;
@@ -0,0 +1,13 @@
+/*
+  update_percolation_position.sql
+  Author: Colby Wirth
+  Version: 19 October 2026
+  Description: Record the GrantChangeLog change_id percolation has applied up to
+
+  Parameters:
+    - change_id: The position (required)
+*/
+
+INSERT INTO SavedSearchPercolation (percolator_id, change_id)
+VALUES (1, %(change_id)s)
+ON DUPLICATE KEY UPDATE change_id = %(change_id)s;
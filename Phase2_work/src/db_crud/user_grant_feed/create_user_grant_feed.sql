@@ -0,0 +1,16 @@
+/*
+  create_user_grant_feed.sql
+  Author: Colby Wirth
+  Version: 19 October 2026
+  Description: Add a grant to a user's feed.  A row whose user or grant was deleted while the
+               feed was refreshed is skipped (IGNORE).
+
+  Parameters:
+    - user_id: The UUID string of the user (required)
+    - grant_id: The UUID string of the grant (required)
+    - score: 0-1000 points (required)
+    - reasons: Bitmask of src.utils.recommendations.REASONS (required)
+*/
+
+INSERT IGNORE INTO UserGrantFeed (user_id, grant_id, score, reasons)
+VALUES (UUID_TO_BIN(%s, 1), UUID_TO_BIN(%s, 1), %s, %s);
@@ -0,0 +1,12 @@
+/*
+  delete_user_grant_feed_by_grant.sql
+  Author: Colby Wirth
+  Version: 19 October 2026
+  Description: Remove a changed grant from every user's feed before it is scored again
+               (idx_user_grant_feed_grant)
+
+  Parameters:
+    - grant_id: The UUID string of the grant (required)
+*/
+
+DELETE FROM UserGrantFeed WHERE grant_id = UUID_TO_BIN(%s, 1);
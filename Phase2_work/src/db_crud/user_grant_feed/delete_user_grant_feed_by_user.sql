@@ -0,0 +1,11 @@
+/*
+  delete_user_grant_feed_by_user.sql
+  Author: Colby Wirth
+  Version: 19 October 2026
+  Description: Empty a user's feed before it is rebuilt
+
+  Parameters:
+    - user_id: The UUID string of the user (required)
+*/
+
+DELETE FROM UserGrantFeed WHERE user_id = UUID_TO_BIN(%s, 1);
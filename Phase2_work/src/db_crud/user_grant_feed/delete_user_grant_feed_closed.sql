@@ -0,0 +1,12 @@
+/*
+  delete_user_grant_feed_closed.sql
+  Author: Colby Wirth
+  Version: 19 October 2026
+  Description: Remove grants that have closed from every feed.  Closing is not a change to the
+               grant, so it is not in GrantChangeLog; the closed grants are found by
+               idx_grants_date_closed_id_award and their feed rows by idx_user_grant_feed_grant.
+*/
+
+DELETE f FROM UserGrantFeed AS f
+JOIN Grants AS g ON g.grant_id = f.grant_id
+WHERE g.date_closed < CURDATE();
@@ -0,0 +1,23 @@
+/*
+  delete_user_grant_feed_overflow.sql
+  Author: Colby Wirth
+  Version: 19 October 2026
+  Description: Trim a user's feed to its best rows after changed grants were added to it.  The
+               rows past the limit are read backwards along idx_user_grant_feed_rank; the LIMIT
+               keeps the derived table materialized, so it may read the table being deleted from.
+
+  Parameters:
+    - user_id: The UUID string of the user (required)
+    - feed_size: The number of rows to keep (required)
+    - user_id: The same UUID string again (required)
+*/
+
+DELETE f FROM UserGrantFeed AS f
+JOIN (
+    SELECT grant_id
+    FROM UserGrantFeed
+    WHERE user_id = UUID_TO_BIN(%s, 1)
+    ORDER BY score DESC, grant_id DESC
+    LIMIT 18446744073709551615 OFFSET %s
+) AS overflow ON overflow.grant_id = f.grant_id
+WHERE f.user_id = UUID_TO_BIN(%s, 1);
@@ -0,0 +1,29 @@
+/*
+  select_changed_grants_for_feed.sql
+  Author: Colby Wirth
+  Version: 19 October 2026
+  Description: Grants changed after a given change log position, with the columns the feed
+               scores on
+
+  Parameters:
+    - change_id: The last GrantChangeLog.change_id already applied (required)
+    - limit: The maximum number of changes to return (required)
+
+  Returns:
+    change_id, grant_id, grant_title, research_field, provider, eligibility, and is_open
+    (1 when the grant exists and has not closed, else 0)
+*/
+
+SELECT
+    c.change_id,
+    BIN_TO_UUID(c.grant_id, 1) AS grant_id,
+    g.grant_title,
+    g.research_field,
+    g.provider,
+    g.eligibility,
+    g.grant_id IS NOT NULL AND (g.date_closed IS NULL OR g.date_closed >= CURDATE()) AS is_open
+FROM GrantChangeLog AS c
+LEFT JOIN Grants AS g ON g.grant_id = c.grant_id
+WHERE c.change_id > %s
+ORDER BY c.change_id
+LIMIT %s;
@@ -0,0 +1,19 @@
+/*
+  select_feed_applications.sql
+  Author: Colby Wirth
+  Version: 19 October 2026
+  Description: The grant of every application, with the provider and research field the feed
+               scores past applications on
+
+  Returns:
+    user_id, grant_id, provider, research_field
+*/
+
+SELECT
+    BIN_TO_UUID(a.user_id, 1) AS user_id,
+    BIN_TO_UUID(a.grant_id, 1) AS grant_id,
+    g.provider,
+    g.research_field
+FROM Applications AS a
+JOIN Grants AS g ON g.grant_id = a.grant_id
+WHERE a.user_id IS NOT NULL;
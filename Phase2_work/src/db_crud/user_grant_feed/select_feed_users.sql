@@ -0,0 +1,19 @@
+/*
+  select_feed_users.sql
+  Author: Colby Wirth
+  Version: 19 October 2026
+  Description: Every user's institution and research fields, read by
+               system_functions/refresh_user_grant_feed.py
+
+  Returns:
+    user_id, institution, research_field; one row per research field, or one row with a NULL
+    research_field for a user without any
+*/
+
+SELECT
+    BIN_TO_UUID(u.user_id, 1) AS user_id,
+    u.institution,
+    rf.research_field
+FROM Users AS u
+LEFT JOIN UserResearchFields AS urf ON urf.user_id = u.user_id
+LEFT JOIN ResearchField AS rf ON rf.research_field_id = urf.research_field_id;
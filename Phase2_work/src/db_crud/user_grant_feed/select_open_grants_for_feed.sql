@@ -0,0 +1,14 @@
+/*
+  select_open_grants_for_feed.sql
+  Author: Colby Wirth
+  Version: 19 October 2026
+  Description: Every open grant (no close date, or closing today or later) with the columns the
+               feed scores on, read when a user's feed is rebuilt
+
+  Returns:
+    grant_id, grant_title, research_field, provider, eligibility
+*/
+
+SELECT BIN_TO_UUID(grant_id, 1) AS grant_id, grant_title, research_field, provider, eligibility
+FROM Grants
+WHERE date_closed IS NULL OR date_closed >= CURDATE();
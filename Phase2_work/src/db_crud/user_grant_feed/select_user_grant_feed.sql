@@ -0,0 +1,36 @@
+/*
+  select_user_grant_feed.sql
+  Author: Colby Wirth
+  Version: 19 October 2026
+  Description: A page of a user's recommended grants, best first.  One range of
+               idx_user_grant_feed_rank (user_id, score, grant_id) read backwards from the
+               previous page's last row, then a primary key lookup of each grant.  Grants that
+               closed since the last refresh are skipped.
+
+  Parameters:
+    - user_id: The UUID string of the user (required)
+    - score: The last score of the previous page, or 65536 for the first page (required)
+    - score: The same value again (required)
+    - grant_id: The last grant_id of the previous page; any UUID string for the first page (required)
+    - limit: The page size (required)
+
+  Returns:
+    grant_id, score, reasons, grant_title, provider, research_field, date_closed, award_max_amount
+*/
+
+SELECT
+    BIN_TO_UUID(f.grant_id, 1) AS grant_id,
+    f.score,
+    f.reasons,
+    g.grant_title,
+    g.provider,
+    g.research_field,
+    DATE_FORMAT(g.date_closed, '%Y-%m-%d') AS date_closed,
+    g.award_max_amount
+FROM UserGrantFeed AS f
+JOIN Grants AS g ON g.grant_id = f.grant_id
+WHERE f.user_id = UUID_TO_BIN(%s, 1)
+  AND (f.score < %s OR (f.score = %s AND f.grant_id < UUID_TO_BIN(%s, 1)))
+  AND (g.date_closed IS NULL OR g.date_closed >= CURDATE())
+ORDER BY f.score DESC, f.grant_id DESC
+LIMIT %s;
@@ -0,0 +1,11 @@
+/*
+  select_user_grant_feed_position.sql
+  Author: Colby Wirth
+  Version: 19 October 2026
+  Description: The last GrantChangeLog change_id the user grant feed has applied
+
+  Returns:
+    change_id, or no row before the first run
+*/
+
+SELECT change_id FROM UserGrantFeedPosition WHERE feed_id = 1;
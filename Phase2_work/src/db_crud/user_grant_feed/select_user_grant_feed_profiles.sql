@@ -0,0 +1,12 @@
+/*
+  select_user_grant_feed_profiles.sql
+  Author: Colby Wirth
+  Version: 19 October 2026
+  Description: The profile digest each user's feed was last built from
+
+  Returns:
+    user_id, profile_digest
+*/
+
+SELECT BIN_TO_UUID(user_id, 1) AS user_id, profile_digest
+FROM UserGrantFeedProfiles;
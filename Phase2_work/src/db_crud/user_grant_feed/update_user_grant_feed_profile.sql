@@ -0,0 +1,14 @@
+/*
+  update_user_grant_feed_profile.sql
+  Author: Colby Wirth
+  Version: 19 October 2026
+  Description: Record the profile digest a user's feed was rebuilt from
+
+  Parameters:
+    - user_id: The UUID string of the user (required)
+    - profile_digest: src.utils.recommendations.UserProfile.digest (required)
+*/
+
+INSERT INTO UserGrantFeedProfiles (user_id, profile_digest)
+VALUES (UUID_TO_BIN(%s, 1), %s)
+ON DUPLICATE KEY UPDATE profile_digest = VALUES(profile_digest);
@@ -5,6 +5,8 @@
   Description: Insert a new user with trimmed and normalized fields
 
   Parameters:
+    - user_id: UUID string generated by the caller (required), so the id is known
+      without reading it back
     - f_name: First name (required)
     - m_name: Middle name (optional, can be NULL)
     - l_name: Last name (required)
@@ -12,10 +14,11 @@
     - email: Email address (required, unique)
     - password: Hashed password (required)
   
-  Returns: The newly created user_id as binary UUID
+  Returns: Nothing; the caller already holds the new user_id
 */
 
 INSERT INTO Users (
+    user_id,
     f_name,
     m_name,
     l_name,
@@ -23,6 +26,7 @@ INSERT INTO Users (
     email,
     password
 ) VALUES (
+    UUID_TO_BIN(%(user_id)s, 1),
     TRIM(%(f_name)s),
     TRIM(%(m_name)s),
     TRIM(%(l_name)s),
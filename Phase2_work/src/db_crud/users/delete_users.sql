@@ -9,4 +9,4 @@
 */
 
 DELETE FROM Users
-WHERE user_id = UUID_TO_BIN(%s);
+WHERE user_id = UUID_TO_BIN(%s, 1);
@@ -12,7 +12,7 @@
 */
 
 SELECT 
-    BIN_TO_UUID(user_id) as useer_id,
+    BIN_TO_UUID(user_id, 1) as useer_id,
     password
 	
 FROM Users
@@ -12,7 +12,7 @@
 */
 
 SELECT 
-    BIN_TO_UUID(user_id) AS user_id,
+    BIN_TO_UUID(user_id, 1) AS user_id,
     f_name,
     m_name,
     l_name,
@@ -20,4 +20,4 @@ SELECT
     email,
     password
 FROM Users
-WHERE user_id = UUID_TO_BIN(%s);
+WHERE user_id = UUID_TO_BIN(%s, 1);
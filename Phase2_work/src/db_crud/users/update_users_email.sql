@@ -12,4 +12,4 @@
 UPDATE Users
 SET
     email = %(email)s
-WHERE user_id = UUID_TO_BIN(%(user_id)s);
+WHERE user_id = UUID_TO_BIN(%(user_id)s, 1);
@@ -18,4 +18,4 @@ SET
     m_name = COALESCE(%(m_name)s, m_name),
     l_name = COALESCE(%(l_name)s, l_name),
     institution = COALESCE(%(institution)s, institution)
-WHERE user_id = UUID_TO_BIN(%(user_id)s);
+WHERE user_id = UUID_TO_BIN(%(user_id)s, 1);
@@ -12,5 +12,5 @@
 
 UPDATE Users
 SET password = %(new_password)s
-WHERE user_id = UUID_TO_BIN(%(user_id)s)
+WHERE user_id = UUID_TO_BIN(%(user_id)s, 1)
   AND password = %(old_password)s;
@@ -0,0 +1,30 @@
+/*
+    Migration: Add the Grants change log
+    Version: 19 October 2026
+    Author: Colby Wirth
+    Description: Adds GrantChangeLog and the triggers that fill it (see
+                 db_creation/create_relations_commands/06_create_grant_change_log.sql) to databases
+                 created before them.  Without it the API's search index is only built at startup
+                 and misses grants ingested while it runs.
+
+                 With binary logging on, creating triggers needs the TRIGGER privilege and either
+                 SUPER or log_bin_trust_function_creators = 1.
+*/
+
+CREATE TABLE GrantChangeLog (
+    change_id BIGINT UNSIGNED AUTO_INCREMENT PRIMARY KEY,
+    grant_id BINARY(16) NOT NULL,
+    change_type ENUM('upsert', 'delete') NOT NULL,
+    changed_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX idx_grant_change_log_changed_at ON GrantChangeLog (changed_at);
+
+CREATE TRIGGER trg_grants_after_insert AFTER INSERT ON Grants FOR EACH ROW
+    INSERT INTO GrantChangeLog (grant_id, change_type) VALUES (NEW.grant_id, 'upsert');
+
+CREATE TRIGGER trg_grants_after_update AFTER UPDATE ON Grants FOR EACH ROW
+    INSERT INTO GrantChangeLog (grant_id, change_type) VALUES (NEW.grant_id, 'upsert');
+
+CREATE TRIGGER trg_grants_after_delete AFTER DELETE ON Grants FOR EACH ROW
+    INSERT INTO GrantChangeLog (grant_id, change_type) VALUES (OLD.grant_id, 'delete');
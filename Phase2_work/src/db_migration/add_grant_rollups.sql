@@ -0,0 +1,22 @@
+/*
+    Migration: Add the grant rollups
+    Version: 19 October 2026
+    Author: Colby Wirth
+    Description: Adds GrantRollups
+                 (db_creation/create_relations_commands/11_create_grant_rollups.sql) to an
+                 existing database.  Fill it with
+                 python -m src.system_functions.rebuild_grant_rollups
+*/
+
+CREATE TABLE GrantRollups (
+    dimension ENUM('month', 'provider', 'research_field') NOT NULL,
+    -- first day of the month the grants were posted in
+    month_posted DATE NOT NULL,
+    -- the provider or research field; '' for the month totals and for grants without one
+    value VARCHAR(255) NOT NULL,
+    grant_count INT UNSIGNED NOT NULL,
+    program_funding BIGINT UNSIGNED NOT NULL,
+
+    -- a date range of one dimension is one range of the key
+    PRIMARY KEY (dimension, month_posted, value)
+);
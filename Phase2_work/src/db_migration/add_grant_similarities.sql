@@ -0,0 +1,19 @@
+/*
+    Migration: Add precomputed grant similarities
+    Version: 19 October 2026
+    Author: Colby Wirth
+    Description: Adds GrantSimilarities (db_creation/create_relations_commands/07_create_grant_similarities.sql)
+                 to an existing database.  Fill it with
+                 python -m src.system_functions.compute_grant_similarities
+*/
+
+CREATE TABLE GrantSimilarities (
+    grant_id BINARY(16) NOT NULL,
+    similarity_rank TINYINT UNSIGNED NOT NULL,
+    similar_grant_id BINARY(16) NOT NULL,
+    score FLOAT NOT NULL,
+
+    PRIMARY KEY (grant_id, similarity_rank),
+    FOREIGN KEY (grant_id) REFERENCES Grants(grant_id) ON DELETE CASCADE,
+    FOREIGN KEY (similar_grant_id) REFERENCES Grants(grant_id) ON DELETE CASCADE
+);
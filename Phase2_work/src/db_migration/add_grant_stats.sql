@@ -0,0 +1,44 @@
+/*
+    Migration: Add the grant statistics
+    Version: 19 October 2026
+    Author: Colby Wirth
+    Description: Adds GrantStats and GrantFieldStats
+                 (db_creation/create_relations_commands/10_create_grant_stats.sql) to an existing
+                 database and fills them from Grants.  Run it while nothing is writing Grants;
+                 python -m src.system_functions.refresh_grant_stats --rebuild repairs them later.
+*/
+
+CREATE TABLE GrantStats (
+    stats_id TINYINT UNSIGNED PRIMARY KEY,
+    grant_count BIGINT NOT NULL,
+    open_count BIGINT NOT NULL,
+    program_funding BIGINT NOT NULL,
+    -- grants closing on or after this date are counted as open
+    open_as_of DATE NOT NULL,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+);
+
+CREATE TABLE GrantFieldStats (
+    research_field VARCHAR(250) PRIMARY KEY,
+    grant_count BIGINT NOT NULL,
+    open_count BIGINT NOT NULL,
+    program_funding BIGINT NOT NULL
+);
+
+INSERT INTO GrantStats (stats_id, grant_count, open_count, program_funding, open_as_of)
+SELECT
+    1,
+    COUNT(*),
+    COALESCE(SUM(date_closed IS NULL OR date_closed >= CURDATE()), 0),
+    COALESCE(SUM(program_funding), 0),
+    CURDATE()
+FROM Grants;
+
+INSERT INTO GrantFieldStats (research_field, grant_count, open_count, program_funding)
+SELECT
+    COALESCE(research_field, ''),
+    COUNT(*),
+    SUM(date_closed IS NULL OR date_closed >= CURDATE()),
+    COALESCE(SUM(program_funding), 0)
+FROM Grants
+GROUP BY COALESCE(research_field, '');
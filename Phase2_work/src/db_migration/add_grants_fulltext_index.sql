@@ -0,0 +1,13 @@
+/*
+    Migration: Add the Grants FULLTEXT index
+    Version: 19 October 2026
+    Author: Colby Wirth
+    Description: Adds the FULLTEXT index that /api/public/search_grants matches keywords against.
+                 Databases created before it was part of 01_create_grants_entity.sql need it, or
+                 every keyword search fails with "Can't find FULLTEXT index matching the column list".
+
+                 Building the first FULLTEXT index on a table rebuilds the table (it adds the
+                 hidden FTS_DOC_ID column), so run it outside busy hours on a large Grants table.
+*/
+
+CREATE FULLTEXT INDEX ft_grants_title_description ON Grants (grant_title, description);
@@ -0,0 +1,19 @@
+/*
+    Migration: Replace the Grants sort indexes with keyset indexes
+    Version: 19 October 2026
+    Author: Colby Wirth
+    Description: search_grants now orders every sort by (column, grant_id) and pages with keyset
+                 cursors.  The (column, grant_id) indexes serve both the order and the cursor's
+                 seek as one range read.  They replace the single-column indexes from
+                 add_grants_sort_indexes.sql, which would only duplicate them.
+
+    Verify with: python -m src.test_suites.query_plan_regression_test_suite
+*/
+
+CREATE INDEX idx_grants_title_id ON Grants (grant_title, grant_id);
+CREATE INDEX idx_grants_date_posted_id ON Grants (date_posted, grant_id);
+CREATE INDEX idx_grants_date_closed_id ON Grants (date_closed, grant_id);
+
+DROP INDEX idx_grants_title ON Grants;
+DROP INDEX idx_grants_date_posted ON Grants;
+DROP INDEX idx_grants_date_closed ON Grants;
@@ -0,0 +1,27 @@
+/*
+    Migration: Add the Grants range filter indexes
+    Version: 19 October 2026
+    Author: Colby Wirth
+    Description: search_grants filters on award_max_amount, award_min_amount, program_funding,
+                 date_posted and date_closed ranges (src/utils/range_filters.py).
+                 - One index per amount column turns an amount bound into a range scan.
+                 - The (date, grant_id) keyset indexes gain award_max_amount as a trailing
+                   column.  They still serve ORDER BY date, grant_id and keyset cursors.  A date
+                   range or date sort combined with an award bound is checked inside the index
+                   (index condition pushdown), and COUNT(*) of such a filter never reads a row.
+                 The new date indexes replace those from add_grants_keyset_indexes.sql, which
+                 they extend.
+
+    Verify with: python -m src.test_suites.query_plan_regression_test_suite
+    Benchmark:   python -m src.query_analysis.range_filter_benchmark
+*/
+
+CREATE INDEX idx_grants_award_max ON Grants (award_max_amount);
+CREATE INDEX idx_grants_award_min ON Grants (award_min_amount);
+CREATE INDEX idx_grants_program_funding ON Grants (program_funding);
+
+CREATE INDEX idx_grants_date_posted_id_award ON Grants (date_posted, grant_id, award_max_amount);
+CREATE INDEX idx_grants_date_closed_id_award ON Grants (date_closed, grant_id, award_max_amount);
+
+DROP INDEX idx_grants_date_posted_id ON Grants;
+DROP INDEX idx_grants_date_closed_id ON Grants;
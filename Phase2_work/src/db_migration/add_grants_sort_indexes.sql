@@ -0,0 +1,14 @@
+/*
+    Migration: Add Grants sort indexes
+    Version: 19 October 2026
+    Author: Colby Wirth
+    Description: Adds the indexes behind the search sort orders (title, date posted, date closed)
+                 to databases created before they were part of 01_create_grants_entity.sql.
+                 Without them every search page is a full scan of Grants followed by a filesort.
+
+    Verify with: python -m src.test_suites.query_plan_regression_test_suite
+*/
+
+CREATE INDEX idx_grants_title ON Grants (grant_title);
+CREATE INDEX idx_grants_date_posted ON Grants (date_posted);
+CREATE INDEX idx_grants_date_closed ON Grants (date_closed);
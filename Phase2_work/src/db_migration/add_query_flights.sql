@@ -0,0 +1,18 @@
+/*
+    Migration: Add the query flights table
+    Version: 19 October 2026
+    Author: Colby Wirth
+    Description: Adds QueryFlights
+                 (db_creation/create_relations_commands/12_create_query_flights.sql) to an
+                 existing database, needed only when the API runs with GG_SINGLE_FLIGHT_DB=1.
+*/
+
+CREATE TABLE QueryFlights (
+    -- api.single_flight.flight_digest() of the response cache key (generation, path, query)
+    flight_key CHAR(32) PRIMARY KEY,
+    body MEDIUMBLOB NOT NULL,
+    expires_at TIMESTAMP(3) NOT NULL
+);
+
+-- each store first drops the expired rows
+CREATE INDEX idx_query_flights_expires ON QueryFlights (expires_at);
@@ -0,0 +1,43 @@
+/*
+    Migration: Add saved searches and their inbox
+    Version: 19 October 2026
+    Author: Colby Wirth
+    Description: Adds SavedSearches, SavedSearchMatches and SavedSearchPercolation
+                 (db_creation/create_relations_commands/08_create_saved_searches.sql) to an
+                 existing database.  Requires GrantChangeLog (add_grant_change_log.sql).
+                 The first run of python -m src.system_functions.percolate_saved_searches
+                 starts percolating from the current change log position.
+*/
+
+CREATE TABLE SavedSearches (
+    search_id BINARY(16) PRIMARY KEY DEFAULT (UUID_TO_BIN(UUID(), 1)),
+    user_id BINARY(16) NOT NULL,
+    name VARCHAR(100) NOT NULL,
+    query_string VARCHAR(2000) NOT NULL,
+    created_change_id BIGINT UNSIGNED NOT NULL DEFAULT 0,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    FOREIGN KEY (user_id) REFERENCES Users(user_id) ON DELETE CASCADE
+);
+
+CREATE INDEX idx_saved_searches_user ON SavedSearches (user_id, created_at);
+
+CREATE TABLE SavedSearchMatches (
+    match_id BIGINT UNSIGNED AUTO_INCREMENT PRIMARY KEY,
+    search_id BINARY(16) NOT NULL,
+    user_id BINARY(16) NOT NULL,
+    grant_id BINARY(16) NOT NULL,
+    matched_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    UNIQUE KEY unique_search_grant (search_id, grant_id),
+    FOREIGN KEY (search_id) REFERENCES SavedSearches(search_id) ON DELETE CASCADE,
+    FOREIGN KEY (user_id) REFERENCES Users(user_id) ON DELETE CASCADE,
+    FOREIGN KEY (grant_id) REFERENCES Grants(grant_id) ON DELETE CASCADE
+);
+
+CREATE INDEX idx_saved_search_matches_inbox ON SavedSearchMatches (user_id, match_id);
+
+CREATE TABLE SavedSearchPercolation (
+    percolator_id TINYINT UNSIGNED PRIMARY KEY,
+    change_id BIGINT UNSIGNED NOT NULL
+);
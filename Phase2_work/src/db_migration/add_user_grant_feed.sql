@@ -0,0 +1,41 @@
+/*
+    Migration: Add the user grant feed
+    Version: 19 October 2026
+    Author: Colby Wirth
+    Description: Adds UserGrantFeed, UserGrantFeedProfiles and UserGrantFeedPosition
+                 (db_creation/create_relations_commands/09_create_user_grant_feed.sql) to an
+                 existing database.  Requires GrantChangeLog (add_grant_change_log.sql).
+                 The first run of python -m src.system_functions.refresh_user_grant_feed builds
+                 the feed of every user.
+*/
+
+CREATE TABLE UserGrantFeed (
+    user_id BINARY(16) NOT NULL,
+    grant_id BINARY(16) NOT NULL,
+    score SMALLINT UNSIGNED NOT NULL,
+    reasons TINYINT UNSIGNED NOT NULL,
+
+    PRIMARY KEY (user_id, grant_id),
+    FOREIGN KEY (user_id) REFERENCES Users(user_id) ON DELETE CASCADE,
+    FOREIGN KEY (grant_id) REFERENCES Grants(grant_id) ON DELETE CASCADE
+);
+
+-- GET /api/user/feed: a user's grants best first, and the next page, with one index range
+CREATE INDEX idx_user_grant_feed_rank ON UserGrantFeed (user_id, score, grant_id);
+-- refreshing a changed grant removes its rows for every user first
+CREATE INDEX idx_user_grant_feed_grant ON UserGrantFeed (grant_id);
+
+-- The profile each user's feed was built from; a user whose profile changed is rebuilt in full
+CREATE TABLE UserGrantFeedProfiles (
+    user_id BINARY(16) PRIMARY KEY,
+    profile_digest CHAR(16) NOT NULL,
+    refreshed_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+
+    FOREIGN KEY (user_id) REFERENCES Users(user_id) ON DELETE CASCADE
+);
+
+-- The GrantChangeLog position the feed has reached (one row)
+CREATE TABLE UserGrantFeedPosition (
+    feed_id TINYINT UNSIGNED PRIMARY KEY,
+    change_id BIGINT UNSIGNED NOT NULL
+);
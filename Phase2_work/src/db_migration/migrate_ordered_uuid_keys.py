@@ -0,0 +1,156 @@
+"""
+    Migration Script: Time-ordered UUID keys
+    Version: 19 October 2026
+    Author: Colby Wirth
+    Description:
+        Converts the BINARY(16) key columns from UUID_TO_BIN(id) to UUID_TO_BIN(id, 1) (see
+        src/utils/uuid_keys.py) and makes UUID_TO_BIN(UUID(), 1) the default for new rows.
+
+        - Every stored key and foreign key is rewritten as UUID_TO_BIN(BIN_TO_UUID(col), 1).
+          BIN_TO_UUID(col, 1) then returns the same string as before, so ids already handed
+          out (URLs, JWT identities, uploaded file names) stay valid.
+        - Databases created from the current create_relations_commands already use ordered keys
+          and are only marked as migrated.
+        - The rewrite runs in one transaction with foreign key checks off, since parents and
+          children are converted by separate statements.  The transaction also records the
+          migration in SchemaMigrations, so a second run never converts the keys twice.
+        - Afterwards each table is rebuilt (OPTIMIZE TABLE) so its clustered index is stored in
+          the new key order.  --skip-rebuild leaves that for a quieter moment.
+
+    Usage (from Phase2_work):
+        python -m src.db_migration.migrate_ordered_uuid_keys
+"""
+import argparse
+import os
+
+import mysql.connector
+from dotenv import load_dotenv
+
+from src.utils.logging_utils import log_info, log_error
+
+load_dotenv()
+
+HOST = os.getenv("HOST", "localhost")
+MYSQL_USER = os.getenv("GG_USER", "root")
+MYSQL_PASS = os.getenv("GG_PASS", "")
+DB_NAME = os.getenv("DB_NAME", "GrantGuruDB")
+
+MIGRATION_NAME = "ordered_uuid_keys"
+
+# table -> (primary key with a UUID default or None, every BINARY(16) UUID column)
+KEY_COLUMNS = {
+    "Grants": ("grant_id", ("grant_id",)),
+    "Users": ("user_id", ("user_id",)),
+    "UserResearchFields": (None, ("user_id",)),
+    "Applications": ("application_id", ("application_id", "user_id", "grant_id")),
+    "Documents": ("document_id", ("document_id", "application_id")),
+    "InternalDeadlines": ("internal_deadline_id", ("internal_deadline_id", "application_id")),
+}
+
+
+def existing_tables(cursor) -> set[str]:
+    cursor.execute("SELECT TABLE_NAME FROM INFORMATION_SCHEMA.TABLES WHERE TABLE_SCHEMA = %s", (DB_NAME,))
+    return {row[0] for row in cursor.fetchall()}
+
+
+def already_applied(cursor) -> bool:
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS SchemaMigrations (
+            name VARCHAR(100) PRIMARY KEY,
+            applied_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+        )
+        """
+    )
+    cursor.execute("SELECT COUNT(*) FROM SchemaMigrations WHERE name = %s", (MIGRATION_NAME,))
+    if cursor.fetchone()[0] > 0:
+        return True
+
+    # databases created from the current create_relations_commands store ordered keys already
+    cursor.execute(
+        """
+        SELECT COLUMN_DEFAULT FROM INFORMATION_SCHEMA.COLUMNS
+        WHERE TABLE_SCHEMA = %s AND TABLE_NAME = 'Users' AND COLUMN_NAME = 'user_id'
+        """,
+        (DB_NAME,),
+    )
+    row = cursor.fetchone()
+    if row and row[0] and ",1)" in row[0].replace(" ", ""):
+        cursor.execute("INSERT INTO SchemaMigrations (name) VALUES (%s)", (MIGRATION_NAME,))
+        return True
+    return False
+
+
+def convert_keys(conn, cursor, tables: set[str]) -> None:
+    """Rewrite every key value with the swap flag, all tables in one transaction."""
+    cursor.execute("SET FOREIGN_KEY_CHECKS = 0")
+    try:
+        conn.start_transaction()
+        for table, (_, columns) in KEY_COLUMNS.items():
+            if table not in tables:
+                continue
+            assignments = ", ".join(f"{c} = UUID_TO_BIN(BIN_TO_UUID({c}), 1)" for c in columns)
+            cursor.execute(f"UPDATE {table} SET {assignments}")
+            log_info(f"{table}: converted {cursor.rowcount} rows")
+        cursor.execute("INSERT INTO SchemaMigrations (name) VALUES (%s)", (MIGRATION_NAME,))
+        conn.commit()
+    except mysql.connector.Error:
+        conn.rollback()
+        raise
+    finally:
+        cursor.execute("SET FOREIGN_KEY_CHECKS = 1")
+
+
+def set_defaults(cursor, tables: set[str]) -> None:
+    """New rows get time-ordered keys.  Safe to repeat."""
+    for table, (primary_key, _) in KEY_COLUMNS.items():
+        if primary_key and table in tables:
+            cursor.execute(
+                f"ALTER TABLE {table} MODIFY {primary_key} BINARY(16) NOT NULL DEFAULT (UUID_TO_BIN(UUID(), 1))"
+            )
+
+
+def rebuild(cursor, tables: set[str]) -> None:
+    for table in KEY_COLUMNS:
+        if table in tables:
+            cursor.execute(f"OPTIMIZE TABLE {table}")
+            cursor.fetchall()
+            log_info(f"{table}: rebuilt")
+
+
+def run_migration(skip_rebuild: bool = False) -> bool:
+    conn = None
+    try:
+        conn = mysql.connector.connect(host=HOST, user=MYSQL_USER, password=MYSQL_PASS, database=DB_NAME)
+        cursor = conn.cursor()
+        tables = existing_tables(cursor)
+
+        applied = already_applied(cursor)
+        # ends the implicit transaction of the checks above (and keeps a new marker row)
+        conn.commit()
+        if applied:
+            log_info("Keys were already converted; checking the column defaults only")
+        else:
+            convert_keys(conn, cursor, tables)
+
+        set_defaults(cursor, tables)
+        if not skip_rebuild:
+            rebuild(cursor, tables)
+
+        cursor.close()
+        log_info("Migration completed successfully")
+        return True
+
+    except mysql.connector.Error as e:
+        log_error(f"Database error: {e}")
+        return False
+    finally:
+        if conn is not None and conn.is_connected():
+            conn.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Switch the UUID key columns to time-ordered storage")
+    parser.add_argument("--skip-rebuild", action="store_true", help="do not run OPTIMIZE TABLE afterwards")
+    args = parser.parse_args()
+    exit(0 if run_migration(args.skip_rebuild) else 1)
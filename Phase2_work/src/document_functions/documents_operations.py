@@ -11,13 +11,13 @@ from mysql.connector import Error as MySQLError
 
 from src.utils.logging_utils import log_error
 from src.user_functions.view_based_operations import require_permission, Role, Entity
-from src.utils.sql_file_parsers import read_sql_helper
+from src.utils.sql_registry import get_sql, get_statements
 
 
-CREATE_SCRIPT = "src/db_crud/documents/create_documents.sql"
-DELETE_SCRIPT = "src/db_crud/documents/delete_documents.sql"
-SELECT_SCRIPT = "src/db_crud/documents/select_documents_by_uuid.sql"
-UPDATE_SCRIPT = "src/db_crud/documents/update_documents.sql"
+CREATE_SCRIPT = "documents/create_documents"
+DELETE_SCRIPT = "documents/delete_documents"
+SELECT_SCRIPT = "documents/select_documents_by_uuid"
+UPDATE_SCRIPT = "documents/update_documents"
 
 
 class DocumentOperationError(Exception):
@@ -58,7 +58,7 @@ def create_document(role: Role, user_id: str, resource_owner_id: str, cursor,
     }
 
     try:
-        sql_script = read_sql_helper(CREATE_SCRIPT)
+        sql_script = get_sql(CREATE_SCRIPT, params)
         cursor.execute(sql_script, params)
         return None
     except MySQLError as e:
@@ -90,7 +90,7 @@ def read_document_by_uuid(role: Role, user_id: str, resource_owner_id: str, curs
     _ = role, user_id, resource_owner_id  # linter ignore
 
     try:
-        sql_script = read_sql_helper(SELECT_SCRIPT)
+        sql_script = get_sql(SELECT_SCRIPT, (document_id,))
         cursor.execute(sql_script, (document_id,))
         return cursor.fetchone()
     except MySQLError as e:
@@ -134,7 +134,7 @@ def update_document(role: Role, user_id: str, resource_owner_id: str, cursor,
     }
 
     try:
-        sql_script = read_sql_helper(UPDATE_SCRIPT)
+        sql_script = get_sql(UPDATE_SCRIPT, params)
         cursor.execute(sql_script, params)
         return None
     except MySQLError as e:
@@ -167,7 +167,7 @@ def delete_document(role: Role, user_id: str, resource_owner_id: str, cursor,
     _ = role, user_id, resource_owner_id  # for linter
 
     try:
-        sql_script = read_sql_helper(DELETE_SCRIPT)
+        sql_script = get_sql(DELETE_SCRIPT, (document_id,))
         cursor.execute(sql_script, (document_id,))
         return None
     except MySQLError as e:
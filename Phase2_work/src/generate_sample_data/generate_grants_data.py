@@ -0,0 +1,293 @@
+"""
+    File: generate_grants_data.py
+    Version: 19 October 2026
+    Author: Colby Wirth
+    Description:
+        - Seeds the database with a configurable number of synthetic grants, users, applications,
+          internal deadlines and documents so that query plans can be studied at realistic sizes
+        - Rows are generated from a fixed random seed, so two runs with the same arguments produce
+          the same data
+        - Every seeded row is tagged (opportunity_number 'SEED-...', email 'seed_user_...') and
+          --clear removes exactly those rows
+        - Inserts go through the db_crud create scripts with executemany(), which sends each batch
+          as one multi-row INSERT; grants are generated batch by batch, so seeding a million of
+          them (src/query_analysis/range_filter_benchmark.py) does not hold them all in memory
+        - The bulk inserts bypass the ingest, so the grant statistics (GrantStats) and the
+          analytics rollups (GrantRollups) are rebuilt after seeding and after --clear
+
+    Usage (from Phase2_work):
+        python -m src.generate_sample_data.generate_grants_data --grants 100000 --users 2000
+        python -m src.generate_sample_data.generate_grants_data --clear
+"""
+
+import argparse
+import os
+import random
+from datetime import date, datetime, timedelta
+from itertools import islice
+
+import mysql.connector
+from dotenv import load_dotenv
+
+from src.utils.logging_utils import log_info, log_error
+from src.utils.grant_rollups import rebuild_grant_rollups
+from src.utils.grant_stats import rebuild_grant_stats
+from src.utils.sql_registry import get_sql
+from src.utils.uuid_keys import new_uuid
+
+load_dotenv()
+
+DB_NAME = os.getenv("DB_NAME", "GrantGuruDB")
+HOST = os.getenv("HOST", "localhost")
+MYSQL_USER = os.getenv("GG_USER", "root")
+MYSQL_PASS = os.getenv("GG_PASS", "")
+
+SEED_OPPORTUNITY_PREFIX = "SEED-"
+SEED_EMAIL_PREFIX = "seed_user_"
+BATCH_SIZE = 1000
+
+RESEARCH_FIELDS = [
+    "Agriculture", "Arts", "Business and Commerce", "Community Development", "Computer Science",
+    "Education", "Energy", "Environment", "Food and Nutrition", "Health", "Housing", "Humanities",
+    "Income Security", "Information and Statistics", "Law and Justice", "Natural Resources",
+    "Regional Development", "Science and Technology", "Transportation", "Biology",
+]
+PROVIDERS = [
+    "National Science Foundation", "National Institutes of Health", "Department of Energy",
+    "Department of Agriculture", "Department of Education", "NASA", "Department of Defense",
+    "Environmental Protection Agency", "National Endowment for the Humanities",
+]
+TITLE_WORDS = [
+    "research", "program", "initiative", "innovation", "training", "climate", "health", "data",
+    "community", "rural", "urban", "clean", "energy", "quantum", "genomics", "education", "STEM",
+    "infrastructure", "resilience", "water", "ocean", "machine", "learning", "cancer", "youth",
+    "workforce", "security", "materials", "biology", "agriculture", "wildlife", "archives",
+]
+DOCUMENT_TYPES = ["PDF", "DOCX", "TXT", "XLSX", "Other"]
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(TITLE_WORDS) for _ in range(words))
+
+
+def _batches(rows, size: int = BATCH_SIZE):
+    rows = iter(rows)
+    while batch := list(islice(rows, size)):
+        yield batch
+
+
+def _insert_many(cursor, script: str, rows) -> None:
+    """Insert rows (a list or a generator of dicts with the same keys), BATCH_SIZE per statement."""
+    sql = None
+    for batch in _batches(rows):
+        if sql is None:
+            sql = get_sql(script, batch[0])
+        cursor.executemany(sql, batch)
+
+
+def _seeded_ids(cursor, sql: str, params=()) -> list[str]:
+    cursor.execute(sql, params)
+    return [row[0] for row in cursor.fetchall()]
+
+
+def _grant_rows(count: int, rng: random.Random):
+    today = date.today()
+    for i in range(count):
+        posted = today - timedelta(days=rng.randint(0, 730))
+        closed = posted + timedelta(days=rng.randint(30, 365)) if rng.random() < 0.9 else None
+        # about a fifth of the grants are archived, which the maintenance job purges
+        archived = closed + timedelta(days=rng.randint(1, 90)) if closed and rng.random() < 0.2 else None
+        award_max = rng.randrange(10_000, 5_000_000, 1_000)
+        yield {
+            "grant_title": f"{_sentence(rng, 4).title()} {i}",
+            "opportunity_number": f"{SEED_OPPORTUNITY_PREFIX}{i:08d}",
+            "description": _sentence(rng, rng.randint(40, 120)),
+            "research_field": rng.choice(RESEARCH_FIELDS),
+            "expected_award_count": rng.randint(1, 50),
+            "eligibility": _sentence(rng, 12),
+            "award_max_amount": award_max,
+            "award_min_amount": rng.randrange(0, award_max + 1, 1_000),
+            "program_funding": award_max * rng.randint(1, 20),
+            "provider": rng.choice(PROVIDERS),
+            "link_to_source": f"https://www.grants.gov/search-results-detail/{i}",
+            "point_of_contact": f"contact{i % 500}@example.gov",
+            "date_posted": posted,
+            "archive_date": archived,
+            "date_closed": closed,
+            "last_update_date": posted + timedelta(days=rng.randint(0, 30)),
+        }
+
+
+def seed_grants(cursor, count: int, rng: random.Random) -> list[str]:
+    """Insert count grants and return their UUID strings."""
+    _insert_many(cursor, "grants/create_grants", _grant_rows(count, rng))
+    return _seeded_ids(
+        cursor,
+        "SELECT BIN_TO_UUID(grant_id, 1) FROM Grants WHERE opportunity_number LIKE %s ORDER BY opportunity_number",
+        (f"{SEED_OPPORTUNITY_PREFIX}%",),
+    )
+
+
+def seed_users(cursor, count: int, rng: random.Random) -> list[str]:
+    """Insert count users and return their UUID strings."""
+    rows = [
+        {
+            "user_id": new_uuid(),
+            "f_name": f"Seed{i}",
+            "m_name": None,
+            "l_name": rng.choice(["Smith", "Nguyen", "Garcia", "Okafor", "Kowalski", "Tanaka"]),
+            "institution": rng.choice(["USM", "MIT", "UCLA", "Bowdoin", "Colby", "Bates"]),
+            "email": f"{SEED_EMAIL_PREFIX}{i:06d}@example.com",
+            # not a valid password hash; seeded users cannot log in
+            "password": "seed",
+        }
+        for i in range(count)
+    ]
+    _insert_many(cursor, "users/create_users", rows)
+    return _seeded_ids(
+        cursor,
+        "SELECT BIN_TO_UUID(user_id, 1) FROM Users WHERE email LIKE %s ORDER BY email",
+        (f"{SEED_EMAIL_PREFIX}%",),
+    )
+
+
+def seed_applications(cursor, user_ids: list[str], grant_ids: list[str], per_user: int,
+                      rng: random.Random) -> list[str]:
+    """Give every user up to per_user applications to distinct grants; return the application ids."""
+    if not user_ids or not grant_ids:
+        return []
+    rows = []
+    for user_id in user_ids:
+        for grant_id in rng.sample(grant_ids, min(per_user, len(grant_ids))):
+            rows.append({
+                "user_id": user_id,
+                "grant_id": grant_id,
+                "status": rng.choice(["pending", "in_review", "approved", "rejected"]),
+                "application_date": date.today() - timedelta(days=rng.randint(0, 365)),
+            })
+    _insert_many(cursor, "applications/create_application", rows)
+    return _seeded_ids(
+        cursor,
+        """
+        SELECT BIN_TO_UUID(a.application_id, 1)
+        FROM Applications a
+        JOIN Users u ON u.user_id = a.user_id
+        WHERE u.email LIKE %s
+        """,
+        (f"{SEED_EMAIL_PREFIX}%",),
+    )
+
+
+def seed_application_children(cursor, application_ids: list[str], tasks_per_application: int,
+                              documents_per_application: int, rng: random.Random) -> None:
+    """Add internal deadlines and document rows to every seeded application."""
+    deadlines, documents = [], []
+    for application_id in application_ids:
+        for t in range(tasks_per_application):
+            deadlines.append({
+                "application_id": application_id,
+                "deadline_name": f"Task {t}: {_sentence(rng, 3)}",
+                "deadline_date": date.today() + timedelta(days=rng.randint(-30, 120)),
+                "task_description": _sentence(rng, 15),
+                "completed": rng.random() < 0.3,
+            })
+        for d in range(documents_per_application):
+            documents.append({
+                "document_name": f"seed_document_{d}.pdf",
+                "document_type": rng.choice(DOCUMENT_TYPES),
+                "document_size": rng.randint(1_000, 5_000_000),
+                "upload_date": datetime.now() - timedelta(minutes=rng.randint(0, 500_000)),
+                "application_id": application_id,
+            })
+    _insert_many(cursor, "internal_deadlines/create_internal_deadlines", deadlines)
+    _insert_many(cursor, "documents/create_documents", documents)
+
+
+def clear_sample_data(cursor) -> None:
+    """Remove every seeded row; applications, deadlines and documents cascade."""
+    cursor.execute("DELETE FROM Users WHERE email LIKE %s", (f"{SEED_EMAIL_PREFIX}%",))
+    cursor.execute("DELETE FROM Grants WHERE opportunity_number LIKE %s", (f"{SEED_OPPORTUNITY_PREFIX}%",))
+
+
+def seed_sample_data(cnx, grants: int = 1000, users: int = 100, applications_per_user: int = 5,
+                     tasks_per_application: int = 3, documents_per_application: int = 2,
+                     seed: int = 42, clear: bool = True) -> dict[str, int]:
+    """
+    Seed the database and commit.
+
+    Args:
+        cnx: Open connection to the target database.
+        clear: Remove earlier seeded rows first, so the sizes are exact.
+
+    Returns:
+        The number of seeded rows per table.
+    """
+    rng = random.Random(seed)
+    cursor = cnx.cursor()
+    try:
+        if clear:
+            clear_sample_data(cursor)
+        grant_ids = seed_grants(cursor, grants, rng)
+        user_ids = seed_users(cursor, users, rng)
+        application_ids = seed_applications(cursor, user_ids, grant_ids, applications_per_user, rng)
+        seed_application_children(cursor, application_ids, tasks_per_application, documents_per_application, rng)
+        rebuild_grant_stats(cursor)
+        rebuild_grant_rollups(cursor)
+        cnx.commit()
+    except mysql.connector.Error:
+        cnx.rollback()
+        raise
+    finally:
+        cursor.close()
+
+    counts = {
+        "grants": len(grant_ids),
+        "users": len(user_ids),
+        "applications": len(application_ids),
+        "internal_deadlines": len(application_ids) * tasks_per_application,
+        "documents": len(application_ids) * documents_per_application,
+    }
+    log_info(f"Seeded {counts}")
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Seed GrantGuruDB with synthetic data")
+    parser.add_argument("--grants", type=int, default=1000)
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--applications-per-user", type=int, default=5)
+    parser.add_argument("--tasks-per-application", type=int, default=3)
+    parser.add_argument("--documents-per-application", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--clear", action="store_true", help="only remove previously seeded rows")
+    args = parser.parse_args()
+
+    cnx = None
+    try:
+        cnx = mysql.connector.connect(host=HOST, user=MYSQL_USER, password=MYSQL_PASS, database=DB_NAME)
+        if args.clear:
+            with cnx.cursor() as cursor:
+                clear_sample_data(cursor)
+                rebuild_grant_stats(cursor)
+                rebuild_grant_rollups(cursor)
+            cnx.commit()
+            log_info("Removed seeded rows")
+            return
+        seed_sample_data(
+            cnx,
+            grants=args.grants,
+            users=args.users,
+            applications_per_user=args.applications_per_user,
+            tasks_per_application=args.tasks_per_application,
+            documents_per_application=args.documents_per_application,
+            seed=args.seed,
+        )
+    except mysql.connector.Error as err:
+        log_error(f"Seeding failed: {err}")
+    finally:
+        if cnx is not None and cnx.is_connected():
+            cnx.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,7 @@ from pathlib import Path
 import mysql.connector
 from dotenv import load_dotenv
 from src.utils.logging_utils import log_info, log_error
+from src.utils.uuid_keys import new_uuid
 
 """
     File: generate_users_data.py
@@ -84,6 +85,7 @@ if __name__ == "__main__":
             with cnx.cursor(buffered=True) as cursor:
                 # 1. Insert user
                 cursor.execute(create_user_sql, {
+                    "user_id": new_uuid(),
                     "f_name": first_name,
                     "m_name": middle_name,
                     "l_name": last_name,
@@ -0,0 +1,547 @@
+"""
+    File: explain_harness.py
+    Version: 19 October 2026
+    Author: Colby Wirth
+
+    Description: Runs EXPLAIN over every query the project sends and keeps the plans so that
+    schema changes can be checked for plan regressions.
+
+    Queries come from two places:
+        - every script in the SQL registry (src/db_crud/**/*.sql)
+        - every cursor.execute()/executemany() in Phase3_work/api whose statement is a string
+          literal, found by parsing the route modules with ast.  Statements assembled at run
+          time (f-strings) are listed as skipped with their file and line; the grant search is
+          covered by SEARCH_VARIANTS instead.
+
+    Parameters are bound from existing rows: a %(name)s placeholder takes the sample value of
+    that name, and a positional %s takes the sample value of the column it is compared with.
+    Values are always sent as bound parameters, never pasted into the statement text.
+
+    For every statement the harness stores EXPLAIN FORMAT=JSON.  SELECTs are also run with
+    EXPLAIN ANALYZE, which executes them and reports actual rows and times; INSERT/UPDATE/DELETE
+    are only explained so the data is left untouched.  Each plan is checked for:
+        - full_table_scan   access_type ALL
+        - full_index_scan   access_type index (reads the whole index)
+        - filesort          ordering_operation.using_filesort
+        - temporary_table   using_temporary_table anywhere in the plan
+
+    Plans are written to src/query_analysis/plans/<label>.json.  The default label is a hash of
+    SHOW CREATE TABLE for every table, so each schema version gets its own file.
+
+    Usage (from Phase2_work):
+        python -m src.query_analysis.explain_harness --seed-grants 50000 --seed-users 1000
+        python -m src.query_analysis.explain_harness --label before_fulltext
+        python -m src.query_analysis.explain_harness --diff before_fulltext after_fulltext
+"""
+import argparse
+import ast
+import hashlib
+import json
+import os
+import re
+import sys
+from datetime import date, datetime
+from pathlib import Path
+
+import mysql.connector
+from dotenv import load_dotenv
+
+from src.generate_sample_data.generate_grants_data import seed_sample_data
+from src.utils.logging_utils import log_info, log_error
+from src.utils.sql_file_parsers import strip_sql_comments
+from src.utils.sql_registry import load_sql_registry
+
+load_dotenv()
+DB_NAME = os.getenv("DB_NAME", "GrantGuruDB")
+HOST = os.getenv("HOST", "localhost")
+MYSQL_USER = os.getenv("GG_USER", "root")
+MYSQL_PASS = os.getenv("GG_PASS", "")
+
+PLANS_DIR = Path(__file__).resolve().parent / "plans"
+API_DIR = Path(__file__).resolve().parents[3] / "Phase3_work" / "api"
+
+EXPLAINABLE = ("select", "with", "insert", "update", "delete", "replace", "table")
+ANALYZABLE = ("select", "with", "table")
+
+# an estimated row count has to move by this factor (and by at least MIN_ROWS_CHANGE rows)
+# before --diff reports it
+ROWS_CHANGE_FACTOR = 10
+MIN_ROWS_CHANGE = 1000
+
+# GET /api/public/search_grants builds its WHERE clause at run time; these mirror the
+# statements it sends for each kind of filter
+_SEARCH_SELECT = """
+    SELECT BIN_TO_UUID(grant_id, 1) AS grant_id, grant_title, description, provider,
+           DATE_FORMAT(date_closed, '%Y-%m-%d') AS date_closed, research_field,
+           DATE_FORMAT(date_posted, '%Y-%m-%d') AS date_posted, opportunity_number,
+           {score} AS score
+    FROM Grants
+"""
+_NATURAL_MATCH = "MATCH(grant_title, description) AGAINST (%s IN NATURAL LANGUAGE MODE)"
+_BOOLEAN_MATCH = "MATCH(grant_title, description) AGAINST (%s IN BOOLEAN MODE)"
+SEARCH_VARIANTS = {
+    "search_grants/count_all": ("SELECT COUNT(*) FROM Grants", ()),
+    "search_grants/count_keyword": (
+        f"SELECT COUNT(*) FROM Grants WHERE {_NATURAL_MATCH}",
+        ("climate",),
+    ),
+    "search_grants/page_relevance": (
+        _SEARCH_SELECT.format(score=_NATURAL_MATCH)
+        + f"WHERE {_NATURAL_MATCH} ORDER BY score DESC, grant_id DESC LIMIT %s OFFSET %s",
+        ("climate", "climate", 10, 0),
+    ),
+    "search_grants/page_boolean": (
+        _SEARCH_SELECT.format(score=_BOOLEAN_MATCH)
+        + f"WHERE {_BOOLEAN_MATCH} ORDER BY score DESC, grant_id DESC LIMIT %s OFFSET %s",
+        ("+climate -ocean", "+climate -ocean", 10, 0),
+    ),
+    "search_grants/page_keyword_title": (
+        _SEARCH_SELECT.format(score=_NATURAL_MATCH)
+        + f"WHERE {_NATURAL_MATCH} ORDER BY grant_title ASC, grant_id ASC LIMIT %s OFFSET %s",
+        ("climate", "climate", 10, 0),
+    ),
+    "search_grants/page_field": (
+        _SEARCH_SELECT.format(score="NULL")
+        + "WHERE research_field LIKE %s ORDER BY date_posted DESC, grant_id DESC LIMIT %s OFFSET %s",
+        ("Biology%", 10, 0),
+    ),
+    "search_grants/page_opportunity_number": (
+        _SEARCH_SELECT.format(score="NULL")
+        + "WHERE opportunity_number LIKE %s ORDER BY grant_title ASC, grant_id ASC LIMIT %s OFFSET %s",
+        ("SEED-0000%", 10, 0),
+    ),
+    "search_grants/page_title_keyset": (
+        _SEARCH_SELECT.format(score="NULL")
+        + "WHERE (grant_title > %s OR (grant_title = %s AND grant_id > UUID_TO_BIN(%s, 1))) "
+        + "ORDER BY grant_title ASC, grant_id ASC LIMIT %s OFFSET %s",
+        ("M", "M", "00000000-0000-1000-8000-000000000000", 11, 0),
+    ),
+    "search_grants/page_closing_soon": (
+        _SEARCH_SELECT.format(score="NULL")
+        + "WHERE date_closed >= %s AND date_closed <= %s ORDER BY date_closed ASC, grant_id ASC LIMIT %s OFFSET %s",
+        ("2025-01-01", "2025-01-31", 11, 0),
+    ),
+    "search_grants/count_closing_soon_award": (
+        "SELECT COUNT(*) FROM Grants WHERE award_max_amount >= %s AND date_closed >= %s AND date_closed <= %s",
+        (500000, "2025-01-01", "2025-01-31"),
+    ),
+    "search_grants/page_award_range": (
+        _SEARCH_SELECT.format(score="NULL")
+        + "WHERE award_max_amount >= %s AND award_max_amount <= %s "
+        + "ORDER BY date_posted DESC, grant_id DESC LIMIT %s OFFSET %s",
+        (4000000, 4100000, 11, 0),
+    ),
+    "search_grants/deep_page": (
+        _SEARCH_SELECT.format(score="NULL") + "ORDER BY date_closed ASC, grant_id ASC LIMIT %s OFFSET %s",
+        (10, 5000),
+    ),
+}
+
+
+# ==================== QUERY DISCOVERY ====================
+
+def registry_queries() -> dict[str, list[str]]:
+    """Every statement of every db_crud script, keyed by script name."""
+    return {name: list(script.statements) for name, script in load_sql_registry().items()}
+
+
+def _string_assignments(func: ast.AST) -> dict[str, ast.AST]:
+    """Last value assigned to each simple name inside a function body."""
+    values = {}
+    for node in ast.walk(func):
+        if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+            values[node.targets[0].id] = node.value
+    return values
+
+
+def api_queries(api_dir: Path = API_DIR) -> tuple[dict[str, str], list[dict]]:
+    """
+    Find the literal statements the API passes to cursor.execute()/executemany().
+
+    Returns:
+        (queries keyed "<module>:<function>:<line>", skipped statements with the reason)
+    """
+    queries, skipped, seen = {}, [], set()
+    for path in sorted(api_dir.rglob("*.py")):
+        module = path.relative_to(api_dir.parent).as_posix()
+        tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+        for func in ast.walk(tree):
+            if not isinstance(func, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                continue
+            assigned = _string_assignments(func)
+            for call in ast.walk(func):
+                if not (isinstance(call, ast.Call) and isinstance(call.func, ast.Attribute)
+                        and call.func.attr in ("execute", "executemany") and call.args):
+                    continue
+                # a nested function's calls are also inside its parent; report them once
+                if (module, call.lineno) in seen:
+                    continue
+                seen.add((module, call.lineno))
+                key = f"{module}:{func.name}:{call.lineno}"
+                arg = call.args[0]
+                if isinstance(arg, ast.Name):
+                    if arg.id not in assigned:
+                        continue  # a wrapper passing its caller's statement through
+                    arg = assigned[arg.id]
+                if isinstance(arg, ast.Constant) and isinstance(arg.value, str):
+                    queries[key] = arg.value
+                elif isinstance(arg, ast.Call) and getattr(arg.func, "id", None) == "get_sql":
+                    continue  # registry script, explained with the registry
+                else:
+                    skipped.append({"query": key, "reason": "statement is built at run time"})
+    return queries, skipped
+
+
+# ==================== PARAMETER BINDING ====================
+
+def sample_values(cursor) -> dict:
+    """Representative values for each parameter name, taken from existing rows where possible."""
+    values = {
+        "status": "pending",
+        "submission_status": "started",
+        "completed": False,
+        "deadline_name": "Draft budget",
+        "task_description": "Explain harness sample",
+        "deadline_date": date.today(),
+        "application_date": date.today(),
+        "submitted_at": None,
+        "created_at": datetime.now(),
+        "upload_date": datetime.now(),
+        "document_name": "explain.pdf",
+        "document_type": "PDF",
+        "document_size": 1000,
+        "f_name": "Explain",
+        "m_name": None,
+        "l_name": "Harness",
+        "institution": "USM",
+        "password": "x",
+        "old_password": "x",
+        "new_password": "y",
+        "research_field": "Biology",
+        "opportunity_number": "EXPLAIN-0",
+        "email": "explain@example.com",
+        "grant_title": "Explain",
+        "description": "explain",
+        "eligibility": "explain",
+        "expected_award_count": 1,
+        "award_max_amount": 1000,
+        "award_min_amount": 0,
+        "program_funding": 1000,
+        "provider": "Explain",
+        "link_to_source": "https://example.com",
+        "point_of_contact": "explain@example.com",
+        "date_posted": date.today(),
+        "archive_date": None,
+        "date_closed": date.today(),
+        "last_update_date": date.today(),
+    }
+    lookups = {
+        ("grant_id", "opportunity_number", "research_field"):
+            "SELECT BIN_TO_UUID(grant_id, 1), opportunity_number, research_field FROM Grants LIMIT 1",
+        ("user_id", "email"): "SELECT BIN_TO_UUID(user_id, 1), email FROM Users LIMIT 1",
+        ("application_id",): "SELECT BIN_TO_UUID(application_id, 1) FROM Applications LIMIT 1",
+        ("internal_deadline_id",): "SELECT BIN_TO_UUID(internal_deadline_id, 1) FROM InternalDeadlines LIMIT 1",
+        ("document_id",): "SELECT BIN_TO_UUID(document_id, 1) FROM Documents LIMIT 1",
+        ("research_field_id",): "SELECT research_field_id FROM ResearchField LIMIT 1",
+    }
+    for names, sql in lookups.items():
+        cursor.execute(sql)
+        row = cursor.fetchone()
+        if row is None:
+            log_info(f"No rows for {', '.join(names)}; seed the database for representative plans")
+            row = ("00000000-0000-0000-0000-000000000000",) + (None,) * (len(names) - 1)
+        for name, value in zip(names, row):
+            if value is not None:
+                values[name] = value
+    return values
+
+
+_POSITIONAL_COLUMN = re.compile(
+    r"([\w.`]+)\s*(?:=|<=>|<=|>=|<|>|!=|<>|\bLIKE\b|\bIN\b)\s*\(?\s*(?:(?:UUID_TO_BIN|LOWER|TRIM)\s*\(\s*)*%s",
+    re.IGNORECASE,
+)
+
+
+def bind_params(sql: str, values: dict):
+    """Build the parameters for sql: a dict for %(name)s, a tuple for positional %s, or None."""
+    names = re.findall(r"%\((\w+)\)s", sql)
+    if names:
+        missing = [n for n in names if n not in values]
+        if missing:
+            raise KeyError(f"no sample value for {', '.join(sorted(set(missing)))}")
+        return {n: values[n] for n in names}
+
+    positional = sql.count("%s")
+    if not positional:
+        return None
+    columns = [m.group(1).strip("`").split(".")[-1] for m in _POSITIONAL_COLUMN.finditer(sql)]
+    if len(columns) != positional:
+        raise KeyError(f"could not match all {positional} %s placeholders to a column")
+    missing = [c for c in columns if c not in values]
+    if missing:
+        raise KeyError(f"no sample value for {', '.join(sorted(set(missing)))}")
+    return tuple(values[c] for c in columns)
+
+
+# ==================== PLAN ANALYSIS ====================
+
+def _walk(node):
+    if isinstance(node, dict):
+        yield node
+        for value in node.values():
+            yield from _walk(value)
+    elif isinstance(node, list):
+        for value in node:
+            yield from _walk(value)
+
+
+def summarize_plan(plan: dict) -> tuple[list[dict], list[str]]:
+    """Pull the per-table access paths and the warning flags out of an EXPLAIN FORMAT=JSON plan."""
+    tables, flags = [], set()
+    for node in _walk(plan):
+        table = node.get("table")
+        if isinstance(table, dict) and "table_name" in table:
+            access = table.get("access_type")
+            tables.append({
+                "table": table["table_name"],
+                "access_type": access,
+                "key": table.get("key"),
+                "rows_examined_per_scan": table.get("rows_examined_per_scan"),
+                "filtered": table.get("filtered"),
+            })
+            if access == "ALL":
+                flags.add(f"full_table_scan:{table['table_name']}")
+            elif access == "index":
+                flags.add(f"full_index_scan:{table['table_name']}")
+        if node.get("using_filesort"):
+            flags.add("filesort")
+        if node.get("using_temporary_table"):
+            flags.add("temporary_table")
+    return tables, sorted(flags)
+
+
+_ACTUAL = re.compile(r"actual time=[\d.]+\.\.([\d.]+) rows=([\d.]+) loops=(\d+)")
+
+
+def analyze_totals(tree: str) -> dict | None:
+    """Time and row count of the top node of an EXPLAIN ANALYZE tree."""
+    match = _ACTUAL.search(tree)
+    if match is None:
+        return None
+    return {"actual_ms": float(match.group(1)), "actual_rows": float(match.group(2))}
+
+
+def explain_statement(cursor, sql: str, values: dict, params=None) -> dict:
+    """
+    EXPLAIN (and for reads, EXPLAIN ANALYZE) one statement.
+
+    Args:
+        values: Sample values to bind from, see sample_values().
+        params: Parameters to use as they are instead of binding from values.
+    """
+    text = strip_sql_comments(sql).strip().rstrip(";")
+    verb = text.split(None, 1)[0].lower() if text else ""
+    if verb not in EXPLAINABLE:
+        return {"skipped": f"{verb or 'empty'} statements cannot be explained"}
+
+    result = {"sql": " ".join(text.split())}
+    if params is None:
+        try:
+            params = bind_params(text, values)
+        except KeyError as e:
+            return {**result, "skipped": str(e).strip("'\"")}
+
+    try:
+        cursor.execute(f"EXPLAIN FORMAT=JSON {text}", params)
+        plan = json.loads(cursor.fetchone()[0])
+        result["plan"] = plan
+        result["tables"], result["flags"] = summarize_plan(plan)
+
+        if verb in ANALYZABLE:
+            cursor.execute(f"EXPLAIN ANALYZE {text}", params)
+            tree = cursor.fetchone()[0]
+            result["analyze"] = tree
+            result["totals"] = analyze_totals(tree)
+    except mysql.connector.Error as err:
+        result["error"] = str(err)
+    return result
+
+
+# ==================== SNAPSHOTS ====================
+
+def schema_fingerprint(cursor) -> tuple[str, dict[str, int]]:
+    """Hash of every table definition, and the row count of each table."""
+    cursor.execute("SHOW TABLES")
+    tables = sorted(row[0] for row in cursor.fetchall())
+    digest = hashlib.sha1()
+    counts = {}
+    for table in tables:
+        cursor.execute(f"SHOW CREATE TABLE `{table}`")
+        ddl = re.sub(r" AUTO_INCREMENT=\d+", "", cursor.fetchone()[1])
+        digest.update(ddl.encode("utf-8"))
+        cursor.execute(f"SELECT COUNT(*) FROM `{table}`")
+        counts[table] = cursor.fetchone()[0]
+    return digest.hexdigest()[:12], counts
+
+
+def run_harness(cnx, label: str | None = None) -> dict:
+    """Explain every known query and return the snapshot."""
+    with cnx.cursor() as cursor:
+        schema_hash, table_rows = schema_fingerprint(cursor)
+        values = sample_values(cursor)
+
+    inline, skipped = api_queries()
+    statements = []
+    for name, stmts in registry_queries().items():
+        for i, sql in enumerate(stmts):
+            statements.append((name if len(stmts) == 1 else f"{name}#{i + 1}", "db_crud", sql))
+    statements += [(name, "api", sql) for name, sql in inline.items()]
+
+    queries = {}
+    with cnx.cursor() as cursor:
+        for name, source, sql in statements:
+            queries[name] = {"source": source, **explain_statement(cursor, sql, values)}
+        for name, (sql, params) in SEARCH_VARIANTS.items():
+            queries[name] = {"source": "api", **explain_statement(cursor, sql, values, params)}
+    # EXPLAIN of a write never changes rows, but do not leave an open transaction behind
+    cnx.rollback()
+
+    return {
+        "label": label or f"schema-{schema_hash}",
+        "schema_hash": schema_hash,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "table_rows": table_rows,
+        "queries": queries,
+        "skipped": skipped,
+    }
+
+
+def save_snapshot(snapshot: dict, plans_dir: Path = PLANS_DIR) -> Path:
+    plans_dir.mkdir(parents=True, exist_ok=True)
+    path = plans_dir / f"{snapshot['label']}.json"
+    path.write_text(json.dumps(snapshot, indent=2, sort_keys=True, default=str), encoding="utf-8")
+    return path
+
+
+def load_snapshot(label: str, plans_dir: Path = PLANS_DIR) -> dict:
+    path = Path(label) if label.endswith(".json") else plans_dir / f"{label}.json"
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+# ==================== DIFF ====================
+
+def diff_snapshots(old: dict, new: dict) -> dict[str, list[str]]:
+    """
+    Compare two snapshots query by query.
+
+    Returns:
+        {"regressions": [...], "improvements": [...], "notes": [...]}; a regression is a new
+        flag, a new error, or an estimated row count that grew by ROWS_CHANGE_FACTOR.
+    """
+    report = {"regressions": [], "improvements": [], "notes": []}
+    old_q, new_q = old["queries"], new["queries"]
+
+    for name in sorted(set(old_q) - set(new_q)):
+        report["notes"].append(f"{name}: removed")
+    for name in sorted(set(new_q) - set(old_q)):
+        flags = new_q[name].get("flags") or []
+        report["notes"].append(f"{name}: new query" + (f" with {', '.join(flags)}" if flags else ""))
+
+    for name in sorted(set(old_q) & set(new_q)):
+        before, after = old_q[name], new_q[name]
+        if "error" in after and "error" not in before:
+            report["regressions"].append(f"{name}: now fails: {after['error']}")
+            continue
+        if "error" in before and "error" not in after:
+            report["improvements"].append(f"{name}: no longer fails")
+
+        old_flags, new_flags = set(before.get("flags") or []), set(after.get("flags") or [])
+        for flag in sorted(new_flags - old_flags):
+            report["regressions"].append(f"{name}: {flag}")
+        for flag in sorted(old_flags - new_flags):
+            report["improvements"].append(f"{name}: no longer {flag}")
+
+        old_tables = {t["table"]: t for t in before.get("tables") or []}
+        for t in after.get("tables") or []:
+            was = old_tables.get(t["table"])
+            if was is None:
+                continue
+            if (was["access_type"], was["key"]) != (t["access_type"], t["key"]):
+                report["notes"].append(
+                    f"{name}: {t['table']} {was['access_type']}/{was['key']} -> {t['access_type']}/{t['key']}"
+                )
+            old_rows, new_rows = was.get("rows_examined_per_scan") or 0, t.get("rows_examined_per_scan") or 0
+            if abs(new_rows - old_rows) >= MIN_ROWS_CHANGE:
+                if new_rows >= max(old_rows, 1) * ROWS_CHANGE_FACTOR:
+                    report["regressions"].append(f"{name}: {t['table']} rows examined {old_rows} -> {new_rows}")
+                elif old_rows >= max(new_rows, 1) * ROWS_CHANGE_FACTOR:
+                    report["improvements"].append(f"{name}: {t['table']} rows examined {old_rows} -> {new_rows}")
+    return report
+
+
+# ==================== REPORTING ====================
+
+def print_snapshot(snapshot: dict) -> None:
+    print(f"\nPlans for {snapshot['label']} (schema {snapshot['schema_hash']})")
+    print("Table rows: " + ", ".join(f"{t}={n}" for t, n in snapshot["table_rows"].items()))
+    flagged = errors = 0
+    for name, q in sorted(snapshot["queries"].items()):
+        if "error" in q:
+            errors += 1
+            print(f"  ERROR   {name}: {q['error']}")
+        elif "skipped" in q:
+            print(f"  skipped {name}: {q['skipped']}")
+        elif q.get("flags"):
+            flagged += 1
+            totals = q.get("totals") or {}
+            timing = f" ({totals['actual_ms']:.2f} ms)" if totals else ""
+            print(f"  FLAG    {name}{timing}: {', '.join(q['flags'])}")
+    for s in snapshot["skipped"]:
+        print(f"  skipped {s['query']}: {s['reason']}")
+    print(f"{len(snapshot['queries'])} queries, {flagged} flagged, {errors} failed")
+
+
+def print_diff(report: dict[str, list[str]]) -> None:
+    for section in ("regressions", "improvements", "notes"):
+        print(f"\n{section.upper()} ({len(report[section])})")
+        for line in report[section]:
+            print(f"  {line}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="EXPLAIN every db_crud script and API query")
+    parser.add_argument("--label", help="snapshot name (default: schema-<hash of the table definitions>)")
+    parser.add_argument("--seed-grants", type=int, help="seed this many grants before explaining")
+    parser.add_argument("--seed-users", type=int, default=100, help="users to seed with --seed-grants")
+    parser.add_argument("--diff", nargs=2, metavar=("OLD", "NEW"), help="compare two saved snapshots")
+    args = parser.parse_args()
+
+    if args.diff:
+        report = diff_snapshots(load_snapshot(args.diff[0]), load_snapshot(args.diff[1]))
+        print_diff(report)
+        sys.exit(1 if report["regressions"] else 0)
+
+    cnx = None
+    try:
+        cnx = mysql.connector.connect(host=HOST, user=MYSQL_USER, password=MYSQL_PASS, database=DB_NAME)
+        if args.seed_grants:
+            seed_sample_data(cnx, grants=args.seed_grants, users=args.seed_users)
+        with cnx.cursor() as cursor:
+            # fresh statistics so the estimates reflect the seeded sizes
+            cursor.execute("SHOW TABLES")
+            for (table,) in cursor.fetchall():
+                cursor.execute(f"ANALYZE TABLE `{table}`")
+                cursor.fetchall()
+        snapshot = run_harness(cnx, args.label)
+        path = save_snapshot(snapshot)
+        print_snapshot(snapshot)
+        log_info(f"Plans saved to {path}")
+    except mysql.connector.Error as err:
+        log_error(f"Database error: {err}")
+    finally:
+        if cnx is not None and cnx.is_connected():
+            cnx.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -18,6 +18,8 @@ from dotenv import load_dotenv
     This means that it can complete without checking every instance of the relation. As our database grows 
     this will be important for allowing our users to access grants in their field quickly.
 
+    explain_harness.py in this package runs the same check over every db_crud script and API query.
+
 """
 load_dotenv()
 DB_NAME = os.getenv("DB_NAME", "GrantGuruDB")
@@ -35,27 +37,8 @@ def explain_query(cursor, query_name, sql_query, params=None):
     explain_sql = f"EXPLAIN {sql_query}"
     
     try:
-        # If parameters are provided, we must use PREPARE/EXECUTE or a client-side
-        # binding. Since we are using mysql.connector, we can pass the params 
-        # directly to execute, which handles the substitution safely.
-        
-        # Note: EXPLAIN queries can sometimes behave differently when parameters 
-        # are used. For simplicity and broad compatibility, we'll try to execute it 
-        # as a string first. For MySQL, if parameters were needed, we'd generally 
-        # hardcode them for EXPLAIN or use EXPLAIN ANALYZE.
-        
-        # Since we're using a single parameter for the targeted query, we'll format 
-        # the EXPLAIN output to make it clearer what query is being run.
-
-        if params:
-            # For the parameterized query, we'll substitute the %s placeholder 
-            # with the actual value for the EXPLAIN command to work correctly.
-            # NOTE: This substitution is only for EXPLAIN and should not be used 
-            # for standard data queries due to SQL injection risks.
-            if len(params) == 1 and sql_query.count('%s') == 1:
-                explain_sql = explain_sql.replace('%s', f"'{params[0]}'")
-            
-        cursor.execute(explain_sql)
+        # Parameters are bound by the driver, the same way the application sends them
+        cursor.execute(explain_sql, params)
         explain_results = cursor.fetchall()
         
         # Print the header for the execution plan
@@ -78,7 +61,7 @@ def main():
     db_connection = None
     
     targeted_filter_query = """
-    SELECT BIN_TO_UUID(grant_id) as grant_id,
+    SELECT BIN_TO_UUID(grant_id, 1) as grant_id,
         grant_title,
         opportunity_number,
         description,
@@ -0,0 +1,154 @@
+"""
+    File: prepared_statement_benchmark.py
+    Version: 19 October 2026
+    Author: Colby Wirth
+
+    Description: Compares the hot API statements sent as text against the same statements run
+    through the prepared statement cache (src/utils/prepared_statements.py).
+
+    For every statement in HOT_STATEMENTS the benchmark runs N executions each way on one
+    connection and reports wall time plus the session status counters the server keeps:
+        - Com_select / Com_stmt_prepare / Com_stmt_execute show how many times the server had to
+          parse the statement text.  Text queries are parsed on every execution; the prepared
+          path parses once (one Com_stmt_prepare) and then only executes.
+        - Bytes_sent / Bytes_received show the wire cost; the binary protocol sends only the
+          statement id and bound values after the first execution.
+    MySQL still optimizes a prepared statement on each execution, so the saving is the parse
+    and the statement text transfer, not the plan.
+
+    Sample parameter values are taken from existing rows, so the database needs at least one
+    grant, user, application and internal deadline (see src/generate_sample_data).
+
+    Usage (from Phase2_work):
+        python -m src.query_analysis.prepared_statement_benchmark --iterations 2000
+"""
+import argparse
+import os
+import time
+
+import mysql.connector
+from dotenv import load_dotenv
+
+from src.utils.logging_utils import log_info, log_error
+from src.utils.prepared_statements import HOT_STATEMENTS, PreparedStatementCache
+from src.utils.sql_registry import get_sql
+
+load_dotenv()
+DB_NAME = os.getenv("DB_NAME", "GrantGuruDB")
+HOST = os.getenv("HOST", "localhost")
+MYSQL_USER = os.getenv("GG_USER", "root")
+MYSQL_PASS = os.getenv("GG_PASS", "")
+
+STATUS_COUNTERS = ("Com_select", "Com_stmt_prepare", "Com_stmt_execute", "Bytes_sent", "Bytes_received")
+
+
+def session_status(cursor) -> dict[str, int]:
+    """Read the session counters in STATUS_COUNTERS."""
+    placeholders = ", ".join(["%s"] * len(STATUS_COUNTERS))
+    cursor.execute(f"SHOW SESSION STATUS WHERE Variable_name IN ({placeholders})", STATUS_COUNTERS)
+    return {name: int(value) for name, value in cursor.fetchall()}
+
+
+def sample_params(cursor) -> dict[str, tuple]:
+    """Pick existing ids to bind to each hot statement."""
+    cursor.execute(
+        """
+        SELECT BIN_TO_UUID(a.application_id, 1), BIN_TO_UUID(a.user_id, 1), BIN_TO_UUID(a.grant_id, 1)
+        FROM Applications a
+        JOIN InternalDeadlines d ON d.application_id = a.application_id
+        LIMIT 1
+        """
+    )
+    row = cursor.fetchone()
+    if row is None:
+        raise RuntimeError("Need at least one application with an internal deadline to benchmark against")
+    application_id, user_id, grant_id = row
+
+    return {
+        "grants/select_grant_details_by_uuid": (grant_id,),
+        "applications/select_applications_with_grant_by_user": (user_id,),
+        "applications/select_owned_application": (application_id, user_id),
+        "applications/select_owned_application_state": (application_id, user_id),
+        "internal_deadlines/select_owned_internal_deadlines": (application_id, user_id),
+        "documents/select_owned_documents": (application_id, user_id),
+    }
+
+
+def run_text(conn, name: str, params: tuple, iterations: int) -> float:
+    sql = get_sql(name)
+    start = time.perf_counter()
+    with conn.cursor() as cursor:
+        for _ in range(iterations):
+            cursor.execute(sql, params)
+            cursor.fetchall()
+    return time.perf_counter() - start
+
+
+def run_prepared(conn, cache: PreparedStatementCache, name: str, params: tuple, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        cache.fetchall(conn, name, params)
+    return time.perf_counter() - start
+
+
+def measure(conn, run) -> tuple[float, dict[str, int]]:
+    """Run run() and return its wall time and the change in session counters."""
+    with conn.cursor() as cursor:
+        before = session_status(cursor)
+    elapsed = run()
+    with conn.cursor() as cursor:
+        after = session_status(cursor)
+    # the SHOW STATUS statement itself is not part of the measurement
+    delta = {k: after[k] - before[k] for k in STATUS_COUNTERS}
+    return elapsed, delta
+
+
+def print_report(name: str, iterations: int, text, prepared) -> None:
+    (text_time, text_delta), (prep_time, prep_delta) = text, prepared
+    print(f"\n--- {name} ({iterations} executions) ---")
+    print(f"  {'':20} | {'text':>12} | {'prepared':>12}")
+    print(f"  {'wall time (ms)':20} | {text_time * 1000:12.1f} | {prep_time * 1000:12.1f}")
+    print(f"  {'per call (us)':20} | {text_time / iterations * 1e6:12.1f} | {prep_time / iterations * 1e6:12.1f}")
+    for counter in STATUS_COUNTERS:
+        print(f"  {counter:20} | {text_delta[counter]:12} | {prep_delta[counter]:12}")
+    parses_saved = text_delta["Com_select"] - prep_delta["Com_stmt_prepare"]
+    print(f"  statement parses saved: {parses_saved}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark text vs prepared execution of the hot API statements")
+    parser.add_argument("--iterations", type=int, default=1000, help="executions per statement and mode")
+    args = parser.parse_args()
+
+    conn = None
+    try:
+        conn = mysql.connector.connect(host=HOST, user=MYSQL_USER, password=MYSQL_PASS, database=DB_NAME)
+        conn.autocommit = True
+
+        with conn.cursor() as cursor:
+            params_by_name = sample_params(cursor)
+
+        cache = PreparedStatementCache()
+        for name in HOT_STATEMENTS:
+            params = params_by_name[name]
+            # warm the buffer pool so both modes read the same cached pages
+            run_text(conn, name, params, 10)
+
+            text = measure(conn, lambda: run_text(conn, name, params, args.iterations))
+            prepared = measure(conn, lambda: run_prepared(conn, cache, name, params, args.iterations))
+            print_report(name, args.iterations, text, prepared)
+
+        log_info(f"Cache counters: {cache.stats()}")
+        cache.close_connection(conn)
+
+    except mysql.connector.Error as err:
+        log_error(f"Database error: {err}")
+    except RuntimeError as err:
+        log_error(str(err))
+    finally:
+        if conn is not None and conn.is_connected():
+            conn.close()
+
+
+if __name__ == "__main__":
+    main()
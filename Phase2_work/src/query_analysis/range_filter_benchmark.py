@@ -0,0 +1,156 @@
+"""
+    File: range_filter_benchmark.py
+    Version: 19 October 2026
+    Author: Colby Wirth
+
+    Description: Plans and timings of the /api/public/search_grants range filters
+    (src/utils/range_filters.py) on a synthetic corpus of a million grants.
+
+    Each case is the statement the route sends for one filter + sort combination ("closing in
+    the next 30 days", "awards of at least $500k by close date", a count, ...).  It is run twice:
+        - indexed    as sent, with the indexes of db_migration/add_grants_range_indexes.sql
+        - no index   with those indexes ignored (IGNORE INDEX), which is how the filter ran
+                     before they existed: a full scan of Grants, or a walk of a sort index that
+                     reads and discards every row outside the range
+    For both, the table shows the access type and index of the plan, whether it sorts, the
+    rows the optimizer expects to examine and the median time of --repeat runs.
+
+    The corpus comes from src/generate_sample_data (award_max_amount uniform in $10k-$5M, close
+    dates up to a year after posting); seeding a million grants takes a few minutes, so
+    --no-seed reuses the rows already in the database.
+
+    Usage (from Phase2_work):
+        python -m src.query_analysis.range_filter_benchmark
+        python -m src.query_analysis.range_filter_benchmark --seed-grants 100000 --repeat 9
+        python -m src.query_analysis.range_filter_benchmark --no-seed
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from datetime import date, timedelta
+
+import mysql.connector
+from dotenv import load_dotenv
+
+from src.generate_sample_data.generate_grants_data import seed_sample_data
+from src.query_analysis.explain_harness import explain_statement
+from src.utils.logging_utils import log_info, log_error
+from src.utils.range_filters import parse_range_filters, sql_conditions
+
+load_dotenv()
+DB_NAME = os.getenv("DB_NAME", "GrantGuruDB")
+HOST = os.getenv("HOST", "localhost")
+MYSQL_USER = os.getenv("GG_USER", "root")
+MYSQL_PASS = os.getenv("GG_PASS", "")
+
+RANGE_INDEXES = (
+    "idx_grants_award_max",
+    "idx_grants_award_min",
+    "idx_grants_program_funding",
+    "idx_grants_date_posted_id_award",
+    "idx_grants_date_closed_id_award",
+)
+
+# the page query of search_grants without a keyword
+_PAGE_SQL = """
+    SELECT BIN_TO_UUID(grant_id, 1) AS grant_id, grant_title, description, provider,
+           DATE_FORMAT(date_closed, '%Y-%m-%d') AS date_closed, research_field,
+           DATE_FORMAT(date_posted, '%Y-%m-%d') AS date_posted, opportunity_number, NULL AS score
+    FROM Grants {hint}
+    WHERE {where}
+    ORDER BY {order}
+    LIMIT 11 OFFSET 0
+"""
+_COUNT_SQL = "SELECT COUNT(*) FROM Grants {hint} WHERE {where}"
+
+ORDERS = {
+    "title_asc": "grant_title ASC, grant_id ASC",
+    "close_date_asc": "date_closed ASC, grant_id ASC",
+    "posted_date_desc": "date_posted DESC, grant_id DESC",
+}
+
+
+def build_cases(today: date) -> list[tuple[str, str, str | None, dict]]:
+    """(name, page or count, sort_by, query string) of every case."""
+    last_week = (today - timedelta(days=7)).isoformat()
+    return [
+        ("closing in 30 days", "page", "close_date_asc", {"closes_within": "30"}),
+        ("closing in 30 days, awards >= $500k", "page", "close_date_asc", {"closes_within": "30", "award_max_gte": "500000"}),
+        ("closing in 30 days, awards >= $500k", "count", None, {"closes_within": "30", "award_max_gte": "500000"}),
+        ("awards >= $500k by title", "page", "title_asc", {"award_max_gte": "500000"}),
+        ("awards $4M-$4.1M, newest", "page", "posted_date_desc", {"award_max_gte": "4000000", "award_max_lte": "4100000"}),
+        ("posted in the last week", "page", "posted_date_desc", {"posted_from": last_week}),
+        ("program funding >= $90M", "count", None, {"funding_gte": "90000000"}),
+        ("minimum award <= $5k by close date", "page", "close_date_asc", {"award_min_lte": "5000"}),
+    ]
+
+
+def statement(kind: str, sort_by: str | None, args: dict, today: date, ignore: bool) -> tuple[str, tuple]:
+    conditions, params = sql_conditions(parse_range_filters(args, today))
+    hint = f"IGNORE INDEX ({', '.join(RANGE_INDEXES)})" if ignore else ""
+    where = " AND ".join(conditions)
+    if kind == "count":
+        return _COUNT_SQL.format(hint=hint, where=where), tuple(params)
+    return _PAGE_SQL.format(hint=hint, where=where, order=ORDERS[sort_by]), tuple(params)
+
+
+def median_ms(cursor, sql: str, params: tuple, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        cursor.execute(sql, params)
+        cursor.fetchall()
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def describe(result: dict) -> str:
+    """access type/index, sort, and rows examined of an explain_statement() result."""
+    if "error" in result:
+        return f"EXPLAIN failed: {result['error']}"
+    table = result["tables"][0] if result["tables"] else {}
+    access = f"{table.get('access_type')}/{table.get('key') or '-'}"
+    sort = "filesort" if "filesort" in result["flags"] else "-"
+    examined = table.get("rows_examined_per_scan")
+    return f"{access:<38}{sort:<10}{examined if examined is not None else '?':>10}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seed-grants", type=int, default=1_000_000)
+    parser.add_argument("--no-seed", action="store_true", help="use the grants already in the database")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    cnx = mysql.connector.connect(host=HOST, user=MYSQL_USER, password=MYSQL_PASS, database=DB_NAME)
+    try:
+        if not args.no_seed:
+            log_info(f"Seeding {args.seed_grants:,} grants")
+            seed_sample_data(cnx, grants=args.seed_grants, users=0, applications_per_user=0)
+        with cnx.cursor() as cursor:
+            cursor.execute("ANALYZE TABLE Grants")
+            cursor.fetchall()
+            cursor.execute("SELECT COUNT(*) FROM Grants")
+            log_info(f"{cursor.fetchone()[0]:,} grants")
+
+            today = date.today()
+            log_info(f"{'case':<42}{'plan':<10}{'access/index':<38}{'sort':<10}{'rows est.':>10}{'ms':>10}")
+            for name, kind, sort_by, query in build_cases(today):
+                label = f"{name} ({kind})"
+                for plan_name, ignore in (("indexed", False), ("no index", True)):
+                    sql, params = statement(kind, sort_by, query, today, ignore)
+                    result = explain_statement(cursor, sql, {}, params)
+                    ms = median_ms(cursor, sql, params, args.repeat)
+                    log_info(f"{label:<42}{plan_name:<10}{describe(result)}{ms:>10.1f}")
+                    label = ""
+    except mysql.connector.Error as err:
+        log_error(f"Benchmark failed: {err}")
+        sys.exit(1)
+    finally:
+        cnx.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+    File: search_payload_benchmark.py
+    Version: 19 October 2026
+    Author: Colby Wirth
+
+    Description: Payload size and serialization time of a /api/public/search_grants page, with
+    the full description per hit (the old response) against a snippet with highlight offsets
+    (src/utils/snippets.py, the current response).
+
+    Each page is built from sample grants and serialized the way Flask's jsonify does (compact
+    separators).  The "after" timing includes cutting the snippets, since the server now does
+    that work per hit.  Two corpora are measured:
+        - sample   the descriptions as stored (src/test_suites/grants_data.json, or the first
+                   grants in the database with --from-db)
+        - longest  the same grants with descriptions repeated to 18,000 characters, the limit
+                   clean_a_grant truncates at
+
+    Usage (from Phase2_work):
+        python -m src.query_analysis.search_payload_benchmark --q "health research" --page-size 50
+"""
+import argparse
+import json
+import os
+import time
+from pathlib import Path
+
+from src.utils.logging_utils import log_info
+from src.utils.snippets import SNIPPET_LENGTH, highlight, make_snippet, query_terms
+
+SAMPLE_FILE = Path(__file__).resolve().parents[1] / "test_suites" / "grants_data.json"
+MAX_DESCRIPTION = 18000
+
+FIELDS = ("grant_id", "grant_title", "provider", "date_closed", "research_field", "date_posted", "opportunity_number")
+
+
+def load_sample(from_db: bool, limit: int) -> list[dict]:
+    if not from_db:
+        return json.loads(SAMPLE_FILE.read_text())
+    import mysql.connector
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    cnx = mysql.connector.connect(
+        database=os.getenv("DB_NAME", "GrantGuruDB"),
+        host=os.getenv("HOST", "localhost"),
+        user=os.getenv("GG_USER", "root"),
+        password=os.getenv("GG_PASS", ""),
+    )
+    try:
+        with cnx.cursor(dictionary=True) as cursor:
+            cursor.execute(
+                """
+                SELECT BIN_TO_UUID(grant_id, 1) AS grant_id, grant_title, description, provider,
+                       DATE_FORMAT(date_closed, '%Y-%m-%d') AS date_closed, research_field,
+                       DATE_FORMAT(date_posted, '%Y-%m-%d') AS date_posted, opportunity_number
+                FROM Grants LIMIT %s
+                """,
+                (limit,),
+            )
+            return cursor.fetchall()
+    finally:
+        cnx.close()
+
+
+def page_of(grants: list[dict], page_size: int) -> list[dict]:
+    return [grants[i % len(grants)] for i in range(page_size)]
+
+
+def full_page(rows: list[dict]) -> bytes:
+    hits = [{**{f: g.get(f) for f in FIELDS}, "description": g.get("description"), "score": 1.0} for g in rows]
+    return json.dumps({"grants": hits}, separators=(",", ":")).encode("utf-8")
+
+
+def snippet_page(rows: list[dict], q: str, length: int) -> bytes:
+    terms = query_terms(q)
+    hits = []
+    for g in rows:
+        snippet, snippet_highlights = make_snippet(g.get("description"), terms, length)
+        hits.append({
+            **{f: g.get(f) for f in FIELDS},
+            "title_highlights": highlight(g.get("grant_title"), terms),
+            "snippet": snippet,
+            "snippet_highlights": snippet_highlights,
+            "score": 1.0,
+        })
+    return json.dumps({"grants": hits}, separators=(",", ":")).encode("utf-8")
+
+
+def measure(build, iterations: int) -> tuple[int, float]:
+    """(payload bytes, mean milliseconds per page)."""
+    body = build()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        build()
+    return len(body), (time.perf_counter() - start) * 1000 / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--q", default="health research", help="query whose terms the snippets center on")
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--snippet-length", type=int, default=SNIPPET_LENGTH)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--from-db", action="store_true", help="read sample grants from the database")
+    args = parser.parse_args()
+
+    sample = load_sample(args.from_db, args.page_size)
+    longest = [
+        {**g, "description": ((g.get("description") or "x") * (MAX_DESCRIPTION // max(1, len(g.get("description") or "x")) + 1))[:MAX_DESCRIPTION]}
+        for g in sample
+    ]
+
+    log_info(f"{args.page_size} hits per page, q={args.q!r}, snippets of {args.snippet_length} characters")
+    log_info(f"{'corpus':<10}{'response':<10}{'bytes':>12}{'ms/page':>10}")
+    for name, grants in (("sample", sample), ("longest", longest)):
+        rows = page_of(grants, args.page_size)
+        before = measure(lambda: full_page(rows), args.iterations)
+        after = measure(lambda: snippet_page(rows, args.q, args.snippet_length), args.iterations)
+        for label, (size, ms) in (("full", before), ("snippet", after)):
+            log_info(f"{name:<10}{label:<10}{size:>12,}{ms:>10.2f}")
+        log_info(f"{name:<10}{'saving':<10}{1 - after[0] / before[0]:>12.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""
+    File: uuid_insert_benchmark.py
+    Version: 19 October 2026
+    Author: Colby Wirth
+
+    Description: Insert throughput and index fragmentation for the three ways a BINARY(16)
+    primary key has been filled in this project:
+        - random      uuid4 bytes (what create_user_entity and the API generated in Python)
+        - v1          UUID_TO_BIN(UUID()): time-based, but the fastest-changing timestamp bits
+                      come first, so consecutive keys still land all over the index
+        - ordered     UUID_TO_BIN(UUID(), 1), the current scheme (src/utils/uuid_keys.py)
+
+    Each mode inserts the same rows into its own scratch table shaped like Applications
+    (key, two secondary indexes, ~200 bytes of payload) in batches of --batch rows.  The report
+    shows rows/s over the whole run and over its last tenth, when the index no longer fits in
+    the pages touched recently, plus the table's size afterwards.  Random keys leave pages about
+    half full after splits, so the same rows take more space and more buffer pool.
+
+    InnoDB page split counts are included when the index_page_splits metric can be enabled
+    (needs SYSTEM_VARIABLES_ADMIN); otherwise that column is blank.
+
+    Usage (from Phase2_work):
+        python -m src.query_analysis.uuid_insert_benchmark --rows 200000
+"""
+import argparse
+import os
+import time
+import uuid
+from datetime import datetime
+
+import mysql.connector
+from dotenv import load_dotenv
+
+from src.utils.logging_utils import log_info, log_error
+from src.utils.uuid_keys import new_uuid, uuid_to_bin
+
+load_dotenv()
+DB_NAME = os.getenv("DB_NAME", "GrantGuruDB")
+HOST = os.getenv("HOST", "localhost")
+MYSQL_USER = os.getenv("GG_USER", "root")
+MYSQL_PASS = os.getenv("GG_PASS", "")
+
+# the same generators the server-side defaults use, run on the client so every mode pays the same cost
+KEY_MODES = {
+    "random": lambda: uuid.uuid4().bytes,
+    "v1": lambda: uuid.uuid1().bytes,
+    "ordered": lambda: uuid_to_bin(new_uuid()),
+}
+
+PAYLOAD = "x" * 200
+
+
+def create_table(cursor, table: str) -> None:
+    cursor.execute(f"DROP TABLE IF EXISTS {table}")
+    cursor.execute(
+        f"""
+        CREATE TABLE {table} (
+            id BINARY(16) PRIMARY KEY,
+            owner_id BINARY(16) NOT NULL,
+            created_at DATETIME NOT NULL,
+            payload VARCHAR(255) NOT NULL,
+            KEY idx_owner (owner_id),
+            KEY idx_created (created_at)
+        )
+        """
+    )
+
+
+def page_splits(cursor) -> int | None:
+    try:
+        cursor.execute("SELECT COUNT FROM INFORMATION_SCHEMA.INNODB_METRICS WHERE NAME = 'index_page_splits'")
+        row = cursor.fetchone()
+        return int(row[0]) if row else None
+    except mysql.connector.Error:
+        return None
+
+
+def enable_split_metric(cursor) -> None:
+    try:
+        cursor.execute("SET GLOBAL innodb_monitor_enable = 'index_page_splits'")
+    except mysql.connector.Error as err:
+        log_info(f"Page split metric unavailable: {err.msg}")
+
+
+def table_size(cursor, table: str) -> dict:
+    cursor.execute(f"ANALYZE TABLE {table}")
+    cursor.fetchall()
+    cursor.execute(
+        """
+        SELECT DATA_LENGTH, INDEX_LENGTH, DATA_FREE
+        FROM INFORMATION_SCHEMA.TABLES
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s
+        """,
+        (table,),
+    )
+    data, index, free = cursor.fetchone()
+    return {"data_mb": data / 2**20, "index_mb": index / 2**20, "free_mb": free / 2**20}
+
+
+def run_mode(conn, mode: str, rows: int, batch: int, owners: list[bytes]) -> dict:
+    table = f"uuid_bench_{mode}"
+    make_key = KEY_MODES[mode]
+    with conn.cursor() as cursor:
+        create_table(cursor, table)
+        conn.commit()
+        splits_before = page_splits(cursor)
+
+        sql = f"INSERT INTO {table} (id, owner_id, created_at, payload) VALUES (%s, %s, %s, %s)"
+        batch_times = []
+        inserted = 0
+        while inserted < rows:
+            size = min(batch, rows - inserted)
+            now = datetime.now()
+            values = [(make_key(), owners[(inserted + i) % len(owners)], now, PAYLOAD) for i in range(size)]
+            start = time.perf_counter()
+            cursor.executemany(sql, values)
+            conn.commit()
+            batch_times.append((size, time.perf_counter() - start))
+            inserted += size
+
+        splits_after = page_splits(cursor)
+        size = table_size(cursor, table)
+
+    total_time = sum(t for _, t in batch_times)
+    tail = batch_times[-max(1, len(batch_times) // 10):]
+    return {
+        "mode": mode,
+        "rows_per_s": rows / total_time,
+        "tail_rows_per_s": sum(n for n, _ in tail) / sum(t for _, t in tail),
+        "page_splits": None if splits_before is None or splits_after is None else splits_after - splits_before,
+        **size,
+    }
+
+
+def print_report(results: list[dict], rows: int) -> None:
+    print(f"\n--- {rows} inserts per mode ---")
+    print(f"  {'mode':10} | {'rows/s':>10} | {'last 10%':>10} | {'splits':>8} | {'data MB':>8} | {'index MB':>8} | {'free MB':>8}")
+    for r in results:
+        splits = "" if r["page_splits"] is None else r["page_splits"]
+        print(
+            f"  {r['mode']:10} | {r['rows_per_s']:10.0f} | {r['tail_rows_per_s']:10.0f} | {splits:>8} | "
+            f"{r['data_mb']:8.1f} | {r['index_mb']:8.1f} | {r['free_mb']:8.1f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare insert throughput of random and time-ordered UUID keys")
+    parser.add_argument("--rows", type=int, default=100_000, help="rows inserted per mode")
+    parser.add_argument("--batch", type=int, default=1000, help="rows per multi-row INSERT")
+    parser.add_argument("--modes", nargs="+", choices=KEY_MODES, default=list(KEY_MODES))
+    parser.add_argument("--keep", action="store_true", help="keep the scratch tables for inspection")
+    args = parser.parse_args()
+
+    conn = None
+    try:
+        conn = mysql.connector.connect(host=HOST, user=MYSQL_USER, password=MYSQL_PASS, database=DB_NAME)
+        with conn.cursor() as cursor:
+            enable_split_metric(cursor)
+
+        # owners repeat, like users with several applications
+        owners = [uuid_to_bin(new_uuid()) for _ in range(max(1, args.rows // 20))]
+        results = [run_mode(conn, mode, args.rows, args.batch, owners) for mode in args.modes]
+        print_report(results, args.rows)
+
+        if not args.keep:
+            with conn.cursor() as cursor:
+                for mode in args.modes:
+                    cursor.execute(f"DROP TABLE IF EXISTS uuid_bench_{mode}")
+
+    except mysql.connector.Error as err:
+        log_error(f"Database error: {err}")
+    finally:
+        if conn is not None and conn.is_connected():
+            conn.close()
+
+
+if __name__ == "__main__":
+    main()
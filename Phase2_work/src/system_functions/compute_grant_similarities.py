@@ -0,0 +1,79 @@
+"""
+    File: compute_grant_similarities.py
+    Version: 19 October 2026
+    Author: Colby Wirth
+
+    Description: Recomputes GrantSimilarities: for every open grant, the TOP_K most similar open
+    grants by cosine similarity of TF-IDF vectors over title, description and eligibility
+    (src/utils/tfidf.py).  Runs after each ingest in daily_grants_maintenance.py.
+
+    The table is emptied and refilled in one transaction, so /api/public/grant/<id>/similar keeps
+    serving the previous neighbors until the new ones are committed.
+
+"""
+import os
+import time
+
+import mysql.connector
+from dotenv import load_dotenv
+from mysql.connector import Error as MySQLError
+
+from src.utils.logging_utils import log_info, log_error
+from src.utils.sql_registry import get_sql
+from src.utils.tfidf import tfidf_matrix, top_k_neighbors
+
+TOP_K = 10
+INSERT_BATCH = 1000
+
+SELECT_SCRIPT = "grants/select_grants_for_similarity"
+DELETE_SCRIPT = "grants/delete_grant_similarities"
+INSERT_SCRIPT = "grants/create_grant_similarities"
+
+
+def main(k: int = TOP_K):
+    load_dotenv()
+    DB_NAME = os.getenv("DB_NAME", "GrantGuruDB")
+    HOST = os.getenv("HOST", "localhost")
+    MYSQL_USER = os.getenv("GG_USER", "root")
+    MYSQL_PASS = os.getenv("GG_PASS", "")
+
+    cnx = None
+    try:
+        start = time.perf_counter()
+        cnx = mysql.connector.connect(database=DB_NAME, host=HOST, user=MYSQL_USER, password=MYSQL_PASS)
+        with cnx.cursor() as cursor:
+            cursor.execute(get_sql(SELECT_SCRIPT))
+            grants = cursor.fetchall()
+
+        grant_ids = [row[0] for row in grants]
+        texts = [" ".join(part for part in row[1:] if part) for row in grants]
+        pairs = []
+        for row, neighbors in top_k_neighbors(tfidf_matrix(texts), k):
+            pairs.extend(
+                (grant_ids[row], rank, grant_ids[col], score)
+                for rank, (col, score) in enumerate(neighbors, start=1)
+            )
+
+        with cnx.cursor() as cursor:
+            cursor.execute(get_sql(DELETE_SCRIPT))
+            insert_sql = get_sql(INSERT_SCRIPT)
+            for i in range(0, len(pairs), INSERT_BATCH):
+                cursor.executemany(insert_sql, pairs[i:i + INSERT_BATCH])
+        cnx.commit()
+        log_info(
+            f"Stored {len(pairs)} similarities for {len(grant_ids)} open grants "
+            f"in {time.perf_counter() - start:.1f}s."
+        )
+        return len(pairs)
+    except MySQLError as e:
+        if cnx is not None:
+            cnx.rollback()
+        log_error(f"MySQL error computing grant similarities: {e}")
+        return e
+    finally:
+        if cnx is not None and cnx.is_connected():
+            cnx.close()
+
+
+if __name__ == "__main__":
+    main()
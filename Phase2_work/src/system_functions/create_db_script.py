@@ -18,6 +18,7 @@ from dotenv import load_dotenv
 import mysql.connector
 from mysql.connector import errorcode
 from src.utils.logging_utils import log_info, log_error
+from src.utils.sql_file_parsers import split_sql_statements
 
 # Load environment variables from .env file
 # Get the directory containing this script
@@ -42,10 +43,8 @@ def execute_sql_file(cursor, sql_file: Path):
     """Execute all statements in a given SQL file."""
     try:
         sql_content = sql_file.read_text()
-        statements = [s.strip() for s in sql_content.split(';') if s.strip()]
-        for stmt in statements:
-            if not stmt.startswith("--"):
-                cursor.execute(stmt)
+        for stmt in split_sql_statements(sql_content):
+            cursor.execute(stmt)
     except mysql.connector.Error as err:
         log_error(f"MySQL Error in {sql_file.name}:\n{err}")
         sys.exit(2)
@@ -3,6 +3,12 @@ from src.scraper.make_scrapes import main as scraper_script
 from src.scraper.clean_scrapes import main as cleaner_script
 from src.system_functions.delete_old_grants import main as deletion_script
 from src.system_functions.insert_cleaned_grant import main as insert_script
+from src.system_functions.prune_grant_change_log import main as prune_change_log_script
+from src.system_functions.compute_grant_similarities import main as similarity_script
+from src.system_functions.percolate_saved_searches import main as percolate_script
+from src.system_functions.refresh_user_grant_feed import main as feed_script
+from src.system_functions.refresh_grant_stats import main as grant_stats_script
+from src.system_functions.rebuild_grant_rollups import main as rollups_script
 
 '''
     File: daily_grants_maintenance.py
@@ -15,6 +21,18 @@ from src.system_functions.insert_cleaned_grant import main as insert_script
             2. Runs scraper_script() function which scrapes all new grants from Grants.gv
             3. Runs cleaner_script() to filter and clean grants that have been posted in the last SCRAPE_PERIOD_DAYS
             4. Runs insert_script() to insert all new Grants to DB
+        - First, grant_stats_script() moves the grants that closed since yesterday to the closed
+          counts of the landing page statistics (GrantStats); steps 1 and 4 update the rest
+        - Step 1 is followed by prune_change_log_script(), which drops week-old rows from
+          GrantChangeLog (the API's search index reads new and deleted grants from that log)
+        - rollups_script() then rebuilds the monthly analytics rollups (GrantRollups) from the
+          grants as they are after steps 1 and 4
+        - Then percolate_script() matches the grants inserted, updated or deleted by this run
+          against every saved search and adds the new matches to each user's inbox
+        - feed_script() re-scores the same changed grants for each user's recommendation feed
+          (UserGrantFeed), rebuilds the feeds of users whose profile changed and drops closed grants
+        - Last, similarity_script() recomputes the "similar grants" of every open grant
+          (GrantSimilarities), including when nothing new was scraped, since grants close daily
 '''
 
 SCRAPE_PERIOD_DAYS = 10000
@@ -23,9 +41,12 @@ from src.utils.logging_utils import log_info, log_error, log_warning
 
 def daily_operations():
 
+    grant_stats_script()
+
     log_info("Starting daily DB cleaning...")
 
     deletion_script() 
+    prune_change_log_script()
 
     log_info("Starting daily scraper scheduler...")
     dirty_grant_dict = scraper_script([
@@ -36,10 +57,21 @@ def daily_operations():
     # scraper_script returns None when no IDs are found or an error occurred
     if not dirty_grant_dict:
         log_warning("Scraper returned no data; skipping cleaning and insertion.")
-        return
+    else:
+        cleaned_grants: list = cleaner_script(dirty_grant_dict)
+        insert_script(cleaned_grants)
+
+    log_info("Rebuilding analytics rollups...")
+    rollups_script()
+
+    log_info("Matching changed grants against saved searches...")
+    percolate_script()
+
+    log_info("Refreshing user grant feeds...")
+    feed_script()
 
-    cleaned_grants: list = cleaner_script(dirty_grant_dict)
-    insert_script(cleaned_grants)
+    log_info("Recomputing similar grants...")
+    similarity_script()
     
 
 if __name__ == "__main__":
@@ -7,6 +7,8 @@
 
     Description: Deletes the grants from the database that are 
     past their archive date and have no applications associated with them.
+    The grant statistics (src/utils/grant_stats.py) are updated in the same
+    transaction.
 
 """
 from mysql.connector import Error as MySQLError
@@ -15,7 +17,8 @@ from dotenv import load_dotenv
 import sys
 import mysql.connector
 from src.utils.logging_utils import log_info, log_error
-from src.utils.sql_file_parsers import read_sql_helper
+from src.utils.sql_registry import get_sql, SqlRegistryError
+from src.utils.grant_stats import lock_grant_stats
 
 class DeletionOperationError(Exception):
     """Custom exception for deletion operation failures."""
@@ -28,8 +31,8 @@ def main ():
     MYSQL_USER = os.getenv("GG_USER", "root")
     MYSQL_PASS = os.getenv("GG_PASS", "")
 
-    DELETE_GRANT_SCRIPT = "src/db_crud/grants/delete_grants.sql"
-    SELECT_OLD_GRANT_SCRIPT = "src/db_crud/grants/select_grants_archived_no_applications.sql"
+    DELETE_GRANT_SCRIPT = "grants/delete_grants"
+    SELECT_OLD_GRANT_SCRIPT = "grants/select_grants_archived_no_applications"
 
     log_info("Connecting to MySQL server...")
     cnx = mysql.connector.connect(
@@ -41,11 +44,11 @@ def main ():
 
     cursor = cnx.cursor()
     try:
-        sql_select = read_sql_helper(SELECT_OLD_GRANT_SCRIPT)
-        if sql_select is None:
-            error_msg = f"SQL script file not found: {SELECT_OLD_GRANT_SCRIPT}"
-            log_error(error_msg)
-            return DeletionOperationError(error_msg)
+        try:
+            sql_select = get_sql(SELECT_OLD_GRANT_SCRIPT)
+        except SqlRegistryError as e:
+            log_error(str(e))
+            return DeletionOperationError(e)
         cursor.execute(sql_select)
         to_delete_ids = cursor.fetchall()
     except MySQLError as e:
@@ -56,21 +59,22 @@ def main ():
         return DeletionOperationError(e)
 
     try:
-        sql_delete = read_sql_helper(DELETE_GRANT_SCRIPT) 
-        if sql_delete is None:
-            error_msg = f"SQL script file not found: {DELETE_GRANT_SCRIPT}"
-            log_error(error_msg)
-            return DeletionOperationError(error_msg)
-        ids_to_delete = [record[0] for record in to_delete_ids] #type: ignore
-
-        
+        try:
+            sql_delete = get_sql(DELETE_GRANT_SCRIPT)
+        except SqlRegistryError as e:
+            log_error(str(e))
+            return DeletionOperationError(e)
+        stats = lock_grant_stats(cursor)
 
         successful_deletions = 0
 
-        for grant_id in ids_to_delete:
+        for grant_id, research_field, program_funding, date_closed in to_delete_ids: #type: ignore
             cursor.execute(sql_delete, (grant_id,)) 
             successful_deletions += cursor.rowcount
+            if cursor.rowcount == 1:
+                stats.remove(research_field, program_funding, date_closed)
 
+        stats.apply(cursor)
         cnx.commit()
         log_info(f"Successfully deleted {successful_deletions} grants.")
     except MySQLError as e:
@@ -5,7 +5,8 @@ Author: James Tedder
 
 Description:
     Inserts cleaned grants into the database. If a grant already exists (by
-    opportunity_number) it will be updated, otherwise inserted.
+    opportunity_number) it will be updated, otherwise inserted. The grant
+    statistics (src/utils/grant_stats.py) are updated in the same transaction.
 
 Usage: call `main(cleaned_grants_list)` where cleaned_grants_list is a list
 of dictionaries produced by `clean_scrapes.main()`.
@@ -22,7 +23,8 @@ import json as _json
 from datetime import datetime
 
 from src.utils.logging_utils import log_info, log_error
-from src.utils.sql_file_parsers import read_sql_helper
+from src.utils.sql_registry import get_sql, SqlRegistryError
+from src.utils.grant_stats import lock_grant_stats
 
 
 def format_grant_data_for_insert(raw_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -55,9 +57,10 @@ def main(cleaned_grants: list):
     MYSQL_USER = os.getenv("GG_USER", "root")
     MYSQL_PASS = os.getenv("GG_PASS", "password")
 
-    INSERT_GRANT_SCRIPT = "src/db_crud/grants/create_grants.sql"
-    CHECK_IF_ALREADY_IN_DB_SCRIPT = "src/db_crud/grants/select_grants_by_opportunity_number.sql"
-    UPDATE_GRANT_SCRIPT = "src/db_crud/grants/update_grants_by_opportunity_number.sql"
+    INSERT_GRANT_SCRIPT = "grants/create_grants"
+    # also returns the columns the grant statistics count
+    CHECK_IF_ALREADY_IN_DB_SCRIPT = "grants/select_grant_stats_columns"
+    UPDATE_GRANT_SCRIPT = "grants/update_grants_by_opportunity_number"
 
     cnx = None
     cursor = None
@@ -75,23 +78,21 @@ def main(cleaned_grants: list):
         cursor = cnx.cursor()
 
         # --- 2. LOAD SQL Script ---
-        sql_insert = read_sql_helper(INSERT_GRANT_SCRIPT)
-        if sql_insert is None:
-            raise GrantOperationError(f"SQL script file not found: {INSERT_GRANT_SCRIPT}")
-        
-        sql_select = read_sql_helper(CHECK_IF_ALREADY_IN_DB_SCRIPT)
-        if sql_select is None:
-            raise GrantOperationError(f"SQL script file not found: {CHECK_IF_ALREADY_IN_DB_SCRIPT}")
-        
-        sql_update = read_sql_helper(UPDATE_GRANT_SCRIPT)
-        if sql_update is None:
-            raise GrantOperationError(f"SQL script file not found: {UPDATE_GRANT_SCRIPT}")
+        try:
+            sql_insert = get_sql(INSERT_GRANT_SCRIPT)
+            sql_select = get_sql(CHECK_IF_ALREADY_IN_DB_SCRIPT)
+            sql_update = get_sql(UPDATE_GRANT_SCRIPT)
+        except SqlRegistryError as e:
+            raise GrantOperationError(str(e))
 
         # --- 3. EXECUTE INSERTION ---
         if not cleaned_grants:
             log_info("No cleaned grants to insert. Exiting.")
             return 0
 
+        # held until commit, so concurrent writers cannot interleave their statistics changes
+        stats = lock_grant_stats(cursor)
+
         # Executes the query using the formatted dictionary for parameterized insertion
         for grants in cleaned_grants:
             try:
@@ -106,6 +107,8 @@ def main(cleaned_grants: list):
                     try:
                         cursor.execute(sql_insert, formatted_params)
                         successful_insertions += 1
+                        cursor.execute(sql_select, opportunity_id)
+                        stats.add(*cursor.fetchone())
                     except MySQLError as db_e:
                         # Log detailed DB error and failing params for diagnosis, then re-raise to trigger rollback
                         err_info = {
@@ -138,6 +141,10 @@ def main(cleaned_grants: list):
                     try:
                         cursor.execute(sql_update, formatted_params)
                         successful_insertions += 1
+                        # the update keeps stored values the scrape left empty, so count what was stored
+                        cursor.execute(sql_select, opportunity_id)
+                        stats.remove(*grant)
+                        stats.add(*cursor.fetchone())
                         log_info("Grant updated")
                     except MySQLError as db_e:
                         err_info = {
@@ -179,6 +186,7 @@ def main(cleaned_grants: list):
                 log_error(traceback.format_exc())
                 continue
 
+        stats.apply(cursor)
         log_info(f"All grants processed into transaction cache ({successful_insertions} changes). Committing...")
         cnx.commit()
         log_info(f"Batch insertion successful. {successful_insertions} grants inserted/updated.")
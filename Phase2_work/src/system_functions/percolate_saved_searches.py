@@ -0,0 +1,115 @@
+"""
+    File: percolate_saved_searches.py
+    Version: 19 October 2026
+    Author: Colby Wirth
+
+    Description: Adds new matches of every saved search to its owner's inbox (SavedSearchMatches).
+    Runs after each ingest in daily_grants_maintenance.py.
+
+    Only the grants changed since the last run are read: the GrantChangeLog rows after
+    SavedSearchPercolation.change_id, CHANGE_BATCH at a time, each with the grant's current
+    values.  They are matched against the saved searches held in a query index
+    (src/utils/percolator.py), so no saved search is re-run against the whole of Grants.
+    The new matches and the new position are committed together, so a failed run is simply
+    repeated by the next one.
+
+    The first run only records the current position.  Change log rows are kept for a week
+    (prune_grant_change_log.py), so a percolator that has not run for longer misses the pruned
+    changes; it warns when that happens.
+
+"""
+import os
+import time
+
+import mysql.connector
+from dotenv import load_dotenv
+from mysql.connector import Error as MySQLError
+
+from src.utils.logging_utils import log_info, log_error, log_warning
+from src.utils.percolator import Percolator, grant_doc, saved_query
+from src.utils.sql_registry import get_sql
+
+CHANGE_BATCH = 5000
+INSERT_BATCH = 1000
+
+
+def _position(cursor) -> int | None:
+    cursor.execute(get_sql("saved_searches/select_percolation_position"))
+    row = cursor.fetchone()
+    return row[0] if row else None
+
+
+def _save_position(cursor, change_id: int) -> None:
+    params = {"change_id": change_id}
+    cursor.execute(get_sql("saved_searches/update_percolation_position", params), params)
+
+
+def main():
+    load_dotenv()
+    DB_NAME = os.getenv("DB_NAME", "GrantGuruDB")
+    HOST = os.getenv("HOST", "localhost")
+    MYSQL_USER = os.getenv("GG_USER", "root")
+    MYSQL_PASS = os.getenv("GG_PASS", "")
+
+    cnx = None
+    try:
+        start = time.perf_counter()
+        cnx = mysql.connector.connect(database=DB_NAME, host=HOST, user=MYSQL_USER, password=MYSQL_PASS)
+        with cnx.cursor() as cursor:
+            position = _position(cursor)
+            if position is None:
+                cursor.execute(get_sql("grants/select_grant_change_log_position"))
+                _save_position(cursor, cursor.fetchone()[0])
+                cnx.commit()
+                log_info("Saved search percolation starts from the current grant change log position.")
+                return 0
+
+            cursor.execute(get_sql("grants/select_grant_change_log_oldest"))
+            oldest = cursor.fetchone()[0]
+            if oldest is not None and oldest > position + 1:
+                log_warning(f"Grant changes {position + 1} to {oldest - 1} were pruned before percolation read them.")
+
+            cursor.execute(get_sql("saved_searches/select_saved_searches_for_percolation"))
+            percolator = Percolator(saved_query(row) for row in cursor.fetchall())
+
+        changed = matched = 0
+        insert_sql = get_sql("saved_searches/create_saved_search_matches")
+        with cnx.cursor() as cursor:
+            while True:
+                cursor.execute(get_sql("grants/select_grant_changes_since"), (position, CHANGE_BATCH))
+                rows = cursor.fetchall()
+                if not rows:
+                    break
+                # the latest change of each grant in the batch; deleted grants have NULL columns
+                latest = {row[1]: row for row in rows}
+                matches = [
+                    (query.search_id, query.user_id, grant[1])
+                    for grant in latest.values() if grant[6] is not None
+                    for query in percolator.match(grant_doc(grant))
+                ]
+                for i in range(0, len(matches), INSERT_BATCH):
+                    cursor.executemany(insert_sql, matches[i:i + INSERT_BATCH])
+                changed += len(latest)
+                matched += len(matches)
+                position = rows[-1][0]
+                if len(rows) < CHANGE_BATCH:
+                    break
+            _save_position(cursor, position)
+        cnx.commit()
+        log_info(
+            f"Percolated {changed} changed grants through {len(percolator)} saved searches: "
+            f"{matched} matches in {time.perf_counter() - start:.1f}s."
+        )
+        return matched
+    except MySQLError as e:
+        if cnx is not None:
+            cnx.rollback()
+        log_error(f"MySQL error percolating saved searches: {e}")
+        return e
+    finally:
+        if cnx is not None and cnx.is_connected():
+            cnx.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+    File: prune_grant_change_log.py
+    Version: 19 October 2026
+    Author: Colby Wirth
+
+    Description: Deletes GrantChangeLog rows older than RETENTION_DAYS.  The API's search index
+    only needs the changes since its last poll (seconds to minutes behind), and a restarted API
+    rebuilds from Grants, so a week of history is plenty.
+
+"""
+import os
+
+import mysql.connector
+from dotenv import load_dotenv
+from mysql.connector import Error as MySQLError
+
+from src.utils.logging_utils import log_info, log_error
+from src.utils.sql_registry import get_sql
+
+RETENTION_DAYS = 7
+PRUNE_SCRIPT = "grants/delete_grant_changes_before"
+
+
+def main(days: int = RETENTION_DAYS):
+    load_dotenv()
+    DB_NAME = os.getenv("DB_NAME", "GrantGuruDB")
+    HOST = os.getenv("HOST", "localhost")
+    MYSQL_USER = os.getenv("GG_USER", "root")
+    MYSQL_PASS = os.getenv("GG_PASS", "")
+
+    cnx = None
+    try:
+        cnx = mysql.connector.connect(database=DB_NAME, host=HOST, user=MYSQL_USER, password=MYSQL_PASS)
+        with cnx.cursor() as cursor:
+            cursor.execute(get_sql(PRUNE_SCRIPT), (days,))
+            pruned = cursor.rowcount
+        cnx.commit()
+        log_info(f"Pruned {pruned} grant change log rows older than {days} days.")
+        return pruned
+    except MySQLError as e:
+        log_error(f"MySQL error executing {PRUNE_SCRIPT}: {e}")
+        return e
+    finally:
+        if cnx is not None and cnx.is_connected():
+            cnx.close()
+
+
+if __name__ == "__main__":
+    main()
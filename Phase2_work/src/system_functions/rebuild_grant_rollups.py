@@ -0,0 +1,53 @@
+"""
+    File: rebuild_grant_rollups.py
+    Version: 19 October 2026
+    Author: Colby Wirth
+
+    Description: Recomputes GrantRollups, the monthly grant counts and program funding by provider
+    and research field behind /api/public/analytics (src/utils/grant_rollups.py).  Runs after each
+    ingest in daily_grants_maintenance.py; the grouping is done in NumPy from one read of four
+    columns of Grants, so the analytics routes never group Grants themselves.
+
+    The table is emptied and refilled in one transaction, so the API keeps serving the previous
+    rollups until the new ones are committed.
+
+"""
+import os
+import time
+
+import mysql.connector
+from dotenv import load_dotenv
+from mysql.connector import Error as MySQLError
+
+from src.utils.grant_rollups import rebuild_grant_rollups
+from src.utils.logging_utils import log_info, log_error
+
+
+def main():
+    load_dotenv()
+    DB_NAME = os.getenv("DB_NAME", "GrantGuruDB")
+    HOST = os.getenv("HOST", "localhost")
+    MYSQL_USER = os.getenv("GG_USER", "root")
+    MYSQL_PASS = os.getenv("GG_PASS", "")
+
+    cnx = None
+    try:
+        start = time.perf_counter()
+        cnx = mysql.connector.connect(database=DB_NAME, host=HOST, user=MYSQL_USER, password=MYSQL_PASS)
+        with cnx.cursor() as cursor:
+            written = rebuild_grant_rollups(cursor)
+        cnx.commit()
+        log_info(f"Stored {written} grant rollup rows in {time.perf_counter() - start:.1f}s.")
+        return written
+    except MySQLError as e:
+        if cnx is not None:
+            cnx.rollback()
+        log_error(f"MySQL error rebuilding grant rollups: {e}")
+        return e
+    finally:
+        if cnx is not None and cnx.is_connected():
+            cnx.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+    File: refresh_grant_stats.py
+    Version: 19 October 2026
+    Author: Colby Wirth
+
+    Description: Moves the grants that closed since GrantStats.open_as_of from the open to the
+    closed counts of GrantStats and GrantFieldStats (src/utils/grant_stats.py).  The ingest and the
+    purge keep every other count current; closing is only the calendar moving, so this runs once a
+    day, first in daily_grants_maintenance.py.  It reads one range of the date_closed index.
+
+    With --rebuild it recomputes both tables from Grants instead, to repair them after writes that
+    bypassed the ingest (manual SQL, restored backups).
+
+"""
+import argparse
+import os
+
+import mysql.connector
+from dotenv import load_dotenv
+from mysql.connector import Error as MySQLError
+
+from src.utils.grant_stats import rebuild_grant_stats, roll_open_counts
+from src.utils.logging_utils import log_info, log_error
+
+
+def main(rebuild: bool = False):
+    load_dotenv()
+    DB_NAME = os.getenv("DB_NAME", "GrantGuruDB")
+    HOST = os.getenv("HOST", "localhost")
+    MYSQL_USER = os.getenv("GG_USER", "root")
+    MYSQL_PASS = os.getenv("GG_PASS", "")
+
+    cnx = None
+    try:
+        cnx = mysql.connector.connect(database=DB_NAME, host=HOST, user=MYSQL_USER, password=MYSQL_PASS)
+        with cnx.cursor() as cursor:
+            if rebuild:
+                rebuild_grant_stats(cursor)
+                closed = 0
+            else:
+                closed = roll_open_counts(cursor)
+        cnx.commit()
+        if rebuild:
+            log_info("Rebuilt the grant statistics from Grants.")
+        else:
+            log_info(f"Moved {closed} newly closed grants to the closed grant statistics.")
+        return closed
+    except MySQLError as e:
+        if cnx is not None:
+            cnx.rollback()
+        log_error(f"MySQL error refreshing grant statistics: {e}")
+        return e
+    finally:
+        if cnx is not None and cnx.is_connected():
+            cnx.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Refresh the grant statistics")
+    parser.add_argument("--rebuild", action="store_true", help="Recompute the statistics from Grants")
+    main(parser.parse_args().rebuild)
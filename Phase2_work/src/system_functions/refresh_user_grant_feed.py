@@ -0,0 +1,188 @@
+"""
+    File: refresh_user_grant_feed.py
+    Version: 19 October 2026
+    Author: Colby Wirth
+
+    Description: Keeps UserGrantFeed, each user's recommended open grants, up to date.  Runs after
+    each ingest in daily_grants_maintenance.py.
+
+    Scores come from src/utils/recommendations.py, over each user's research fields, institution
+    and past applications.  Only what changed is re-scored:
+        - grants: the GrantChangeLog rows after UserGrantFeedPosition.change_id, CHANGE_BATCH at a
+          time; each changed grant is removed from every feed and, while open, scored again for
+          the users it can reach.  A feed that grew past FEED_SIZE is trimmed to its best rows.
+        - users: a user whose profile digest differs from the one their feed was built from
+          (new users, changed research fields or institution, new applications) is rebuilt
+          against every open grant.
+    Grants that closed are then removed from every feed.  Everything is committed together, so
+    /api/user/feed serves the previous feed until the new one is complete, and a failed run is
+    simply repeated by the next one.
+
+    The first run builds the feed of every user.
+
+"""
+import os
+import time
+from collections import defaultdict
+
+import mysql.connector
+from dotenv import load_dotenv
+from mysql.connector import Error as MySQLError
+
+from src.utils.logging_utils import log_info, log_error, log_warning
+from src.utils.recommendations import FEED_SIZE, Recommender, feed_grant, user_profile
+from src.utils.sql_registry import get_sql
+
+CHANGE_BATCH = 5000
+INSERT_BATCH = 1000
+
+
+def _position(cursor) -> int | None:
+    cursor.execute(get_sql("user_grant_feed/select_user_grant_feed_position"))
+    row = cursor.fetchone()
+    return row[0] if row else None
+
+
+def _save_position(cursor, change_id: int) -> None:
+    params = {"change_id": change_id}
+    cursor.execute(get_sql("user_grant_feed/update_user_grant_feed_position", params), params)
+
+
+def _load_profiles(cursor) -> list:
+    """The current profile of every user."""
+    cursor.execute(get_sql("user_grant_feed/select_feed_users"))
+    institutions, fields = {}, defaultdict(list)
+    for user_id, institution, research_field in cursor.fetchall():
+        institutions[user_id] = institution
+        if research_field:
+            fields[user_id].append(research_field)
+
+    cursor.execute(get_sql("user_grant_feed/select_feed_applications"))
+    applications = defaultdict(list)
+    for user_id, grant_id, provider, research_field in cursor.fetchall():
+        applications[user_id].append((grant_id, provider, research_field))
+
+    return [
+        user_profile(user_id, institution, fields[user_id], applications[user_id])
+        for user_id, institution in institutions.items()
+    ]
+
+
+def _insert(cursor, rows: list[tuple]) -> None:
+    insert_sql = get_sql("user_grant_feed/create_user_grant_feed")
+    for i in range(0, len(rows), INSERT_BATCH):
+        cursor.executemany(insert_sql, rows[i:i + INSERT_BATCH])
+
+
+def _apply_grant_changes(cursor, recommender: Recommender, position: int) -> tuple[int, int]:
+    """Re-score the grants changed after position for the users of recommender; (changes read, new position)."""
+    changed = 0
+    grown = set()
+    while True:
+        cursor.execute(get_sql("user_grant_feed/select_changed_grants_for_feed"), (position, CHANGE_BATCH))
+        rows = cursor.fetchall()
+        if not rows:
+            break
+        # the latest change of each grant in the batch
+        latest = {row[1]: row for row in rows}
+        cursor.executemany(get_sql("user_grant_feed/delete_user_grant_feed_by_grant"), [(g,) for g in latest])
+        feed_rows = []
+        for _, grant_id, title, research_field, provider, eligibility, is_open in latest.values():
+            if not is_open:
+                continue
+            for user, points, reasons in recommender.match(feed_grant(grant_id, title, research_field, provider, eligibility)):
+                feed_rows.append((user.user_id, grant_id, points, reasons))
+                grown.add(user.user_id)
+        _insert(cursor, feed_rows)
+        changed += len(latest)
+        position = rows[-1][0]
+        if len(rows) < CHANGE_BATCH:
+            break
+
+    if grown:
+        cursor.executemany(
+            get_sql("user_grant_feed/delete_user_grant_feed_overflow"),
+            [(user_id, FEED_SIZE, user_id) for user_id in grown],
+        )
+    return changed, position
+
+
+def _rebuild(cursor, recommender: Recommender) -> int:
+    """Replace the feeds of the users of recommender, scored against every open grant; rows written."""
+    cursor.execute(get_sql("user_grant_feed/select_open_grants_for_feed"))
+    grants = [feed_grant(*row) for row in cursor.fetchall()]
+    feeds = recommender.feeds(grants)
+
+    user_ids = [(user.user_id,) for user in recommender.users]
+    cursor.executemany(get_sql("user_grant_feed/delete_user_grant_feed_by_user"), user_ids)
+    rows = [
+        (user_id, grant_id, points, reasons)
+        for user_id, feed in feeds.items()
+        for points, grant_id, reasons in feed
+    ]
+    _insert(cursor, rows)
+    cursor.executemany(
+        get_sql("user_grant_feed/update_user_grant_feed_profile"),
+        [(user.user_id, user.digest) for user in recommender.users],
+    )
+    return len(rows)
+
+
+def main():
+    load_dotenv()
+    DB_NAME = os.getenv("DB_NAME", "GrantGuruDB")
+    HOST = os.getenv("HOST", "localhost")
+    MYSQL_USER = os.getenv("GG_USER", "root")
+    MYSQL_PASS = os.getenv("GG_PASS", "")
+
+    cnx = None
+    try:
+        start = time.perf_counter()
+        cnx = mysql.connector.connect(database=DB_NAME, host=HOST, user=MYSQL_USER, password=MYSQL_PASS)
+        with cnx.cursor() as cursor:
+            position = _position(cursor)
+            # read before the grants, so a change made during the run is applied again next time
+            cursor.execute(get_sql("grants/select_grant_change_log_position"))
+            latest_change = cursor.fetchone()[0]
+
+            profiles = _load_profiles(cursor)
+            cursor.execute(get_sql("user_grant_feed/select_user_grant_feed_profiles"))
+            built_from = dict(cursor.fetchall())
+            stale = [p for p in profiles if built_from.get(p.user_id) != p.digest]
+            current = [p for p in profiles if built_from.get(p.user_id) == p.digest]
+
+            changed = 0
+            if position is None:
+                position = latest_change
+            else:
+                cursor.execute(get_sql("grants/select_grant_change_log_oldest"))
+                oldest = cursor.fetchone()[0]
+                if oldest is not None and oldest > position + 1:
+                    log_warning(f"Grant changes {position + 1} to {oldest - 1} were pruned before the feed read them.")
+                # before the rebuild, which would otherwise lose the changed grants of stale users
+                changed, position = _apply_grant_changes(cursor, Recommender(current), position)
+
+            written = _rebuild(cursor, Recommender(stale)) if stale else 0
+
+            cursor.execute(get_sql("user_grant_feed/delete_user_grant_feed_closed"))
+            closed = cursor.rowcount
+            _save_position(cursor, max(position, latest_change))
+        cnx.commit()
+        log_info(
+            f"Refreshed grant feeds: {changed} changed grants for {len(current)} users, "
+            f"{len(stale)} users rebuilt ({written} rows), {closed} closed rows removed "
+            f"in {time.perf_counter() - start:.1f}s."
+        )
+        return len(stale)
+    except MySQLError as e:
+        if cnx is not None:
+            cnx.rollback()
+        log_error(f"MySQL error refreshing user grant feeds: {e}")
+        return e
+    finally:
+        if cnx is not None and cnx.is_connected():
+            cnx.close()
+
+
+if __name__ == "__main__":
+    main()
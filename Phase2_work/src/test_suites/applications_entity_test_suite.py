@@ -77,7 +77,7 @@ def setup_test_data():
         INSERT INTO Users (f_name, l_name, email, password)
         VALUES ('Test', 'User', 'testuser@example.com', 'pw123')
     """)
-    cursor.execute("SELECT BIN_TO_UUID(user_id) FROM Users WHERE email='testuser@example.com'")
+    cursor.execute("SELECT BIN_TO_UUID(user_id, 1) FROM Users WHERE email='testuser@example.com'")
     user_id = cursor.fetchone()[0]
     
     # Create second test user for multi-user tests
@@ -85,7 +85,7 @@ def setup_test_data():
         INSERT INTO Users (f_name, l_name, email, password)
         VALUES ('Second', 'User', 'seconduser@example.com', 'pw456')
     """)
-    cursor.execute("SELECT BIN_TO_UUID(user_id) FROM Users WHERE email='seconduser@example.com'")
+    cursor.execute("SELECT BIN_TO_UUID(user_id, 1) FROM Users WHERE email='seconduser@example.com'")
     user_id_2 = cursor.fetchone()[0]
 
     # Create test grant
@@ -93,7 +93,7 @@ def setup_test_data():
         INSERT INTO Grants (grant_title, link_to_source)
         VALUES ('Test Grant 2025', 'http://example.com/grant1')
     """)
-    cursor.execute("SELECT BIN_TO_UUID(grant_id) FROM Grants WHERE grant_title='Test Grant 2025'")
+    cursor.execute("SELECT BIN_TO_UUID(grant_id, 1) FROM Grants WHERE grant_title='Test Grant 2025'")
     grant_id = cursor.fetchone()[0]
     
     # Create second test grant
@@ -101,7 +101,7 @@ def setup_test_data():
         INSERT INTO Grants (grant_title, link_to_source)
         VALUES ('Second Test Grant', 'http://example.com/grant2')
     """)
-    cursor.execute("SELECT BIN_TO_UUID(grant_id) FROM Grants WHERE grant_title='Second Test Grant'")
+    cursor.execute("SELECT BIN_TO_UUID(grant_id, 1) FROM Grants WHERE grant_title='Second Test Grant'")
     grant_id_2 = cursor.fetchone()[0]
 
     cnx.commit()
@@ -230,7 +230,7 @@ def create_application_tests(user_id, grant_id, user_id_2, grant_id_2):
         INSERT INTO Users (f_name, l_name, email, password)
         VALUES ('Status', 'Tester', 'statustester@example.com', 'pw789')
     """)
-    cursor.execute("SELECT BIN_TO_UUID(user_id) FROM Users WHERE email='statustester@example.com'")
+    cursor.execute("SELECT BIN_TO_UUID(user_id, 1) FROM Users WHERE email='statustester@example.com'")
     status_user_id = cursor.fetchone()[0]
     cnx.commit()  # Commit before creating grants
     
@@ -240,7 +240,7 @@ def create_application_tests(user_id, grant_id, user_id_2, grant_id_2):
             VALUES (%s, %s)
         """, (f"Grant for {status}", f"http://example.com/{status}"))
         cnx.commit()  # Commit each grant
-        cursor.execute("SELECT BIN_TO_UUID(grant_id) FROM Grants WHERE grant_title=%s", (f"Grant for {status}",))
+        cursor.execute("SELECT BIN_TO_UUID(grant_id, 1) FROM Grants WHERE grant_title=%s", (f"Grant for {status}",))
         temp_grant_id = cursor.fetchone()[0]
         
         try_insert({
@@ -279,20 +279,20 @@ def select_application_by_id_tests(user_id, grant_id):
         INSERT INTO Grants (grant_title, link_to_source)
         VALUES ('Select Test Grant', 'http://example.com/selecttest')
     """)
-    cursor.execute("SELECT BIN_TO_UUID(grant_id) FROM Grants WHERE grant_title='Select Test Grant'")
+    cursor.execute("SELECT BIN_TO_UUID(grant_id, 1) FROM Grants WHERE grant_title='Select Test Grant'")
     test_grant_id = cursor.fetchone()[0]
     
     # Create test application with new grant
     today = date.today().isoformat()
     cursor.execute("""
         INSERT INTO Applications (user_id, grant_id, status, application_date)
-        VALUES (UUID_TO_BIN(%s), UUID_TO_BIN(%s), 'pending', %s)
+        VALUES (UUID_TO_BIN(%s, 1), UUID_TO_BIN(%s, 1), 'pending', %s)
     """, (user_id, test_grant_id, today))
     
     cursor.execute("""
-        SELECT BIN_TO_UUID(application_id) 
+        SELECT BIN_TO_UUID(application_id, 1) 
         FROM Applications 
-        WHERE user_id = UUID_TO_BIN(%s) AND grant_id = UUID_TO_BIN(%s)
+        WHERE user_id = UUID_TO_BIN(%s, 1) AND grant_id = UUID_TO_BIN(%s, 1)
     """, (user_id, grant_id))
     app_id = cursor.fetchone()[0]
     cnx.commit()
@@ -363,14 +363,14 @@ def select_application_by_user_tests(user_id, grant_id, grant_id_2):
         INSERT INTO Grants (grant_title, link_to_source)
         VALUES ('User Test Grant 1', 'http://example.com/usertest1')
     """)
-    cursor.execute("SELECT BIN_TO_UUID(grant_id) FROM Grants WHERE grant_title='User Test Grant 1'")
+    cursor.execute("SELECT BIN_TO_UUID(grant_id, 1) FROM Grants WHERE grant_title='User Test Grant 1'")
     user_test_grant_1 = cursor.fetchone()[0]
     
     cursor.execute("""
         INSERT INTO Grants (grant_title, link_to_source)
         VALUES ('User Test Grant 2', 'http://example.com/usertest2')
     """)
-    cursor.execute("SELECT BIN_TO_UUID(grant_id) FROM Grants WHERE grant_title='User Test Grant 2'")
+    cursor.execute("SELECT BIN_TO_UUID(grant_id, 1) FROM Grants WHERE grant_title='User Test Grant 2'")
     user_test_grant_2 = cursor.fetchone()[0]
     cnx.commit()
 
@@ -378,12 +378,12 @@ def select_application_by_user_tests(user_id, grant_id, grant_id_2):
     today = date.today().isoformat()
     cursor.execute("""
         INSERT INTO Applications (user_id, grant_id, status, application_date)
-        VALUES (UUID_TO_BIN(%s), UUID_TO_BIN(%s), 'pending', %s)
+        VALUES (UUID_TO_BIN(%s, 1), UUID_TO_BIN(%s, 1), 'pending', %s)
     """, (user_id, user_test_grant_1, today))
     
     cursor.execute("""
         INSERT INTO Applications (user_id, grant_id, status, application_date)
-        VALUES (UUID_TO_BIN(%s), UUID_TO_BIN(%s), 'approved', %s)
+        VALUES (UUID_TO_BIN(%s, 1), UUID_TO_BIN(%s, 1), 'approved', %s)
     """, (user_id, user_test_grant_2, today))
     cnx.commit()
 
@@ -403,7 +403,7 @@ def select_application_by_user_tests(user_id, grant_id, grant_id_2):
         INSERT INTO Users (f_name, l_name, email, password)
         VALUES ('No', 'Apps', 'noapps@example.com', 'pw000')
     """)
-    cursor.execute("SELECT BIN_TO_UUID(user_id) FROM Users WHERE email='noapps@example.com'")
+    cursor.execute("SELECT BIN_TO_UUID(user_id, 1) FROM Users WHERE email='noapps@example.com'")
     empty_user_id = cursor.fetchone()[0]
     cnx.commit()
 
@@ -449,7 +449,7 @@ def select_application_by_grant_tests(user_id, user_id_2, grant_id):
         INSERT INTO Grants (grant_title, link_to_source)
         VALUES ('Grant Test Multi User', 'http://example.com/grantmulti')
     """)
-    cursor.execute("SELECT BIN_TO_UUID(grant_id) FROM Grants WHERE grant_title='Grant Test Multi User'")
+    cursor.execute("SELECT BIN_TO_UUID(grant_id, 1) FROM Grants WHERE grant_title='Grant Test Multi User'")
     grant_test_id = cursor.fetchone()[0]
     cnx.commit()
 
@@ -457,12 +457,12 @@ def select_application_by_grant_tests(user_id, user_id_2, grant_id):
     today = date.today().isoformat()
     cursor.execute("""
         INSERT INTO Applications (user_id, grant_id, status, application_date)
-        VALUES (UUID_TO_BIN(%s), UUID_TO_BIN(%s), 'pending', %s)
+        VALUES (UUID_TO_BIN(%s, 1), UUID_TO_BIN(%s, 1), 'pending', %s)
     """, (user_id, grant_test_id, today))
     
     cursor.execute("""
         INSERT INTO Applications (user_id, grant_id, status, application_date)
-        VALUES (UUID_TO_BIN(%s), UUID_TO_BIN(%s), 'submitted', %s)
+        VALUES (UUID_TO_BIN(%s, 1), UUID_TO_BIN(%s, 1), 'submitted', %s)
     """, (user_id_2, grant_test_id, today))
     cnx.commit()
 
@@ -482,7 +482,7 @@ def select_application_by_grant_tests(user_id, user_id_2, grant_id):
         INSERT INTO Grants (grant_title, link_to_source)
         VALUES ('Empty Grant', 'http://example.com/empty')
     """)
-    cursor.execute("SELECT BIN_TO_UUID(grant_id) FROM Grants WHERE grant_title='Empty Grant'")
+    cursor.execute("SELECT BIN_TO_UUID(grant_id, 1) FROM Grants WHERE grant_title='Empty Grant'")
     empty_grant_id = cursor.fetchone()[0]
     cnx.commit()
 
@@ -516,14 +516,14 @@ def select_application_by_status_tests(user_id, grant_id, grant_id_2):
         INSERT INTO Grants (grant_title, link_to_source)
         VALUES ('Status Test Grant 1', 'http://example.com/statustest1')
     """)
-    cursor.execute("SELECT BIN_TO_UUID(grant_id) FROM Grants WHERE grant_title='Status Test Grant 1'")
+    cursor.execute("SELECT BIN_TO_UUID(grant_id, 1) FROM Grants WHERE grant_title='Status Test Grant 1'")
     status_grant_1 = cursor.fetchone()[0]
     
     cursor.execute("""
         INSERT INTO Grants (grant_title, link_to_source)
         VALUES ('Status Test Grant 2', 'http://example.com/statustest2')
     """)
-    cursor.execute("SELECT BIN_TO_UUID(grant_id) FROM Grants WHERE grant_title='Status Test Grant 2'")
+    cursor.execute("SELECT BIN_TO_UUID(grant_id, 1) FROM Grants WHERE grant_title='Status Test Grant 2'")
     status_grant_2 = cursor.fetchone()[0]
     cnx.commit()
 
@@ -535,18 +535,18 @@ def select_application_by_status_tests(user_id, grant_id, grant_id_2):
         INSERT INTO Users (f_name, l_name, email, password)
         VALUES ('Status', 'Test', 'statustest@example.com', 'pw111')
     """)
-    cursor.execute("SELECT BIN_TO_UUID(user_id) FROM Users WHERE email='statustest@example.com'")
+    cursor.execute("SELECT BIN_TO_UUID(user_id, 1) FROM Users WHERE email='statustest@example.com'")
     status_user = cursor.fetchone()[0]
     cnx.commit()
     
     cursor.execute("""
         INSERT INTO Applications (user_id, grant_id, status, application_date)
-        VALUES (UUID_TO_BIN(%s), UUID_TO_BIN(%s), 'approved', %s)
+        VALUES (UUID_TO_BIN(%s, 1), UUID_TO_BIN(%s, 1), 'approved', %s)
     """, (status_user, status_grant_1, today))
     
     cursor.execute("""
         INSERT INTO Applications (user_id, grant_id, status, application_date)
-        VALUES (UUID_TO_BIN(%s), UUID_TO_BIN(%s), 'approved', %s)
+        VALUES (UUID_TO_BIN(%s, 1), UUID_TO_BIN(%s, 1), 'approved', %s)
     """, (user_id, status_grant_2, today))
     cnx.commit()
 
@@ -593,7 +593,7 @@ def update_application_status_tests(user_id, grant_id):
         INSERT INTO Grants (grant_title, link_to_source)
         VALUES ('Update Status Test Grant', 'http://example.com/updatetest')
     """)
-    cursor.execute("SELECT BIN_TO_UUID(grant_id) FROM Grants WHERE grant_title='Update Status Test Grant'")
+    cursor.execute("SELECT BIN_TO_UUID(grant_id, 1) FROM Grants WHERE grant_title='Update Status Test Grant'")
     update_grant_id = cursor.fetchone()[0]
     cnx.commit()
 
@@ -601,13 +601,13 @@ def update_application_status_tests(user_id, grant_id):
     today = date.today().isoformat()
     cursor.execute("""
         INSERT INTO Applications (user_id, grant_id, status, application_date)
-        VALUES (UUID_TO_BIN(%s), UUID_TO_BIN(%s), 'pending', %s)
+        VALUES (UUID_TO_BIN(%s, 1), UUID_TO_BIN(%s, 1), 'pending', %s)
     """, (user_id, update_grant_id, today))
     
     cursor.execute("""
-        SELECT BIN_TO_UUID(application_id)
+        SELECT BIN_TO_UUID(application_id, 1)
         FROM Applications
-        WHERE user_id = UUID_TO_BIN(%s) AND grant_id = UUID_TO_BIN(%s)
+        WHERE user_id = UUID_TO_BIN(%s, 1) AND grant_id = UUID_TO_BIN(%s, 1)
     """, (user_id, update_grant_id))
     app_id = cursor.fetchone()[0]
     cnx.commit()
@@ -623,9 +623,9 @@ def update_application_status_tests(user_id, grant_id):
 
     # 2. Verify status updated and other fields unchanged
     cursor.execute("""
-        SELECT BIN_TO_UUID(user_id), BIN_TO_UUID(grant_id), status, application_date
+        SELECT BIN_TO_UUID(user_id, 1), BIN_TO_UUID(grant_id, 1), status, application_date
         FROM Applications
-        WHERE application_id = UUID_TO_BIN(%s)
+        WHERE application_id = UUID_TO_BIN(%s, 1)
     """, (app_id,))
     row = cursor.fetchone()
     
@@ -649,7 +649,7 @@ def update_application_status_tests(user_id, grant_id):
         cursor.execute(update_sql, {"application_id": app_id, "status": "  rejected  "})
         cnx.commit()
         cursor.execute("""
-            SELECT status FROM Applications WHERE application_id = UUID_TO_BIN(%s)
+            SELECT status FROM Applications WHERE application_id = UUID_TO_BIN(%s, 1)
         """, (app_id,))
         status = cursor.fetchone()[0]
         if status == "rejected":
@@ -680,7 +680,7 @@ def delete_application_by_id_tests(user_id, grant_id):
         INSERT INTO Grants (grant_title, link_to_source)
         VALUES ('Delete By ID Test Grant', 'http://example.com/deleteidtest')
     """)
-    cursor.execute("SELECT BIN_TO_UUID(grant_id) FROM Grants WHERE grant_title='Delete By ID Test Grant'")
+    cursor.execute("SELECT BIN_TO_UUID(grant_id, 1) FROM Grants WHERE grant_title='Delete By ID Test Grant'")
     delete_grant_id = cursor.fetchone()[0]
     cnx.commit()
 
@@ -688,13 +688,13 @@ def delete_application_by_id_tests(user_id, grant_id):
     today = date.today().isoformat()
     cursor.execute("""
         INSERT INTO Applications (user_id, grant_id, status, application_date)
-        VALUES (UUID_TO_BIN(%s), UUID_TO_BIN(%s), 'pending', %s)
+        VALUES (UUID_TO_BIN(%s, 1), UUID_TO_BIN(%s, 1), 'pending', %s)
     """, (user_id, delete_grant_id, today))
     
     cursor.execute("""
-        SELECT BIN_TO_UUID(application_id)
+        SELECT BIN_TO_UUID(application_id, 1)
         FROM Applications
-        WHERE user_id = UUID_TO_BIN(%s) AND grant_id = UUID_TO_BIN(%s)
+        WHERE user_id = UUID_TO_BIN(%s, 1) AND grant_id = UUID_TO_BIN(%s, 1)
     """, (user_id, delete_grant_id))
     app_id = cursor.fetchone()[0]
     cnx.commit()
@@ -706,7 +706,7 @@ def delete_application_by_id_tests(user_id, grant_id):
         
         # Verify deletion
         cursor.execute("""
-            SELECT COUNT(*) FROM Applications WHERE application_id = UUID_TO_BIN(%s)
+            SELECT COUNT(*) FROM Applications WHERE application_id = UUID_TO_BIN(%s, 1)
         """, (app_id,))
         count = cursor.fetchone()[0]
         
@@ -748,14 +748,14 @@ def delete_application_by_user_grant_tests(user_id, grant_id):
         INSERT INTO Grants (grant_title, link_to_source)
         VALUES ('Delete User-Grant Test 1', 'http://example.com/deleteug1')
     """)
-    cursor.execute("SELECT BIN_TO_UUID(grant_id) FROM Grants WHERE grant_title='Delete User-Grant Test 1'")
+    cursor.execute("SELECT BIN_TO_UUID(grant_id, 1) FROM Grants WHERE grant_title='Delete User-Grant Test 1'")
     delete_ug_grant_1 = cursor.fetchone()[0]
     
     cursor.execute("""
         INSERT INTO Grants (grant_title, link_to_source)
         VALUES ('Delete User-Grant Test 2', 'http://example.com/deleteug2')
     """)
-    cursor.execute("SELECT BIN_TO_UUID(grant_id) FROM Grants WHERE grant_title='Delete User-Grant Test 2'")
+    cursor.execute("SELECT BIN_TO_UUID(grant_id, 1) FROM Grants WHERE grant_title='Delete User-Grant Test 2'")
     delete_ug_grant_2 = cursor.fetchone()[0]
     cnx.commit()
 
@@ -763,12 +763,12 @@ def delete_application_by_user_grant_tests(user_id, grant_id):
     today = date.today().isoformat()
     cursor.execute("""
         INSERT INTO Applications (user_id, grant_id, status, application_date)
-        VALUES (UUID_TO_BIN(%s), UUID_TO_BIN(%s), 'pending', %s)
+        VALUES (UUID_TO_BIN(%s, 1), UUID_TO_BIN(%s, 1), 'pending', %s)
     """, (user_id, delete_ug_grant_1, today))
     
     cursor.execute("""
         INSERT INTO Applications (user_id, grant_id, status, application_date)
-        VALUES (UUID_TO_BIN(%s), UUID_TO_BIN(%s), 'pending', %s)
+        VALUES (UUID_TO_BIN(%s, 1), UUID_TO_BIN(%s, 1), 'pending', %s)
     """, (user_id, delete_ug_grant_2, today))
     cnx.commit()
 
@@ -780,14 +780,14 @@ def delete_application_by_user_grant_tests(user_id, grant_id):
         # Verify specific deletion
         cursor.execute("""
             SELECT COUNT(*) FROM Applications 
-            WHERE user_id = UUID_TO_BIN(%s) AND grant_id = UUID_TO_BIN(%s)
+            WHERE user_id = UUID_TO_BIN(%s, 1) AND grant_id = UUID_TO_BIN(%s, 1)
         """, (user_id, delete_ug_grant_1))
         count = cursor.fetchone()[0]
         
         # Verify other application still exists
         cursor.execute("""
             SELECT COUNT(*) FROM Applications 
-            WHERE user_id = UUID_TO_BIN(%s) AND grant_id = UUID_TO_BIN(%s)
+            WHERE user_id = UUID_TO_BIN(%s, 1) AND grant_id = UUID_TO_BIN(%s, 1)
         """, (user_id, delete_ug_grant_2))
         other_count = cursor.fetchone()[0]
         
@@ -829,28 +829,28 @@ def delete_applications_by_user_tests(user_id, grant_id, grant_id_2):
         INSERT INTO Grants (grant_title, link_to_source)
         VALUES ('Delete User Test Grant 1', 'http://example.com/delusertest1')
     """)
-    cursor.execute("SELECT BIN_TO_UUID(grant_id) FROM Grants WHERE grant_title='Delete User Test Grant 1'")
+    cursor.execute("SELECT BIN_TO_UUID(grant_id, 1) FROM Grants WHERE grant_title='Delete User Test Grant 1'")
     del_user_grant_1 = cursor.fetchone()[0]
     
     cursor.execute("""
         INSERT INTO Grants (grant_title, link_to_source)
         VALUES ('Delete User Test Grant 2', 'http://example.com/delusertest2')
     """)
-    cursor.execute("SELECT BIN_TO_UUID(grant_id) FROM Grants WHERE grant_title='Delete User Test Grant 2'")
+    cursor.execute("SELECT BIN_TO_UUID(grant_id, 1) FROM Grants WHERE grant_title='Delete User Test Grant 2'")
     del_user_grant_2 = cursor.fetchone()[0]
     
     cursor.execute("""
         INSERT INTO Grants (grant_title, link_to_source)
         VALUES ('Delete User Test Grant 3', 'http://example.com/delusertest3')
     """)
-    cursor.execute("SELECT BIN_TO_UUID(grant_id) FROM Grants WHERE grant_title='Delete User Test Grant 3'")
+    cursor.execute("SELECT BIN_TO_UUID(grant_id, 1) FROM Grants WHERE grant_title='Delete User Test Grant 3'")
     del_user_grant_3 = cursor.fetchone()[0]
     
     cursor.execute("""
         INSERT INTO Grants (grant_title, link_to_source)
         VALUES ('Delete User Test Grant 4', 'http://example.com/delusertest4')
     """)
-    cursor.execute("SELECT BIN_TO_UUID(grant_id) FROM Grants WHERE grant_title='Delete User Test Grant 4'")
+    cursor.execute("SELECT BIN_TO_UUID(grant_id, 1) FROM Grants WHERE grant_title='Delete User Test Grant 4'")
     del_user_grant_4 = cursor.fetchone()[0]
     cnx.commit()
 
@@ -859,7 +859,7 @@ def delete_applications_by_user_tests(user_id, grant_id, grant_id_2):
         INSERT INTO Users (f_name, l_name, email, password)
         VALUES ('Delete', 'User', 'deleteuser@example.com', 'pw222')
     """)
-    cursor.execute("SELECT BIN_TO_UUID(user_id) FROM Users WHERE email='deleteuser@example.com'")
+    cursor.execute("SELECT BIN_TO_UUID(user_id, 1) FROM Users WHERE email='deleteuser@example.com'")
     delete_user_id = cursor.fetchone()[0]
     
     # Create another user for "other applications" test
@@ -867,25 +867,25 @@ def delete_applications_by_user_tests(user_id, grant_id, grant_id_2):
         INSERT INTO Users (f_name, l_name, email, password)
         VALUES ('Keep', 'User', 'keepuser@example.com', 'pw223')
     """)
-    cursor.execute("SELECT BIN_TO_UUID(user_id) FROM Users WHERE email='keepuser@example.com'")
+    cursor.execute("SELECT BIN_TO_UUID(user_id, 1) FROM Users WHERE email='keepuser@example.com'")
     keep_user_id = cursor.fetchone()[0]
     cnx.commit()
     
     today = date.today().isoformat()
     cursor.execute("""
         INSERT INTO Applications (user_id, grant_id, status, application_date)
-        VALUES (UUID_TO_BIN(%s), UUID_TO_BIN(%s), 'pending', %s)
+        VALUES (UUID_TO_BIN(%s, 1), UUID_TO_BIN(%s, 1), 'pending', %s)
     """, (delete_user_id, del_user_grant_1, today))  # ← CHANGED: uses delete_user_id and del_user_grant_1
     
     cursor.execute("""
         INSERT INTO Applications (user_id, grant_id, status, application_date)
-        VALUES (UUID_TO_BIN(%s), UUID_TO_BIN(%s), 'pending', %s)
+        VALUES (UUID_TO_BIN(%s, 1), UUID_TO_BIN(%s, 1), 'pending', %s)
     """, (delete_user_id, del_user_grant_2, today))  # ← CHANGED: uses delete_user_id and del_user_grant_2
     
     # Keep track of another user's application with different grant
     cursor.execute("""
         INSERT INTO Applications (user_id, grant_id, status, application_date)
-        VALUES (UUID_TO_BIN(%s), UUID_TO_BIN(%s), 'pending', %s)
+        VALUES (UUID_TO_BIN(%s, 1), UUID_TO_BIN(%s, 1), 'pending', %s)
     """, (keep_user_id, del_user_grant_3, today))  # ← CHANGED: uses keep_user_id and del_user_grant_3
     cnx.commit()
 
@@ -896,13 +896,13 @@ def delete_applications_by_user_tests(user_id, grant_id, grant_id_2):
         
         # Verify all deleted
         cursor.execute("""
-            SELECT COUNT(*) FROM Applications WHERE user_id = UUID_TO_BIN(%s)
+            SELECT COUNT(*) FROM Applications WHERE user_id = UUID_TO_BIN(%s, 1)
         """, (delete_user_id,))
         count = cursor.fetchone()[0]
         
         # Verify other user's application still exists
         cursor.execute("""
-            SELECT COUNT(*) FROM Applications WHERE user_id = UUID_TO_BIN(%s)
+            SELECT COUNT(*) FROM Applications WHERE user_id = UUID_TO_BIN(%s, 1)
         """, (keep_user_id,))
         other_count = cursor.fetchone()[0]
         
@@ -919,7 +919,7 @@ def delete_applications_by_user_tests(user_id, grant_id, grant_id_2):
         INSERT INTO Users (f_name, l_name, email, password)
         VALUES ('Empty', 'User', 'emptyuser@example.com', 'pw333')
     """)
-    cursor.execute("SELECT BIN_TO_UUID(user_id) FROM Users WHERE email='emptyuser@example.com'")
+    cursor.execute("SELECT BIN_TO_UUID(user_id, 1) FROM Users WHERE email='emptyuser@example.com'")
     empty_user_id = cursor.fetchone()[0]
     cnx.commit()
 
@@ -950,32 +950,32 @@ def delete_applications_by_grant_tests(user_id, user_id_2, grant_id):
         INSERT INTO Grants (grant_title, link_to_source)
         VALUES ('Delete Grant Test Main', 'http://example.com/delgrantmain')
     """)
-    cursor.execute("SELECT BIN_TO_UUID(grant_id) FROM Grants WHERE grant_title='Delete Grant Test Main'")
+    cursor.execute("SELECT BIN_TO_UUID(grant_id, 1) FROM Grants WHERE grant_title='Delete Grant Test Main'")
     delete_grant_id = cursor.fetchone()[0]
     
     cursor.execute("""
         INSERT INTO Grants (grant_title, link_to_source)
         VALUES ('Delete Grant Test Other', 'http://example.com/delgrantother')
     """)
-    cursor.execute("SELECT BIN_TO_UUID(grant_id) FROM Grants WHERE grant_title='Delete Grant Test Other'")
+    cursor.execute("SELECT BIN_TO_UUID(grant_id, 1) FROM Grants WHERE grant_title='Delete Grant Test Other'")
     other_grant_id = cursor.fetchone()[0]
     cnx.commit()
     
     today = date.today().isoformat()
     cursor.execute("""
         INSERT INTO Applications (user_id, grant_id, status, application_date)
-        VALUES (UUID_TO_BIN(%s), UUID_TO_BIN(%s), 'pending', %s)
+        VALUES (UUID_TO_BIN(%s, 1), UUID_TO_BIN(%s, 1), 'pending', %s)
     """, (user_id, delete_grant_id, today))
     
     cursor.execute("""
         INSERT INTO Applications (user_id, grant_id, status, application_date)
-        VALUES (UUID_TO_BIN(%s), UUID_TO_BIN(%s), 'pending', %s)
+        VALUES (UUID_TO_BIN(%s, 1), UUID_TO_BIN(%s, 1), 'pending', %s)
     """, (user_id_2, delete_grant_id, today))
     
     # Keep another grant's application
     cursor.execute("""
         INSERT INTO Applications (user_id, grant_id, status, application_date)
-        VALUES (UUID_TO_BIN(%s), UUID_TO_BIN(%s), 'pending', %s)
+        VALUES (UUID_TO_BIN(%s, 1), UUID_TO_BIN(%s, 1), 'pending', %s)
     """, (user_id, other_grant_id, today))  # ← FIXED: uses other_grant_id
     cnx.commit()
 
@@ -986,13 +986,13 @@ def delete_applications_by_grant_tests(user_id, user_id_2, grant_id):
         
         # Verify all deleted
         cursor.execute("""
-            SELECT COUNT(*) FROM Applications WHERE grant_id = UUID_TO_BIN(%s)
+            SELECT COUNT(*) FROM Applications WHERE grant_id = UUID_TO_BIN(%s, 1)
         """, (delete_grant_id,))
         count = cursor.fetchone()[0]
         
         # Verify other grant's application still exists
         cursor.execute("""
-            SELECT COUNT(*) FROM Applications WHERE grant_id = UUID_TO_BIN(%s)
+            SELECT COUNT(*) FROM Applications WHERE grant_id = UUID_TO_BIN(%s, 1)
         """, (other_grant_id,))  # ← FIXED: uses other_grant_id
         other_count = cursor.fetchone()[0]
         
@@ -1009,7 +1009,7 @@ def delete_applications_by_grant_tests(user_id, user_id_2, grant_id):
         INSERT INTO Grants (grant_title, link_to_source)
         VALUES ('Empty Delete Grant', 'http://example.com/emptydelete')
     """)
-    cursor.execute("SELECT BIN_TO_UUID(grant_id) FROM Grants WHERE grant_title='Empty Delete Grant'")
+    cursor.execute("SELECT BIN_TO_UUID(grant_id, 1) FROM Grants WHERE grant_title='Empty Delete Grant'")
     empty_grant_id = cursor.fetchone()[0]
     cnx.commit()
 
@@ -1038,23 +1038,23 @@ def cascade_delete_tests(user_id, grant_id):
         INSERT INTO Users (f_name, l_name, email, password)
         VALUES ('Cascade', 'User', 'cascadeuser@example.com', 'pw444')
     """)
-    cursor.execute("SELECT BIN_TO_UUID(user_id) FROM Users WHERE email='cascadeuser@example.com'")
+    cursor.execute("SELECT BIN_TO_UUID(user_id, 1) FROM Users WHERE email='cascadeuser@example.com'")
     cascade_user_id = cursor.fetchone()[0]
     
     cursor.execute("""
         INSERT INTO Applications (user_id, grant_id, status, application_date)
-        VALUES (UUID_TO_BIN(%s), UUID_TO_BIN(%s), 'pending', %s)
+        VALUES (UUID_TO_BIN(%s, 1), UUID_TO_BIN(%s, 1), 'pending', %s)
     """, (cascade_user_id, grant_id, today))
     cnx.commit()
 
     try:
         # Delete user
-        cursor.execute("DELETE FROM Users WHERE user_id = UUID_TO_BIN(%s)", (cascade_user_id,))
+        cursor.execute("DELETE FROM Users WHERE user_id = UUID_TO_BIN(%s, 1)", (cascade_user_id,))
         cnx.commit()
         
         # Verify application was cascade deleted
         cursor.execute("""
-            SELECT COUNT(*) FROM Applications WHERE user_id = UUID_TO_BIN(%s)
+            SELECT COUNT(*) FROM Applications WHERE user_id = UUID_TO_BIN(%s, 1)
         """, (cascade_user_id,))
         count = cursor.fetchone()[0]
         
@@ -1071,23 +1071,23 @@ def cascade_delete_tests(user_id, grant_id):
         INSERT INTO Grants (grant_title, link_to_source)
         VALUES ('Cascade Grant', 'http://example.com/cascadegrant')
     """)
-    cursor.execute("SELECT BIN_TO_UUID(grant_id) FROM Grants WHERE grant_title='Cascade Grant'")
+    cursor.execute("SELECT BIN_TO_UUID(grant_id, 1) FROM Grants WHERE grant_title='Cascade Grant'")
     cascade_grant_id = cursor.fetchone()[0]
     
     cursor.execute("""
         INSERT INTO Applications (user_id, grant_id, status, application_date)
-        VALUES (UUID_TO_BIN(%s), UUID_TO_BIN(%s), 'pending', %s)
+        VALUES (UUID_TO_BIN(%s, 1), UUID_TO_BIN(%s, 1), 'pending', %s)
     """, (user_id, cascade_grant_id, today))
     cnx.commit()
 
     try:
         # Delete grant
-        cursor.execute("DELETE FROM Grants WHERE grant_id = UUID_TO_BIN(%s)", (cascade_grant_id,))
+        cursor.execute("DELETE FROM Grants WHERE grant_id = UUID_TO_BIN(%s, 1)", (cascade_grant_id,))
         cnx.commit()
         
         # Verify application was cascade deleted
         cursor.execute("""
-            SELECT COUNT(*) FROM Applications WHERE grant_id = UUID_TO_BIN(%s)
+            SELECT COUNT(*) FROM Applications WHERE grant_id = UUID_TO_BIN(%s, 1)
         """, (cascade_grant_id,))
         count = cursor.fetchone()[0]
         
@@ -1118,14 +1118,14 @@ def unique_constraint_tests(user_id, grant_id):
         INSERT INTO Grants (grant_title, link_to_source)
         VALUES ('Unique Constraint Test Grant', 'http://example.com/uniquetest')
     """)
-    cursor.execute("SELECT BIN_TO_UUID(grant_id) FROM Grants WHERE grant_title='Unique Constraint Test Grant'")
+    cursor.execute("SELECT BIN_TO_UUID(grant_id, 1) FROM Grants WHERE grant_title='Unique Constraint Test Grant'")
     unique_grant_id = cursor.fetchone()[0]
     cnx.commit()
 
     # 1. Create initial application
     cursor.execute("""
         INSERT INTO Applications (user_id, grant_id, status, application_date)
-        VALUES (UUID_TO_BIN(%s), UUID_TO_BIN(%s), 'pending', %s)
+        VALUES (UUID_TO_BIN(%s, 1), UUID_TO_BIN(%s, 1), 'pending', %s)
     """, (user_id, unique_grant_id, today))
     cnx.commit()
 
@@ -1133,7 +1133,7 @@ def unique_constraint_tests(user_id, grant_id):
     try:
         cursor.execute("""
             INSERT INTO Applications (user_id, grant_id, status, application_date)
-            VALUES (UUID_TO_BIN(%s), UUID_TO_BIN(%s), 'approved', %s)
+            VALUES (UUID_TO_BIN(%s, 1), UUID_TO_BIN(%s, 1), 'approved', %s)
         """, (user_id, unique_grant_id, today))
         cnx.commit()
         log_error(" ❌ FAIL: Duplicate user-grant application was allowed")
@@ -1149,14 +1149,14 @@ def unique_constraint_tests(user_id, grant_id):
         INSERT INTO Grants (grant_title, link_to_source)
         VALUES ('Unique Test Grant 2', 'http://example.com/uniquetest2')
     """)
-    cursor.execute("SELECT BIN_TO_UUID(grant_id) FROM Grants WHERE grant_title='Unique Test Grant 2'")
+    cursor.execute("SELECT BIN_TO_UUID(grant_id, 1) FROM Grants WHERE grant_title='Unique Test Grant 2'")
     other_grant_id = cursor.fetchone()[0]
     cnx.commit()
 
     try:
         cursor.execute("""
             INSERT INTO Applications (user_id, grant_id, status, application_date)
-            VALUES (UUID_TO_BIN(%s), UUID_TO_BIN(%s), 'pending', %s)
+            VALUES (UUID_TO_BIN(%s, 1), UUID_TO_BIN(%s, 1), 'pending', %s)
         """, (user_id, other_grant_id, today))
         cnx.commit()
         log_info(" ✅ PASS: User can apply to different grants")
@@ -1169,14 +1169,14 @@ def unique_constraint_tests(user_id, grant_id):
         INSERT INTO Users (f_name, l_name, email, password)
         VALUES ('Unique', 'User', 'uniqueuser@example.com', 'pw555')
     """)
-    cursor.execute("SELECT BIN_TO_UUID(user_id) FROM Users WHERE email='uniqueuser@example.com'")
+    cursor.execute("SELECT BIN_TO_UUID(user_id, 1) FROM Users WHERE email='uniqueuser@example.com'")
     other_user_id = cursor.fetchone()[0]
     cnx.commit()
 
     try:
         cursor.execute("""
             INSERT INTO Applications (user_id, grant_id, status, application_date)
-            VALUES (UUID_TO_BIN(%s), UUID_TO_BIN(%s), 'pending', %s)
+            VALUES (UUID_TO_BIN(%s, 1), UUID_TO_BIN(%s, 1), 'pending', %s)
         """, (other_user_id, unique_grant_id, today))
         cnx.commit()
         log_info(" ✅ PASS: Different users can apply to same grant")
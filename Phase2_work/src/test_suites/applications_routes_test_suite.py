@@ -0,0 +1,132 @@
+"""
+    File: applications_routes_test_suite.py
+    Author: Colby Wirth
+    Version: 19 October 2026
+    Description:
+        Tests POST /api/applications/create (Phase3_work/api/applications/routes_applications.py)
+        through a Flask test client: a valid request returns 201 after its connection has gone
+        back to the pool, and invalid requests get 400 without touching the database.
+        MySQL is replaced by a connection that behaves like a pooled one once it is returned
+        (its methods fail), so no database is needed.
+
+    Usage:
+        python -m src.test_suites.applications_routes_test_suite
+"""
+
+import sys
+from pathlib import Path
+
+from flask import Flask
+
+from src.utils.logging_utils import log_info, log_error
+from src.utils.sql_registry import get_sql
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "Phase3_work"))
+from api.applications import applications_bp, routes_applications  # noqa: E402
+from api.query_stats import TimedConnection  # noqa: E402
+
+
+# Test statistics
+test_stats = {"passed": 0, "failed": 0, "errors": 0}
+
+USER = "0190a1b2-0000-7000-8000-0000000000aa"
+GRANT = "0190a1b2-0000-7000-8000-000000000001"
+
+
+def check(description: str, fn):
+    """Run fn() and count it as passed when it returns True."""
+    try:
+        if fn():
+            test_stats["passed"] += 1
+            log_info(f"PASS: {description}")
+        else:
+            test_stats["failed"] += 1
+            log_error(f"FAIL: {description}")
+    except Exception as e:
+        test_stats["errors"] += 1
+        log_error(f"ERROR: {description} - {type(e).__name__}: {e}")
+
+
+class RecordingCursor:
+    def __init__(self, statements):
+        self.statements = statements
+        self.rowcount = 1
+
+    def execute(self, sql, params=None):
+        self.statements.append((sql, params))
+
+    def close(self):
+        pass
+
+
+class PooledConnection:
+    """Like mysql.connector's PooledMySQLConnection: closing returns it and drops the real connection."""
+
+    def __init__(self):
+        self._cnx = self
+        self.statements = []
+
+    def cursor(self):
+        return RecordingCursor(self.statements)
+
+    def commit(self):
+        # PooledMySQLConnection.commit after close() dereferences _cnx, which is then None
+        return self._cnx.commit_real()
+
+    def commit_real(self):
+        pass
+
+    def close(self):
+        self._cnx = None
+
+
+def client_and_connection():
+    conn = PooledConnection()
+    routes_applications.get_connection = lambda: TimedConnection(conn)
+    app = Flask(__name__)
+    app.register_blueprint(applications_bp, url_prefix="/api/applications")
+    return app.test_client(), conn
+
+
+def test_create_returns_201():
+    client, conn = client_and_connection()
+    response = client.post("/api/applications/create", json={"user_id": USER, "grant_id": GRANT})
+    return (
+        response.status_code == 201
+        and response.get_json() == {"message": "Application created successfully"}
+        and [sql for sql, _ in conn.statements] == [get_sql("applications/create_application")]
+        and conn.statements[0][1]["status"] == "pending"
+        and conn._cnx is None
+    )
+
+
+def test_invalid_requests_are_rejected():
+    client, conn = client_and_connection()
+    bodies = (
+        {"user_id": USER},
+        {"user_id": "not-a-uuid", "grant_id": GRANT},
+        {"user_id": USER, "grant_id": GRANT, "status": "won"},
+    )
+    return (
+        all(client.post("/api/applications/create", json=body).status_code == 400 for body in bodies)
+        and conn.statements == []
+    )
+
+
+# MAIN
+if __name__ == "__main__":
+    log_info("Starting Applications Routes Test Suite")
+
+    check("Creating an application returns 201 once its connection is back in the pool", test_create_returns_201)
+    check("Missing ids, bad ids and unknown statuses get 400", test_invalid_requests_are_rejected)
+
+    log_info(f"Passed: {test_stats['passed']}")
+    if test_stats['failed'] > 0:
+        log_error(f"Failed: {test_stats['failed']}")
+    if test_stats['errors'] > 0:
+        log_error(f"Errors: {test_stats['errors']}")
+
+    if test_stats['failed'] == 0 and test_stats['errors'] == 0:
+        log_info("All tests passed")
+    else:
+        sys.exit(1)
@@ -0,0 +1,185 @@
+"""
+    File: bm25_index_test_suite.py
+    Author: Colby Wirth
+    Version: 19 October 2026
+    Description:
+        Tests the in-memory search index in src/utils/bm25_index.py: ranking, incremental updates,
+        compaction, filters and sort orders, plus the latency of a two-word query over a synthetic
+        corpus the size of the grants table.  No database connection is needed.
+
+    Usage:
+        python -m src.test_suites.bm25_index_test_suite
+"""
+
+import random
+import statistics
+import sys
+import time
+
+from src.utils.bm25_index import BM25Index, tokenize, COMPACT_MIN
+from src.utils.logging_utils import log_info, log_error
+
+
+# Test statistics
+test_stats = {"passed": 0, "failed": 0, "errors": 0}
+
+# p50 budget for a search over LATENCY_DOCS synthetic grants
+LATENCY_DOCS = 20000
+LATENCY_BUDGET_MS = 10.0
+
+
+def check(description: str, fn):
+    """Run fn() and count it as passed when it returns True."""
+    try:
+        if fn():
+            test_stats["passed"] += 1
+            log_info(f"PASS: {description}")
+        else:
+            test_stats["failed"] += 1
+            log_error(f"FAIL: {description}")
+    except Exception as e:
+        test_stats["errors"] += 1
+        log_error(f"ERROR: {description} - {type(e).__name__}: {e}")
+
+
+def sample_index() -> BM25Index:
+    index = BM25Index()
+    index.add("g1", {"grant_title": "Climate resilience research", "description": "Coastal flooding models."}, "b")
+    index.add("g2", {"grant_title": "Youth literacy", "description": "Reading programs; climate is not a topic."}, "a")
+    index.add("g3", {"grant_title": "Ocean chemistry", "description": "Acidification and the climate."}, "c")
+    index.add("g4", {"grant_title": "Rural broadband", "description": "Network access for farms."}, None)
+    return index
+
+
+def ids(hits):
+    return [doc_id for doc_id, _, _ in hits]
+
+
+def test_tokenize_drops_stopwords():
+    return tokenize("The Impact of AI on U.S. agriculture") == ["impact", "ai", "agriculture"]
+
+
+def test_title_match_ranks_first():
+    total, hits = sample_index().search("climate")
+    return total == 3 and ids(hits)[0] == "g1"
+
+
+def test_rare_term_outweighs_common_term():
+    # "acidification" is in one grant, "climate" in three
+    _, hits = sample_index().search("climate acidification")
+    return ids(hits)[0] == "g3"
+
+
+def test_no_match():
+    return sample_index().search("quantum") == (0, [])
+
+
+def test_update_replaces_document():
+    index = sample_index()
+    index.add("g4", {"grant_title": "Climate data for farms"}, None)
+    total, hits = index.search("broadband")
+    return total == 0 and "g4" in ids(index.search("climate")[1]) and len(index) == 4
+
+
+def test_remove():
+    index = sample_index()
+    removed = index.remove("g1") and not index.remove("g1")
+    total, hits = index.search("climate")
+    return removed and total == 2 and "g1" not in ids(hits)
+
+
+def test_compaction_keeps_results():
+    def fields(i):
+        return {"grant_title": f"grant number{i % 10}", "description": "climate" if i % 3 == 0 else "ocean"}
+
+    index, fresh = BM25Index(), BM25Index()
+    for i in range(COMPACT_MIN * 2):
+        index.add(f"g{i}", fields(i))
+    for i in range(1, COMPACT_MIN * 2, 2):
+        index.remove(f"g{i}")
+    for i in range(0, COMPACT_MIN * 2, 2):
+        fresh.add(f"g{i}", fields(i))
+    # an index built from the survivors only must rank them identically
+    return index.stats() == fresh.stats() and index.search("climate number3", limit=50) == fresh.search("climate number3", limit=50)
+
+
+def test_where_filter():
+    total, hits = sample_index().search("climate", where=lambda meta: meta in ("a", "c"))
+    return total == 2 and set(ids(hits)) == {"g2", "g3"}
+
+
+def test_on_match_sees_every_filtered_match():
+    seen = []
+    total, hits = sample_index().search("climate", limit=1, where=lambda meta: meta != "a", on_match=seen.append)
+    return total == 2 and len(hits) == 1 and sorted(seen) == ["b", "c"]
+
+
+def test_sort_key_and_paging():
+    index = sample_index()
+    _, first = index.search("climate", limit=2, sort_key=lambda meta: meta)
+    _, second = index.search("climate", offset=2, limit=2, sort_key=lambda meta: meta)
+    _, reverse = index.search("climate", limit=3, sort_key=lambda meta: meta, descending=True)
+    return ids(first) == ["g2", "g1"] and ids(second) == ["g3"] and ids(reverse) == ["g3", "g1", "g2"]
+
+
+def test_keyset_paging_matches_offset_paging():
+    index = BM25Index()
+    for i in range(40):
+        # only four distinct texts, so most scores tie
+        index.add(f"g{i:02}", {"grant_title": ["climate", "climate ocean", "ocean", "climate data"][i % 4]})
+    _, expected = index.search("climate ocean", limit=40)
+    pages, after = [], None
+    while True:
+        _, page = index.search("climate ocean", limit=7, after=after)
+        if not page:
+            break
+        pages.extend(page)
+        after = page[-1][2]
+    return pages == expected and len(expected) == 40
+
+
+def test_latency():
+    rng = random.Random(7)
+    vocabulary = [f"w{i}" for i in range(5000)]
+    index = BM25Index()
+    for i in range(LATENCY_DOCS):
+        words = rng.choices(vocabulary, weights=[1 / (r + 1) for r in range(len(vocabulary))], k=60)
+        index.add(f"g{i}", {"grant_title": " ".join(words[:8]), "description": " ".join(words[8:])})
+    timings = []
+    for _ in range(50):
+        query = f"{rng.choice(vocabulary[20:500])} {rng.choice(vocabulary[500:])}"
+        start = time.perf_counter()
+        index.search(query)
+        timings.append((time.perf_counter() - start) * 1000)
+    p50 = statistics.median(timings)
+    log_info(f"  p50 {p50:.2f} ms over {LATENCY_DOCS} documents")
+    return p50 < LATENCY_BUDGET_MS
+
+
+# MAIN
+if __name__ == "__main__":
+    log_info("Starting BM25 Index Test Suite")
+
+    check("Tokenizer drops stopwords and single letters", test_tokenize_drops_stopwords)
+    check("Title match ranks above description matches", test_title_match_ranks_first)
+    check("Rare query term outweighs a common one", test_rare_term_outweighs_common_term)
+    check("Unknown term matches nothing", test_no_match)
+    check("Re-adding a document replaces it", test_update_replaces_document)
+    check("Removed documents stop matching", test_remove)
+    check("Compaction drops tombstones and keeps results", test_compaction_keeps_results)
+    check("where() filters matches before counting", test_where_filter)
+    check("on_match sees every filtered match, not just the page", test_on_match_sees_every_filtered_match)
+    check("sort_key orders and pages matches", test_sort_key_and_paging)
+    check("Keyset pages cover every match once, in order", test_keyset_paging_matches_offset_paging)
+    check(f"Two-word query p50 under {LATENCY_BUDGET_MS:.0f} ms", test_latency)
+
+    log_info(f"Passed: {test_stats['passed']}")
+    if test_stats['failed'] > 0:
+        log_error(f"Failed: {test_stats['failed']}")
+    if test_stats['errors'] > 0:
+        log_error(f"Errors: {test_stats['errors']}")
+
+    if test_stats['failed'] == 0 and test_stats['errors'] == 0:
+        log_info("All tests passed")
+    else:
+        sys.exit(1)
@@ -0,0 +1,195 @@
+"""
+    File: caching_test_suite.py
+    Author: Colby Wirth
+    Version: 19 October 2026
+    Description:
+        Tests the LRU/TTL cache in Phase3_work/api/caching.py that holds search counts and
+        public responses, and the ETag/304 and compression handling of cached routes
+        (api/compression.py) through a Flask test client.
+        No database connection is needed.
+
+    Usage:
+        python -m src.test_suites.caching_test_suite
+"""
+
+import gzip
+import sys
+import time
+from pathlib import Path
+
+from flask import Flask, jsonify
+
+from src.utils.logging_utils import log_info, log_error
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "Phase3_work"))
+from api import caching, compression  # noqa: E402
+from api.caching import LRUTTLCache, cached_response  # noqa: E402
+
+
+# Test statistics
+test_stats = {"passed": 0, "failed": 0, "errors": 0}
+
+
+def check(description: str, fn):
+    """Run fn() and count it as passed when it returns True."""
+    try:
+        if fn():
+            test_stats["passed"] += 1
+            log_info(f"PASS: {description}")
+        else:
+            test_stats["failed"] += 1
+            log_error(f"FAIL: {description}")
+    except Exception as e:
+        test_stats["errors"] += 1
+        log_error(f"ERROR: {description} - {type(e).__name__}: {e}")
+
+
+def test_hit_and_miss():
+    cache = LRUTTLCache(max_entries=4, ttl=60)
+    cache.set(("gen", 1), 42)
+    return cache.get(("gen", 1)) == 42 and cache.get(("gen", 2)) is None and cache.stats()["hits"] == 1
+
+
+def test_zero_is_a_hit():
+    cache = LRUTTLCache()
+    cache.set("empty search", 0)
+    return cache.get("empty search", "missing") == 0
+
+
+def test_least_recently_used_is_evicted():
+    cache = LRUTTLCache(max_entries=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    return cache.get("a") == 1 and cache.get("b") is None and cache.get("c") == 3
+
+
+def test_entries_expire():
+    cache = LRUTTLCache(max_entries=2, ttl=0.05)
+    cache.set("a", 1)
+    time.sleep(0.1)
+    return cache.get("a") is None and len(cache) == 0
+
+
+def test_byte_bound_evicts_oldest():
+    cache = LRUTTLCache(max_entries=100, ttl=60, max_bytes=10)
+    cache.set("a", b"aaaa", size=4)
+    cache.set("b", b"bbbb", size=4)
+    cache.set("c", b"cccc", size=4)
+    stats = cache.stats()
+    return cache.get("a") is None and cache.get("c") == b"cccc" and stats["bytes"] == 8 and stats["evictions"] == 1
+
+
+def test_oversized_value_is_not_stored():
+    cache = LRUTTLCache(max_entries=100, ttl=60, max_bytes=10)
+    cache.set("small", b"ok", size=2)
+    cache.set("huge", b"x" * 11, size=11)
+    return cache.get("huge") is None and cache.get("small") == b"ok" and cache.stats()["bytes"] == 2
+
+
+def test_replacing_a_key_recounts_bytes():
+    cache = LRUTTLCache(max_entries=100, ttl=60, max_bytes=10)
+    cache.set("a", b"aaaaaaaa", size=8)
+    cache.set("a", b"aa", size=2)
+    return cache.stats()["bytes"] == 2 and len(cache) == 1
+
+
+class FixedGeneration:
+    """Stands in for the GrantChangeLog position, which needs MySQL."""
+
+    def __init__(self, value):
+        self.value = value
+
+    def current(self, conn=None):
+        return self.value
+
+
+def client_and_calls():
+    """A test client for one cached route, and a list recording each time the route ran."""
+    app = Flask(__name__)
+    compression.init_app(app)
+    calls = []
+
+    @app.route("/grants")
+    @cached_response(LRUTTLCache(ttl=60))
+    def grants():
+        calls.append(1)
+        return jsonify({"grants": [{"title": f"grant {i}", "description": "x" * 40} for i in range(100)]})
+
+    return app.test_client(), calls
+
+
+def test_repeat_request_is_not_modified():
+    caching.ingest_generation = FixedGeneration(1)
+    client, calls = client_and_calls()
+    first = client.get("/grants")
+    etag = first.headers["ETag"]
+    again = client.get("/grants", headers={"If-None-Match": etag})
+    return (
+        first.status_code == 200 and first.headers["X-Cache"] == "MISS"
+        and again.status_code == 304 and again.data == b"" and again.headers["X-Cache"] == "HIT"
+        and len(calls) == 1
+    )
+
+
+def test_new_generation_changes_nothing_but_reruns():
+    caching.ingest_generation = FixedGeneration(1)
+    client, calls = client_and_calls()
+    etag = client.get("/grants").headers["ETag"]
+    caching.ingest_generation = FixedGeneration(2)
+    after_ingest = client.get("/grants", headers={"If-None-Match": etag})
+    # the route ran again, but the grants are the same bytes, so the client's copy is still valid
+    return after_ingest.status_code == 304 and len(calls) == 2
+
+
+def test_gzip_and_its_etag():
+    caching.ingest_generation = FixedGeneration(1)
+    client, _ = client_and_calls()
+    plain = client.get("/grants")
+    zipped = client.get("/grants", headers={"Accept-Encoding": "gzip"})
+    again = client.get("/grants", headers={"Accept-Encoding": "gzip", "If-None-Match": zipped.headers["ETag"]})
+    return (
+        zipped.headers["Content-Encoding"] == "gzip"
+        and gzip.decompress(zipped.data) == plain.data
+        and len(zipped.data) < len(plain.data) / 5
+        and zipped.headers["ETag"] == plain.headers["ETag"][:-1] + '-gzip"'
+        and "Accept-Encoding" in zipped.headers["Vary"]
+        and again.status_code == 304
+    )
+
+
+def test_small_responses_are_not_compressed():
+    app = Flask(__name__)
+    compression.init_app(app)
+    app.add_url_rule("/small", "small", lambda: jsonify({"total": 1}))
+    response = app.test_client().get("/small", headers={"Accept-Encoding": "gzip"})
+    return "Content-Encoding" not in response.headers
+
+
+# MAIN
+if __name__ == "__main__":
+    log_info("Starting Caching Test Suite")
+
+    check("Stored values are returned, others miss", test_hit_and_miss)
+    check("A cached 0 is not mistaken for a miss", test_zero_is_a_hit)
+    check("The least recently used entry is evicted", test_least_recently_used_is_evicted)
+    check("Entries expire after the TTL", test_entries_expire)
+    check("Byte bound evicts the oldest entries", test_byte_bound_evicts_oldest)
+    check("A value larger than the byte bound is not stored", test_oversized_value_is_not_stored)
+    check("Replacing a key counts only its new size", test_replacing_a_key_recounts_bytes)
+    check("A repeat request with If-None-Match gets a bodiless 304", test_repeat_request_is_not_modified)
+    check("Unchanged content keeps its ETag across ingests", test_new_generation_changes_nothing_but_reruns)
+    check("Large responses are gzipped with an encoding-specific ETag", test_gzip_and_its_etag)
+    check("Small responses are sent uncompressed", test_small_responses_are_not_compressed)
+
+    log_info(f"Passed: {test_stats['passed']}")
+    if test_stats['failed'] > 0:
+        log_error(f"Failed: {test_stats['failed']}")
+    if test_stats['errors'] > 0:
+        log_error(f"Errors: {test_stats['errors']}")
+
+    if test_stats['failed'] == 0 and test_stats['errors'] == 0:
+        log_info("All tests passed")
+    else:
+        sys.exit(1)
@@ -0,0 +1,129 @@
+"""
+    File: dashboard_test_suite.py
+    Author: Colby Wirth
+    Version: 19 October 2026
+    Description:
+        Tests GET /api/user/dashboard's data access (Phase3_work/api/user/data_access.py): task
+        and document counts are merged onto the right applications, applications without tasks or
+        documents get zeros, the totals, and that the dashboard costs the same three statements
+        for any number of applications.
+        MySQL is replaced by recorded rows, so no database is needed.
+
+    Usage:
+        python -m src.test_suites.dashboard_test_suite
+"""
+
+import sys
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+
+from src.utils.logging_utils import log_info, log_error
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "Phase3_work"))
+from api.user import data_access as dal  # noqa: E402
+
+
+# Test statistics
+test_stats = {"passed": 0, "failed": 0, "errors": 0}
+
+APP_A = "0190a1b2-0000-7000-8000-0000000000a1"
+APP_B = "0190a1b2-0000-7000-8000-0000000000b2"
+GRANT = "0190a1b2-0000-7000-8000-000000000001"
+
+
+def check(description: str, fn):
+    """Run fn() and count it as passed when it returns True."""
+    try:
+        if fn():
+            test_stats["passed"] += 1
+            log_info(f"PASS: {description}")
+        else:
+            test_stats["failed"] += 1
+            log_error(f"FAIL: {description}")
+    except Exception as e:
+        test_stats["errors"] += 1
+        log_error(f"ERROR: {description} - {type(e).__name__}: {e}")
+
+
+def application(application_id):
+    # a row of applications/select_dashboard_applications
+    return (application_id, GRANT, "started", "pending", "2026-10-01", None, "Coral reef restoration", "2026-12-01")
+
+
+def test_counts_are_merged():
+    dashboard = dal.build_dashboard(
+        [application(APP_A), application(APP_B)],
+        # SUM() comes back as Decimal
+        [(APP_A, 4, Decimal(3), Decimal(1), "2026-11-01")],
+        [(APP_A, 2, datetime(2026, 10, 10, 9, 30))],
+    )
+    a, b = dashboard["applications"]
+    return (
+        a["task_count"] == 4 and a["completed_tasks"] == 3 and a["completed_percent"] == 75
+        and a["overdue_tasks"] == 1 and a["next_deadline"] == "2026-11-01"
+        and a["document_count"] == 2 and a["last_upload"] == "2026-10-10 09:30:00"
+        and a["grant_name"] == "Coral reef restoration" and a["grant_date_closed"] == "2026-12-01"
+        and b["task_count"] == 0 and b["completed_percent"] is None and b["next_deadline"] is None
+        and b["document_count"] == 0 and b["last_upload"] is None
+    )
+
+
+def test_summary():
+    dashboard = dal.build_dashboard(
+        [application(APP_A), application(APP_B)],
+        [(APP_A, 4, 3, 1, "2026-11-01"), (APP_B, 2, 0, 0, "2026-10-25")],
+        [(APP_B, 5, None)],
+    )
+    return dashboard["summary"] == {
+        "applications": 2, "open_tasks": 3, "overdue_tasks": 1, "next_deadline": "2026-10-25", "documents": 5,
+    }
+
+
+def test_no_applications():
+    return dal.build_dashboard([], [], [])["summary"] == {
+        "applications": 0, "open_tasks": 0, "overdue_tasks": 0, "next_deadline": None, "documents": 0,
+    }
+
+
+def test_fixed_number_of_statements():
+    statements = []
+
+    def recording_fetchall(conn, name, params=()):
+        statements.append(name)
+        if name == "applications/select_dashboard_applications":
+            return [application(f"0190a1b2-0000-7000-8000-{i:012d}") for i in range(500)]
+        return []
+
+    original = dal.prepared_fetchall
+    dal.prepared_fetchall = recording_fetchall
+    try:
+        dashboard = dal.get_dashboard(None, "0190a1b2-0000-7000-8000-0000000000aa")
+    finally:
+        dal.prepared_fetchall = original
+    return len(dashboard["applications"]) == 500 and statements == [
+        "applications/select_dashboard_applications",
+        "internal_deadlines/select_dashboard_task_counts",
+        "documents/select_dashboard_document_counts",
+    ]
+
+
+# MAIN
+if __name__ == "__main__":
+    log_info("Starting Dashboard Test Suite")
+
+    check("Task and document counts land on their application, zeros elsewhere", test_counts_are_merged)
+    check("The summary totals tasks, deadlines and documents", test_summary)
+    check("A user without applications gets an empty dashboard", test_no_applications)
+    check("The dashboard is three statements for any number of applications", test_fixed_number_of_statements)
+
+    log_info(f"Passed: {test_stats['passed']}")
+    if test_stats['failed'] > 0:
+        log_error(f"Failed: {test_stats['failed']}")
+    if test_stats['errors'] > 0:
+        log_error(f"Errors: {test_stats['errors']}")
+
+    if test_stats['failed'] == 0 and test_stats['errors'] == 0:
+        log_info("All tests passed")
+    else:
+        sys.exit(1)
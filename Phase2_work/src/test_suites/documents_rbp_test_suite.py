@@ -25,6 +25,7 @@ from src.document_functions.documents_operations import (
 )
 from src.user_functions.view_based_operations import Role
 from src.utils.sql_file_parsers import read_sql_helper
+from src.utils.uuid_keys import new_uuid
 
 load_dotenv()
 
@@ -68,6 +69,7 @@ def insert_test_user(cursor, email="test_user@example.com", password="pw123"):
         return None
 
     cursor.execute(sql_script, {
+        "user_id": new_uuid(),
         "f_name": "Test",
         "m_name": "M",
         "l_name": "User",
@@ -75,7 +77,7 @@ def insert_test_user(cursor, email="test_user@example.com", password="pw123"):
         "email": email,
         "password": password
     })
-    cursor.execute("SELECT BIN_TO_UUID(user_id) FROM Users WHERE email=%s", (email,))
+    cursor.execute("SELECT BIN_TO_UUID(user_id, 1) FROM Users WHERE email=%s", (email,))
     return cursor.fetchone()[0]
 
 
@@ -107,7 +109,7 @@ def insert_test_grant(cursor, grant_name="Test Grant"):
         "date_closed": None,
         "last_update_date": current_date
     })
-    cursor.execute("SELECT BIN_TO_UUID(grant_id) FROM Grants WHERE grant_title=%s", (grant_name,))
+    cursor.execute("SELECT BIN_TO_UUID(grant_id, 1) FROM Grants WHERE grant_title=%s", (grant_name,))
     return cursor.fetchone()[0]
 
 
@@ -128,7 +130,7 @@ def insert_test_application(cursor, user_id, grant_id):
         "application_date": datetime.now()
     })
     cursor.execute(
-        "SELECT BIN_TO_UUID(application_id) FROM Applications WHERE user_id=UUID_TO_BIN(%s) AND grant_id=UUID_TO_BIN(%s)",
+        "SELECT BIN_TO_UUID(application_id, 1) FROM Applications WHERE user_id=UUID_TO_BIN(%s, 1) AND grant_id=UUID_TO_BIN(%s, 1)",
         (user_id, grant_id)
     )
     return cursor.fetchone()[0]
@@ -164,7 +166,7 @@ def test_create_document(cursor, uid, aid):
     
     if result is None:
         cursor.execute(
-            "SELECT document_name, document_type FROM Documents WHERE application_id=UUID_TO_BIN(%s) AND document_name='test_document.pdf'",
+            "SELECT document_name, document_type FROM Documents WHERE application_id=UUID_TO_BIN(%s, 1) AND document_name='test_document.pdf'",
             (aid,)
         )
         row = cursor.fetchone()
@@ -190,7 +192,7 @@ def test_read_document_by_uuid(cursor, uid, aid):
     )
     
     cursor.execute(
-        "SELECT BIN_TO_UUID(document_id) FROM Documents WHERE application_id=UUID_TO_BIN(%s) AND document_name='read_test_doc.pdf'",
+        "SELECT BIN_TO_UUID(document_id, 1) FROM Documents WHERE application_id=UUID_TO_BIN(%s, 1) AND document_name='read_test_doc.pdf'",
         (aid,)
     )
     doc_id = cursor.fetchone()[0]
@@ -217,7 +219,7 @@ def test_update_document(cursor, uid, aid):
     )
     
     cursor.execute(
-        "SELECT BIN_TO_UUID(document_id) FROM Documents WHERE application_id=UUID_TO_BIN(%s) AND document_name='original_doc.pdf'",
+        "SELECT BIN_TO_UUID(document_id, 1) FROM Documents WHERE application_id=UUID_TO_BIN(%s, 1) AND document_name='original_doc.pdf'",
         (aid,)
     )
     doc_id = cursor.fetchone()[0]
@@ -232,7 +234,7 @@ def test_update_document(cursor, uid, aid):
     
     if result is None:
         cursor.execute(
-            "SELECT document_name, document_type, document_size FROM Documents WHERE document_id=UUID_TO_BIN(%s)",
+            "SELECT document_name, document_type, document_size FROM Documents WHERE document_id=UUID_TO_BIN(%s, 1)",
             (doc_id,)
         )
         row = cursor.fetchone()
@@ -259,7 +261,7 @@ def test_delete_document(cursor, uid, aid):
     )
     
     cursor.execute(
-        "SELECT BIN_TO_UUID(document_id) FROM Documents WHERE application_id=UUID_TO_BIN(%s) AND document_name='delete_me.pdf'",
+        "SELECT BIN_TO_UUID(document_id, 1) FROM Documents WHERE application_id=UUID_TO_BIN(%s, 1) AND document_name='delete_me.pdf'",
         (aid,)
     )
     doc_id = cursor.fetchone()[0]
@@ -268,7 +270,7 @@ def test_delete_document(cursor, uid, aid):
     
     if result is None:
         cursor.execute(
-            "SELECT COUNT(*) FROM Documents WHERE document_id=UUID_TO_BIN(%s)",
+            "SELECT COUNT(*) FROM Documents WHERE document_id=UUID_TO_BIN(%s, 1)",
             (doc_id,)
         )
         if cursor.fetchone()[0] == 0:
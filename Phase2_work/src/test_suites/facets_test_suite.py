@@ -0,0 +1,111 @@
+"""
+    File: facets_test_suite.py
+    Author: Colby Wirth
+    Version: 19 October 2026
+    Description:
+        Tests the search facet helpers in Phase3_work/api/facets.py: parsing ?facets=, award
+        buckets, folding grouped rows and counting index matches.  No database connection is
+        needed.
+
+    Usage:
+        python -m src.test_suites.facets_test_suite
+"""
+
+import sys
+from collections import namedtuple
+from pathlib import Path
+
+from src.utils.logging_utils import log_info, log_error
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "Phase3_work"))
+from api.facets import FACETS, FacetCounter, award_bucket, fold, grouped_sql, parse_facets  # noqa: E402
+
+
+# Test statistics
+test_stats = {"passed": 0, "failed": 0, "errors": 0}
+
+Keys = namedtuple("Keys", "research_field provider award_size date_closed")
+
+
+def check(description: str, fn):
+    """Run fn() and count it as passed when it returns True."""
+    try:
+        if fn():
+            test_stats["passed"] += 1
+            log_info(f"PASS: {description}")
+        else:
+            test_stats["failed"] += 1
+            log_error(f"FAIL: {description}")
+    except Exception as e:
+        test_stats["errors"] += 1
+        log_error(f"ERROR: {description} - {type(e).__name__}: {e}")
+
+
+def test_parse_facets():
+    return (
+        parse_facets("") == ()
+        and parse_facets("all") == FACETS
+        and parse_facets("status, research_field") == ("research_field", "status")
+        and parse_facets("research_field,colour") is None
+    )
+
+
+def test_award_buckets():
+    return [award_bucket(v) for v in (None, 0, 99_999, 100_000, 750_000, 5_000_000)] == [
+        None, "under_100k", "under_100k", "100k_500k", "500k_1m", "5m_plus",
+    ]
+
+
+def test_one_grouped_query():
+    sql = grouped_sql(("research_field", "status"), "WHERE research_field LIKE %s")
+    return sql.count("SELECT") == 1 and sql.endswith("GROUP BY 1, 2")
+
+
+def test_fold_adds_up_combinations():
+    rows = [("Health", "open", 3), ("Health", "closed", 2), ("Education", "open", 4), (None, "open", 1)]
+    result = fold(("research_field", "status"), rows)
+    return result == {
+        "research_field": [
+            {"value": "Health", "count": 5}, {"value": "Education", "count": 4}, {"value": None, "count": 1},
+        ],
+        "status": [{"value": "open", "count": 8}, {"value": "closed", "count": 2}],
+    }
+
+
+def test_counter_matches_fold():
+    keys = [
+        Keys("Health", "NIH", "1m_5m", "2000-01-01"),
+        Keys("Health", "NIH", "under_100k", None),
+        Keys("Education", "ED", "1m_5m", "2999-01-01"),
+    ]
+    counter = FacetCounter(FACETS)
+    for k in keys:
+        counter(k)
+    result = counter.result()
+    return (
+        result["status"] == [{"value": "open", "count": 2}, {"value": "closed", "count": 1}]
+        and result["award_size"] == [{"value": "under_100k", "count": 1}, {"value": "1m_5m", "count": 2}]
+        and result["provider"][0] == {"value": "NIH", "count": 2}
+    )
+
+
+# MAIN
+if __name__ == "__main__":
+    log_info("Starting Facets Test Suite")
+
+    check("?facets= accepts names and 'all', rejects unknown names", test_parse_facets)
+    check("award_max_amount falls into the right bucket", test_award_buckets)
+    check("All facets come from one grouped query", test_one_grouped_query)
+    check("Grouped rows fold into per-facet counts", test_fold_adds_up_combinations)
+    check("Index matches are counted like the grouped query", test_counter_matches_fold)
+
+    log_info(f"Passed: {test_stats['passed']}")
+    if test_stats['failed'] > 0:
+        log_error(f"Failed: {test_stats['failed']}")
+    if test_stats['errors'] > 0:
+        log_error(f"Errors: {test_stats['errors']}")
+
+    if test_stats['failed'] == 0 and test_stats['errors'] == 0:
+        log_info("All tests passed")
+    else:
+        sys.exit(1)
@@ -0,0 +1,164 @@
+"""
+    File: grant_rollups_test_suite.py
+    Author: Colby Wirth
+    Version: 19 October 2026
+    Description:
+        Tests the analytics rollups in src/utils/grant_rollups.py: monthly, provider and research
+        field totals, grants without a posting date, provider or funding, values differing only in
+        case or accents, exact funding sums, the YYYY-MM month parameter, and agreement with a
+        plain Python grouping on random grants.
+        No database connection is needed.
+
+    Usage:
+        python -m src.test_suites.grant_rollups_test_suite
+"""
+
+import random
+import sys
+from collections import defaultdict
+from datetime import date, timedelta
+
+from src.utils.logging_utils import log_info, log_error
+from src.utils.grant_rollups import parse_month, rollup_rows
+
+
+# Test statistics
+test_stats = {"passed": 0, "failed": 0, "errors": 0}
+
+GRANTS = [
+    (date(2025, 1, 5), "NSF", "Biology", 1_000),
+    (date(2025, 1, 31), "NSF", "Physics", 2_000),
+    (date(2025, 1, 15), "NIH", "Biology", None),
+    (date(2025, 3, 1), None, None, 500),
+    (None, "NSF", "Biology", 9_999),
+]
+
+
+def check(description: str, fn):
+    """Run fn() and count it as passed when it returns True."""
+    try:
+        if fn():
+            test_stats["passed"] += 1
+            log_info(f"PASS: {description}")
+        else:
+            test_stats["failed"] += 1
+            log_error(f"FAIL: {description}")
+    except Exception as e:
+        test_stats["errors"] += 1
+        log_error(f"ERROR: {description} - {type(e).__name__}: {e}")
+
+
+def rollups(grants) -> dict:
+    return {(d, m, v): (c, f) for d, m, v, c, f in rollup_rows(grants)}
+
+
+def test_monthly_totals():
+    rows = rollups(GRANTS)
+    return (
+        rows[("month", date(2025, 1, 1), "")] == (3, 3_000)
+        and rows[("month", date(2025, 3, 1), "")] == (1, 500)
+        and len([k for k in rows if k[0] == "month"]) == 2
+    )
+
+
+def test_provider_and_field_totals():
+    rows = rollups(GRANTS)
+    return (
+        rows[("provider", date(2025, 1, 1), "NSF")] == (2, 3_000)
+        and rows[("provider", date(2025, 1, 1), "NIH")] == (1, 0)
+        and rows[("provider", date(2025, 3, 1), "")] == (1, 500)
+        and rows[("research_field", date(2025, 1, 1), "Biology")] == (2, 1_000)
+        and rows[("research_field", date(2025, 3, 1), "")] == (1, 500)
+    )
+
+
+def test_unposted_grants_and_empty_input():
+    return (
+        sum(c for (d, _, _), (c, _) in rollups(GRANTS).items() if d == "month") == 4
+        and list(rollup_rows([])) == []
+        and list(rollup_rows([(None, "NSF", "Biology", 1)])) == []
+    )
+
+
+def test_case_and_accent_variants_share_a_row():
+    # GrantRollups.value is case- and accent-insensitive and part of the primary key
+    rows = list(rollup_rows([
+        (date(2025, 1, 5), "NSF", "Sciences Sociales", 100),
+        (date(2025, 1, 6), "nsf", "sciences sociales", 200),
+        (date(2025, 1, 7), "Nsf", "Sciences Socialés", 300),
+        (date(2025, 1, 8), "NSF ", "Biology", 400),
+    ]))
+    keys = [(d, m, v.casefold()) for d, m, v, _, _ in rows]
+    return (
+        len(keys) == len(set(keys))
+        and ("provider", date(2025, 1, 1), "NSF", 3, 600) in rows
+        and ("provider", date(2025, 1, 1), "NSF ", 1, 400) in rows
+        and ("research_field", date(2025, 1, 1), "Sciences Sociales", 3, 600) in rows
+    )
+
+
+def test_funding_is_exact():
+    # past float64's 2**53, where a weighted bincount would round
+    big = 2 ** 53 + 1
+    rows = rollups([(date(2025, 1, 1), "A", "X", big), (date(2025, 1, 2), "A", "X", 2)])
+    return rows[("month", date(2025, 1, 1), "")] == (2, big + 2)
+
+
+def test_parse_month():
+    def rejects(text):
+        try:
+            parse_month(text)
+        except ValueError:
+            return True
+        return False
+
+    return (
+        parse_month("2025-02") == date(2025, 2, 1)
+        and all(rejects(t) for t in ("2025-13", "2025-2", "2025-02-01", "202502", "abcd-ef"))
+    )
+
+
+def test_matches_python_grouping():
+    rng = random.Random(7)
+    grants = [
+        (
+            date(2020, 1, 1) + timedelta(days=rng.randint(0, 2000)) if rng.random() > 0.05 else None,
+            rng.choice(["NSF", "NIH", "DOE", None]),
+            rng.choice(["Biology", "Physics", "Health", None]),
+            rng.choice([None, rng.randint(0, 10 ** 9)]),
+        )
+        for _ in range(5000)
+    ]
+    expected = defaultdict(lambda: [0, 0])
+    for posted, provider, field, funding in grants:
+        if posted is None:
+            continue
+        month = posted.replace(day=1)
+        for key in (("month", month, ""), ("provider", month, provider or ""), ("research_field", month, field or "")):
+            expected[key][0] += 1
+            expected[key][1] += funding or 0
+    return rollups(grants) == {k: tuple(v) for k, v in expected.items()}
+
+
+# MAIN
+if __name__ == "__main__":
+    log_info("Starting Grant Rollups Test Suite")
+
+    check("Grants are counted and funding summed per month posted", test_monthly_totals)
+    check("Providers and research fields are rolled up per month, '' for none", test_provider_and_field_totals)
+    check("Grants without a posting date are left out", test_unposted_grants_and_empty_input)
+    check("Values differing only in case or accents are one row", test_case_and_accent_variants_share_a_row)
+    check("Funding totals are exact integers", test_funding_is_exact)
+    check("Months are parsed from YYYY-MM only", test_parse_month)
+    check("NumPy grouping matches a plain Python grouping", test_matches_python_grouping)
+
+    log_info(f"Passed: {test_stats['passed']}")
+    if test_stats['failed'] > 0:
+        log_error(f"Failed: {test_stats['failed']}")
+    if test_stats['errors'] > 0:
+        log_error(f"Errors: {test_stats['errors']}")
+
+    if test_stats['failed'] == 0 and test_stats['errors'] == 0:
+        log_info("All tests passed")
+    else:
+        sys.exit(1)
@@ -0,0 +1,191 @@
+"""
+    File: grant_stats_test_suite.py
+    Author: Colby Wirth
+    Version: 19 October 2026
+    Description:
+        Tests the running grant statistics in src/utils/grant_stats.py: the net change of inserted,
+        updated and removed grants, what counts as open, the statements apply() sends, and the
+        daily move of closed grants from the open counts.
+        No database connection is needed; a recording cursor stands in for MySQL.
+
+    Usage:
+        python -m src.test_suites.grant_stats_test_suite
+"""
+
+import sys
+from datetime import date
+
+from src.utils.logging_utils import log_info, log_error
+from src.utils.grant_stats import GrantStatsDelta, lock_grant_stats, roll_open_counts
+from src.utils.sql_registry import get_sql
+
+
+# Test statistics
+test_stats = {"passed": 0, "failed": 0, "errors": 0}
+
+TODAY = date(2026, 10, 19)
+
+
+class RecordingCursor:
+    """Records (script, params) of every statement; answers fetches from a queue of results."""
+
+    def __init__(self, results=()):
+        self.results = list(results)
+        self.statements = []
+        self._last = None
+
+    def _name(self, sql):
+        for name in (
+            "grants/update_grant_stats", "grants/update_grant_field_stats",
+            "grants/delete_empty_grant_field_stats", "grants/select_grant_stats_for_update",
+            "grants/select_grant_closings", "grants/update_grant_stats_open_as_of",
+            "grants/rebuild_grant_stats", "grants/delete_grant_field_stats",
+            "grants/rebuild_grant_field_stats",
+        ):
+            if sql == get_sql(name):
+                return name
+        return sql
+
+    def execute(self, sql, params=None):
+        name = self._name(sql)
+        self.statements.append((name, params))
+        self._last = self.results.pop(0) if name.startswith("grants/select") else None
+
+    def executemany(self, sql, rows):
+        self.statements.append((self._name(sql), list(rows)))
+
+    def fetchone(self):
+        return self._last[0] if self._last else None
+
+    def fetchall(self):
+        return self._last or []
+
+    def names(self):
+        return [name for name, _ in self.statements]
+
+
+def check(description: str, fn):
+    """Run fn() and count it as passed when it returns True."""
+    try:
+        if fn():
+            test_stats["passed"] += 1
+            log_info(f"PASS: {description}")
+        else:
+            test_stats["failed"] += 1
+            log_error(f"FAIL: {description}")
+    except Exception as e:
+        test_stats["errors"] += 1
+        log_error(f"ERROR: {description} - {type(e).__name__}: {e}")
+
+
+def test_insert_and_remove():
+    delta = GrantStatsDelta(TODAY)
+    delta.add("Health", 1000, None)
+    delta.add("Health", 500, date(2026, 1, 1))
+    delta.add(None, None, TODAY)
+    delta.remove("Environment", 200, date(2027, 1, 1))
+    return (
+        delta.total == [2, 1, 1300]
+        and delta.fields["Health"] == [2, 1, 1500]
+        and delta.fields[""] == [1, 1, 0]
+        and delta.fields["Environment"] == [-1, -1, -200]
+    )
+
+
+def test_update_is_net_change():
+    delta = GrantStatsDelta(TODAY)
+    # funding raised, closed date moved into the past
+    delta.remove("Health", 1000, date(2026, 12, 1))
+    delta.add("Health", 1500, date(2026, 10, 1))
+    # research field changed
+    delta.remove("Health", 100, None)
+    delta.add("Biology", 100, None)
+    return (
+        delta.total == [0, -1, 500]
+        and delta.fields["Health"] == [-1, -2, 400]
+        and delta.fields["Biology"] == [1, 1, 100]
+    )
+
+
+def test_open_is_relative_to_open_as_of():
+    delta = GrantStatsDelta(TODAY)
+    return (
+        delta.is_open(None)
+        and delta.is_open(TODAY)
+        and delta.is_open(date(2026, 10, 20))
+        and not delta.is_open(date(2026, 10, 18))
+    )
+
+
+def test_apply_sends_only_changes():
+    delta = GrantStatsDelta(TODAY)
+    delta.add("Health", 1000, None)
+    delta.remove("Health", 1000, None)
+    delta.add("Biology", 10, None)
+    cursor = RecordingCursor()
+    delta.apply(cursor)
+    empty = RecordingCursor()
+    delta.apply(empty)
+    return (
+        cursor.statements == [
+            ("grants/update_grant_stats", (1, 1, 10)),
+            ("grants/update_grant_field_stats", [("Biology", 1, 1, 10)]),
+            ("grants/delete_empty_grant_field_stats", None),
+        ]
+        and empty.statements == []
+    )
+
+
+def test_lock_rebuilds_missing_stats():
+    cursor = RecordingCursor(results=[[], [(TODAY,)]])
+    delta = lock_grant_stats(cursor)
+    return delta.open_as_of == TODAY and cursor.names() == [
+        "grants/select_grant_stats_for_update",
+        "grants/rebuild_grant_stats",
+        "grants/delete_grant_field_stats",
+        "grants/rebuild_grant_field_stats",
+        "grants/select_grant_stats_for_update",
+    ]
+
+
+def test_roll_open_counts():
+    yesterday = date(2026, 10, 18)
+    cursor = RecordingCursor(results=[[(yesterday,)], [("Health", 3), (None, 1)]])
+    closed = roll_open_counts(cursor, TODAY)
+    return closed == 4 and cursor.statements == [
+        ("grants/select_grant_stats_for_update", None),
+        ("grants/select_grant_closings", (yesterday, TODAY)),
+        ("grants/update_grant_stats", (0, -4, 0)),
+        ("grants/update_grant_field_stats", [("Health", 0, -3, 0), ("", 0, -1, 0)]),
+        ("grants/delete_empty_grant_field_stats", None),
+        ("grants/update_grant_stats_open_as_of", (TODAY,)),
+    ]
+
+
+def test_roll_is_idempotent_within_a_day():
+    cursor = RecordingCursor(results=[[(TODAY,)]])
+    return roll_open_counts(cursor, TODAY) == 0 and cursor.names() == ["grants/select_grant_stats_for_update"]
+
+
+# MAIN
+if __name__ == "__main__":
+    log_info("Starting Grant Stats Test Suite")
+
+    check("Inserted and removed grants change the totals and their research field", test_insert_and_remove)
+    check("An update counts as removing the old values and adding the new ones", test_update_is_net_change)
+    check("A grant is open until the day after it closes", test_open_is_relative_to_open_as_of)
+    check("apply() sends one statement per table and skips unchanged rows", test_apply_sends_only_changes)
+    check("Missing statistics are rebuilt before they are locked", test_lock_rebuilds_missing_stats)
+    check("Grants closed since open_as_of move from open to closed", test_roll_open_counts)
+    check("A second roll on the same day changes nothing", test_roll_is_idempotent_within_a_day)
+
+    log_info(f"Passed: {test_stats['passed']}")
+    if test_stats['failed'] > 0:
+        log_error(f"Failed: {test_stats['failed']}")
+    if test_stats['errors'] > 0:
+        log_error(f"Errors: {test_stats['errors']}")
+
+    if test_stats['failed'] == 0 and test_stats['errors'] == 0:
+        log_info("All tests passed")
+    else:
+        sys.exit(1)
@@ -0,0 +1,150 @@
+"""
+    File: grants_batch_test_suite.py
+    Author: Colby Wirth
+    Version: 19 October 2026
+    Description:
+        Tests POST /api/public/grants/batch (Phase3_work/api/public/routes_public.py) through a
+        Flask test client: request validation, request order, missing ids, field lists, and
+        that grants cached for the ingest generation are not queried again.
+        MySQL is replaced by an in-memory connection, so no database is needed.
+
+    Usage:
+        python -m src.test_suites.grants_batch_test_suite
+"""
+
+import sys
+from pathlib import Path
+
+from flask import Flask
+
+from src.utils.logging_utils import log_info, log_error
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "Phase3_work"))
+from api.public import public_bp, routes_public  # noqa: E402
+
+
+# Test statistics
+test_stats = {"passed": 0, "failed": 0, "errors": 0}
+
+GRANT_A = "0190a1b2-0000-7000-8000-00000000000a"
+GRANT_B = "0190a1b2-0000-7000-8000-00000000000b"
+UNKNOWN = "0190a1b2-0000-7000-8000-0000000000ff"
+
+
+def check(description: str, fn):
+    """Run fn() and count it as passed when it returns True."""
+    try:
+        if fn():
+            test_stats["passed"] += 1
+            log_info(f"PASS: {description}")
+        else:
+            test_stats["failed"] += 1
+            log_error(f"FAIL: {description}")
+    except Exception as e:
+        test_stats["errors"] += 1
+        log_error(f"ERROR: {description} - {type(e).__name__}: {e}")
+
+
+class FakeDatabase:
+    """Answers the batch query from a dict of grants, recording the ids of each query."""
+
+    def __init__(self, grant_ids):
+        self.rows = {
+            grant_id: tuple(grant_id if f == "grant_id" else f"{f} of {grant_id[-1]}" for f in routes_public.GRANT_FIELDS)
+            for grant_id in grant_ids
+        }
+        self.queries = []
+
+    def __call__(self):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def cursor(self):
+        return self
+
+    def execute(self, sql, params):
+        self.queries.append(params)
+        self._result = [self.rows[p] for p in params if p in self.rows]
+
+    def fetchall(self):
+        return self._result
+
+
+class FixedGeneration:
+    def current(self, conn=None):
+        return 1
+
+
+def client_and_database():
+    database = FakeDatabase([GRANT_A, GRANT_B])
+    routes_public.get_connection = database
+    routes_public.ingest_generation = FixedGeneration()
+    routes_public.grant_cache.clear()
+    app = Flask(__name__)
+    app.register_blueprint(public_bp, url_prefix="/api/public")
+    return app.test_client(), database
+
+
+def post(client, body):
+    return client.post("/api/public/grants/batch", json=body)
+
+
+def test_invalid_requests_are_rejected():
+    client, database = client_and_database()
+    bodies = (
+        [GRANT_A],
+        {"grant_ids": []},
+        {"grant_ids": ["not-a-uuid"]},
+        {"grant_ids": [GRANT_A] * (routes_public.BATCH_MAX_IDS + 1)},
+        {"grant_ids": [GRANT_A], "fields": ["grant_title", "password"]},
+    )
+    return all(post(client, body).status_code == 400 for body in bodies) and not database.queries
+
+
+def test_request_order_and_missing():
+    client, database = client_and_database()
+    data = post(client, {"grant_ids": [GRANT_B, UNKNOWN, GRANT_A.upper(), GRANT_B]}).get_json()
+    return (
+        [g["grant_id"] for g in data["grants"]] == [GRANT_B, GRANT_A]
+        and data["missing"] == [UNKNOWN]
+        and len(database.queries) == 1
+    )
+
+
+def test_fields_trim_each_grant():
+    client, _ = client_and_database()
+    data = post(client, {"grant_ids": [GRANT_A], "fields": ["grant_title", "date_closed"]}).get_json()
+    return data["grants"] == [{"grant_id": GRANT_A, "grant_title": "grant_title of a", "date_closed": "date_closed of a"}]
+
+
+def test_cached_grants_are_not_queried_again():
+    client, database = client_and_database()
+    post(client, {"grant_ids": [GRANT_A]})
+    data = post(client, {"grant_ids": [GRANT_A, GRANT_B]}).get_json()
+    return database.queries == [(GRANT_A,), (GRANT_B,)] and len(data["grants"]) == 2
+
+
+# MAIN
+if __name__ == "__main__":
+    log_info("Starting Grants Batch Test Suite")
+
+    check("Malformed bodies, bad ids, too many ids and unknown fields get 400", test_invalid_requests_are_rejected)
+    check("Grants come back once each in request order, unknown ids in missing", test_request_order_and_missing)
+    check("A field list trims each grant, keeping grant_id", test_fields_trim_each_grant)
+    check("Grants cached for the generation are not queried again", test_cached_grants_are_not_queried_again)
+
+    log_info(f"Passed: {test_stats['passed']}")
+    if test_stats['failed'] > 0:
+        log_error(f"Failed: {test_stats['failed']}")
+    if test_stats['errors'] > 0:
+        log_error(f"Errors: {test_stats['errors']}")
+
+    if test_stats['failed'] == 0 and test_stats['errors'] == 0:
+        log_info("All tests passed")
+    else:
+        sys.exit(1)
@@ -25,6 +25,7 @@ from src.db_creation.internal_deadline_functions.internal_deadlines_operations i
 )
 from src.user_functions.view_based_operations import Role
 from src.utils.sql_file_parsers import read_sql_helper
+from src.utils.uuid_keys import new_uuid
 
 load_dotenv()
 
@@ -68,6 +69,7 @@ def insert_test_user(cursor, email="test_user@example.com", password="pw123"):
         return None
 
     cursor.execute(sql_script, {
+        "user_id": new_uuid(),
         "f_name": "Test",
         "m_name": "M",
         "l_name": "User",
@@ -75,7 +77,7 @@ def insert_test_user(cursor, email="test_user@example.com", password="pw123"):
         "email": email,
         "password": password
     })
-    cursor.execute("SELECT BIN_TO_UUID(user_id) FROM Users WHERE email=%s", (email,))
+    cursor.execute("SELECT BIN_TO_UUID(user_id, 1) FROM Users WHERE email=%s", (email,))
     return cursor.fetchone()[0]
 
 
@@ -107,7 +109,7 @@ def insert_test_grant(cursor, grant_name="Test Grant"):
         "date_closed": None,
         "last_update_date": current_date
     })
-    cursor.execute("SELECT BIN_TO_UUID(grant_id) FROM Grants WHERE grant_title=%s", (grant_name,))
+    cursor.execute("SELECT BIN_TO_UUID(grant_id, 1) FROM Grants WHERE grant_title=%s", (grant_name,))
     return cursor.fetchone()[0]
 
 
@@ -128,7 +130,7 @@ def insert_test_application(cursor, user_id, grant_id):
         "application_date": datetime.now()
     })
     cursor.execute(
-        "SELECT BIN_TO_UUID(application_id) FROM Applications WHERE user_id=UUID_TO_BIN(%s) AND grant_id=UUID_TO_BIN(%s)",
+        "SELECT BIN_TO_UUID(application_id, 1) FROM Applications WHERE user_id=UUID_TO_BIN(%s, 1) AND grant_id=UUID_TO_BIN(%s, 1)",
         (user_id, grant_id)
     )
     return cursor.fetchone()[0]
@@ -162,7 +164,7 @@ def test_create_internal_deadline(cursor, uid, aid):
     
     if result is None:
         cursor.execute(
-            "SELECT deadline_name FROM InternalDeadlines WHERE application_id=UUID_TO_BIN(%s) AND deadline_name='Test Deadline'",
+            "SELECT deadline_name FROM InternalDeadlines WHERE application_id=UUID_TO_BIN(%s, 1) AND deadline_name='Test Deadline'",
             (aid,)
         )
         row = cursor.fetchone()
@@ -186,7 +188,7 @@ def test_read_internal_deadline_by_uuid(cursor, uid, aid):
     )
     
     cursor.execute(
-        "SELECT BIN_TO_UUID(internal_deadline_id) FROM InternalDeadlines WHERE application_id=UUID_TO_BIN(%s) AND deadline_name='Read Test Deadline'",
+        "SELECT BIN_TO_UUID(internal_deadline_id, 1) FROM InternalDeadlines WHERE application_id=UUID_TO_BIN(%s, 1) AND deadline_name='Read Test Deadline'",
         (aid,)
     )
     deadline_id = cursor.fetchone()[0]
@@ -211,7 +213,7 @@ def test_update_internal_deadline(cursor, uid, aid):
     )
     
     cursor.execute(
-        "SELECT BIN_TO_UUID(internal_deadline_id) FROM InternalDeadlines WHERE application_id=UUID_TO_BIN(%s) AND deadline_name='Original Deadline'",
+        "SELECT BIN_TO_UUID(internal_deadline_id, 1) FROM InternalDeadlines WHERE application_id=UUID_TO_BIN(%s, 1) AND deadline_name='Original Deadline'",
         (aid,)
     )
     deadline_id = cursor.fetchone()[0]
@@ -226,7 +228,7 @@ def test_update_internal_deadline(cursor, uid, aid):
     
     if result is None:
         cursor.execute(
-            "SELECT deadline_name, deadline_date FROM InternalDeadlines WHERE internal_deadline_id=UUID_TO_BIN(%s)",
+            "SELECT deadline_name, deadline_date FROM InternalDeadlines WHERE internal_deadline_id=UUID_TO_BIN(%s, 1)",
             (deadline_id,)
         )
         row = cursor.fetchone()
@@ -250,7 +252,7 @@ def test_delete_internal_deadline(cursor, uid, aid):
     )
     
     cursor.execute(
-        "SELECT BIN_TO_UUID(internal_deadline_id) FROM InternalDeadlines WHERE application_id=UUID_TO_BIN(%s) AND deadline_name='Delete Me Deadline'",
+        "SELECT BIN_TO_UUID(internal_deadline_id, 1) FROM InternalDeadlines WHERE application_id=UUID_TO_BIN(%s, 1) AND deadline_name='Delete Me Deadline'",
         (aid,)
     )
     deadline_id = cursor.fetchone()[0]
@@ -259,7 +261,7 @@ def test_delete_internal_deadline(cursor, uid, aid):
     
     if result is None:
         cursor.execute(
-            "SELECT COUNT(*) FROM InternalDeadlines WHERE internal_deadline_id=UUID_TO_BIN(%s)",
+            "SELECT COUNT(*) FROM InternalDeadlines WHERE internal_deadline_id=UUID_TO_BIN(%s, 1)",
             (deadline_id,)
         )
         if cursor.fetchone()[0] == 0:
@@ -0,0 +1,177 @@
+"""
+    File: percolator_test_suite.py
+    Author: Colby Wirth
+    Version: 19 October 2026
+    Description:
+        Tests saved search percolation in src/utils/percolator.py: validation and normalization of
+        a saved search, natural and boolean keyword matching, filters and ranges, the change log
+        position a search was saved at, reading saved searches as the percolation job selects
+        them, and the candidate index.
+        No database connection is needed.
+
+    Usage:
+        python -m src.test_suites.percolator_test_suite
+"""
+
+import sys
+from datetime import date
+
+from src.utils.logging_utils import log_info, log_error
+from src.utils.percolator import Percolator, grant_doc, normalize_query, parse_saved_query, saved_query
+
+
+# Test statistics
+test_stats = {"passed": 0, "failed": 0, "errors": 0}
+
+TODAY = date(2026, 10, 19)
+USER = "0190a1b2-0000-7000-8000-0000000000aa"
+
+
+def check(description: str, fn):
+    """Run fn() and count it as passed when it returns True."""
+    try:
+        if fn():
+            test_stats["passed"] += 1
+            log_info(f"PASS: {description}")
+        else:
+            test_stats["failed"] += 1
+            log_error(f"FAIL: {description}")
+    except Exception as e:
+        test_stats["errors"] += 1
+        log_error(f"ERROR: {description} - {type(e).__name__}: {e}")
+
+
+def grant(grant_id, title, description="", field="Environment", op_num="NSF-26-001", change_id=10,
+          closed=date(2026, 11, 1), award_max=500_000):
+    # a row of grants/select_grant_changes_since
+    return grant_doc((change_id, grant_id, title, description, "NSF", field, op_num,
+                      date(2026, 1, 1), closed, award_max, 10_000, 5_000_000))
+
+
+def matched(saved: dict, doc, since: int = 0) -> bool:
+    """Whether a search saved with these parameters matches doc."""
+    query = parse_saved_query("s1", USER, since, normalize_query(saved), TODAY)
+    return bool(Percolator([query]).match(doc))
+
+
+def rejects(params: dict) -> bool:
+    try:
+        normalize_query(params)
+    except ValueError:
+        return True
+    return False
+
+
+def test_normalize_query():
+    a = normalize_query({"q": "  coral   reefs ", "award_max_gte": "1000", "mode": "natural", "page": "3"})
+    b = normalize_query({"award_max_gte": "1000", "q": "coral reefs"})
+    c = normalize_query({"op_num": "NSF", "op_num_match": "contains"})
+    return a == b == "award_max_gte=1000&q=coral+reefs" and c == "op_num=NSF"
+
+
+def test_invalid_searches_are_rejected():
+    return all(rejects(params) for params in (
+        {},
+        {"mode": "boolean"},
+        {"q": "x", "mode": "fuzzy"},
+        {"q": "x" * 501},
+        {"award_max_gte": "lots"},
+        {"op_num": "NSF", "op_num_match": "exact"},
+        {"op_num_match": "prefix"},
+    ))
+
+
+def test_natural_mode_matches_any_word():
+    doc = grant("g1", "Coral reef restoration", "<p>Funding for marine ecosystems</p>")
+    return matched({"q": "desert marine"}, doc) and not matched({"q": "desert forest"}, doc)
+
+
+def test_boolean_operators():
+    doc = grant("g1", "Coral reef restoration", "Funding for marine ecosystems in the Pacific")
+    return (
+        matched({"q": "+coral +marine", "mode": "boolean"}, doc)
+        and not matched({"q": "+coral +atlantic", "mode": "boolean"}, doc)
+        and not matched({"q": "+coral -pacific", "mode": "boolean"}, doc)
+        and matched({"q": "+restor*", "mode": "boolean"}, doc)
+        and matched({"q": '"marine ecosystems"', "mode": "boolean"}, doc)
+        and not matched({"q": '"ecosystems marine"', "mode": "boolean"}, doc)
+    )
+
+
+def test_filters_and_ranges():
+    doc = grant("g1", "Coral reef restoration", field="Environmental Science", op_num="NSF-26-001")
+    return (
+        matched({"q": "coral", "field": "environ", "op_num": "nsf"}, doc)
+        and matched({"q": "coral", "field": "science", "op_num": "26-0"}, doc)
+        and not matched({"q": "coral", "field": "health"}, doc)
+        and matched({"op_num": "nsf-26", "op_num_match": "prefix"}, doc)
+        and not matched({"op_num": "26-0", "op_num_match": "prefix"}, doc)
+        and matched({"closes_within": "30", "award_max_gte": "100000"}, doc)
+        and not matched({"closes_within": "7"}, doc)
+        and not matched({"award_max_gte": "600000"}, doc)
+    )
+
+
+def test_changes_before_saving_do_not_match():
+    doc = grant("g1", "Coral reef restoration", change_id=10)
+    return matched({"q": "coral"}, doc, since=9) and not matched({"q": "coral"}, doc, since=10)
+
+
+def test_queries_without_terms_match_nothing():
+    # like MySQL: only exclusions, or only stopwords, find no rows
+    doc = grant("g1", "Coral reef restoration")
+    return (
+        not matched({"q": "-desert", "mode": "boolean"}, doc)
+        and not matched({"q": "the and of"}, doc)
+    )
+
+
+def test_saved_search_rows_are_read_by_column():
+    # a row of saved_searches/select_saved_searches_for_percolation
+    row = ("s1", USER, normalize_query({"q": "coral", "field": "environ"}), 9)
+    query = saved_query(row, TODAY)
+    return (
+        query.search_id == "s1" and query.user_id == USER and query.since == 9
+        and Percolator([query]).match(grant("g1", "Coral reef restoration", change_id=10))
+        and not Percolator([query]).match(grant("g1", "Coral reef restoration", change_id=9))
+    )
+
+
+def test_candidate_index():
+    queries = [
+        parse_saved_query(f"s{i}", USER, 0, normalize_query({"q": f"topic{i}"}), TODAY) for i in range(1000)
+    ] + [
+        parse_saved_query("prefix", USER, 0, normalize_query({"q": "+topic99*", "mode": "boolean"}), TODAY),
+        parse_saved_query("filter", USER, 0, normalize_query({"field": "environ"}), TODAY),
+    ]
+    percolator = Percolator(queries)
+    doc = grant("g1", "topic7 and topic995")
+    candidates = percolator._candidates(frozenset(doc.tokens))
+    found = sorted(q.search_id for q in percolator.match(doc))
+    return len(candidates) == 4 and found == ["filter", "prefix", "s7", "s995"]
+
+
+# MAIN
+if __name__ == "__main__":
+    log_info("Starting Percolator Test Suite")
+
+    check("Saved searches are normalized to a canonical query string", test_normalize_query)
+    check("Empty, malformed and oversized searches are rejected", test_invalid_searches_are_rejected)
+    check("Natural mode matches any query word in the title or description", test_natural_mode_matches_any_word)
+    check("Boolean mode follows +word, -word, word* and phrases", test_boolean_operators)
+    check("Field, opportunity number and range filters apply", test_filters_and_ranges)
+    check("Grants changed before a search was saved do not match it", test_changes_before_saving_do_not_match)
+    check("Exclusion-only and stopword-only searches match nothing", test_queries_without_terms_match_nothing)
+    check("Saved search rows are read in the column order the job selects them", test_saved_search_rows_are_read_by_column)
+    check("A grant is only checked against searches sharing a term with it", test_candidate_index)
+
+    log_info(f"Passed: {test_stats['passed']}")
+    if test_stats['failed'] > 0:
+        log_error(f"Failed: {test_stats['failed']}")
+    if test_stats['errors'] > 0:
+        log_error(f"Errors: {test_stats['errors']}")
+
+    if test_stats['failed'] == 0 and test_stats['errors'] == 0:
+        log_info("All tests passed")
+    else:
+        sys.exit(1)
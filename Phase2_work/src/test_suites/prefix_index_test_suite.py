@@ -0,0 +1,147 @@
+"""
+    File: prefix_index_test_suite.py
+    Author: Colby Wirth
+    Version: 19 October 2026
+    Description:
+        Tests the typeahead index in src/utils/prefix_index.py: ranking by weight, word-start
+        completions, kind filters, and p99 lookup latency over a synthetic corpus the size of the
+        grants table.  No database connection is needed.
+
+    Usage:
+        python -m src.test_suites.prefix_index_test_suite
+"""
+
+import random
+import sys
+import time
+
+from src.utils.prefix_index import PrefixIndex, HEAVY_SLICE, TOP_K_MAX
+from src.utils.logging_utils import log_info, log_error
+
+
+# Test statistics
+test_stats = {"passed": 0, "failed": 0, "errors": 0}
+
+# p99 budget for a lookup over LATENCY_GRANTS synthetic grants
+LATENCY_GRANTS = 20000
+LATENCY_BUDGET_MS = 3.0
+
+
+def check(description: str, fn):
+    """Run fn() and count it as passed when it returns True."""
+    try:
+        if fn():
+            test_stats["passed"] += 1
+            log_info(f"PASS: {description}")
+        else:
+            test_stats["failed"] += 1
+            log_error(f"FAIL: {description}")
+    except Exception as e:
+        test_stats["errors"] += 1
+        log_error(f"ERROR: {description} - {type(e).__name__}: {e}")
+
+
+def sample_index() -> PrefixIndex:
+    return PrefixIndex([
+        ("title", "Climate Resilience Research", "g1", 5),
+        ("title", "Climate Data Infrastructure", "g2", 9),
+        ("title", "Coastal  climate   models", "g3", 1),
+        ("opportunity_number", "NSF-24-CLI", "g1", 5),
+        ("provider", "National Science Foundation", None, 300),
+        ("research_field", "Science and Technology", None, 120),
+        ("title", None, "g4", 50),
+    ])
+
+
+def texts(suggestions):
+    return [s["text"] for s in suggestions]
+
+
+def test_ranked_by_weight():
+    return texts(sample_index().suggest("clim", kind="title")) == [
+        "Climate Data Infrastructure", "Climate Resilience Research", "Coastal  climate   models",
+    ]
+
+
+def test_precomputed_ranking_matches_slice_ranking():
+    # "climate " matches more than HEAVY_SLICE keys and is precomputed; "climate 0" is ranked
+    # from its slice
+    rng = random.Random(3)
+    entries = [("title", f"Climate {i:04}", f"g{i}", rng.randint(1, 9)) for i in range(HEAVY_SLICE * 3)]
+    index = PrefixIndex(entries)
+    expected = sorted(entries, key=lambda e: (-e[3], e[1]))
+    in_zero = [e for e in expected if e[1].startswith("Climate 0")]
+    return (
+        index.stats()["precomputed_prefixes"] > 0
+        and texts(index.suggest("climate ", k=TOP_K_MAX)) == [e[1] for e in expected[:TOP_K_MAX]]
+        and texts(index.suggest("climate 0", k=TOP_K_MAX)) == [e[1] for e in in_zero[:TOP_K_MAX]]
+    )
+
+
+def test_word_start_completion():
+    result = sample_index().suggest("scien")
+    return texts(result) == ["National Science Foundation", "Science and Technology"]
+
+
+def test_opportunity_numbers_complete_from_start_only():
+    index = sample_index()
+    return texts(index.suggest("nsf-24")) == ["NSF-24-CLI"] and index.suggest("24-cli") == []
+
+
+def test_case_and_whitespace_insensitive():
+    result = sample_index().suggest("  CLIMATE   data ")
+    return texts(result) == ["Climate Data Infrastructure"] and result[0]["ref"] == "g2"
+
+
+def test_k_and_empty_prefix():
+    index = sample_index()
+    return len(index.suggest("c", k=1)) == 1 and index.suggest("") == [] and len(index) == 6
+
+
+def test_latency():
+    rng = random.Random(11)
+    words = [f"{rng.choice('abcdefghijklmnoprstw')}{rng.choice('aeiou')}word{i}" for i in range(3000)]
+    entries = []
+    for i in range(LATENCY_GRANTS):
+        title = " ".join(rng.choices(words, k=6))
+        entries.append(("title", title, f"g{i}", rng.randint(1, 50)))
+        # every opportunity number shares the stem "opp-0"
+        entries.append(("opportunity_number", f"OPP-{i:06}", f"g{i}", 1))
+    start = time.perf_counter()
+    index = PrefixIndex(entries)
+    log_info(f"  built in {time.perf_counter() - start:.1f}s")
+
+    timings = []
+    for _ in range(500):
+        word = rng.choice(words + [f"opp-{rng.randrange(LATENCY_GRANTS):06}"])
+        prefix = word[:rng.randint(1, len(word))]
+        start = time.perf_counter()
+        index.suggest(prefix, k=TOP_K_MAX)
+        timings.append((time.perf_counter() - start) * 1000)
+    p99 = sorted(timings)[int(len(timings) * 0.99)]
+    log_info(f"  p99 {p99:.2f} ms over {LATENCY_GRANTS} grants")
+    return p99 < LATENCY_BUDGET_MS
+
+
+# MAIN
+if __name__ == "__main__":
+    log_info("Starting Prefix Index Test Suite")
+
+    check("Completions are ranked by weight", test_ranked_by_weight)
+    check("Precomputed and sliced rankings agree", test_precomputed_ranking_matches_slice_ranking)
+    check("Providers and fields complete from any word", test_word_start_completion)
+    check("Opportunity numbers complete from the start only", test_opportunity_numbers_complete_from_start_only)
+    check("Prefixes ignore case and extra whitespace", test_case_and_whitespace_insensitive)
+    check("k limits results; empty prefix suggests nothing", test_k_and_empty_prefix)
+    check(f"Lookup p99 under {LATENCY_BUDGET_MS:.0f} ms", test_latency)
+
+    log_info(f"Passed: {test_stats['passed']}")
+    if test_stats['failed'] > 0:
+        log_error(f"Failed: {test_stats['failed']}")
+    if test_stats['errors'] > 0:
+        log_error(f"Errors: {test_stats['errors']}")
+
+    if test_stats['failed'] == 0 and test_stats['errors'] == 0:
+        log_info("All tests passed")
+    else:
+        sys.exit(1)
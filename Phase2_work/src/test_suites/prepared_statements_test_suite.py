@@ -0,0 +1,180 @@
+"""
+prepared_statements_test_suite.py
+Author: Colby Wirth
+Version: 19 October 2026
+Description:
+    Tests for the prepared statement cache in src/utils/prepared_statements.py against a live database.
+    Checks that prepared results match the text protocol, that repeated executions reuse the
+    prepared handle (Com_stmt_prepare stays flat) and that a reconnect invalidates the cache.
+
+Usage:
+    python -m src.test_suites.prepared_statements_test_suite
+"""
+
+import os
+import sys
+from datetime import datetime
+from dotenv import load_dotenv
+import mysql.connector as connector
+from mysql.connector import errorcode, Error as MySQLError
+
+from src.utils.logging_utils import log_info, log_error, log_default
+from src.utils.prepared_statements import PreparedStatementCache, PreparedStatementError
+from src.utils.sql_registry import get_sql
+from src.utils.uuid_keys import new_uuid
+
+load_dotenv()
+
+DB_NAME = os.getenv("DB_NAME", "GrantGuruDB")
+HOST = os.getenv("HOST", "localhost")
+MYSQL_USER = os.getenv("GG_USER", "root")
+MYSQL_PASS = os.getenv("GG_PASS", "")
+
+FIXTURE_EMAIL = "fixture_user_prepared@example.com"
+FIXTURE_GRANT = "Fixture Grant Prepared"
+
+
+def setup_db():
+    try:
+        cnx = connector.connect(
+            host=HOST,
+            user=MYSQL_USER,
+            password=MYSQL_PASS,
+            database=DB_NAME
+        )
+        cursor = cnx.cursor()
+        return cnx, cursor
+    except MySQLError as err:
+        if err.errno == errorcode.ER_ACCESS_DENIED_ERROR:
+            log_error(f"Access denied. Check MySQL user/password: {err}")
+        else:
+            log_error(f"MySQL Error: {err}")
+        sys.exit(1)
+
+
+def create_test_fixtures(cursor):
+    """
+    Creates a user with one application and one internal deadline.
+    Returns (user_id, grant_id, application_id).
+    """
+    cursor.execute("DELETE FROM Users WHERE email=%s", (FIXTURE_EMAIL,))
+    cursor.execute("DELETE FROM Grants WHERE grant_title=%s", (FIXTURE_GRANT,))
+
+    cursor.execute(get_sql("users/create_users"), {
+        "user_id": new_uuid(), "f_name": "Test", "m_name": "M", "l_name": "User",
+        "institution": "Test University", "email": FIXTURE_EMAIL, "password": "pw123"
+    })
+    cursor.execute(get_sql("grants/create_grants"), {
+        "grant_title": FIXTURE_GRANT, "opportunity_number": "PREPARED-TEST-001",
+        "description": "Test grant description", "research_field": "Computer Science",
+        "expected_award_count": 1, "eligibility": "Open to all",
+        "award_max_amount": 50000, "award_min_amount": 10000, "program_funding": 100000,
+        "provider": "Test Org", "link_to_source": "https://example.com/grant",
+        "point_of_contact": "test@example.com", "date_posted": datetime.now(),
+        "archive_date": None, "date_closed": None, "last_update_date": datetime.now()
+    })
+    cursor.execute("SELECT BIN_TO_UUID(user_id, 1) FROM Users WHERE email=%s", (FIXTURE_EMAIL,))
+    uid = cursor.fetchone()[0]
+    cursor.execute("SELECT BIN_TO_UUID(grant_id, 1) FROM Grants WHERE grant_title=%s", (FIXTURE_GRANT,))
+    gid = cursor.fetchone()[0]
+
+    cursor.execute(get_sql("applications/create_application"), {
+        "status": "pending", "user_id": uid, "grant_id": gid, "application_date": datetime.now()
+    })
+    cursor.execute(
+        "SELECT BIN_TO_UUID(application_id, 1) FROM Applications WHERE user_id=UUID_TO_BIN(%s, 1)", (uid,)
+    )
+    aid = cursor.fetchone()[0]
+    cursor.execute(
+        "INSERT INTO InternalDeadlines (application_id, deadline_name, deadline_date) "
+        "VALUES (UUID_TO_BIN(%s, 1), 'Prepared Deadline', NOW())",
+        (aid,)
+    )
+    return uid, gid, aid
+
+
+def stmt_prepare_count(cursor) -> int:
+    cursor.execute("SHOW SESSION STATUS LIKE 'Com_stmt_prepare'")
+    return int(cursor.fetchone()[1])
+
+
+def test_results_match_text_protocol(cnx, cursor, cache, uid, gid, aid):
+    log_default("Running test_results_match_text_protocol()")
+
+    cases = {
+        "grants/select_grant_details_by_uuid": (gid,),
+        "applications/select_applications_with_grant_by_user": (uid,),
+        "applications/select_owned_application": (aid, uid),
+        "internal_deadlines/select_owned_internal_deadlines": (aid, uid),
+    }
+    for name, params in cases.items():
+        cursor.execute(get_sql(name), params)
+        expected = [tuple(r) for r in cursor.fetchall()]
+        got = [tuple(r) for r in cache.fetchall(cnx, name, params)]
+        if got == expected and got:
+            log_info(f" PASS: {name} matches the text protocol")
+        else:
+            log_error(f" FAIL: {name} returned {got}, expected {expected}")
+
+
+def test_handle_is_reused(cnx, cursor, cache, uid, aid):
+    log_default("Running test_handle_is_reused()")
+
+    cache.reset_stats()
+    before = stmt_prepare_count(cursor)
+    for _ in range(20):
+        cache.fetchone(cnx, "applications/select_owned_application", (aid, uid))
+    prepares = stmt_prepare_count(cursor) - before
+    stats = cache.stats()
+
+    # the statement was already prepared by the previous test
+    if prepares == 0 and stats["hits"] == 20 and stats["misses"] == 0:
+        log_info(" PASS: 20 executions reused one prepared handle")
+    else:
+        log_error(f" FAIL: {prepares} prepares on the server, cache stats {stats}")
+
+
+def test_reconnect_invalidates(cnx, cache, uid, aid):
+    log_default("Running test_reconnect_invalidates()")
+
+    cnx.reconnect()
+    cache.reset_stats()
+    row = cache.fetchone(cnx, "applications/select_owned_application_state", (aid, uid))
+    stats = cache.stats()
+    if row and row[0] == "started" and stats["misses"] == 1 and stats["invalidations"] == 1:
+        log_info(" PASS: reconnect re-prepared the statement")
+    else:
+        log_error(f" FAIL: row {row}, cache stats {stats}")
+
+
+def test_named_placeholders_rejected(cnx, cache, uid):
+    log_default("Running test_named_placeholders_rejected()")
+
+    try:
+        cache.fetchall(cnx, "users/update_users_email", (uid,))
+        log_error(" FAIL: script with named placeholders was prepared")
+    except PreparedStatementError:
+        log_info(" PASS: script with named placeholders was rejected")
+
+
+if __name__ == "__main__":
+    cnx, cursor = setup_db()
+    cache = PreparedStatementCache()
+
+    uid, gid, aid = create_test_fixtures(cursor)
+    cnx.commit()
+
+    test_results_match_text_protocol(cnx, cursor, cache, uid, gid, aid)
+    test_handle_is_reused(cnx, cursor, cache, uid, aid)
+    test_reconnect_invalidates(cnx, cache, uid, aid)
+    test_named_placeholders_rejected(cnx, cache, uid)
+
+    cache.close_connection(cnx)
+    # the reconnect test replaced the session; clean up through a fresh cursor
+    cursor = cnx.cursor()
+    cursor.execute("DELETE FROM Users WHERE email=%s", (FIXTURE_EMAIL,))
+    cursor.execute("DELETE FROM Grants WHERE grant_title=%s", (FIXTURE_GRANT,))
+    cnx.commit()
+
+    cursor.close()
+    cnx.close()
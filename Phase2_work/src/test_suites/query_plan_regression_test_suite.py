@@ -0,0 +1,252 @@
+"""
+    File: query_plan_regression_test_suite.py
+    Author: Colby Wirth
+    Version: 19 October 2026
+    Description:
+        Calls each API endpoint through the Flask test client against a seeded database, captures
+        every statement the endpoint sends (api.query_stats.capture_statements) and EXPLAINs it
+        with the parameters it was sent with.
+
+        A case fails when one of its plans reads a table with a full scan (access_type ALL) that
+        is estimated to examine at least GG_PLAN_SCAN_THRESHOLD rows (default 1000).  Typical
+        causes are a function wrapped around an indexed column (BIN_TO_UUID(grant_id) = %s),
+        a LIKE pattern with a leading wildcard, or a missing index (keyword search needs the
+        FULLTEXT index).  ALLOWED_FULL_SCANS lists the cases that scan on purpose, each with
+        the reason.
+
+        The run seeds --seed-grants grants (default 5000) with src/generate_sample_data and
+        refreshes the table statistics first, so the estimates reflect a realistic table size.
+
+    Usage (from Phase2_work):
+        python -m src.test_suites.query_plan_regression_test_suite
+        python -m src.test_suites.query_plan_regression_test_suite --seed-grants 50000
+        python -m src.test_suites.query_plan_regression_test_suite --no-seed
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+import mysql.connector as connector
+from dotenv import load_dotenv
+from mysql.connector import errorcode, Error as MySQLError
+
+from src.generate_sample_data.generate_grants_data import seed_sample_data
+from src.query_analysis.explain_harness import explain_statement
+from src.utils.logging_utils import log_info, log_error, log_default
+
+load_dotenv()
+
+DB_NAME = os.getenv("DB_NAME", "GrantGuruDB")
+HOST = os.getenv("HOST", "localhost")
+MYSQL_USER = os.getenv("GG_USER", "root")
+MYSQL_PASS = os.getenv("GG_PASS", "")
+
+SCAN_THRESHOLD = int(os.getenv("GG_PLAN_SCAN_THRESHOLD", "1000"))
+
+PHASE3_ROOT = Path(__file__).resolve().parents[3] / "Phase3_work"
+
+# case name -> why a full scan is expected there
+ALLOWED_FULL_SCANS: dict[str, str] = {
+    "search_opportunity_number_contains": "op_num has always matched substrings, which no index can "
+                                          "answer; callers that know the start of the number pass "
+                                          "op_num_match=prefix, a range on the unique index "
+                                          "(search_opportunity_number, not allowed to scan)",
+    "search_short_word": "words FULLTEXT leaves out (shorter than innodb_ft_min_token_size, stopwords) "
+                         "are matched against every title",
+}
+
+# Test statistics
+test_stats = {"passed": 0, "failed": 0, "errors": 0}
+
+
+def setup_db():
+    try:
+        cnx = connector.connect(host=HOST, user=MYSQL_USER, password=MYSQL_PASS, database=DB_NAME)
+        return cnx
+    except MySQLError as err:
+        if err.errno == errorcode.ER_ACCESS_DENIED_ERROR:
+            log_error(f"Access denied. Check MySQL user/password: {err}")
+        else:
+            log_error(f"MySQL Error: {err}")
+        sys.exit(1)
+
+
+def analyze_tables(cnx):
+    """Refresh index statistics so the optimizer sees the seeded row counts."""
+    with cnx.cursor() as cursor:
+        cursor.execute("SHOW TABLES")
+        for (table,) in cursor.fetchall():
+            cursor.execute(f"ANALYZE TABLE `{table}`")
+            cursor.fetchall()
+
+
+def pick_fixture_ids(cnx) -> dict[str, str]:
+    """A user whose application has tasks and documents, so every user route returns rows."""
+    with cnx.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT BIN_TO_UUID(a.user_id, 1), BIN_TO_UUID(a.application_id, 1), BIN_TO_UUID(a.grant_id, 1), u.email
+            FROM Applications a
+            JOIN Users u ON u.user_id = a.user_id
+            WHERE EXISTS (SELECT 1 FROM InternalDeadlines d WHERE d.application_id = a.application_id)
+              AND EXISTS (SELECT 1 FROM Documents doc WHERE doc.application_id = a.application_id)
+            LIMIT 1
+            """
+        )
+        row = cursor.fetchone()
+    if row is None:
+        log_error("No application with tasks and documents; run without --no-seed")
+        sys.exit(1)
+    user_id, application_id, grant_id, email = row
+    return {"user_id": user_id, "application_id": application_id, "grant_id": grant_id, "email": email}
+
+
+def build_cases(ids: dict[str, str]) -> list[tuple[str, str, str, dict | None, bool]]:
+    """(case name, method, path, JSON body, needs a JWT) for every endpoint under test."""
+    from api.pagination import encode_cursor
+
+    app_path = f"/api/user/applications/{ids['application_id']}"
+    grant_id = ids["grant_id"]
+    title_cursor = encode_cursor(s="title_asc", src="mysql", k=["M", grant_id])
+    posted_cursor = encode_cursor(s="posted_date_desc", src="mysql", k=["2025-01-01", grant_id])
+    null_close_cursor = encode_cursor(s="close_date_asc", src="mysql", k=[None, grant_id])
+    grants_cursor = encode_cursor(s="grant_id", k=grant_id)
+    return [
+        ("aggregate_grants", "GET", "/api/public/aggregate-grants", None, False),
+        ("grant_count", "GET", "/api/public/fetch_grant_count", None, False),
+        ("grant_stats", "GET", "/api/public/grant-stats", None, False),
+        ("analytics_monthly", "GET", "/api/public/analytics/monthly?from=2024-01&to=2025-12", None, False),
+        ("analytics_providers", "GET", "/api/public/analytics/providers", None, False),
+        ("analytics_research_fields", "GET", "/api/public/analytics/research-fields?from=2025-01&limit=5", None, False),
+        ("search_default", "GET", "/api/public/search_grants", None, False),
+        ("search_posted_desc", "GET", "/api/public/search_grants?sort_by=posted_date_desc", None, False),
+        ("search_close_asc", "GET", "/api/public/search_grants?sort_by=close_date_asc&page=3", None, False),
+        ("search_title_cursor", "GET", f"/api/public/search_grants?sort_by=title_asc&cursor={title_cursor}", None, False),
+        ("search_posted_desc_cursor", "GET", f"/api/public/search_grants?sort_by=posted_date_desc&cursor={posted_cursor}", None, False),
+        ("search_close_asc_null_cursor", "GET", f"/api/public/search_grants?sort_by=close_date_asc&cursor={null_close_cursor}", None, False),
+        ("search_keyword", "GET", "/api/public/search_grants?q=climate", None, False),
+        ("search_keyword_title", "GET", "/api/public/search_grants?q=climate&sort_by=title_asc", None, False),
+        ("search_short_word", "GET", "/api/public/search_grants?q=AI", None, False),
+        ("search_boolean", "GET", "/api/public/search_grants?q=%2Bclimate%20-ocean&mode=boolean", None, False),
+        ("search_field", "GET", "/api/public/search_grants?field=Bio", None, False),
+        ("search_field_substring", "GET", "/api/public/search_grants?field=science", None, False),
+        ("search_opportunity_number", "GET", "/api/public/search_grants?op_num=SEED-0000&op_num_match=prefix", None, False),
+        ("search_opportunity_number_contains", "GET", "/api/public/search_grants?op_num=0000", None, False),
+        ("search_closing_soon", "GET", "/api/public/search_grants?closes_within=30&sort_by=close_date_asc", None, False),
+        ("search_closing_soon_award", "GET", "/api/public/search_grants?closes_within=30&award_max_gte=500000&sort_by=close_date_asc", None, False),
+        ("search_award_range", "GET", "/api/public/search_grants?award_max_gte=4000000&award_max_lte=4100000", None, False),
+        ("search_posted_range", "GET", "/api/public/search_grants?posted_from=2025-01-01&posted_to=2025-01-31&sort_by=posted_date_desc", None, False),
+        ("grant_detail", "GET", f"/api/public/grant/{ids['grant_id']}", None, False),
+        ("signin", "POST", "/api/auth/signin", {"email": ids["email"], "password": "not-the-password"}, False),
+        ("grants_list", "GET", "/api/applications/grants", None, False),
+        ("grants_list_cursor", "GET", f"/api/applications/grants?cursor={grants_cursor}", None, False),
+        ("applications_for_user", "GET", f"/api/applications/user/{ids['user_id']}", None, False),
+        ("user_applications", "GET", "/api/user/applications", None, True),
+        ("user_dashboard", "GET", "/api/user/dashboard", None, True),
+        ("user_application", "GET", app_path, None, True),
+        ("user_tasks", "GET", f"{app_path}/tasks", None, True),
+        ("user_documents", "GET", f"{app_path}/documents", None, True),
+    ]
+
+
+def _explain_params(params):
+    """executemany() batches are explained with their first row."""
+    if isinstance(params, (list, tuple)) and params and all(isinstance(p, (dict, list, tuple)) for p in params):
+        return params[0]
+    return params
+
+
+def full_scans(plan: dict) -> list[str]:
+    """Tables the plan reads with a full scan above SCAN_THRESHOLD rows."""
+    return [
+        f"{t['table']} ({t['rows_examined_per_scan']} rows)"
+        for t in plan.get("tables") or []
+        if t["access_type"] == "ALL" and (t["rows_examined_per_scan"] or 0) >= SCAN_THRESHOLD
+    ]
+
+
+def run_case(client, explain_cursor, capture_statements, case, headers) -> None:
+    name, method, path, body, needs_auth = case
+    log_default(f"Running {name}: {method} {path}")
+    try:
+        with capture_statements() as statements:
+            response = client.open(path, method=method, json=body, headers=headers if needs_auth else None)
+
+        if response.status_code >= 500:
+            test_stats["errors"] += 1
+            log_error(f" ERROR: {name} returned {response.status_code}: {response.get_data(as_text=True)[:200]}")
+            return
+        if not statements:
+            test_stats["failed"] += 1
+            log_error(f" FAIL: {name} sent no statements; the capture hook missed them")
+            return
+
+        problems = []
+        for sql, params in statements:
+            plan = explain_statement(explain_cursor, sql, {}, _explain_params(params))
+            if "error" in plan:
+                problems.append(f"EXPLAIN failed: {plan['error']}")
+                continue
+            scans = full_scans(plan)
+            if scans:
+                problems.append(f"full scan of {', '.join(scans)} in: {plan['sql'][:160]}")
+
+        if problems and name in ALLOWED_FULL_SCANS:
+            test_stats["passed"] += 1
+            log_info(f" PASS (allowed: {ALLOWED_FULL_SCANS[name]}): {name}")
+        elif problems:
+            test_stats["failed"] += 1
+            for problem in problems:
+                log_error(f" FAIL: {name}: {problem}")
+        else:
+            test_stats["passed"] += 1
+            log_info(f" PASS: {name} ({len(statements)} statements)")
+    except Exception as e:
+        test_stats["errors"] += 1
+        log_error(f" ERROR: {name} - {type(e).__name__}: {e}")
+
+
+# MAIN
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fail when an API endpoint's plan scans a large table")
+    parser.add_argument("--seed-grants", type=int, default=5000)
+    parser.add_argument("--seed-users", type=int, default=200)
+    parser.add_argument("--no-seed", action="store_true", help="use the data already in the database")
+    args = parser.parse_args()
+
+    log_info("Starting Query Plan Regression Test Suite")
+    cnx = setup_db()
+    cnx.autocommit = True
+    if not args.no_seed:
+        seed_sample_data(cnx, grants=args.seed_grants, users=args.seed_users)
+    analyze_tables(cnx)
+    ids = pick_fixture_ids(cnx)
+
+    sys.path.insert(0, str(PHASE3_ROOT))
+    from flask_jwt_extended import create_access_token
+    from api import create_app
+    from api.query_stats import capture_statements
+
+    app = create_app()
+    app.config["TESTING"] = True
+    with app.app_context():
+        headers = {"Authorization": f"Bearer {create_access_token(identity=ids['user_id'])}"}
+
+    with app.test_client() as client, cnx.cursor() as explain_cursor:
+        for case in build_cases(ids):
+            run_case(client, explain_cursor, capture_statements, case, headers)
+
+    cnx.close()
+
+    log_info(f"Passed: {test_stats['passed']}")
+    if test_stats['failed'] > 0:
+        log_error(f"Failed: {test_stats['failed']}")
+    if test_stats['errors'] > 0:
+        log_error(f"Errors: {test_stats['errors']}")
+
+    if test_stats['failed'] == 0 and test_stats['errors'] == 0:
+        log_info("All tests passed")
+    else:
+        sys.exit(1)
@@ -0,0 +1,151 @@
+"""
+    File: range_filters_test_suite.py
+    Author: Colby Wirth
+    Version: 19 October 2026
+    Description:
+        Tests the search_grants range filters in src/utils/range_filters.py: parsing and
+        validation of the query string, the SQL conditions, and the same filters applied by the
+        in-memory search index (api/search_index.py).
+        No database connection is needed.
+
+    Usage:
+        python -m src.test_suites.range_filters_test_suite
+"""
+
+import sys
+from datetime import date
+from pathlib import Path
+
+from src.utils.bm25_index import BM25Index
+from src.utils.logging_utils import log_info, log_error
+from src.utils.range_filters import RangeFilter, matches, parse_range_filters, sql_conditions
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "Phase3_work"))
+from api import search_index  # noqa: E402
+
+
+# Test statistics
+test_stats = {"passed": 0, "failed": 0, "errors": 0}
+
+TODAY = date(2026, 10, 19)
+
+
+def check(description: str, fn):
+    """Run fn() and count it as passed when it returns True."""
+    try:
+        if fn():
+            test_stats["passed"] += 1
+            log_info(f"PASS: {description}")
+        else:
+            test_stats["failed"] += 1
+            log_error(f"FAIL: {description}")
+    except Exception as e:
+        test_stats["errors"] += 1
+        log_error(f"ERROR: {description} - {type(e).__name__}: {e}")
+
+
+def rejects(args: dict) -> bool:
+    try:
+        parse_range_filters(args, TODAY)
+    except ValueError:
+        return True
+    return False
+
+
+def test_parse_amounts_and_dates():
+    filters = parse_range_filters({"award_max_gte": "500000", "posted_from": "2026-01-05", "q": "climate"}, TODAY)
+    return filters == (
+        RangeFilter("award_max_amount", ">=", 500000),
+        RangeFilter("date_posted", ">=", "2026-01-05"),
+    )
+
+
+def test_closes_within_is_a_date_range():
+    return parse_range_filters({"closes_within": "30"}, TODAY) == (
+        RangeFilter("date_closed", "<=", "2026-11-18"),
+        RangeFilter("date_closed", ">=", "2026-10-19"),
+    )
+
+
+def test_malformed_values_are_rejected():
+    return all(rejects(args) for args in (
+        {"award_max_gte": "lots"},
+        {"funding_lte": "-1"},
+        {"closes_to": "2026-13-01"},
+        {"closes_within": "-3"},
+        {"closes_within": "99999"},
+    ))
+
+
+def test_equal_requests_give_equal_filters():
+    # the count cache keys on the filters, so parameter order must not matter
+    a = parse_range_filters({"award_max_lte": "9", "award_max_gte": "1"}, TODAY)
+    b = parse_range_filters({"award_max_gte": "1", "award_max_lte": "9"}, TODAY)
+    return a == b
+
+
+def test_sql_conditions_bind_every_value():
+    conditions, params = sql_conditions(parse_range_filters({"funding_gte": "10", "closes_to": "2027-01-01"}, TODAY))
+    return conditions == ["date_closed <= %s", "program_funding >= %s"] and params == ["2027-01-01", 10]
+
+
+def test_matches_is_inclusive_and_skips_nulls():
+    filters = parse_range_filters({"award_max_gte": "100", "award_max_lte": "200"}, TODAY)
+
+    class Keys:
+        def __init__(self, award_max_amount):
+            self.award_max_amount = award_max_amount
+
+    return (
+        matches(filters, Keys(100)) and matches(filters, Keys(200))
+        and not matches(filters, Keys(99)) and not matches(filters, Keys(201))
+        and not matches(filters, Keys(None))
+    )
+
+
+def test_search_index_applies_ranges():
+    index = BM25Index()
+    rows = [
+        # grant_id, title, description, provider, field, opp #, posted, closed, award max, award min, funding
+        ("0190a1b2-0000-7000-8000-000000000001", "Climate A", "climate research", "NSF", "Environment", "A-1",
+         date(2026, 1, 1), date(2026, 11, 1), 800_000, 10_000, 5_000_000),
+        ("0190a1b2-0000-7000-8000-000000000002", "Climate B", "climate research", "NSF", "Environment", "A-2",
+         date(2026, 1, 1), date(2027, 6, 1), 900_000, 10_000, 5_000_000),
+        ("0190a1b2-0000-7000-8000-000000000003", "Climate C", "climate research", "NSF", "Environment", "A-3",
+         date(2026, 1, 1), date(2026, 11, 2), 50_000, 10_000, 5_000_000),
+        ("0190a1b2-0000-7000-8000-000000000004", "Climate D", "climate research", "NSF", "Environment", "A-4",
+         date(2026, 1, 1), None, 800_000, 10_000, 5_000_000),
+    ]
+    for row in rows:
+        search_index._add_row(index, row)
+    search_index._index = index
+    try:
+        ranges = parse_range_filters({"closes_within": "30", "award_max_gte": "500000"}, TODAY)
+        total, hits = search_index.search("climate", ranges=ranges)
+        return total == 1 and hits[0][0] == rows[0][0]
+    finally:
+        search_index._index = None
+
+
+# MAIN
+if __name__ == "__main__":
+    log_info("Starting Range Filters Test Suite")
+
+    check("Amount and date parameters are parsed, other parameters ignored", test_parse_amounts_and_dates)
+    check("closes_within=N is today through today + N days", test_closes_within_is_a_date_range)
+    check("Malformed, negative and out-of-range values are rejected", test_malformed_values_are_rejected)
+    check("Parameter order does not change the filters", test_equal_requests_give_equal_filters)
+    check("SQL conditions bind every value as a parameter", test_sql_conditions_bind_every_value)
+    check("Bounds are inclusive and NULL never matches", test_matches_is_inclusive_and_skips_nulls)
+    check("The in-memory index applies the same ranges", test_search_index_applies_ranges)
+
+    log_info(f"Passed: {test_stats['passed']}")
+    if test_stats['failed'] > 0:
+        log_error(f"Failed: {test_stats['failed']}")
+    if test_stats['errors'] > 0:
+        log_error(f"Errors: {test_stats['errors']}")
+
+    if test_stats['failed'] == 0 and test_stats['errors'] == 0:
+        log_info("All tests passed")
+    else:
+        sys.exit(1)
@@ -0,0 +1,144 @@
+"""
+    File: recommendations_test_suite.py
+    Author: Colby Wirth
+    Version: 19 October 2026
+    Description:
+        Tests the user grant feed scoring in src/utils/recommendations.py: research field, history
+        and institution points, excluded grants, the per-user feed size, the candidate index, and
+        the profile digest that decides which feeds are rebuilt.
+        No database connection is needed.
+
+    Usage:
+        python -m src.test_suites.recommendations_test_suite
+"""
+
+import sys
+
+from src.utils.logging_utils import log_info, log_error
+from src.utils import recommendations
+from src.utils.recommendations import (
+    FIELD_PARTIAL, FIELD_POINTS, INSTITUTION_POINTS, REASON_FIELD, REASON_HISTORY, REASON_INSTITUTION,
+    Recommender, eligible_kinds, feed_grant, institution_kinds, score, user_profile,
+)
+
+
+# Test statistics
+test_stats = {"passed": 0, "failed": 0, "errors": 0}
+
+UNIVERSITIES = "Public and State controlled institutions of higher education; Private institutions of higher education"
+
+
+def check(description: str, fn):
+    """Run fn() and count it as passed when it returns True."""
+    try:
+        if fn():
+            test_stats["passed"] += 1
+            log_info(f"PASS: {description}")
+        else:
+            test_stats["failed"] += 1
+            log_error(f"FAIL: {description}")
+    except Exception as e:
+        test_stats["errors"] += 1
+        log_error(f"ERROR: {description} - {type(e).__name__}: {e}")
+
+
+def grant(grant_id="g1", title="Coral reef restoration", field="Environment", provider="NSF",
+          eligibility="Nonprofits having a 501(c)(3) status"):
+    return feed_grant(grant_id, title, field, provider, eligibility)
+
+
+def test_institution_and_eligibility_kinds():
+    return (
+        institution_kinds("University of Massachusetts Amherst") == {"higher_education"}
+        and institution_kinds("Gates Foundation") == {"nonprofit"}
+        and institution_kinds("International Rescue Committee") == frozenset()
+        and eligible_kinds(UNIVERSITIES) == {"higher_education"}
+        and eligible_kinds("Unrestricted (i.e., open to any type of entity below)") is None
+        and eligible_kinds(None) is None
+    )
+
+
+def test_research_field_points():
+    user = user_profile("u1", None, ["environment", "Machine Learning"], [])
+    exact = score(user, grant())
+    partial = score(user, grant(title="Learning ecology in schools", field="Education"))
+    none = score(user, grant(title="Rural broadband", field="Infrastructure"))
+    return (
+        exact == (FIELD_POINTS, REASON_FIELD)
+        and partial == (round(FIELD_POINTS * FIELD_PARTIAL * 0.5), REASON_FIELD)
+        and none is None
+    )
+
+
+def test_history_points_and_applied_grants():
+    user = user_profile("u1", None, [], [("a1", "NSF", "Health"), ("a2", "NSF", "Environment")])
+    result = score(user, grant())
+    return (
+        result == (round(recommendations.HISTORY_POINTS * 0.75), REASON_HISTORY)
+        and score(user, grant(grant_id="a1")) is None
+    )
+
+
+def test_institution_points_need_relevance():
+    user = user_profile("u1", "Stanford University", ["Environment"], [])
+    eligible = score(user, grant(eligibility=UNIVERSITIES))
+    ineligible = score(user, grant())
+    unrelated = score(user, grant(title="Rural broadband", field="Infrastructure", eligibility=UNIVERSITIES))
+    return (
+        eligible == (FIELD_POINTS + INSTITUTION_POINTS, REASON_FIELD | REASON_INSTITUTION)
+        and ineligible == (FIELD_POINTS, REASON_FIELD)
+        and unrelated is None
+    )
+
+
+def test_feed_keeps_the_best_grants():
+    user = user_profile("u1", None, ["coral reef restoration"], [])
+    grants = [
+        grant("g1", title="Coral monitoring", field="Ocean"),
+        grant("g2", title="Coral reef restoration", field="Ocean"),
+        grant("g3", title="Reef coral survey", field="Ocean"),
+        grant("g4", title="Rural broadband", field="Infrastructure"),
+    ]
+    feeds = Recommender([user]).feeds(grants, size=2)
+    return [grant_id for _, grant_id, _ in feeds["u1"]] == ["g2", "g3"]
+
+
+def test_candidate_index():
+    users = [user_profile(f"u{i}", None, [f"topic{i}"], []) for i in range(1000)]
+    users.append(user_profile("history", None, [], [("a1", "NOAA", None)]))
+    recommender = Recommender(users)
+    target = grant(title="topic7 and topic995", field="Ocean", provider="NOAA")
+    matched = sorted(user.user_id for user, _, _ in recommender.match(target))
+    return len(recommender._candidates(target)) == 3 and matched == ["history", "u7", "u995"]
+
+
+def test_profile_digest():
+    base = user_profile("u1", "MIT", ["Physics", "Chemistry"], [("a1", "NSF", "Physics")])
+    reordered = user_profile("u1", " mit ", ["chemistry", "physics"], [("a1", "NSF", "Physics")])
+    new_field = user_profile("u1", "MIT", ["Physics"], [("a1", "NSF", "Physics")])
+    new_application = user_profile("u1", "MIT", ["Physics", "Chemistry"], [("a1", "NSF", "Physics"), ("a2", "NIH", None)])
+    return base.digest == reordered.digest and len({base.digest, new_field.digest, new_application.digest}) == 3
+
+
+# MAIN
+if __name__ == "__main__":
+    log_info("Starting Recommendations Test Suite")
+
+    check("Institutions and eligibility texts are classified by kind", test_institution_and_eligibility_kinds)
+    check("Research fields score exact and partial matches", test_research_field_points)
+    check("Past applications score by provider and field, and are not recommended again", test_history_points_and_applied_grants)
+    check("Institution points only add to grants that already score", test_institution_points_need_relevance)
+    check("A feed keeps its best grants, best first", test_feed_keeps_the_best_grants)
+    check("A grant is only scored for the users it can reach", test_candidate_index)
+    check("The profile digest changes with fields and applications only", test_profile_digest)
+
+    log_info(f"Passed: {test_stats['passed']}")
+    if test_stats['failed'] > 0:
+        log_error(f"Failed: {test_stats['failed']}")
+    if test_stats['errors'] > 0:
+        log_error(f"Errors: {test_stats['errors']}")
+
+    if test_stats['failed'] == 0 and test_stats['errors'] == 0:
+        log_info("All tests passed")
+    else:
+        sys.exit(1)
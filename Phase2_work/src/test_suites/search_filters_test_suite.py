@@ -0,0 +1,225 @@
+"""
+    File: search_filters_test_suite.py
+    Author: Colby Wirth
+    Version: 19 October 2026
+    Description:
+        Tests the research field and opportunity number filters of GET /api/public/search_grants
+        (Phase3_work/api/public/routes_public.py) through a Flask test client: both match
+        substrings, the research field filter becomes an IN list of the distinct fields of
+        Grants that contain it, op_num_match=prefix matches from the start, and the
+        in-memory index (api/search_index.py) filters the same way.  Also that two-letter
+        keywords and stopwords, which FULLTEXT leaves out, still match grant titles.
+        MySQL is replaced by a recording connection, so no database is needed.
+
+    Usage:
+        python -m src.test_suites.search_filters_test_suite
+"""
+
+import re
+import sys
+from datetime import date
+from pathlib import Path
+
+from flask import Flask
+
+from src.utils.bm25_index import BM25Index
+from src.utils.logging_utils import log_info, log_error
+from src.utils.sql_registry import get_sql
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "Phase3_work"))
+from api import caching, search_index  # noqa: E402
+from api.public import public_bp, routes_public  # noqa: E402
+
+
+# Test statistics
+test_stats = {"passed": 0, "failed": 0, "errors": 0}
+
+FIELDS = ("Biology", "Science and Technology", "Technology Transfer", "Health")
+
+
+def check(description: str, fn):
+    """Run fn() and count it as passed when it returns True."""
+    try:
+        if fn():
+            test_stats["passed"] += 1
+            log_info(f"PASS: {description}")
+        else:
+            test_stats["failed"] += 1
+            log_error(f"FAIL: {description}")
+    except Exception as e:
+        test_stats["errors"] += 1
+        log_error(f"ERROR: {description} - {type(e).__name__}: {e}")
+
+
+class FakeDatabase:
+    """Answers the research field lookup from FIELDS and records every search statement."""
+
+    def __init__(self):
+        self.statements = []
+        self.lookups = []
+        self._result = []
+
+    def __call__(self):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def cursor(self):
+        return self
+
+    def fetch_fields(self, conn, name, params=()):
+        # LIKE '%value%' on a case-insensitive collation
+        self.lookups.append(name)
+        needle = params[0].strip("%").lower()
+        return [(f,) for f in FIELDS if needle in f.lower()]
+
+    def execute(self, sql, params=None):
+        self.statements.append((" ".join(sql.split()), params))
+        self._result = [(0,)] if "COUNT(*)" in sql else []
+
+    def fetchone(self):
+        return self._result[0] if self._result else None
+
+    def fetchall(self):
+        return self._result
+
+
+class FixedGeneration:
+    def current(self, conn=None):
+        return 1
+
+
+def search(query_string: str) -> tuple[dict, FakeDatabase]:
+    database = FakeDatabase()
+    routes_public.get_connection = database
+    routes_public.prepared_fetchall = database.fetch_fields
+    routes_public.ingest_generation = caching.ingest_generation = FixedGeneration()
+    routes_public.response_cache.clear()
+    routes_public.count_cache.clear()
+    app = Flask(__name__)
+    app.register_blueprint(public_bp, url_prefix="/api/public")
+    response = app.test_client().get(f"/api/public/search_grants?{query_string}")
+    return response, database
+
+
+def data_statement(database: FakeDatabase) -> tuple[str, tuple]:
+    return next((sql, params) for sql, params in database.statements if "LIMIT %s OFFSET %s" in sql)
+
+
+def test_field_matches_substrings_through_an_in_list():
+    response, database = search("field=technology")
+    sql, params = data_statement(database)
+    return (
+        response.status_code == 200
+        and database.lookups == ["grants/select_research_fields_containing"]
+        # from Grants itself, so a missing or stale GrantFieldStats cannot drop grants
+        and "FROM Grants" in get_sql("grants/select_research_fields_containing")
+        and "research_field IN (%s, %s)" in sql and "LIKE" not in sql
+        and params[:2] == ("Science and Technology", "Technology Transfer")
+    )
+
+
+def test_field_without_matching_fields_finds_nothing():
+    response, database = search("field=astronomy")
+    sql, _ = data_statement(database)
+    return response.status_code == 200 and "WHERE FALSE" in sql
+
+
+def test_op_num_contains_by_default_and_prefix_on_request():
+    _, contains = search("op_num=26-0")
+    _, prefix = search("op_num=NSF_26&op_num_match=prefix")
+    rejected, _ = search("op_num=NSF&op_num_match=exact")
+    return (
+        data_statement(contains)[1][0] == "%26-0%"
+        and data_statement(prefix)[1][0] == "NSF\\_26%"
+        and rejected.status_code == 400
+    )
+
+
+def test_search_index_matches_substrings():
+    index = BM25Index()
+    rows = [
+        # grant_id, title, description, provider, field, opp #, posted, closed, award max, award min, funding
+        ("0190a1b2-0000-7000-8000-000000000001", "Climate A", "climate research", "NSF", "Science and Technology",
+         "NSF-26-001", date(2026, 1, 1), None, 800_000, 10_000, 5_000_000),
+        ("0190a1b2-0000-7000-8000-000000000002", "Climate B", "climate research", "NSF", "Biology",
+         "DOE-26-002", date(2026, 1, 1), None, 800_000, 10_000, 5_000_000),
+    ]
+    for row in rows:
+        search_index._add_row(index, row)
+    search_index._index = index
+    try:
+        by_field = search_index.search("climate", field="technology")[0]
+        by_op_num = search_index.search("climate", op_num="26-00")[0]
+        by_prefix = search_index.search("climate", op_num="26-00", op_num_prefix=True)[0]
+        return by_field == 1 and by_op_num == 2 and by_prefix == 0
+    finally:
+        search_index._index = None
+
+
+def test_two_letter_query_matches_titles():
+    response, database = search("q=AI")
+    sql, params = data_statement(database)
+    # MySQL's ICU regular expressions treat \b like Python's
+    pattern = re.compile(params[2], re.IGNORECASE)
+    return (
+        response.status_code == 200 and response.get_json()["source"] == "mysql"
+        and "(MATCH(grant_title, description) AGAINST (%s IN NATURAL LANGUAGE MODE) OR grant_title REGEXP %s)" in sql
+        and params[1] == "AI"
+        and pattern.search("AI for Public Health") and pattern.search("Applied ai research")
+        and not pattern.search("Maine Fisheries") and not pattern.search("Training Grants")
+    )
+
+
+def test_stopword_query_matches_titles_and_long_words_stay_fulltext():
+    _, stopword = search("q=it%20workforce")
+    _, plain = search("q=climate%20resilience")
+    _, boolean = search("q=%2BAI&mode=boolean")
+    return (
+        data_statement(stopword)[1][2] == r"\b(it)\b"
+        and "REGEXP" not in data_statement(plain)[0]
+        and "REGEXP" not in data_statement(boolean)[0]
+    )
+
+
+def test_search_index_finds_two_letter_words():
+    index = BM25Index()
+    search_index._add_row(index, (
+        "0190a1b2-0000-7000-8000-000000000001", "AI for Public Health", "models", "NIH", "Health",
+        "NIH-26-001", date(2026, 1, 1), None, 800_000, 10_000, 5_000_000,
+    ))
+    search_index._index = index
+    try:
+        total, hits = search_index.search("AI")
+        return total == 1 and hits[0][0] == "0190a1b2-0000-7000-8000-000000000001"
+    finally:
+        search_index._index = None
+
+
+# MAIN
+if __name__ == "__main__":
+    log_info("Starting Search Filters Test Suite")
+
+    check("field matches anywhere in the research field, through an IN list", test_field_matches_substrings_through_an_in_list)
+    check("field matching no research field finds nothing", test_field_without_matching_fields_finds_nothing)
+    check("op_num matches substrings unless op_num_match=prefix", test_op_num_contains_by_default_and_prefix_on_request)
+    check("The in-memory index matches the same substrings", test_search_index_matches_substrings)
+    check("A two-letter keyword still matches whole words of the title", test_two_letter_query_matches_titles)
+    check("Stopwords match titles; other queries and boolean mode stay FULLTEXT only",
+          test_stopword_query_matches_titles_and_long_words_stay_fulltext)
+    check("The in-memory index finds two-letter words", test_search_index_finds_two_letter_words)
+
+    log_info(f"Passed: {test_stats['passed']}")
+    if test_stats['failed'] > 0:
+        log_error(f"Failed: {test_stats['failed']}")
+    if test_stats['errors'] > 0:
+        log_error(f"Errors: {test_stats['errors']}")
+
+    if test_stats['failed'] == 0 and test_stats['errors'] == 0:
+        log_info("All tests passed")
+    else:
+        sys.exit(1)
@@ -0,0 +1,275 @@
+"""
+    File: single_flight_test_suite.py
+    Author: Colby Wirth
+    Version: 19 October 2026
+    Description:
+        Tests request coalescing in Phase3_work/api/single_flight.py: concurrent identical calls
+        run once, waiters time out and run on their own, leader errors reach waiters, cached
+        routes coalesce concurrent misses through a Flask test client, and the cross-worker flight
+        returns a response stored by another worker, leads on a flight pool connection without
+        holding one of the routes' pool, or falls back when MySQL is unavailable.
+        No database connection is needed.
+
+    Usage:
+        python -m src.test_suites.single_flight_test_suite
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+from flask import Flask, jsonify
+from mysql.connector import Error as MySQLError
+
+from src.utils.logging_utils import log_info, log_error
+from src.utils.sql_registry import get_sql
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "Phase3_work"))
+from api import caching, single_flight  # noqa: E402
+from api.caching import LRUTTLCache, cached_response  # noqa: E402
+from api.single_flight import DatabaseFlight, SingleFlight  # noqa: E402
+
+
+# Test statistics
+test_stats = {"passed": 0, "failed": 0, "errors": 0}
+
+
+def check(description: str, fn):
+    """Run fn() and count it as passed when it returns True."""
+    try:
+        if fn():
+            test_stats["passed"] += 1
+            log_info(f"PASS: {description}")
+        else:
+            test_stats["failed"] += 1
+            log_error(f"FAIL: {description}")
+    except Exception as e:
+        test_stats["errors"] += 1
+        log_error(f"ERROR: {description} - {type(e).__name__}: {e}")
+
+
+def run_concurrently(count: int, target) -> list:
+    """Results of target() called from count threads at once."""
+    results = [None] * count
+
+    def run(i):
+        try:
+            results[i] = target()
+        except Exception as e:
+            results[i] = e
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def slow(value, calls: list, seconds: float = 0.2):
+    def compute():
+        calls.append(1)
+        time.sleep(seconds)
+        return value
+    return compute
+
+
+def test_concurrent_calls_run_once():
+    flight = SingleFlight(timeout=5)
+    calls = []
+    results = run_concurrently(20, lambda: flight.do("stats", slow(42, calls)))
+    stats = flight.stats()
+    return (
+        results == [42] * 20 and len(calls) == 1
+        and stats["leaders"] == 1 and stats["coalesced"] == 19 and stats["max_waiters"] == 19
+        and stats["in_flight"] == 0 and stats["avg_wait_ms"] > 0
+    )
+
+
+def test_keys_do_not_share():
+    flight = SingleFlight(timeout=5)
+    calls = []
+    results = [flight.do(key, slow(key, calls, 0)) for key in ("a", "b")]
+    return results == ["a", "b"] and len(calls) == 2 and flight.stats()["coalesced"] == 0
+
+
+def test_waiters_time_out_and_run():
+    flight = SingleFlight(timeout=0.05)
+    calls = []
+    leader = threading.Thread(target=flight.do, args=("stats", slow("leader", calls, 0.5)))
+    leader.start()
+    time.sleep(0.02)
+    result = flight.do("stats", slow("waiter", calls, 0))
+    leader.join()
+    return result == "waiter" and len(calls) == 2 and flight.stats()["timeouts"] == 1
+
+
+def test_leader_error_reaches_waiters():
+    flight = SingleFlight(timeout=5)
+
+    def fail():
+        time.sleep(0.2)
+        raise MySQLError("server gone")
+
+    results = run_concurrently(5, lambda: flight.do("stats", fail))
+    return all(isinstance(r, MySQLError) for r in results) and flight.stats()["shared_errors"] == 4
+
+
+class FixedGeneration:
+    """Stands in for the GrantChangeLog position, which needs MySQL."""
+
+    def current(self, conn=None):
+        return 1
+
+
+def test_cached_route_coalesces_misses():
+    caching.ingest_generation = FixedGeneration()
+    app = Flask(__name__)
+    calls = []
+
+    @app.route("/stats")
+    @cached_response(LRUTTLCache(ttl=60))
+    def stats():
+        calls.append(1)
+        time.sleep(0.2)
+        return jsonify({"total": 42})
+
+    @app.route("/bad")
+    @cached_response(LRUTTLCache(ttl=60))
+    def bad():
+        return jsonify({"error": "Invalid limit"}), 400
+
+    responses = run_concurrently(10, lambda: app.test_client().get("/stats"))
+    again = app.test_client().get("/stats")
+    rejected = app.test_client().get("/bad")
+    return (
+        len(calls) == 1
+        and all(r.status_code == 200 and r.get_json() == {"total": 42} for r in responses)
+        and len({r.headers["ETag"] for r in responses}) == 1
+        and again.headers["X-Cache"] == "HIT"
+        and rejected.status_code == 400 and rejected.get_json() == {"error": "Invalid limit"}
+    )
+
+
+class StoredFlightCursor:
+    """Answers select_query_flight with a response another worker stored."""
+
+    with_rows = True
+
+    def __init__(self, body):
+        self.body = body
+        self.scripts = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        self.scripts.append(sql)
+
+    def fetchone(self):
+        return (self.body,) if self.scripts[-1] == get_sql("query_flights/select_query_flight") else None
+
+
+class FakeConnection:
+    def __init__(self, cursor):
+        self._cursor = cursor
+        self.closed = False
+
+    def cursor(self):
+        return self._cursor
+
+    def close(self):
+        self.closed = True
+
+
+def test_database_flight_uses_stored_response():
+    import api.db
+
+    conn = FakeConnection(StoredFlightCursor(bytearray(b'{"total": 42}')))
+    original = api.db.get_flight_connection
+    api.db.get_flight_connection = lambda: conn
+    try:
+        calls = []
+        flight = DatabaseFlight(timeout=1)
+        value = flight.do(("gen", "/stats"), slow((200, b"{}", single_flight.JSON), calls, 0))
+    finally:
+        api.db.get_flight_connection = original
+    return (
+        value == (200, b'{"total": 42}', single_flight.JSON) and calls == []
+        and flight.stats()["remote_hits"] == 1 and conn.closed
+    )
+
+
+class LeaderFlightCursor(StoredFlightCursor):
+    """Grants the named lock; nothing is stored yet."""
+
+    def fetchone(self):
+        return (1,) if self.scripts[-1] == get_sql("query_flights/get_query_flight_lock") else None
+
+
+def test_database_flight_leader_holds_no_route_connection():
+    import api.db
+
+    cursor = LeaderFlightCursor(None)
+    conn = FakeConnection(cursor)
+    routes_pool = []
+    original = api.db.get_flight_connection, api.db.get_connection
+    api.db.get_flight_connection = lambda: conn
+    api.db.get_connection = lambda: routes_pool.append(1)
+    try:
+        flight = DatabaseFlight(timeout=1)
+        value = flight.do(("gen", "/stats"), lambda: (200, b'{"total": 42}', single_flight.JSON))
+    finally:
+        api.db.get_flight_connection, api.db.get_connection = original
+    return (
+        value == (200, b'{"total": 42}', single_flight.JSON) and routes_pool == []
+        and get_sql("query_flights/create_query_flight") in cursor.scripts
+        and cursor.scripts[-1] == get_sql("query_flights/release_query_flight_lock")
+        and flight.stats()["stored"] == 1 and conn.closed
+    )
+
+
+def test_database_flight_falls_back_without_mysql():
+    import api.db
+
+    def unavailable():
+        raise MySQLError("no free connection")
+
+    original = api.db.get_flight_connection
+    api.db.get_flight_connection = unavailable
+    try:
+        flight = DatabaseFlight(timeout=1)
+        value = flight.do(("gen", "/stats"), lambda: (200, b"{}", single_flight.JSON))
+    finally:
+        api.db.get_flight_connection = original
+    return value == (200, b"{}", single_flight.JSON) and flight.stats()["unavailable"] == 1
+
+
+# MAIN
+if __name__ == "__main__":
+    log_info("Starting Single Flight Test Suite")
+
+    check("Concurrent calls with one key run once and share the result", test_concurrent_calls_run_once)
+    check("Different keys are computed separately", test_keys_do_not_share)
+    check("A waiter past the timeout runs the computation itself", test_waiters_time_out_and_run)
+    check("The leader's exception is raised to its waiters", test_leader_error_reaches_waiters)
+    check("A cached route runs once for concurrent misses", test_cached_route_coalesces_misses)
+    check("Across workers, a response stored by another worker is returned", test_database_flight_uses_stored_response)
+    check("Across workers, the leader locks on a flight connection, not one of the routes' pool",
+          test_database_flight_leader_holds_no_route_connection)
+    check("Across workers, the route runs when MySQL cannot be used", test_database_flight_falls_back_without_mysql)
+
+    log_info(f"Passed: {test_stats['passed']}")
+    if test_stats['failed'] > 0:
+        log_error(f"Failed: {test_stats['failed']}")
+    if test_stats['errors'] > 0:
+        log_error(f"Errors: {test_stats['errors']}")
+
+    if test_stats['failed'] == 0 and test_stats['errors'] == 0:
+        log_info("All tests passed")
+    else:
+        sys.exit(1)
@@ -0,0 +1,96 @@
+"""
+    File: snippets_test_suite.py
+    Author: Colby Wirth
+    Version: 19 October 2026
+    Description:
+        Tests the search result snippets in src/utils/snippets.py: window choice, word-boundary
+        cuts, HTML stripping and highlight offsets.  No database connection is needed.
+
+    Usage:
+        python -m src.test_suites.snippets_test_suite
+"""
+
+import sys
+
+from src.utils.snippets import ELLIPSIS, highlight, make_snippet, query_terms
+from src.utils.logging_utils import log_info, log_error
+
+
+# Test statistics
+test_stats = {"passed": 0, "failed": 0, "errors": 0}
+
+FILLER = " ".join(["lorem ipsum dolor sit amet"] * 40)
+LONG = f"{FILLER} Coastal flooding and climate resilience for island towns. {FILLER} climate {FILLER}"
+
+
+def check(description: str, fn):
+    """Run fn() and count it as passed when it returns True."""
+    try:
+        if fn():
+            test_stats["passed"] += 1
+            log_info(f"PASS: {description}")
+        else:
+            test_stats["failed"] += 1
+            log_error(f"FAIL: {description}")
+    except Exception as e:
+        test_stats["errors"] += 1
+        log_error(f"ERROR: {description} - {type(e).__name__}: {e}")
+
+
+def marked(snippet, highlights):
+    return [snippet[start:end] for start, end in highlights]
+
+
+def test_window_holds_most_distinct_terms():
+    snippet, highlights = make_snippet(LONG, query_terms("climate flooding"), 120)
+    return marked(snippet, highlights) == ["flooding", "climate"] and len(snippet) <= 122
+
+
+def test_cut_on_words_with_ellipses():
+    snippet, _ = make_snippet(LONG, query_terms("coastal"), 120)
+    body = snippet[1:-1]
+    return snippet.startswith(ELLIPSIS) and snippet.endswith(ELLIPSIS) and body == body.strip() \
+        and all(word in LONG.split() for word in body.split()[1:-1])
+
+
+def test_no_match_starts_at_beginning():
+    snippet, highlights = make_snippet(LONG, query_terms("quantum"), 60)
+    return snippet.startswith("lorem ipsum") and snippet.endswith(ELLIPSIS) and highlights == []
+
+
+def test_html_is_stripped():
+    snippet, highlights = make_snippet("<p>Supports <strong>health</strong> &amp; research.</p>", query_terms("health"))
+    return snippet == "Supports health & research." and marked(snippet, highlights) == ["health"]
+
+
+def test_whole_words_and_prefixes():
+    terms = query_terms("care* health")
+    title = "Healthcare, Health and Caregivers"
+    return marked(title, highlight(title, terms)) == ["Health", "Caregivers"]
+
+
+def test_short_text_is_returned_whole():
+    return make_snippet("Climate data", query_terms("climate"), 120) == ("Climate data", [[0, 7]])
+
+
+# MAIN
+if __name__ == "__main__":
+    log_info("Starting Snippets Test Suite")
+
+    check("Snippet window holds the most distinct query terms", test_window_holds_most_distinct_terms)
+    check("Snippets are cut on word boundaries with ellipses", test_cut_on_words_with_ellipses)
+    check("Without matches the snippet is the start of the text", test_no_match_starts_at_beginning)
+    check("HTML tags and entities are removed", test_html_is_stripped)
+    check("Whole words and word* prefixes are highlighted", test_whole_words_and_prefixes)
+    check("Short descriptions are returned whole", test_short_text_is_returned_whole)
+
+    log_info(f"Passed: {test_stats['passed']}")
+    if test_stats['failed'] > 0:
+        log_error(f"Failed: {test_stats['failed']}")
+    if test_stats['errors'] > 0:
+        log_error(f"Errors: {test_stats['errors']}")
+
+    if test_stats['failed'] == 0 and test_stats['errors'] == 0:
+        log_info("All tests passed")
+    else:
+        sys.exit(1)
@@ -0,0 +1,146 @@
+"""
+    File: sql_registry_test_suite.py
+    Author: Colby Wirth
+    Version: 19 October 2026
+    Description:
+        Tests the SQL statement registry (src/utils/sql_registry.py) and the parsing helpers in
+        src/utils/sql_file_parsers.py.  No database connection is needed.
+
+    Usage:
+        python -m src.test_suites.sql_registry_test_suite
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+from src.utils.logging_utils import log_info, log_error
+from src.utils.sql_file_parsers import strip_sql_comments, split_sql_statements, find_sql_parameters
+from src.utils.sql_registry import (
+    load_sql_registry,
+    get_sql,
+    get_statements,
+    get_script,
+    check_params,
+    SqlRegistryError,
+)
+
+
+# Test statistics
+test_stats = {"passed": 0, "failed": 0, "errors": 0}
+
+
+def check(description: str, fn):
+    """Run fn() and count it as passed when it returns True."""
+    try:
+        if fn():
+            test_stats["passed"] += 1
+            log_info(f"PASS: {description}")
+        else:
+            test_stats["failed"] += 1
+            log_error(f"FAIL: {description}")
+    except Exception as e:
+        test_stats["errors"] += 1
+        log_error(f"ERROR: {description} - {type(e).__name__}: {e}")
+
+
+def raises(exc_type, fn) -> bool:
+    try:
+        fn()
+    except exc_type:
+        return True
+    return False
+
+
+# Parser tests
+def test_strip_comments_keeps_strings():
+    sql = "SELECT '-- not a comment', \"/* nor this */\" -- trailing\n/* block */ FROM t # hash"
+    stripped = strip_sql_comments(sql)
+    return "'-- not a comment'" in stripped and '"/* nor this */"' in stripped \
+        and "trailing" not in stripped and "block" not in stripped and "hash" not in stripped
+
+
+def test_split_ignores_semicolons_in_strings_and_comments():
+    sql = "/* header; with semicolon */\nINSERT INTO t VALUES ('a;b');\n-- note; here\nSELECT 1;\n\n"
+    return split_sql_statements(sql) == ["INSERT INTO t VALUES ('a;b')", "SELECT 1"]
+
+
+def test_find_parameters():
+    names, positional = find_sql_parameters(
+        "SELECT DATE_FORMAT(d, '%Y-%m-%d'), '%(ignored)s' FROM t WHERE a = %(a)s AND b = %(b)s OR a = %(a)s"
+    )
+    return names == ("a", "b") and positional == 0
+
+
+def test_find_positional_parameters():
+    return find_sql_parameters("SELECT 1 FROM t WHERE a = %s AND b = %s AND c LIKE '100%'") == ((), 2)
+
+
+# Registry tests
+def test_registry_loads_every_db_crud_script():
+    registry = load_sql_registry()
+    crud_dir = Path(__file__).resolve().parent.parent / "db_crud"
+    return len(registry) == len(list(crud_dir.rglob("*.sql"))) and "users/create_users" in registry
+
+
+def test_get_sql_has_no_comments():
+    sql = get_sql("users/create_users")
+    return sql.startswith("INSERT INTO Users") and "Author" not in sql
+
+
+def test_multi_statement_script():
+    return len(get_statements("research_fields/create_research_fields")) == 3
+
+
+def test_single_statement_accessor_rejects_multi_statement_script():
+    return raises(SqlRegistryError, lambda: get_sql("research_fields/create_research_fields"))
+
+
+def test_missing_named_parameter_is_rejected():
+    return raises(SqlRegistryError, lambda: get_sql("users/update_users_email", {"email": "a@b.test"}))
+
+
+def test_positional_count_is_checked():
+    script = get_script("users/select_users_by_uuid")
+    return raises(SqlRegistryError, lambda: check_params(script, ("a", "b"))) and check_params(script, ("a",)) is None
+
+
+def test_unknown_script():
+    return raises(SqlRegistryError, lambda: get_sql("users/does_not_exist"))
+
+
+def test_mixed_placeholders_fail_at_load_time():
+    with tempfile.TemporaryDirectory() as tmp:
+        (Path(tmp) / "bad.sql").write_text("SELECT 1 FROM t WHERE a = %s AND b = %(b)s;")
+        ok = raises(SqlRegistryError, lambda: load_sql_registry(tmp, reload=True))
+    load_sql_registry(reload=True)
+    return ok
+
+
+# MAIN
+if __name__ == "__main__":
+    log_info("Starting SQL Registry Test Suite")
+
+    check("Strip comments keeps string literals", test_strip_comments_keeps_strings)
+    check("Split ignores ';' in strings and comments", test_split_ignores_semicolons_in_strings_and_comments)
+    check("Find named parameters", test_find_parameters)
+    check("Find positional parameters", test_find_positional_parameters)
+    check("Registry loads every db_crud script", test_registry_loads_every_db_crud_script)
+    check("get_sql strips header comments", test_get_sql_has_no_comments)
+    check("Multi-statement script is split", test_multi_statement_script)
+    check("get_sql rejects multi-statement script", test_single_statement_accessor_rejects_multi_statement_script)
+    check("Missing named parameter is rejected", test_missing_named_parameter_is_rejected)
+    check("Positional parameter count is checked", test_positional_count_is_checked)
+    check("Unknown script name is rejected", test_unknown_script)
+    check("Mixed placeholder styles fail at load time", test_mixed_placeholders_fail_at_load_time)
+
+    log_info(f"Passed: {test_stats['passed']}")
+    if test_stats['failed'] > 0:
+        log_error(f"Failed: {test_stats['failed']}")
+    if test_stats['errors'] > 0:
+        log_error(f"Errors: {test_stats['errors']}")
+
+    if test_stats['failed'] == 0 and test_stats['errors'] == 0:
+        log_info("All tests passed")
+    else:
+        sys.exit(1)
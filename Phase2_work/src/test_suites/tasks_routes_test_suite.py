@@ -0,0 +1,159 @@
+"""
+    File: tasks_routes_test_suite.py
+    Author: Colby Wirth
+    Version: 19 October 2026
+    Description:
+        Tests the task deadline handling of POST and PUT /api/user/applications/<id>/tasks
+        (Phase3_work/api/user/routes_user.py) through a Flask test client: malformed deadlines
+        get 400 before any statement runs, a deadline after the grant closes gets 400 instead
+        of "Task not found", and a valid deadline is stored as a date.
+        MySQL is replaced by a recording connection, so no database is needed.
+
+    Usage:
+        python -m src.test_suites.tasks_routes_test_suite
+"""
+
+import sys
+from datetime import date
+from pathlib import Path
+
+from flask import Flask
+from flask_jwt_extended import JWTManager, create_access_token
+
+from src.utils.logging_utils import log_info, log_error
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "Phase3_work"))
+from api.user import data_access as dal, routes_user, user_bp  # noqa: E402
+
+
+# Test statistics
+test_stats = {"passed": 0, "failed": 0, "errors": 0}
+
+USER = "0190a1b2-0000-7000-8000-0000000000aa"
+APPLICATION = "0190a1b2-0000-7000-8000-0000000000a1"
+TASK = "0190a1b2-0000-7000-8000-0000000000c1"
+GRANT_CLOSES = date(2025, 12, 1)
+
+
+def check(description: str, fn):
+    """Run fn() and count it as passed when it returns True."""
+    try:
+        if fn():
+            test_stats["passed"] += 1
+            log_info(f"PASS: {description}")
+        else:
+            test_stats["failed"] += 1
+            log_error(f"FAIL: {description}")
+    except Exception as e:
+        test_stats["errors"] += 1
+        log_error(f"ERROR: {description} - {type(e).__name__}: {e}")
+
+
+class FakeConnection:
+    """Inserts a task only when its deadline is on or before GRANT_CLOSES, like the SQL does."""
+
+    def __init__(self):
+        self.statements = []
+        self.rowcount = 0
+
+    def __call__(self):
+        return self
+
+    def cursor(self):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        self.statements.append(params)
+        deadline = params.get("deadline_date") if isinstance(params, dict) else None
+        self.rowcount = 1 if deadline is None or deadline <= GRANT_CLOSES else 0
+
+    def close(self):
+        pass
+
+
+def client_and_connection():
+    conn = FakeConnection()
+    routes_user.get_connection = conn
+    # the application is the user's, still started, for a grant closing on GRANT_CLOSES
+    dal.prepared_fetchone = lambda conn, name, params=(): ("started", GRANT_CLOSES)
+    app = Flask(__name__)
+    app.config["JWT_SECRET_KEY"] = "test-secret-key-of-at-least-32-bytes"
+    JWTManager(app)
+    app.register_blueprint(user_bp, url_prefix="/api/user")
+    with app.app_context():
+        token = create_access_token(identity=USER)
+    return app.test_client(), conn, {"Authorization": f"Bearer {token}"}
+
+
+def create(deadline):
+    client, conn, headers = client_and_connection()
+    response = client.post(
+        f"/api/user/applications/{APPLICATION}/tasks", headers=headers,
+        json={"task_name": "Budget", "deadline": deadline},
+    )
+    return response, conn
+
+
+def test_malformed_deadlines_are_rejected():
+    results = [create(deadline) for deadline in ("2025-9-01", "12/01/2025", "2025-02-30", "", None, 20251201)]
+    return all(
+        response.status_code == 400 and response.get_json() == {"error": "Invalid deadline. Use YYYY-MM-DD"}
+        and conn.statements == []
+        for response, conn in results
+    )
+
+
+def test_deadline_after_grant_closes_is_rejected():
+    response, conn = create("2025-12-15")
+    return (
+        response.status_code == 400
+        and response.get_json() == {"error": "Task deadline cannot exceed grant deadline"}
+        and conn.statements[0]["deadline_date"] == date(2025, 12, 15)
+    )
+
+
+def test_valid_deadline_is_stored_as_a_date():
+    response, conn = create("2025-11-30")
+    return (
+        response.status_code == 201
+        and response.get_json()["task"]["deadline"] == "2025-11-30"
+        and conn.statements[0]["deadline_date"] == date(2025, 11, 30)
+    )
+
+
+def test_update_rejects_malformed_deadline():
+    client, conn, headers = client_and_connection()
+    path = f"/api/user/applications/{APPLICATION}/tasks/{TASK}"
+    rejected = client.put(path, headers=headers, json={"deadline": "2025-9-01"})
+    updated = client.put(path, headers=headers, json={"deadline": "2025-11-01", "completed": True})
+    return (
+        rejected.status_code == 400 and updated.status_code == 200
+        and conn.statements == [(date(2025, 11, 1), True, TASK, APPLICATION, USER)]
+    )
+
+
+# MAIN
+if __name__ == "__main__":
+    log_info("Starting Tasks Routes Test Suite")
+
+    check("Deadlines that are not YYYY-MM-DD dates get 400 before any statement", test_malformed_deadlines_are_rejected)
+    check("A deadline after the grant closes gets 400, not 404", test_deadline_after_grant_closes_is_rejected)
+    check("A valid deadline is sent and returned as a date", test_valid_deadline_is_stored_as_a_date)
+    check("Updating a task parses its deadline the same way", test_update_rejects_malformed_deadline)
+
+    log_info(f"Passed: {test_stats['passed']}")
+    if test_stats['failed'] > 0:
+        log_error(f"Failed: {test_stats['failed']}")
+    if test_stats['errors'] > 0:
+        log_error(f"Errors: {test_stats['errors']}")
+
+    if test_stats['failed'] == 0 and test_stats['errors'] == 0:
+        log_info("All tests passed")
+    else:
+        sys.exit(1)
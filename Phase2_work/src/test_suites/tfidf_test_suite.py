@@ -0,0 +1,95 @@
+"""
+    File: tfidf_test_suite.py
+    Author: Colby Wirth
+    Version: 19 October 2026
+    Description:
+        Tests the TF-IDF vectors and nearest neighbors in src/utils/tfidf.py used by the
+        "similar grants" batch job.  No database connection is needed (NumPy and SciPy are).
+
+    Usage:
+        python -m src.test_suites.tfidf_test_suite
+"""
+
+import sys
+
+import numpy as np
+
+from src.utils.tfidf import tfidf_matrix, top_k_neighbors
+from src.utils.logging_utils import log_info, log_error
+
+
+# Test statistics
+test_stats = {"passed": 0, "failed": 0, "errors": 0}
+
+TEXTS = [
+    "Coastal flooding resilience research for island communities",
+    "Flooding resilience planning in coastal cities",
+    "Early childhood literacy and reading programs",
+    "Reading programs for early literacy in rural schools",
+    "Rural broadband network access",
+]
+
+
+def check(description: str, fn):
+    """Run fn() and count it as passed when it returns True."""
+    try:
+        if fn():
+            test_stats["passed"] += 1
+            log_info(f"PASS: {description}")
+        else:
+            test_stats["failed"] += 1
+            log_error(f"FAIL: {description}")
+    except Exception as e:
+        test_stats["errors"] += 1
+        log_error(f"ERROR: {description} - {type(e).__name__}: {e}")
+
+
+def test_rows_are_unit_length():
+    matrix = tfidf_matrix(TEXTS)
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    # the broadband grant shares only "rural", which is kept, so every row has a term
+    return matrix.shape[0] == len(TEXTS) and np.allclose(norms, 1.0, atol=1e-5)
+
+
+def test_nearest_neighbor_shares_the_topic():
+    neighbors = dict(top_k_neighbors(tfidf_matrix(TEXTS), k=2))
+    return neighbors[0][0][0] == 1 and neighbors[2][0][0] == 3 and neighbors[3][0][0] == 2
+
+
+def test_not_its_own_neighbor_and_sorted():
+    for row, found in top_k_neighbors(tfidf_matrix(TEXTS), k=4, chunk_rows=2):
+        scores = [score for _, score in found]
+        if row in [col for col, _ in found] or scores != sorted(scores, reverse=True):
+            return False
+    return True
+
+
+def test_unrelated_text_has_no_neighbors():
+    neighbors = dict(top_k_neighbors(tfidf_matrix(TEXTS + ["Quantum cryptography"]), k=3))
+    return neighbors[5] == []
+
+
+def test_empty_corpus():
+    return list(top_k_neighbors(tfidf_matrix([]), k=3)) == []
+
+
+# MAIN
+if __name__ == "__main__":
+    log_info("Starting TF-IDF Test Suite")
+
+    check("TF-IDF rows are L2-normalized", test_rows_are_unit_length)
+    check("Nearest neighbor is the grant on the same topic", test_nearest_neighbor_shares_the_topic)
+    check("Neighbors exclude the grant itself and are best first", test_not_its_own_neighbor_and_sorted)
+    check("A grant sharing no terms has no neighbors", test_unrelated_text_has_no_neighbors)
+    check("An empty corpus yields nothing", test_empty_corpus)
+
+    log_info(f"Passed: {test_stats['passed']}")
+    if test_stats['failed'] > 0:
+        log_error(f"Failed: {test_stats['failed']}")
+    if test_stats['errors'] > 0:
+        log_error(f"Errors: {test_stats['errors']}")
+
+    if test_stats['failed'] == 0 and test_stats['errors'] == 0:
+        log_info("All tests passed")
+    else:
+        sys.exit(1)
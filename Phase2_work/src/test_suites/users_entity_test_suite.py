@@ -29,6 +29,7 @@ from src.user_functions.users_operations import (
     delete_a_reference_to_research_field,
 )
 from src.user_functions.view_based_operations import Role
+from src.utils.uuid_keys import new_uuid
 
 load_dotenv()
 
@@ -61,7 +62,7 @@ def unique_email(prefix: str = "user") -> str:
 def insert_user(email: str | None = None, f_name: str = "Test", m_name=None, l_name: str = "User") -> str:
     """
     Insert a user using the SQL creation script. If email is None, generate a unique one.
-    Commits immediately and returns BIN_TO_UUID(user_id).
+    Commits immediately and returns BIN_TO_UUID(user_id, 1).
     """
     sql_script_path = Path("src/db_crud/users/create_users.sql")
     sql_script = sql_script_path.read_text()
@@ -70,6 +71,7 @@ def insert_user(email: str | None = None, f_name: str = "Test", m_name=None, l_n
         email = unique_email("user")
 
     params = {
+        "user_id": new_uuid(),
         "f_name": f_name,
         "m_name": m_name,
         "l_name": l_name,
@@ -96,7 +98,7 @@ def insert_user(email: str | None = None, f_name: str = "Test", m_name=None, l_n
         log_error(f"Failed to insert user: {e}")
         raise
 
-    cursor.execute("SELECT BIN_TO_UUID(user_id) FROM Users WHERE email=%s", (params["email"],))
+    cursor.execute("SELECT BIN_TO_UUID(user_id, 1) FROM Users WHERE email=%s", (params["email"],))
     row = cursor.fetchone()
     if not row:
         raise RuntimeError("Inserted user not found after insert.")
@@ -28,6 +28,7 @@ from src.user_functions.users_operations import (
 )
 from src.user_functions.view_based_operations import Role
 from src.utils.sql_file_parsers import read_sql_helper
+from src.utils.uuid_keys import new_uuid
 
 load_dotenv()
 
@@ -70,6 +71,7 @@ def insert_test_user(cursor, email="test_user@example.com", password="pw123"):
         return None
 
     cursor.execute(sql_script, {
+        "user_id": new_uuid(),
         "f_name": "Test",
         "m_name": "M",
         "l_name": "User",
@@ -77,7 +79,7 @@ def insert_test_user(cursor, email="test_user@example.com", password="pw123"):
         "email": email,
         "password": password
     })
-    cursor.execute("SELECT BIN_TO_UUID(user_id) FROM Users WHERE email=%s", (email,))
+    cursor.execute("SELECT BIN_TO_UUID(user_id, 1) FROM Users WHERE email=%s", (email,))
     return cursor.fetchone()[0]
 
 
@@ -110,7 +112,7 @@ def test_update_users_fields(cursor):
 
     if result is None:
         cursor.execute("SELECT f_name, m_name, l_name, institution, email "
-                       "FROM Users WHERE user_id=UUID_TO_BIN(%s)", (uid,))
+                       "FROM Users WHERE user_id=UUID_TO_BIN(%s, 1)", (uid,))
         row = cursor.fetchone()
         expected = (
             "UpdatedFirst", "UpdatedMiddle", "UpdatedLast",
@@ -132,7 +134,7 @@ def test_update_users_password(cursor):
     result = update_users_password(Role.USER, uid, uid, cursor, new_password)
 
     if result is None:
-        cursor.execute("SELECT password FROM Users WHERE user_id=UUID_TO_BIN(%s)", (uid,))
+        cursor.execute("SELECT password FROM Users WHERE user_id=UUID_TO_BIN(%s, 1)", (uid,))
         pw = cursor.fetchone()[0]
         if pw == new_password:
             log_info(" PASS: update_users_password updated correctly")
@@ -150,7 +152,7 @@ def test_update_users_email(cursor):
     result = update_users_email(Role.USER, uid, uid, cursor, new_email)
 
     if result is None:
-        cursor.execute("SELECT email FROM Users WHERE user_id=UUID_TO_BIN(%s)", (uid,))
+        cursor.execute("SELECT email FROM Users WHERE user_id=UUID_TO_BIN(%s, 1)", (uid,))
         email = cursor.fetchone()[0]
         if email == new_email:
             log_info(" PASS: update_users_email persisted new email")
@@ -167,7 +169,7 @@ def test_delete_a_users_entity(cursor):
     result = delete_a_users_entity(Role.USER, uid, uid, cursor)
 
     if result is None:
-        cursor.execute("SELECT COUNT(*) FROM Users WHERE user_id=UUID_TO_BIN(%s)", (uid,))
+        cursor.execute("SELECT COUNT(*) FROM Users WHERE user_id=UUID_TO_BIN(%s, 1)", (uid,))
         if cursor.fetchone()[0] == 0:
             log_info(" PASS: delete_a_users_entity removed user")
         else:
@@ -0,0 +1,106 @@
+"""
+    File: uuid_keys_test_suite.py
+    Author: Colby Wirth
+    Version: 19 October 2026
+    Description:
+        Tests the time-ordered key helpers in src/utils/uuid_keys.py, and that create_user_entity
+        returns the key it generated without reading it back.  No database connection is needed;
+        the expected bytes come from the UUID_TO_BIN(..., 1) example in the MySQL manual.
+
+    Usage:
+        python -m src.test_suites.uuid_keys_test_suite
+"""
+
+import sys
+import time
+import uuid
+
+from src.utils.logging_utils import log_info, log_error
+from src.user_functions.users_operations import create_user_entity
+from src.utils.sql_registry import get_sql
+from src.utils.uuid_keys import new_uuid, uuid_to_bin, bin_to_uuid
+
+
+# Test statistics
+test_stats = {"passed": 0, "failed": 0, "errors": 0}
+
+
+def check(description: str, fn):
+    """Run fn() and count it as passed when it returns True."""
+    try:
+        if fn():
+            test_stats["passed"] += 1
+            log_info(f"PASS: {description}")
+        else:
+            test_stats["failed"] += 1
+            log_error(f"FAIL: {description}")
+    except Exception as e:
+        test_stats["errors"] += 1
+        log_error(f"ERROR: {description} - {type(e).__name__}: {e}")
+
+
+def test_matches_mysql_swap_flag():
+    return uuid_to_bin("6ccd780c-baba-1026-9564-5b8c656024db").hex() == "1026baba6ccd780c95645b8c656024db"
+
+
+def test_round_trip():
+    value = str(uuid.uuid4())
+    return bin_to_uuid(uuid_to_bin(value)) == value
+
+
+def test_new_keys_sort_by_creation_time():
+    keys = []
+    for _ in range(50):
+        keys.append(uuid_to_bin(new_uuid()))
+        time.sleep(0.001)
+    return keys == sorted(keys)
+
+
+def test_node_is_not_the_mac_address():
+    # a random node has the multicast bit set
+    return uuid.UUID(new_uuid()).node & 0x010000000000 != 0
+
+
+
+class RecordingCursor:
+    def __init__(self):
+        self.statements = []
+
+    def execute(self, sql, params=None):
+        self.statements.append((sql, params))
+
+
+def test_new_user_key_is_generated_before_insert():
+    cursor = RecordingCursor()
+    # the signup pattern accepts a trailing newline, which SQL TRIM keeps
+    user_id = create_user_entity(cursor, {
+        "f_name": "Ada", "m_name": None, "l_name": "Lovelace", "institution": None,
+        "email": "ada@example.com\n", "password": "hash",
+    })
+    return (
+        [sql for sql, _ in cursor.statements] == [get_sql("users/create_users")]
+        and cursor.statements[0][1]["user_id"] == user_id
+        and uuid.UUID(user_id).version == 1
+    )
+
+
+# MAIN
+if __name__ == "__main__":
+    log_info("Starting UUID Keys Test Suite")
+
+    check("uuid_to_bin matches UUID_TO_BIN(x, 1)", test_matches_mysql_swap_flag)
+    check("bin_to_uuid reverses uuid_to_bin", test_round_trip)
+    check("New keys sort in creation order", test_new_keys_sort_by_creation_time)
+    check("New keys use a random node", test_node_is_not_the_mac_address)
+    check("A new user's key is generated before the INSERT and returned", test_new_user_key_is_generated_before_insert)
+
+    log_info(f"Passed: {test_stats['passed']}")
+    if test_stats['failed'] > 0:
+        log_error(f"Failed: {test_stats['failed']}")
+    if test_stats['errors'] > 0:
+        log_error(f"Errors: {test_stats['errors']}")
+
+    if test_stats['failed'] == 0 and test_stats['errors'] == 0:
+        log_info("All tests passed")
+    else:
+        sys.exit(1)
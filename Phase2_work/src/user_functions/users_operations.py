@@ -6,24 +6,24 @@
         - Wraps SQL CRUD operations for User entity with their ResearchField with permissions checking
 '''
 
-import uuid
 from mysql.connector import Error as MySQLError
 from werkzeug.security import generate_password_hash, check_password_hash
 
 from src.utils.logging_utils import log_info, log_error
 from src.user_functions.view_based_operations import require_permission, Role, Entity
-from src.utils.sql_file_parsers import read_sql_helper
+from src.utils.sql_registry import get_sql, get_script, get_statements
+from src.utils.uuid_keys import new_uuid, uuid_to_bin
 
-CREATE_SCRIPT = "src/db_crud/users/create_users.sql"
-DELETE_SCRIPT = "src/db_crud/users/delete_users.sql"
-SELECT_SCRIPT = "src/db_crud/users/select_users_by_uuid.sql"
-SELECT_PASSWORDS_BY_EMAIL = "src/db_crud/users/select_password_by_email.sql"
-UPDATE_SCRIPT = "src/db_crud/users/update_users_fields.sql"
-UPDATE_PW_SCRIPT = "src/db_crud/users/update_users_password.sql"
-UPDATE_EMAIL_SCRIPT = "src/db_crud/users/update_users_email.sql"
-CREATE_RESEARCH_FIELDS = "src/db_crud/research_fields/create_research_fields.sql"
-SELECT_RESEARCH_FIELDS = "src/db_crud/research_fields/select_a_research_field_by_name.sql"
-DELETE_A_USERS_RESEARCH_FIELDS = "src/db_crud/research_fields/delete_a_users_research_fields.sql"
+CREATE_SCRIPT = "users/create_users"
+DELETE_SCRIPT = "users/delete_users"
+SELECT_SCRIPT = "users/select_users_by_uuid"
+SELECT_PASSWORDS_BY_EMAIL = "users/select_password_by_email"
+UPDATE_SCRIPT = "users/update_users_fields"
+UPDATE_PW_SCRIPT = "users/update_users_password"
+UPDATE_EMAIL_SCRIPT = "users/update_users_email"
+CREATE_RESEARCH_FIELDS = "research_fields/create_research_fields"
+SELECT_RESEARCH_FIELDS = "research_fields/select_a_research_field_by_name"
+DELETE_A_USERS_RESEARCH_FIELDS = "research_fields/delete_a_users_research_fields"
 
 
 
@@ -41,16 +41,15 @@ def create_user_entity(cursor, user_info: dict, base_path: str | None=None) -> s
         cursor: MySQL cursor object for executing queries.
         user_info (dict): Dictionary with keys:
             f_name, m_name, l_name, institution, email, password
-        base_path (str): Base path to SQL scripts
+        base_path (str): Unused; kept for callers written before the SQL registry
 
     Returns:
         str: New user_id (UUID) on success, or an error object on failure.
     """
 
-    new_user_id = str(uuid.uuid4())
-
-    # Parameters matching your SQL placeholders
+    # Parameters matching your SQL placeholders; the key is generated here so it is known without reading it back
     user_params = {
+        "user_id": new_uuid(),
         "f_name": user_info.get("f_name"),
         "m_name": user_info.get("m_name"),
         "l_name": user_info.get("l_name"),
@@ -60,12 +59,9 @@ def create_user_entity(cursor, user_info: dict, base_path: str | None=None) -> s
     }
 
     try:
-        sql_script = read_sql_helper(CREATE_SCRIPT, base_path)
-        if not sql_script:
-            raise UserOperationError(f"Could not read SQL script at {CREATE_SCRIPT}")
-
+        sql_script = get_sql(CREATE_SCRIPT, user_params)
         cursor.execute(sql_script, user_params)
-        return new_user_id
+        return user_params["user_id"]
 
     except MySQLError as e:
         log_error(f"MySQL error executing {CREATE_SCRIPT}: {e}")
@@ -82,7 +78,7 @@ def get_password_hashed(cursor, email: str, base_path: str | None) -> tuple | Us
         Args:
             cursor: MySQL cursor object for executing queries.
             email (str): The user's email to fetch.
-            base_path (str, optional): Base path to SQL scripts.
+            base_path (str, optional): Unused; kept for callers written before the SQL registry.
 
         Returns:
             tuple: (user_id, password_hash) on success,
@@ -90,7 +86,7 @@ def get_password_hashed(cursor, email: str, base_path: str | None) -> tuple | Us
     """
 
     try:
-        sql_script = read_sql_helper(SELECT_PASSWORDS_BY_EMAIL, base_path=base_path)
+        sql_script = get_sql(SELECT_PASSWORDS_BY_EMAIL, (email,))
 
         cursor.execute(sql_script, (email,))
         result = cursor.fetchone()
@@ -127,7 +123,7 @@ def read_users_fields_by_uuid(role: Role, user_id: str, resource_owner_id: str,
     _ = role, resource_owner_id  # linter ignore
 
     try:
-        sql_script = read_sql_helper(SELECT_SCRIPT)
+        sql_script = get_sql(SELECT_SCRIPT, (user_id,))
         cursor.execute(sql_script, (user_id,))
         return cursor.fetchone()
     except MySQLError as e:
@@ -158,8 +154,10 @@ def update_users_fields(role: Role, user_id: str, resource_owner_id: str, cursor
     _ = role, user_id, resource_owner_id  # for linter
 
     try:
-        sql_script = read_sql_helper(UPDATE_SCRIPT, base_path)
-        cursor.execute(sql_script, new_fields)
+        sql_script = get_sql(UPDATE_SCRIPT)
+        # fields left out of new_fields are bound as NULL so COALESCE keeps the stored value
+        params = {name: new_fields.get(name) for name in get_script(UPDATE_SCRIPT).param_names}
+        cursor.execute(sql_script, params)
         return None
     except MySQLError as e:
         log_error(f"MySQL error executing {UPDATE_SCRIPT}: {e}")
@@ -193,8 +191,8 @@ def update_users_password(
     _ = role, resource_owner_id  # for linter
 
     try:
-        # Convert UUID string to 16-byte format for MySQL
-        user_uuid_bytes = uuid.UUID(user_id).bytes
+        # Convert UUID string to the 16-byte key format, same as UUID_TO_BIN(user_id, 1)
+        user_uuid_bytes = uuid_to_bin(user_id)
 
         # Fetch hashed password
         cursor.execute("SELECT password FROM users WHERE user_id=%s", (user_uuid_bytes,))
@@ -246,7 +244,7 @@ def update_users_email(role: Role, user_id: str, resource_owner_id: str, cursor,
 
     params = {"user_id": user_id, "email": new_email}
     try:
-        sql_script = read_sql_helper(UPDATE_EMAIL_SCRIPT, base_path)
+        sql_script = get_sql(UPDATE_EMAIL_SCRIPT, params)
         cursor.execute(sql_script, params)
         # success
         return None
@@ -278,7 +276,7 @@ def delete_a_users_entity(role: Role, user_id: str, resource_owner_id: str, curs
     _ = role, resource_owner_id  # for linter
 
     try:
-        sql_script = read_sql_helper(DELETE_SCRIPT)
+        sql_script = get_sql(DELETE_SCRIPT, (user_id,))
         cursor.execute(sql_script, (user_id,))
         return None
     except MySQLError as e:
@@ -310,18 +308,13 @@ def add_a_reference_to_research_field(role: Role, user_id: str, resource_owner_i
     _ = role, resource_owner_id  # for linter
 
     try:
-        sql_script: str | None = read_sql_helper(CREATE_RESEARCH_FIELDS)
-        if not sql_script:
-            raise UserOperationError(f"Failed to read SQL script {CREATE_RESEARCH_FIELDS}")
-
-        for stmt in filter(None, (s.strip() for s in sql_script.split(";"))):
-            if not stmt.startswith("--"):
-                cursor.execute(stmt, {"user_id": user_id, "research_field": research_field})
-
-        select_sql: str | None = read_sql_helper(SELECT_RESEARCH_FIELDS)
-        if not select_sql:
-            raise UserOperationError(f"Failed to read SQL script {SELECT_RESEARCH_FIELDS}")
+        params = {"user_id": user_id, "research_field": research_field}
+        for stmt in get_statements(CREATE_RESEARCH_FIELDS, params):
+            cursor.execute(stmt, params)
+            if cursor.with_rows:
+                cursor.fetchall()
 
+        select_sql = get_sql(SELECT_RESEARCH_FIELDS)
         cursor.execute(select_sql, {"research_field": research_field})
         row = cursor.fetchone()
         if not row:
@@ -357,17 +350,17 @@ def delete_a_reference_to_research_field(role: Role, user_id: str, resource_owne
     _ = role, resource_owner_id  # for linter
 
     try:
-        select_sql = read_sql_helper(SELECT_RESEARCH_FIELDS)
+        select_sql = get_sql(SELECT_RESEARCH_FIELDS)
         cursor.execute(select_sql, {"research_field": research_field})
         row = cursor.fetchone()
         if not row:
             raise UserOperationError(f"Research field '{research_field}' not found in DB")
 
         research_field_id = row[0]
-        delete_sql = read_sql_helper(DELETE_A_USERS_RESEARCH_FIELDS)
+        delete_sql = get_sql(DELETE_A_USERS_RESEARCH_FIELDS)
 
         cursor.execute(delete_sql, {
-            "user_id": uuid.UUID(user_id).bytes,
+            "user_id": uuid_to_bin(user_id),
             "research_field_id": research_field_id
         })
 
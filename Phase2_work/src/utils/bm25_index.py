@@ -0,0 +1,285 @@
+'''
+    File: bm25_index.py
+    Version: 19 October 2026
+    Author: Colby Wirth
+    Description:
+        - In-memory inverted index with BM25 ranking, used by /api/public/search_grants
+          (see Phase3_work/api/search_index.py for how it is built and kept current)
+        - Documents get a dense slot number; each term's postings are two parallel arrays
+          (slot numbers as unsigned ints, term frequencies as unsigned shorts), appended in
+          slot order, so a posting costs 6 bytes instead of a Python object per entry
+        - Fields are weighted by repeating their terms (FIELD_WEIGHTS): a word in the title counts
+          three times, which keeps title hits ahead of description-only hits
+        - Updates never edit postings in place: a changed document is removed (its slot becomes a
+          tombstone that scoring skips) and added again in a new slot.  Once tombstones pass
+          COMPACT_RATIO of all slots the postings are rewritten without them
+        - Every document also carries an opaque meta value (filters, sort keys and facet values for
+          the caller)
+        - All methods take the index lock, so searches never see a half-applied update
+        - Search cost grows with the postings of the query terms, not with the corpus: a rare term
+          reads a handful of entries, while a term found in nearly every grant reads one per grant
+'''
+
+import heapq
+import math
+import re
+import threading
+from array import array
+from typing import Any, Callable, Mapping
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# too common in grant text to rank anything
+STOPWORDS = frozenset("""
+    a an and are as at be by for from has have in is it its of on or that the their this to was
+    were will with which who may must can not no all any each other such these those than into
+""".split())
+
+FIELD_WEIGHTS = {"grant_title": 3, "research_field": 2, "provider": 1, "description": 1}
+
+K1 = 1.2
+B = 0.75
+
+# rewrite the postings once this share of slots are tombstones (and there are at least COMPACT_MIN)
+COMPACT_RATIO = 0.25
+COMPACT_MIN = 1000
+
+# recompute the length normalisation once the average document length moves by this share
+NORM_DRIFT = 0.02
+# score into a flat list once the postings read reach 1/DENSE_FACTOR of the slots
+DENSE_FACTOR = 8
+
+_MAX_TF = 0xFFFF
+
+
+def _first(item):
+    return item[0]
+
+
+def tokenize(text: str | None) -> list[str]:
+    """Lowercased alphanumeric words, without stopwords and single characters."""
+    if not text:
+        return []
+    return [t for t in TOKEN_PATTERN.findall(text.lower()) if len(t) > 1 and t not in STOPWORDS]
+
+
+class BM25Index:
+    """Inverted index over weighted text fields, ranked with Okapi BM25."""
+
+    def __init__(self, k1: float = K1, b: float = B):
+        self.k1 = k1
+        self.b = b
+        self._lock = threading.RLock()
+        self._postings: dict[str, tuple[array, array]] = {}
+        self._df: dict[str, int] = {}
+        self._slot_of: dict[str, int] = {}
+        # per slot; None marks a tombstone
+        self._doc_ids: list[str | None] = []
+        self._terms: list[tuple[str, ...] | None] = []
+        self._meta: list[Any] = []
+        self._lengths = array("I")
+        self._total_length = 0
+        self._dead = 0
+        self._norms = array("d")
+        self._norm_avg = 0.0
+
+    def __len__(self) -> int:
+        return len(self._slot_of)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._slot_of
+
+    def add(self, doc_id: str, fields: Mapping[str, str | None], meta: Any = None) -> None:
+        """Index a document, replacing any earlier version with the same id."""
+        counts: dict[str, int] = {}
+        length = 0
+        for field, weight in FIELD_WEIGHTS.items():
+            for term in tokenize(fields.get(field)):
+                counts[term] = counts.get(term, 0) + weight
+                length += weight
+
+        with self._lock:
+            self._remove(doc_id)
+            slot = len(self._doc_ids)
+            for term, count in counts.items():
+                posting = self._postings.get(term)
+                if posting is None:
+                    posting = self._postings[term] = (array("I"), array("H"))
+                posting[0].append(slot)
+                posting[1].append(min(count, _MAX_TF))
+                self._df[term] = self._df.get(term, 0) + 1
+            self._slot_of[doc_id] = slot
+            self._doc_ids.append(doc_id)
+            self._terms.append(tuple(counts))
+            self._meta.append(meta)
+            self._lengths.append(length)
+            self._total_length += length
+            if len(self._norms) == slot and self._norm_avg:
+                self._norms.append(self.k1 * (1.0 - self.b + self.b * length / self._norm_avg))
+
+    def remove(self, doc_id: str) -> bool:
+        """Drop a document; False when it was not indexed."""
+        with self._lock:
+            removed = self._remove(doc_id)
+            if self._dead >= COMPACT_MIN and self._dead > COMPACT_RATIO * len(self._doc_ids):
+                self.compact()
+            return removed
+
+    def _remove(self, doc_id: str) -> bool:
+        slot = self._slot_of.pop(doc_id, None)
+        if slot is None:
+            return False
+        for term in self._terms[slot]:
+            remaining = self._df[term] - 1
+            if remaining:
+                self._df[term] = remaining
+            else:
+                del self._df[term]
+        self._total_length -= self._lengths[slot]
+        self._doc_ids[slot] = None
+        self._terms[slot] = None
+        self._meta[slot] = None
+        if slot < len(self._norms):
+            self._norms[slot] = math.inf
+        self._dead += 1
+        return True
+
+    def compact(self) -> None:
+        """Renumber the live slots and rewrite the postings without tombstones."""
+        with self._lock:
+            if not self._dead:
+                return
+            new_slot = array("i", [-1]) * len(self._doc_ids)
+            doc_ids, terms, meta, lengths = [], [], [], array("I")
+            for slot, doc_id in enumerate(self._doc_ids):
+                if doc_id is None:
+                    continue
+                new_slot[slot] = len(doc_ids)
+                self._slot_of[doc_id] = len(doc_ids)
+                doc_ids.append(doc_id)
+                terms.append(self._terms[slot])
+                meta.append(self._meta[slot])
+                lengths.append(self._lengths[slot])
+
+            postings = {}
+            for term, (slots, counts) in self._postings.items():
+                if term not in self._df:
+                    continue
+                kept_slots, kept_counts = array("I"), array("H")
+                for slot, count in zip(slots, counts):
+                    if new_slot[slot] >= 0:
+                        kept_slots.append(new_slot[slot])
+                        kept_counts.append(count)
+                postings[term] = (kept_slots, kept_counts)
+
+            self._postings = postings
+            self._doc_ids, self._terms, self._meta, self._lengths = doc_ids, terms, meta, lengths
+            self._dead = 0
+            self._norms, self._norm_avg = array("d"), 0.0
+
+    def search(
+        self,
+        query: str,
+        offset: int = 0,
+        limit: int = 10,
+        where: Callable[[Any], bool] | None = None,
+        sort_key: Callable[[Any], Any] | None = None,
+        descending: bool = False,
+        after: Any = None,
+        on_match: Callable[[Any], None] | None = None,
+    ) -> tuple[int, list[tuple[str, float, Any]]]:
+        """
+        Match documents containing any query term.
+
+        Args:
+            where: keeps a match only when where(meta) is true.
+            sort_key: orders matches by sort_key(meta).  By default they are ordered by
+                (score, doc_id), highest first.  The key should end with a unique value so the
+                order is total.
+            after: a sort key from an earlier page; only matches ordered after it are returned
+                (keyset paging).  The total still counts every match.
+            on_match: called with the meta of every match that passes where, e.g. to count
+                facet values in the same pass.
+
+        Returns:
+            (number of matches, [(doc_id, score, sort key), ...] for the requested page)
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        with self._lock:
+            scores = self._score(terms)
+            meta, doc_ids = self._meta, self._doc_ids
+            if where is not None:
+                scores = {slot: s for slot, s in scores.items() if where(meta[slot])}
+            total = len(scores)
+            if on_match is not None:
+                for slot in scores:
+                    on_match(meta[slot])
+
+            if sort_key is None:
+                keyed = [((score, doc_ids[slot]), slot) for slot, score in scores.items()]
+                descending = True
+            else:
+                keyed = [(sort_key(meta[slot]), slot) for slot in scores]
+            if after is not None:
+                keyed = [item for item in keyed if (item[0] < after if descending else item[0] > after)]
+
+            select = heapq.nlargest if descending else heapq.nsmallest
+            page = select(offset + limit, keyed, key=_first)[offset:]
+            return total, [(doc_ids[slot], scores[slot], key) for key, slot in page]
+
+    def _refresh_norms(self) -> array:
+        """Per-slot length normalisation k1 * (1 - b + b * length / average length).
+
+        Kept in an array and only recomputed when the average length has drifted by more than
+        NORM_DRIFT, so scoring a posting is one lookup.  Tombstones get an infinite norm and so
+        contribute nothing.
+        """
+        live = len(self._slot_of)
+        avg_length = (self._total_length / live if live else 0.0) or 1.0
+        if self._norm_avg and abs(avg_length - self._norm_avg) <= NORM_DRIFT * self._norm_avg \
+                and len(self._norms) == len(self._doc_ids):
+            return self._norms
+        k1, b = self.k1, self.b
+        self._norms = array("d", (
+            k1 * (1.0 - b + b * length / avg_length) if doc_id is not None else math.inf
+            for doc_id, length in zip(self._doc_ids, self._lengths)
+        ))
+        self._norm_avg = avg_length
+        return self._norms
+
+    def _score(self, terms: list[str]) -> dict[int, float]:
+        live = len(self._slot_of)
+        if not live or not terms:
+            return {}
+        norms = self._refresh_norms()
+        weighted = []
+        for term in terms:
+            df = self._df.get(term)
+            if df:
+                idf = math.log(1.0 + (live - df + 0.5) / (df + 0.5))
+                weighted.append((idf * (self.k1 + 1.0), self._postings[term]))
+
+        # common terms touch most slots: a flat list accumulates faster than a dict
+        if sum(len(slots) for _, (slots, _) in weighted) * DENSE_FACTOR >= len(norms):
+            acc = [0.0] * len(norms)
+            for weight, (slots, counts) in weighted:
+                for slot, tf in zip(slots, counts):
+                    acc[slot] += weight * tf / (tf + norms[slot])
+            return {slot: score for slot, score in enumerate(acc) if score}
+
+        scores: dict[int, float] = {}
+        for weight, (slots, counts) in weighted:
+            for slot, tf in zip(slots, counts):
+                norm = norms[slot]
+                if norm != math.inf:
+                    scores[slot] = scores.get(slot, 0.0) + weight * tf / (tf + norm)
+        return scores
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "documents": len(self._slot_of),
+                "terms": len(self._df),
+                "postings": sum(len(slots) for slots, _ in self._postings.values()),
+                "tombstones": self._dead,
+            }
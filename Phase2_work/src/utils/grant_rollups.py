@@ -0,0 +1,118 @@
+'''
+    File: grant_rollups.py
+    Version: 19 October 2026
+    Author: Colby Wirth
+    Description:
+        - Aggregates grants into GrantRollups, the monthly totals behind /api/public/analytics,
+          refilled by rebuild_grant_rollups() (src/system_functions/rebuild_grant_rollups.py after
+          each ingest, and sample data seeding)
+        - One row per (dimension, month posted, value) with the number of grants and their total
+          program funding:
+            month           value '': every grant posted that month
+            provider        one row per provider with grants posted that month
+            research_field  the same per research field
+          Missing providers and research fields are stored as ''.  Grants without a posting date
+          have no month and are left out
+        - value is compared with the table's case- and accent-insensitive collation
+          (utf8mb4_0900_ai_ci), so values differing only in case or accents ("NSF", "nsf") are
+          one key: they are grouped on a folded value and stored under the first spelling seen
+        - A date range is a range of months on the primary key, so any range by provider or
+          research field sums a few rows per value per month instead of reading Grants
+        - Grouping is done with NumPy: months and values are coded as integers, combined into one
+          key per row, and counts and funding are summed per distinct key (np.unique and
+          np.add.at on int64, so funding totals are exact)
+'''
+
+import unicodedata
+from datetime import date
+from typing import Iterable, Iterator
+
+import numpy as np
+
+from src.utils.sql_registry import get_sql
+
+DIMENSIONS = ("month", "provider", "research_field")
+INSERT_BATCH = 1000
+
+
+def parse_month(text: str) -> date:
+    """The first day of a YYYY-MM month; ValueError when text is not one."""
+    if len(text) != 7 or text[4] != "-":
+        raise ValueError(f"expected YYYY-MM, got {text!r}")
+    return date(int(text[:4]), int(text[5:]), 1)
+
+
+def _month_index(day: date) -> int:
+    return day.year * 12 + day.month - 1
+
+
+def _index_month(index: int) -> date:
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _fold(value: str) -> str:
+    """value without case or accents, as utf8mb4_0900_ai_ci compares it (a NO PAD collation)."""
+    decomposed = unicodedata.normalize("NFKD", value.casefold())
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def _codes(values: list[str]) -> tuple[np.ndarray, list[str]]:
+    """Integer code of each value, equal for values the collation equates, and the value of each code."""
+    index: dict[str, int] = {}
+    first: list[str] = []
+    codes = np.empty(len(values), dtype=np.int64)
+    for i, value in enumerate(values):
+        code = index.setdefault(_fold(value), len(index))
+        if code == len(first):
+            first.append(value)
+        codes[i] = code
+    return codes, first
+
+
+def _group(months: np.ndarray, codes: np.ndarray, funding: np.ndarray):
+    """(month index, code, grant count, funding) per distinct (month, code), in key order."""
+    width = int(codes.max()) + 1
+    keys, inverse = np.unique(months * width + codes, return_inverse=True)
+    counts = np.bincount(inverse, minlength=len(keys)).astype(np.int64)
+    sums = np.zeros(len(keys), dtype=np.int64)
+    np.add.at(sums, inverse, funding)
+    return keys // width, keys % width, counts, sums
+
+
+def rollup_rows(grants: Iterable[tuple[date | None, str | None, str | None, int | None]]) -> Iterator[tuple]:
+    """
+    GrantRollups rows of a set of grants.
+
+    Args:
+        grants: (date_posted, provider, research_field, program_funding) of every grant.
+
+    Yields:
+        (dimension, month_posted, value, grant_count, program_funding), ordered by dimension,
+        month and value code.
+    """
+    posted = [g for g in grants if g[0] is not None]
+    if not posted:
+        return
+    months = np.fromiter((_month_index(g[0]) for g in posted), dtype=np.int64, count=len(posted))
+    funding = np.fromiter((g[3] or 0 for g in posted), dtype=np.int64, count=len(posted))
+
+    dimensions = {
+        "month": [""] * len(posted),
+        "provider": [g[1] or "" for g in posted],
+        "research_field": [g[2] or "" for g in posted],
+    }
+    for dimension in DIMENSIONS:
+        codes, values = _codes(dimensions[dimension])
+        for month, code, count, total in zip(*_group(months, codes, funding)):
+            yield dimension, _index_month(int(month)), values[code], int(count), int(total)
+
+
+def rebuild_grant_rollups(cursor) -> int:
+    """Refill GrantRollups from Grants on cursor's connection (not committed); rows written."""
+    cursor.execute(get_sql("grant_rollups/select_grants_for_rollups"))
+    rows = list(rollup_rows(cursor.fetchall()))
+    cursor.execute(get_sql("grant_rollups/delete_grant_rollups"))
+    insert_sql = get_sql("grant_rollups/create_grant_rollups")
+    for i in range(0, len(rows), INSERT_BATCH):
+        cursor.executemany(insert_sql, rows[i:i + INSERT_BATCH])
+    return len(rows)
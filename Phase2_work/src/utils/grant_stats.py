@@ -0,0 +1,98 @@
+'''
+    File: grant_stats.py
+    Version: 19 October 2026
+    Author: Colby Wirth
+    Description:
+        - Keeps GrantStats (totals) and GrantFieldStats (per research field) in step with Grants, so
+          the landing page statistics are one-row reads instead of aggregates over every grant
+        - The code paths that write Grants (src/system_functions/insert_cleaned_grant.py and
+          delete_old_grants.py) lock the stats with lock_grant_stats(), record each grant they
+          add, change or remove in the GrantStatsDelta, and apply() it in the same transaction;
+          the lock serializes them, so no change is counted twice or lost
+        - A grant is open when it has no close date or closes on or after GrantStats.open_as_of.
+          Closing is not a write, so src/system_functions/refresh_grant_stats.py moves the grants
+          that closed since open_as_of from open to closed once a day (roll_open_counts())
+        - rebuild_grant_stats() recomputes both tables from Grants, for bulk writers (sample data)
+          and to repair drift
+'''
+
+from collections import defaultdict
+from datetime import date
+
+from src.utils.sql_registry import get_sql
+
+
+class GrantStatsDelta:
+    """Net changes to the grant statistics, applied in the writer's transaction."""
+
+    def __init__(self, open_as_of: date):
+        self.open_as_of = open_as_of
+        # grant_count, open_count, program_funding
+        self.total = [0, 0, 0]
+        self.fields: dict[str, list[int]] = defaultdict(lambda: [0, 0, 0])
+
+    def is_open(self, date_closed: date | None) -> bool:
+        return date_closed is None or date_closed >= self.open_as_of
+
+    def add(self, research_field: str | None, program_funding: int | None, date_closed: date | None,
+            sign: int = 1) -> None:
+        """Count a grant with these values (sign=-1 un-counts it)."""
+        change = (sign, sign if self.is_open(date_closed) else 0, sign * (program_funding or 0))
+        field = self.fields[research_field or ""]
+        for i, value in enumerate(change):
+            self.total[i] += value
+            field[i] += value
+
+    def remove(self, research_field: str | None, program_funding: int | None, date_closed: date | None) -> None:
+        self.add(research_field, program_funding, date_closed, sign=-1)
+
+    def apply(self, cursor) -> None:
+        if any(self.total):
+            cursor.execute(get_sql("grants/update_grant_stats"), tuple(self.total))
+        rows = [(field, *change) for field, change in self.fields.items() if any(change)]
+        if rows:
+            cursor.executemany(get_sql("grants/update_grant_field_stats"), rows)
+            cursor.execute(get_sql("grants/delete_empty_grant_field_stats"))
+        self.total = [0, 0, 0]
+        self.fields.clear()
+
+
+def lock_grant_stats(cursor) -> GrantStatsDelta:
+    """Lock the statistics until the transaction ends and start an empty delta."""
+    cursor.execute(get_sql("grants/select_grant_stats_for_update"))
+    row = cursor.fetchone()
+    if row is None:
+        # the stats row was never created (db_migration/add_grant_stats.sql)
+        rebuild_grant_stats(cursor)
+        cursor.execute(get_sql("grants/select_grant_stats_for_update"))
+        row = cursor.fetchone()
+    return GrantStatsDelta(row[0])
+
+
+def roll_open_counts(cursor, today: date | None = None) -> int:
+    """
+    Move the grants that closed since open_as_of from open to closed and advance open_as_of to today.
+
+    Returns:
+        The number of grants that closed.
+    """
+    today = today or date.today()
+    delta = lock_grant_stats(cursor)
+    if delta.open_as_of >= today:
+        return 0
+    cursor.execute(get_sql("grants/select_grant_closings"), (delta.open_as_of, today))
+    closed = 0
+    for research_field, count in cursor.fetchall():
+        delta.total[1] -= count
+        delta.fields[research_field or ""][1] -= count
+        closed += count
+    delta.apply(cursor)
+    cursor.execute(get_sql("grants/update_grant_stats_open_as_of"), (today,))
+    return closed
+
+
+def rebuild_grant_stats(cursor) -> None:
+    """Recompute GrantStats and GrantFieldStats from Grants (two grouped scans)."""
+    cursor.execute(get_sql("grants/rebuild_grant_stats"))
+    cursor.execute(get_sql("grants/delete_grant_field_stats"))
+    cursor.execute(get_sql("grants/rebuild_grant_field_stats"))
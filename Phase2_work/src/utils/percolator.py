@@ -0,0 +1,238 @@
+'''
+    File: percolator.py
+    Version: 19 October 2026
+    Author: Colby Wirth
+    Description:
+        - Reverse search for saved searches: instead of re-running every saved query against all of
+          Grants, each changed grant is run against the saved queries
+          (src/system_functions/percolate_saved_searches.py feeds it the grants of one ingest)
+        - A saved search is the query string of /api/public/search_grants, normalized by
+          normalize_query(): q, mode, field, op_num, op_num_match and the range filters of
+          src/utils/range_filters.py
+        - Queries are indexed by one term each must contain (any required term in boolean mode, every
+          term in natural mode), so a grant is only checked against the queries sharing a term with
+          it, plus the queries without keywords
+        - Matching follows the search: natural mode matches any query word; boolean mode follows
+          MySQL's +word, -word, word* and "phrase" (other operators only group or weight, and are
+          ignored); a boolean query without a required or optional term matches nothing.  Words are
+          matched in the title and description, like the FULLTEXT index, after the search
+          tokenizer (src/utils/bm25_index.py); field and op_num match case-insensitive substrings,
+          and op_num the start of the opportunity number with op_num_match=prefix
+'''
+
+import re
+from collections import defaultdict
+from datetime import date
+from typing import Iterable, Mapping, NamedTuple
+from urllib.parse import parse_qsl, urlencode
+
+from src.utils.bm25_index import tokenize
+from src.utils.range_filters import RANGE_PARAMS, RangeFilter, matches, parse_range_filters
+from src.utils.snippets import plain_text
+
+SEARCH_MODES = ("natural", "boolean")
+OP_NUM_MATCHES = ("contains", "prefix")
+SAVED_QUERY_PARAMS = ("q", "mode", "field", "op_num", "op_num_match", *RANGE_PARAMS, "closes_within")
+MAX_QUERY_LENGTH = 500
+
+# a boolean clause: optional +/- then a "phrase" or a word
+_BOOLEAN_CLAUSE = re.compile(r'([+-]?)(?:"([^"]*)"|(\S+))')
+_BOOLEAN_NOISE = re.compile(r"[<>~()@]")
+
+
+class Clause(NamedTuple):
+    """Consecutive words a grant must contain; the last one may be a prefix (word*)."""
+    tokens: tuple[str, ...]
+    prefix: bool
+
+
+class SavedQuery(NamedTuple):
+    search_id: str
+    user_id: str
+    # GrantChangeLog position when saved; earlier changes never match
+    since: int
+    q: str
+    required: tuple[Clause, ...]
+    optional: tuple[Clause, ...]
+    excluded: tuple[Clause, ...]
+    field: str
+    op_num: str
+    op_num_prefix: bool
+    ranges: tuple[RangeFilter, ...]
+
+    @property
+    def has_text(self) -> bool:
+        return bool(self.q.strip())
+
+
+class GrantDoc(NamedTuple):
+    """One changed grant, as percolation sees it (dates as ISO strings)."""
+    grant_id: str
+    change_id: int
+    tokens: tuple[str, ...]
+    research_field: str | None
+    opportunity_number: str | None
+    date_posted: str | None
+    date_closed: str | None
+    award_max_amount: int | None
+    award_min_amount: int | None
+    program_funding: int | None
+
+
+def normalize_query(params: Mapping[str, str]) -> str:
+    """
+    The saved form of a search: its non-empty search_grants parameters, sorted, as a query string.
+
+    Raises:
+        ValueError: with a message for the client when the search is invalid or has no criteria.
+    """
+    values = {}
+    for name in SAVED_QUERY_PARAMS:
+        value = params.get(name)
+        if value is None:
+            continue
+        value = " ".join(str(value).split())
+        if value:
+            values[name] = value
+    if values.get("mode", "natural") not in SEARCH_MODES:
+        raise ValueError(f"Invalid mode. Must be one of: {', '.join(SEARCH_MODES)}")
+    if values.get("mode") == "natural":
+        del values["mode"]
+    if values.get("op_num_match", "contains") not in OP_NUM_MATCHES:
+        raise ValueError(f"Invalid op_num_match. Must be one of: {', '.join(OP_NUM_MATCHES)}")
+    if values.get("op_num_match") == "contains":
+        del values["op_num_match"]
+    if any(len(values.get(name, "")) > MAX_QUERY_LENGTH for name in ("q", "field", "op_num")):
+        raise ValueError("Query string too long")
+    parse_range_filters(values)
+    if not set(values) - {"mode", "op_num_match"}:
+        raise ValueError("A saved search needs a query or at least one filter")
+    return urlencode(sorted(values.items()))
+
+
+def _clause(text: str) -> Clause | None:
+    prefix = text.endswith("*")
+    tokens = tuple(tokenize(text))
+    if not tokens:
+        return None
+    return Clause(tokens, prefix)
+
+
+def parse_saved_query(search_id: str, user_id: str, since: int, query_string: str,
+                      today: date | None = None) -> SavedQuery:
+    """A saved search ready for matching; closes_within counts from today."""
+    params = dict(parse_qsl(query_string))
+    q = params.get("q", "")
+    required, optional, excluded = [], [], []
+    if params.get("mode") == "boolean":
+        for op, phrase, word in _BOOLEAN_CLAUSE.findall(q):
+            clause = _clause(phrase if phrase else _BOOLEAN_NOISE.sub(" ", word))
+            if clause is None:
+                continue
+            {"+": required, "-": excluded}.get(op, optional).append(clause)
+    else:
+        optional = [Clause((term,), False) for term in dict.fromkeys(tokenize(q))]
+    return SavedQuery(
+        search_id, user_id, since, q, tuple(required), tuple(optional), tuple(excluded),
+        params.get("field", "").lower(), params.get("op_num", "").lower(),
+        params.get("op_num_match") == "prefix", parse_range_filters(params, today),
+    )
+
+
+def saved_query(row, today: date | None = None) -> SavedQuery:
+    """A SavedQuery from a row of saved_searches/select_saved_searches_for_percolation."""
+    search_id, user_id, query_string, created_change_id = row
+    return parse_saved_query(search_id, user_id, created_change_id, query_string, today)
+
+
+def grant_doc(row) -> GrantDoc:
+    """A GrantDoc from a row of grants/select_grant_changes_since (change_id first)."""
+    (change_id, grant_id, title, description, _provider, research_field, opportunity_number,
+     posted, closed, award_max, award_min, funding) = row
+    return GrantDoc(
+        grant_id, change_id, tuple(tokenize(f"{title or ''} {plain_text(description)}")),
+        research_field, opportunity_number,
+        posted.isoformat() if posted else None, closed.isoformat() if closed else None,
+        award_max, award_min, funding,
+    )
+
+
+def _contains(tokens: tuple[str, ...], token_set: frozenset[str], clause: Clause) -> bool:
+    words, prefix = clause.tokens, clause.prefix
+    if len(words) == 1:
+        if prefix:
+            return any(t.startswith(words[0]) for t in token_set)
+        return words[0] in token_set
+    if words[0] not in token_set:
+        return False
+    n = len(words)
+    for i in range(len(tokens) - n + 1):
+        if tokens[i:i + n - 1] == words[:-1] and (
+            tokens[i + n - 1].startswith(words[-1]) if prefix else tokens[i + n - 1] == words[-1]
+        ):
+            return True
+    return False
+
+
+class Percolator:
+    """Saved queries indexed by term, matched against one grant at a time."""
+
+    def __init__(self, queries: Iterable[SavedQuery]):
+        self.queries: list[SavedQuery] = []
+        self._by_term: dict[str, list[int]] = defaultdict(list)
+        self._by_prefix: dict[str, list[int]] = defaultdict(list)
+        # queries without keywords: candidates for every grant
+        self._unconditional: list[int] = []
+        for query in queries:
+            anchors = query.required[:1] or query.optional
+            if query.has_text and not anchors:
+                continue  # only exclusions or stopwords: matches nothing, like MySQL
+            i = len(self.queries)
+            self.queries.append(query)
+            if not anchors:
+                self._unconditional.append(i)
+            for clause in anchors:
+                if clause.prefix and len(clause.tokens) == 1:
+                    self._by_prefix[clause.tokens[0]].append(i)
+                else:
+                    self._by_term[clause.tokens[0]].append(i)
+        self._prefix_lengths = sorted({len(p) for p in self._by_prefix})
+
+    def __len__(self) -> int:
+        return len(self.queries)
+
+    def _candidates(self, token_set: frozenset[str]) -> set[int]:
+        candidates = set(self._unconditional)
+        for token in token_set:
+            candidates.update(self._by_term.get(token, ()))
+            for length in self._prefix_lengths:
+                if length > len(token):
+                    break
+                candidates.update(self._by_prefix.get(token[:length], ()))
+        return candidates
+
+    def match(self, grant: GrantDoc) -> list[SavedQuery]:
+        """The saved queries grant matches."""
+        token_set = frozenset(grant.tokens)
+        found = []
+        for i in sorted(self._candidates(token_set)):
+            query = self.queries[i]
+            if grant.change_id <= query.since:
+                continue
+            if query.field not in (grant.research_field or "").lower():
+                continue
+            op_num = (grant.opportunity_number or "").lower()
+            if not (op_num.startswith(query.op_num) if query.op_num_prefix else query.op_num in op_num):
+                continue
+            if not matches(query.ranges, grant):
+                continue
+            if not all(_contains(grant.tokens, token_set, c) for c in query.required):
+                continue
+            if any(_contains(grant.tokens, token_set, c) for c in query.excluded):
+                continue
+            if not query.required and query.optional and not any(
+                _contains(grant.tokens, token_set, c) for c in query.optional
+            ):
+                continue
+            found.append(query)
+        return found
@@ -0,0 +1,123 @@
+'''
+    File: prefix_index.py
+    Version: 19 October 2026
+    Author: Colby Wirth
+    Description:
+        - Read-only prefix index for typeahead suggestions, used by /api/public/suggest
+          (see Phase3_work/api/suggest_index.py for how it is built and replaced after ingest)
+        - Each suggestion has a kind (title, opportunity_number, ...), its display text, an optional
+          reference (the grant_id for per-grant kinds) and a popularity weight
+        - Keys are lowercased, whitespace-squeezed texts in one sorted list; a prefix selects a
+          contiguous slice with two bisections.  Kinds in WORD_KINDS are also keyed from the start
+          of every later word, so "science" completes "National Science Foundation"
+        - A prefix matching more than HEAVY_SLICE keys (short prefixes, or shared stems such as
+          "opp-" of opportunity numbers) has its best TOP_K_MAX suggestions, overall and per
+          kind, ranked once at build time, so a lookup for it is a dict hit.  Every other prefix
+          ranks a slice of at most HEAVY_SLICE keys, which keeps each lookup around a millisecond
+        - Never modified after construction: the owner builds a new index and swaps the reference,
+          so lookups need no lock
+'''
+
+import heapq
+from bisect import bisect_left
+from typing import Any, Iterable
+
+# kinds whose texts are also completed from the start of each word
+WORD_KINDS = frozenset({"title", "provider", "research_field"})
+
+# prefixes matching more keys than this have their top suggestions precomputed
+HEAVY_SLICE = 256
+# most suggestions a lookup returns
+TOP_K_MAX = 20
+
+# sorts after every character a key can contain
+_HIGH = "\U0010ffff"
+
+
+def normalize(text: str | None) -> str:
+    """Lowercased text with runs of whitespace squeezed to one space."""
+    return " ".join(text.lower().split()) if text else ""
+
+
+class PrefixIndex:
+    """Top-k completions of a prefix, ranked by weight."""
+
+    def __init__(self, entries: Iterable[tuple[str, str, Any, int]]):
+        """entries: (kind, display text, reference, weight); empty texts are skipped."""
+        self._items: list[tuple[str, str, Any, int]] = []
+        keyed: list[tuple[str, int]] = []
+        for kind, text, ref, weight in entries:
+            key = normalize(text)
+            if not key:
+                continue
+            item = len(self._items)
+            self._items.append((text, kind, ref, weight))
+            keyed.append((key, item))
+            if kind in WORD_KINDS:
+                for i, char in enumerate(key):
+                    if char == " ":
+                        keyed.append((key[i + 1:], item))
+        keyed.sort()
+        self._keys = [key for key, _ in keyed]
+        self._slots = [item for _, item in keyed]
+        self._top = self._precompute()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def _rank(self, items: Iterable[int], k: int, kind: str | None = None) -> list[int]:
+        """The k heaviest distinct items (ties by text), optionally of one kind."""
+        candidates = set(items)
+        if kind is not None:
+            candidates = {i for i in candidates if self._items[i][1] == kind}
+        return heapq.nsmallest(k, candidates, key=lambda i: (-self._items[i][3], self._items[i][0]))
+
+    def _precompute(self) -> dict[tuple[str | None, str], list[int]]:
+        """Top suggestions of every prefix matching more than HEAVY_SLICE keys."""
+        kinds = {item[1] for item in self._items}
+        keys, slots = self._keys, self._slots
+        top = {}
+        # (lo, hi, length): keys[lo:hi] share their first length - 1 characters
+        pending = [(0, len(keys), 1)]
+        while pending:
+            lo, hi, length = pending.pop()
+            # keys no longer than the shared part sort first and extend no prefix
+            while lo < hi and len(keys[lo]) < length:
+                lo += 1
+            while lo < hi:
+                prefix = keys[lo][:length]
+                end = bisect_left(keys, prefix + _HIGH, lo, hi)
+                if end - lo > HEAVY_SLICE:
+                    items = slots[lo:end]
+                    top[(None, prefix)] = self._rank(items, TOP_K_MAX)
+                    for kind in kinds:
+                        top[(kind, prefix)] = self._rank(items, TOP_K_MAX, kind)
+                    pending.append((lo, end, length + 1))
+                lo = end
+        return top
+
+    def suggest(self, prefix: str, k: int = 8, kind: str | None = None) -> list[dict]:
+        """
+        Up to k suggestions whose text (or a word of it, for WORD_KINDS) starts with prefix.
+
+        Returns:
+            [{"text", "kind", "ref", "weight"}, ...], heaviest first
+        """
+        key = normalize(prefix)
+        k = min(k, TOP_K_MAX)
+        if not key or k < 1:
+            return []
+        ranked = self._top.get((kind, key))
+        if ranked is not None:
+            ranked = ranked[:k]
+        else:
+            lo = bisect_left(self._keys, key)
+            hi = bisect_left(self._keys, key + _HIGH, lo)
+            ranked = self._rank(self._slots[lo:hi], k, kind)
+        return [
+            {"text": text, "kind": item_kind, "ref": ref, "weight": weight}
+            for text, item_kind, ref, weight in (self._items[i] for i in ranked)
+        ]
+
+    def stats(self) -> dict:
+        return {"suggestions": len(self._items), "keys": len(self._keys), "precomputed_prefixes": len(self._top)}
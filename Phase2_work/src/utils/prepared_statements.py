@@ -0,0 +1,196 @@
+'''
+    File: prepared_statements.py
+    Version: 19 October 2026
+    Author: Colby Wirth
+    Description:
+        - Server-side prepared statement cache for the hot API queries
+        - Each connection keeps one cursor(prepared=True) per registered SQL script; the first
+          execution prepares the statement (COM_STMT_PREPARE), later executions on the same
+          connection only send COM_STMT_EXECUTE with the bound values
+        - Meant for long-lived pooled connections.  The pool must be created with
+          pool_reset_session=False, since resetting a session deallocates its prepared statements
+        - Only scripts with positional %s placeholders can be prepared
+'''
+
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Sequence
+
+from mysql.connector import errorcode, Error as MySQLError
+
+from src.utils.logging_utils import log_info
+from src.utils.sql_registry import get_script, SqlRegistryError
+
+# The highest-volume statements of the API
+HOT_STATEMENTS = (
+    "grants/select_grant_details_by_uuid",
+    "applications/select_applications_with_grant_by_user",
+    "applications/select_owned_application",
+    "applications/select_owned_application_state",
+    "internal_deadlines/select_owned_internal_deadlines",
+    "documents/select_owned_documents",
+)
+
+# Upper bound on prepared handles held open per connection (server limit is max_prepared_stmt_count)
+MAX_STATEMENTS_PER_CONNECTION = 32
+
+
+class PreparedStatementError(Exception):
+    """Raised when a script cannot be run as a prepared statement."""
+    pass
+
+
+class _ConnectionStatements:
+    """Prepared cursors of one physical connection, least recently used first."""
+
+    def __init__(self, connection_id: int | None):
+        self.connection_id = connection_id
+        self.cursors: OrderedDict[str, object] = OrderedDict()
+
+    def close(self) -> None:
+        for cursor in self.cursors.values():
+            try:
+                cursor.close()
+            except Exception:
+                pass
+        self.cursors.clear()
+
+
+class PreparedStatementCache:
+    """
+    Caches prepared statement handles per connection and counts hits and misses.
+
+    A hit reuses a handle already prepared on the connection; a miss prepares the statement.
+    """
+
+    def __init__(self, max_per_connection: int = MAX_STATEMENTS_PER_CONNECTION):
+        self.max_per_connection = max_per_connection
+        self._connections = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+
+    @staticmethod
+    def _physical(conn):
+        # pooled connections wrap the real connection; the statements belong to the latter
+        return getattr(conn, "_cnx", None) or conn
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self._stats[key] += 1
+
+    def _statements_for(self, cnx) -> _ConnectionStatements:
+        connection_id = cnx.connection_id
+        with self._lock:
+            entry = self._connections.get(cnx)
+            if entry is not None and entry.connection_id != connection_id:
+                # the connection reconnected, its old handles no longer exist on the server
+                self._stats["invalidations"] += 1
+                entry.close()
+                entry = None
+            if entry is None:
+                entry = _ConnectionStatements(connection_id)
+                self._connections[cnx] = entry
+            return entry
+
+    def _cursor_for(self, cnx, name: str):
+        entry = self._statements_for(cnx)
+        cursor = entry.cursors.get(name)
+        if cursor is not None:
+            entry.cursors.move_to_end(name)
+            self._count("hits")
+            return cursor
+
+        self._count("misses")
+        cursor = cnx.cursor(prepared=True)
+        entry.cursors[name] = cursor
+        if len(entry.cursors) > self.max_per_connection:
+            _, oldest = entry.cursors.popitem(last=False)
+            oldest.close()
+            self._count("evictions")
+        return cursor
+
+    def _discard(self, cnx, name: str) -> None:
+        with self._lock:
+            entry = self._connections.get(cnx)
+        if entry is not None and name in entry.cursors:
+            try:
+                entry.cursors.pop(name).close()
+            except Exception:
+                pass
+
+    def fetchall(self, conn, name: str, params: Sequence = ()) -> list[tuple]:
+        """
+        Run a registered SELECT script as a prepared statement and return every row.
+
+        Args:
+            conn: An open (pooled) MySQL connection.
+            name: Registry name of the script, e.g. "grants/select_grant_details_by_uuid".
+            params: Positional values for the script's %s placeholders.
+
+        Raises:
+            PreparedStatementError: if the script is unknown, uses named placeholders or holds
+                more than one statement.
+            MySQLError: if the statement fails.
+        """
+        try:
+            script = get_script(name)
+            sql = script.sql
+        except SqlRegistryError as e:
+            raise PreparedStatementError(str(e)) from e
+        if script.param_names:
+            raise PreparedStatementError(f"SQL script '{name}' uses named placeholders and cannot be prepared")
+        if len(params) != script.positional_count:
+            raise PreparedStatementError(f"SQL script '{name}' expects {script.positional_count} parameter(s)")
+
+        cnx = self._physical(conn)
+        cursor = self._cursor_for(cnx, name)
+        try:
+            # the registry hands out the same string every time, so the cursor keeps its handle
+            cursor.execute(sql, tuple(params))
+            # prepared cursors are unbuffered; always drain them before the next statement
+            return cursor.fetchall()
+        except MySQLError as e:
+            self._discard(cnx, name)
+            if e.errno != errorcode.ER_UNKNOWN_STMT_HANDLER:
+                raise
+            # the handle was deallocated behind our back (e.g. a session reset); prepare again
+            self._count("invalidations")
+            cursor = self._cursor_for(cnx, name)
+            cursor.execute(sql, tuple(params))
+            return cursor.fetchall()
+
+    def fetchone(self, conn, name: str, params: Sequence = ()) -> tuple | None:
+        """Like fetchall() but return only the first row, or None."""
+        rows = self.fetchall(conn, name, params)
+        return rows[0] if rows else None
+
+    def close_connection(self, conn) -> None:
+        """Deallocate every statement prepared on conn."""
+        cnx = self._physical(conn)
+        with self._lock:
+            entry = self._connections.pop(cnx, None)
+        if entry is not None:
+            entry.close()
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and the number of handles currently prepared."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["connections"] = len(self._connections)
+            stats["prepared"] = sum(len(e.cursors) for e in self._connections.values())
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_ratio"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+        return stats
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            for key in self._stats:
+                self._stats[key] = 0
+
+    def log_stats(self) -> None:
+        log_info(f"Prepared statement cache: {self.stats()}")
+
+
+# Shared by every request handler of a process
+statement_cache = PreparedStatementCache()
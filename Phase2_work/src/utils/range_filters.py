@@ -0,0 +1,109 @@
+'''
+    File: range_filters.py
+    Version: 19 October 2026
+    Author: Colby Wirth
+    Description:
+        - Numeric and date range filters of /api/public/search_grants ("awards of at least $500k",
+          "closing in the next 30 days"), shared by the route, the API's in-memory search index
+          (Phase3_work/api/search_index.py) and saved search percolation (src/utils/percolator.py)
+        - Each parameter in RANGE_PARAMS bounds one column, inclusively:
+              award_max_gte / award_max_lte   award_max_amount
+              award_min_gte / award_min_lte   award_min_amount
+              funding_gte / funding_lte       program_funding
+              posted_from / posted_to         date_posted (YYYY-MM-DD)
+              closes_from / closes_to         date_closed (YYYY-MM-DD)
+          closes_within=N is short for closes_from=today and closes_to=today + N days
+        - sql_conditions() returns "column >= %s" style conditions, so every bound is a range on one
+          indexed column (see db_migration/add_grants_range_indexes.sql)
+        - matches() applies the same bounds in Python to any object with attributes named after the
+          columns; as in SQL, a grant with no value in a bounded column never matches
+'''
+
+from datetime import date, timedelta
+from typing import NamedTuple
+
+# parameter -> (column, operator)
+RANGE_PARAMS = {
+    "award_max_gte": ("award_max_amount", ">="),
+    "award_max_lte": ("award_max_amount", "<="),
+    "award_min_gte": ("award_min_amount", ">="),
+    "award_min_lte": ("award_min_amount", "<="),
+    "funding_gte": ("program_funding", ">="),
+    "funding_lte": ("program_funding", "<="),
+    "posted_from": ("date_posted", ">="),
+    "posted_to": ("date_posted", "<="),
+    "closes_from": ("date_closed", ">="),
+    "closes_to": ("date_closed", "<="),
+}
+
+DATE_COLUMNS = ("date_posted", "date_closed")
+
+# largest closes_within, in days
+MAX_WITHIN_DAYS = 3650
+
+
+class RangeFilter(NamedTuple):
+    column: str
+    op: str
+    # an int for amounts, an ISO date string for dates
+    value: int | str
+
+
+def _parse_value(column: str, text: str) -> int | str:
+    if column in DATE_COLUMNS:
+        return date.fromisoformat(text).isoformat()
+    value = int(text)
+    if value < 0:
+        raise ValueError
+    return value
+
+
+def parse_range_filters(args, today: date | None = None) -> tuple[RangeFilter, ...]:
+    """
+    The range filters in a request's query string, in a canonical order.
+
+    Raises:
+        ValueError: with a message for the client when a value is malformed.
+    """
+    filters = []
+    for param, (column, op) in RANGE_PARAMS.items():
+        text = args.get(param, "").strip()
+        if not text:
+            continue
+        try:
+            filters.append(RangeFilter(column, op, _parse_value(column, text)))
+        except ValueError:
+            kind = "a date (YYYY-MM-DD)" if column in DATE_COLUMNS else "a non-negative whole number"
+            raise ValueError(f"{param} must be {kind}") from None
+
+    within = args.get("closes_within", "").strip()
+    if within:
+        try:
+            days = int(within)
+        except ValueError:
+            days = -1
+        if not 0 <= days <= MAX_WITHIN_DAYS:
+            raise ValueError(f"closes_within must be a number of days from 0 to {MAX_WITHIN_DAYS}")
+        today = today or date.today()
+        filters.append(RangeFilter("date_closed", ">=", today.isoformat()))
+        filters.append(RangeFilter("date_closed", "<=", (today + timedelta(days=days)).isoformat()))
+
+    return tuple(sorted(set(filters), key=lambda f: (f.column, f.op, str(f.value))))
+
+
+def sql_conditions(filters: tuple[RangeFilter, ...]) -> tuple[list[str], list]:
+    """WHERE conditions and their parameters; column and operator come from RANGE_PARAMS only."""
+    return [f"{f.column} {f.op} %s" for f in filters], [f.value for f in filters]
+
+
+def matches(filters: tuple[RangeFilter, ...], keys) -> bool:
+    """Whether the grant whose values are keys (attributes named after the columns) passes every filter."""
+    for f in filters:
+        value = getattr(keys, f.column)
+        if value is None:
+            return False
+        if f.op == ">=" and value < f.value:
+            return False
+        if f.op == "<=" and value > f.value:
+            return False
+    return True
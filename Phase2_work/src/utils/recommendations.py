@@ -0,0 +1,231 @@
+'''
+    File: recommendations.py
+    Version: 19 October 2026
+    Author: Colby Wirth
+    Description:
+        - Scores open grants for a user's recommendation feed (UserGrantFeed), written by
+          src/system_functions/refresh_user_grant_feed.py and read by /api/user/feed
+        - A score is 0-1000 points:
+            research field  up to FIELD_POINTS: all of one of the user's research fields, or the
+                            grant's research_field exactly; FIELD_PARTIAL of that for the share of a
+                            field's words found in the grant's research_field and title
+            history         up to HISTORY_POINTS: the shares of the user's applications to grants of
+                            the same provider and of the same research_field
+            institution     INSTITUTION_POINTS when the eligibility text admits the kind of
+                            institution the user belongs to (or anyone); only added to grants that
+                            already score on field or history, since most grants admit universities
+          Grants below MIN_POINTS, and grants the user applied to, are left out; a user keeps the
+          FEED_SIZE best
+        - Users are indexed by the words, research fields and providers they score on, so a grant is
+          only scored for the users it can reach
+'''
+
+import hashlib
+import heapq
+import re
+from collections import Counter, defaultdict
+from typing import Iterable, NamedTuple
+
+from src.utils.bm25_index import tokenize
+
+FIELD_POINTS = 600
+FIELD_PARTIAL = 0.8
+HISTORY_POINTS = 300
+INSTITUTION_POINTS = 100
+MIN_POINTS = 150
+FEED_SIZE = 200
+# part of every profile digest: bump it when the scoring changes, so every feed is rebuilt
+SCORING_VERSION = 1
+
+# reasons bitmask stored with each feed row
+REASON_FIELD = 1
+REASON_HISTORY = 2
+REASON_INSTITUTION = 4
+REASONS = {REASON_FIELD: "research_field", REASON_HISTORY: "history", REASON_INSTITUTION: "institution"}
+
+# kind -> (words of an institution name, phrases of grants.gov eligibility text)
+INSTITUTION_KINDS = {
+    "higher_education": (
+        ("university", "college", "institute of technology", "polytechnic", "school of medicine"),
+        ("institutions of higher education", "higher education"),
+    ),
+    "nonprofit": (
+        ("foundation", "nonprofit", "non profit", "association", "society", "trust"),
+        ("nonprofits", "nonprofit", "non profit", "501 c"),
+    ),
+    "government": (
+        ("city of", "county", "state of", "department of", "agency", "authority", "district"),
+        ("state governments", "county governments", "city or township governments",
+         "special district governments", "government"),
+    ),
+    "tribal": (
+        ("tribe", "tribal", "nation", "pueblo"),
+        ("native american tribal", "tribal organizations", "tribal governments"),
+    ),
+    "business": (
+        ("inc", "llc", "corp", "corporation", "company", "ltd"),
+        ("small businesses", "for profit organizations", "for profit"),
+    ),
+}
+_UNRESTRICTED = ("unrestricted", "open to any type of entity")
+
+
+class UserProfile(NamedTuple):
+    user_id: str
+    # folded research field names
+    fields: frozenset[str]
+    # words of each research field, in the order of fields' sorted names
+    field_words: tuple[frozenset[str], ...]
+    institution_kinds: frozenset[str]
+    applied: frozenset[str]
+    # share of the user's applications per folded provider / research field
+    provider_share: dict[str, float]
+    history_field_share: dict[str, float]
+    digest: str
+
+
+class FeedGrant(NamedTuple):
+    grant_id: str
+    field: str
+    provider: str
+    words: frozenset[str]
+    # institution kinds the eligibility text admits; None for anyone
+    eligible: frozenset[str] | None
+
+
+def _fold(value: str | None) -> str:
+    return " ".join((value or "").lower().split())
+
+
+def _normalized(text: str | None) -> str:
+    """Lowercased words separated by single spaces, padded so phrases can be found as ' x y '."""
+    return f" {' '.join(re.findall(r'[a-z0-9]+', (text or '').lower()))} "
+
+
+def institution_kinds(institution: str | None) -> frozenset[str]:
+    text = _normalized(institution)
+    return frozenset(kind for kind, (names, _) in INSTITUTION_KINDS.items() if any(f" {n} " in text for n in names))
+
+
+def eligible_kinds(eligibility: str | None) -> frozenset[str] | None:
+    """The institution kinds an eligibility text admits; None when it admits anyone or says nothing."""
+    text = _normalized(eligibility)
+    if not text.strip() or any(f" {p} " in text for p in _UNRESTRICTED):
+        return None
+    return frozenset(kind for kind, (_, phrases) in INSTITUTION_KINDS.items() if any(f" {p} " in text for p in phrases))
+
+
+def user_profile(user_id: str, institution: str | None, research_fields: Iterable[str],
+                 applications: Iterable[tuple[str, str | None, str | None]]) -> UserProfile:
+    """
+    A user's profile for scoring.
+
+    Args:
+        applications: (grant_id, provider, research_field) of each grant the user applied to.
+    """
+    fields = sorted({_fold(f) for f in research_fields if _fold(f)})
+    applications = list(applications)
+    providers = Counter(_fold(provider) for _, provider, _ in applications if provider)
+    history_fields = Counter(_fold(field) for _, _, field in applications if field)
+    applied = frozenset(grant_id for grant_id, _, _ in applications)
+    total = len(applications)
+    # changes whenever anything the score depends on changes, so the job can rebuild only those users
+    digest = hashlib.blake2b(
+        repr((SCORING_VERSION, _fold(institution), fields, sorted(applied))).encode("utf-8"), digest_size=8
+    ).hexdigest()
+    return UserProfile(
+        user_id,
+        frozenset(fields),
+        tuple(frozenset(tokenize(f)) for f in fields),
+        institution_kinds(institution),
+        applied,
+        {p: n / total for p, n in providers.items()},
+        {f: n / total for f, n in history_fields.items()},
+        digest,
+    )
+
+
+def feed_grant(grant_id: str, title: str | None, research_field: str | None, provider: str | None,
+               eligibility: str | None) -> FeedGrant:
+    return FeedGrant(
+        grant_id, _fold(research_field), _fold(provider),
+        frozenset(tokenize(f"{research_field or ''} {title or ''}")), eligible_kinds(eligibility),
+    )
+
+
+def score(user: UserProfile, grant: FeedGrant) -> tuple[int, int] | None:
+    """(points, reasons) of grant for user, or None when it does not belong in the feed."""
+    if grant.grant_id in user.applied:
+        return None
+    points = 0.0
+    reasons = 0
+
+    field_match = 1.0 if grant.field in user.fields else FIELD_PARTIAL * max(
+        (len(words & grant.words) / len(words) for words in user.field_words if words), default=0.0
+    )
+    if field_match:
+        points += FIELD_POINTS * field_match
+        reasons |= REASON_FIELD
+
+    history = (user.provider_share.get(grant.provider, 0.0) + user.history_field_share.get(grant.field, 0.0)) / 2
+    if history:
+        points += HISTORY_POINTS * history
+        reasons |= REASON_HISTORY
+
+    if reasons and (grant.eligible is None or user.institution_kinds & grant.eligible):
+        points += INSTITUTION_POINTS
+        reasons |= REASON_INSTITUTION
+
+    points = round(points)
+    if points < MIN_POINTS:
+        return None
+    return points, reasons
+
+
+class Recommender:
+    """User profiles indexed by what they score on, matched against one grant at a time."""
+
+    def __init__(self, users: Iterable[UserProfile]):
+        self.users: list[UserProfile] = list(users)
+        self._by_word: dict[str, list[int]] = defaultdict(list)
+        self._by_field: dict[str, list[int]] = defaultdict(list)
+        self._by_provider: dict[str, list[int]] = defaultdict(list)
+        for i, user in enumerate(self.users):
+            for word in set().union(*user.field_words):
+                self._by_word[word].append(i)
+            for field in user.fields | set(user.history_field_share):
+                self._by_field[field].append(i)
+            for provider in user.provider_share:
+                self._by_provider[provider].append(i)
+
+    def __len__(self) -> int:
+        return len(self.users)
+
+    def _candidates(self, grant: FeedGrant) -> set[int]:
+        candidates = set(self._by_field.get(grant.field, ()))
+        candidates.update(self._by_provider.get(grant.provider, ()))
+        for word in grant.words:
+            candidates.update(self._by_word.get(word, ()))
+        return candidates
+
+    def match(self, grant: FeedGrant) -> list[tuple[UserProfile, int, int]]:
+        """(user, points, reasons) of every user grant belongs in the feed of."""
+        found = []
+        for i in sorted(self._candidates(grant)):
+            result = score(self.users[i], grant)
+            if result is not None:
+                found.append((self.users[i], *result))
+        return found
+
+    def feeds(self, grants: Iterable[FeedGrant], size: int = FEED_SIZE) -> dict[str, list[tuple[int, str, int]]]:
+        """The size best (points, grant_id, reasons) of each user, best first; users without any are left out."""
+        best: dict[str, list[tuple[int, str, int]]] = defaultdict(list)
+        for grant in grants:
+            for user, points, reasons in self.match(grant):
+                heap = best[user.user_id]
+                entry = (points, grant.grant_id, reasons)
+                if len(heap) < size:
+                    heapq.heappush(heap, entry)
+                elif entry > heap[0]:
+                    heapq.heapreplace(heap, entry)
+        return {user_id: sorted(heap, reverse=True) for user_id, heap in best.items()}
@@ -0,0 +1,138 @@
+'''
+    File: snippets.py
+    Version: 19 October 2026
+    Author: Colby Wirth
+    Description:
+        - Short excerpts of grant descriptions for search results, so a results page carries a few
+          hundred characters per grant instead of the whole description (up to 18,000)
+        - The excerpt is the SNIPPET_LENGTH-character window holding the most distinct query terms,
+          widened to word boundaries, with "…" where text was cut
+        - Highlights are [start, end) character offsets of the matched words in the returned text,
+          so the client can mark them without re-tokenizing; text is never marked up server-side
+        - Descriptions from Grants.gov are HTML; tags and entities are dropped first, so the excerpt is
+          plain text (the details page still renders the full, sanitized HTML)
+        - Words are matched with the search tokenizer (src/utils/bm25_index.py), case-insensitively;
+          a query word ending in * (boolean mode) matches words starting with it
+'''
+
+import html
+import re
+from typing import NamedTuple
+
+from src.utils.bm25_index import tokenize
+
+SNIPPET_LENGTH = 240
+ELLIPSIS = "…"
+
+_PREFIX = re.compile(r"([a-z0-9]+)\*", re.IGNORECASE)
+_TAG = re.compile(r"<[^>]*>")
+
+
+class Terms(NamedTuple):
+    """The words and prefixes to highlight for one query."""
+    words: frozenset[str]
+    prefixes: tuple[str, ...]
+
+
+def query_terms(q: str) -> Terms:
+    """Whole words and prefixes (word*) to highlight for a search query."""
+    prefixes = tuple(dict.fromkeys(p.lower() for p in _PREFIX.findall(q or "")))
+    return Terms(frozenset(tokenize(q)) - set(prefixes), prefixes)
+
+
+def plain_text(text: str | None) -> str:
+    """text without HTML tags and entities, whitespace squeezed."""
+    if not text:
+        return ""
+    return " ".join(html.unescape(_TAG.sub(" ", text)).split())
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isascii() and char.isalnum()
+
+
+def _matches(text: str, terms: Terms) -> list[tuple[int, int, str]]:
+    """(start, end, term) of every matched word, in order; term is the prefix for prefix matches."""
+    if not terms.words and not terms.prefixes:
+        return []
+    lowered = text.lower()
+    if len(lowered) != len(text):
+        # a few characters lower-case to two; offsets must stay those of text
+        lowered = "".join(c if len(c.lower()) != 1 else c.lower() for c in text)
+    found = []
+    # str.find scans in C; only the candidates are checked for word boundaries in Python
+    for term in terms.words:
+        i = lowered.find(term)
+        while i >= 0:
+            end = i + len(term)
+            if (i == 0 or not _is_word_char(lowered[i - 1])) and (end == len(lowered) or not _is_word_char(lowered[end])):
+                found.append((i, end, term))
+            i = lowered.find(term, end)
+    for prefix in terms.prefixes:
+        i = lowered.find(prefix)
+        while i >= 0:
+            end = i + len(prefix)
+            if i == 0 or not _is_word_char(lowered[i - 1]):
+                while end < len(lowered) and _is_word_char(lowered[end]):
+                    end += 1
+                found.append((i, end, prefix))
+            i = lowered.find(prefix, end)
+    found.sort()
+    # a word matched both whole and by a prefix is kept once
+    return [m for k, m in enumerate(found) if not k or m[0] >= found[k - 1][1]]
+
+
+def highlight(text: str | None, terms: Terms) -> list[list[int]]:
+    """Offsets of every matched word in text (e.g. a title)."""
+    return [[start, end] for start, end, _ in _matches(text or "", terms)]
+
+
+def make_snippet(
+    text: str | None,
+    terms: Terms,
+    length: int = SNIPPET_LENGTH,
+) -> tuple[str, list[list[int]]]:
+    """
+    The excerpt of text around its best cluster of query terms, and the highlight offsets in it.
+
+    Without matches the excerpt is the start of the text.
+    """
+    text = plain_text(text)
+    if len(text) <= length:
+        return text, highlight(text, terms)
+
+    matches = _matches(text, terms)
+    start = keep = 0
+    if matches:
+        # two pointers: the window of matches fitting in length with the most distinct terms
+        best, best_key, left = 0, (-1, -1), 0
+        in_window: dict[str, int] = {}
+        for right, (_, right_end, term) in enumerate(matches):
+            in_window[term] = in_window.get(term, 0) + 1
+            while right_end - matches[left][0] > length:
+                left_term = matches[left][2]
+                in_window[left_term] -= 1
+                if not in_window[left_term]:
+                    del in_window[left_term]
+                left += 1
+            key = (len(in_window), right - left + 1)
+            if key > best_key:
+                best, best_key = left, key
+        first = matches[best][0]
+        keep = max(end for _, end, _ in matches[best:] if end - first <= length)
+        # lead in with a little context before the first match, as far as the last one allows
+        start = max(0, first - length // 5, keep - length)
+        if start:
+            # begin on a word: move forward to the next space, never past the first match
+            space = text.find(" ", start, first)
+            start = space + 1 if space >= 0 else start
+
+    end = min(len(text), start + length)
+    if end < len(text):
+        # end on a word, but after the last match kept
+        space = text.rfind(" ", max(start + length // 2, keep), end)
+        end = space if space >= 0 else end
+
+    lead = ELLIPSIS if start else ""
+    snippet = lead + text[start:end].strip() + (ELLIPSIS if end < len(text) else "")
+    return snippet, highlight(snippet, terms)
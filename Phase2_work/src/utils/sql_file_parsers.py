@@ -1,8 +1,18 @@
 import os
+import re
 from src.utils.logging_utils import log_error
+
+# %(name)s placeholders used by dict-bound statements and bare %s placeholders used by tuple-bound ones
+NAMED_PARAM_PATTERN = re.compile(r"%\((\w+)\)s")
+POSITIONAL_PARAM_PATTERN = re.compile(r"(?<!%)%s")
+
+
 def read_sql_helper(path: str, base_path = None) -> str | None:
     """Read a SQL script from a file and return its content as a string.
 
+    Prefer src.utils.sql_registry.get_sql() for scripts under src/db_crud, which are
+    loaded once instead of being read from disk on every call.
+
     Args:
         path: Path to the SQL file.
 
@@ -17,5 +27,117 @@ def read_sql_helper(path: str, base_path = None) -> str | None:
         with open(path, "r", encoding="utf-8") as f:
             return f.read()
     except Exception as e:
-        log_error(f"Error reading SQL script {str}: {e}")
+        log_error(f"Error reading SQL script {path}: {e}")
         return None
+
+
+def _scan_sql(sql: str):
+    """Yield (kind, text) chunks of a SQL script.
+
+    kind is one of 'code', 'string', 'comment' or 'delimiter'.  Quoted strings and
+    backtick identifiers are kept intact so that '--', '/*' or ';' inside them are
+    never mistaken for comments or statement separators.
+    """
+    i = 0
+    n = len(sql)
+    start = 0
+
+    while i < n:
+        ch = sql[i]
+        nxt = sql[i + 1] if i + 1 < n else ""
+
+        if ch in ("'", '"', "`"):
+            if start < i:
+                yield "code", sql[start:i]
+            j = i + 1
+            while j < n:
+                if sql[j] == "\\" and ch != "`":
+                    j += 2
+                    continue
+                if sql[j] == ch:
+                    # doubled quote is an escaped quote
+                    if j + 1 < n and sql[j + 1] == ch:
+                        j += 2
+                        continue
+                    break
+                j += 1
+            if j >= n:
+                raise ValueError("Unterminated quoted string in SQL script")
+            yield "string", sql[i:j + 1]
+            i = start = j + 1
+            continue
+
+        if ch == "/" and nxt == "*":
+            if start < i:
+                yield "code", sql[start:i]
+            end = sql.find("*/", i + 2)
+            if end == -1:
+                raise ValueError("Unterminated /* comment in SQL script")
+            yield "comment", sql[i:end + 2]
+            i = start = end + 2
+            continue
+
+        # MySQL requires whitespace after '--' for it to start a comment
+        if (ch == "-" and nxt == "-" and (i + 2 >= n or sql[i + 2].isspace())) or ch == "#":
+            if start < i:
+                yield "code", sql[start:i]
+            end = sql.find("\n", i)
+            end = n if end == -1 else end
+            yield "comment", sql[i:end]
+            i = start = end
+            continue
+
+        if ch == ";":
+            if start < i:
+                yield "code", sql[start:i]
+            yield "delimiter", ";"
+            i = start = i + 1
+            continue
+
+        i += 1
+
+    if start < n:
+        yield "code", sql[start:]
+
+
+def strip_sql_comments(sql: str) -> str:
+    """Remove /* */, -- and # comments from a SQL script, leaving string literals untouched."""
+    return "".join(text if kind != "comment" else " " for kind, text in _scan_sql(sql))
+
+
+def split_sql_statements(sql: str) -> list[str]:
+    """Strip comments and split a SQL script into its individual statements.
+
+    Returns:
+        A list of non-empty statements without their trailing ';'.
+    """
+    statements = []
+    current = []
+
+    for kind, text in _scan_sql(sql):
+        if kind == "comment":
+            current.append(" ")
+        elif kind == "delimiter":
+            statements.append("".join(current))
+            current = []
+        else:
+            current.append(text)
+    statements.append("".join(current))
+
+    return [s.strip() for s in statements if s.strip()]
+
+
+def find_sql_parameters(statement: str) -> tuple[tuple[str, ...], int]:
+    """Find the placeholders of a statement, ignoring anything inside string literals.
+
+    Returns:
+        (named parameters in order of first appearance, number of positional %s placeholders)
+    """
+    code = " ".join(text for kind, text in _scan_sql(statement) if kind == "code")
+
+    names = []
+    for name in NAMED_PARAM_PATTERN.findall(code):
+        if name not in names:
+            names.append(name)
+
+    return tuple(names), len(POSITIONAL_PARAM_PATTERN.findall(code))
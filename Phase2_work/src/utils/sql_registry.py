@@ -0,0 +1,161 @@
+'''
+    File: sql_registry.py
+    Version: 19 October 2026
+    Author: Colby Wirth
+    Description:
+        - Loads every SQL script under src/db_crud once and keeps the parsed statements in memory
+        - Scripts are looked up by name, e.g. "users/create_users" for src/db_crud/users/create_users.sql
+        - Comments are stripped, multi-statement scripts are split, and placeholders are validated at load time
+        - CRUD functions call get_sql()/get_statements() so the hot path never touches the filesystem
+'''
+
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Mapping, Sequence
+
+from src.utils.logging_utils import log_info
+from src.utils.sql_file_parsers import split_sql_statements, find_sql_parameters
+
+# Resolved from this file so lookups work no matter what the current working directory is
+DB_CRUD_DIR = Path(__file__).resolve().parent.parent / "db_crud"
+
+
+class SqlRegistryError(Exception):
+    """Raised when a SQL script is missing, malformed, or bound with the wrong parameters."""
+    pass
+
+
+@dataclass(frozen=True)
+class SqlScript:
+    """A parsed SQL script from src/db_crud."""
+    name: str
+    path: Path
+    statements: tuple[str, ...]
+    param_names: tuple[str, ...]
+    positional_count: int
+
+    @property
+    def sql(self) -> str:
+        """The statement of a single-statement script."""
+        if len(self.statements) != 1:
+            raise SqlRegistryError(f"SQL script '{self.name}' holds {len(self.statements)} statements; use get_statements()")
+        return self.statements[0]
+
+
+_registry: dict[str, SqlScript] = {}
+_lock = threading.Lock()
+
+
+def _script_name(path: Path, root: Path) -> str:
+    return path.relative_to(root).with_suffix("").as_posix()
+
+
+def _parse_script(name: str, path: Path) -> SqlScript:
+    try:
+        statements = tuple(split_sql_statements(path.read_text(encoding="utf-8")))
+    except ValueError as e:
+        raise SqlRegistryError(f"Could not parse SQL script '{name}': {e}") from e
+
+    if not statements:
+        raise SqlRegistryError(f"SQL script '{name}' contains no statements")
+
+    param_names: list[str] = []
+    positional_count = 0
+    for stmt in statements:
+        names, positional = find_sql_parameters(stmt)
+        if names and positional:
+            raise SqlRegistryError(f"SQL script '{name}' mixes %(name)s and %s placeholders in one statement")
+        param_names.extend(n for n in names if n not in param_names)
+        positional_count = max(positional_count, positional)
+
+    if param_names and positional_count:
+        raise SqlRegistryError(f"SQL script '{name}' mixes %(name)s and %s placeholders across statements")
+
+    return SqlScript(name, path, statements, tuple(param_names), positional_count)
+
+
+def load_sql_registry(root: Path | str | None = None, reload: bool = False) -> dict[str, SqlScript]:
+    """
+    Parse every .sql file under src/db_crud into the registry.
+
+    Called once at startup; later calls are no-ops unless reload=True.
+
+    Args:
+        root: Directory to load from (defaults to src/db_crud).
+        reload: Re-read the scripts even if the registry is already populated.
+
+    Returns:
+        The registry, keyed by script name.
+    """
+    with _lock:
+        if _registry and not reload:
+            return _registry
+
+        root = Path(root) if root else DB_CRUD_DIR
+        if not root.is_dir():
+            raise SqlRegistryError(f"SQL script directory not found: {root}")
+
+        scripts = {}
+        for path in sorted(root.rglob("*.sql")):
+            name = _script_name(path, root)
+            scripts[name] = _parse_script(name, path)
+
+        _registry.clear()
+        _registry.update(scripts)
+        log_info(f"Loaded {len(_registry)} SQL scripts from {root}")
+        return _registry
+
+
+def get_script(name: str) -> SqlScript:
+    """Return the parsed script registered under name, loading the registry on first use."""
+    script = _registry.get(name)
+    if script is None:
+        if not _registry:
+            load_sql_registry()
+            script = _registry.get(name)
+        if script is None:
+            raise SqlRegistryError(f"Unknown SQL script '{name}'")
+    return script
+
+
+def check_params(script: SqlScript, params: Mapping | Sequence | None) -> None:
+    """
+    Verify that params can be bound to every placeholder of script.
+
+    Raises:
+        SqlRegistryError: if a named parameter is missing or the positional count is wrong.
+    """
+    if script.param_names:
+        if not isinstance(params, Mapping):
+            raise SqlRegistryError(f"SQL script '{script.name}' expects named parameters {list(script.param_names)}")
+        missing = [n for n in script.param_names if n not in params]
+        if missing:
+            raise SqlRegistryError(f"SQL script '{script.name}' is missing parameters {missing}")
+    elif script.positional_count:
+        if isinstance(params, Mapping) or params is None or len(params) != script.positional_count:
+            raise SqlRegistryError(f"SQL script '{script.name}' expects {script.positional_count} positional parameter(s)")
+    elif params:
+        raise SqlRegistryError(f"SQL script '{script.name}' takes no parameters")
+
+
+def get_sql(name: str, params: Mapping | Sequence | None = None) -> str:
+    """
+    Return the single statement of a registered script.
+
+    Args:
+        name: Script name relative to src/db_crud without the extension, e.g. "users/create_users".
+        params: If given, checked against the script's placeholders before returning.
+    """
+    script = get_script(name)
+    if params is not None:
+        check_params(script, params)
+    return script.sql
+
+
+def get_statements(name: str, params: Mapping | Sequence | None = None) -> tuple[str, ...]:
+    """Return every statement of a registered (possibly multi-statement) script."""
+    script = get_script(name)
+    if params is not None:
+        check_params(script, params)
+    return script.statements
@@ -0,0 +1,85 @@
+'''
+    File: tfidf.py
+    Version: 19 October 2026
+    Author: Colby Wirth
+    Description:
+        - TF-IDF vectors and cosine nearest neighbors for the "similar grants" batch job
+          (src/system_functions/compute_grant_similarities.py), on SciPy sparse matrices
+        - Terms come from the search tokenizer (src/utils/bm25_index.py), so stopwords match search
+        - Weights are sublinear tf (1 + log count) times smoothed idf (log((1 + n) / (1 + df)) + 1),
+          and every row is L2-normalized, which makes cosine similarity a plain dot product
+        - Terms in fewer than MIN_DF documents cannot link two grants and terms in more than
+          MAX_DF_RATIO of them link every grant, so both are left out of the vocabulary
+        - Neighbors are found CHUNK_ROWS rows at a time: each chunk's similarities to the whole corpus
+          are one sparse product, densified only for that chunk, so memory stays at
+          CHUNK_ROWS x documents floats
+'''
+
+from collections import Counter
+from typing import Iterator
+
+import numpy as np
+from scipy import sparse
+
+from src.utils.bm25_index import tokenize
+
+MIN_DF = 2
+MAX_DF_RATIO = 0.5
+CHUNK_ROWS = 512
+
+
+def tfidf_matrix(texts: list[str], min_df: int = MIN_DF, max_df_ratio: float = MAX_DF_RATIO) -> sparse.csr_matrix:
+    """One L2-normalized TF-IDF row per text (float32); a text with no kept term is an all-zero row."""
+    counts = [Counter(tokenize(text)) for text in texts]
+    df = Counter(term for doc in counts for term in doc)
+    n = len(texts)
+    max_df = max(min_df, max_df_ratio * n)
+    vocabulary = {term: i for i, term in enumerate(t for t, d in df.items() if min_df <= d <= max_df)}
+    if not vocabulary:
+        return sparse.csr_matrix((n, 0), dtype=np.float32)
+
+    rows, cols, values = [], [], []
+    for row, doc in enumerate(counts):
+        for term, count in doc.items():
+            col = vocabulary.get(term)
+            if col is not None:
+                rows.append(row)
+                cols.append(col)
+                values.append(1.0 + np.log(count))
+    idf = np.zeros(len(vocabulary), dtype=np.float32)
+    for term, col in vocabulary.items():
+        idf[col] = np.log((1.0 + n) / (1.0 + df[term])) + 1.0
+
+    matrix = sparse.csr_matrix(
+        (np.asarray(values, dtype=np.float32), (rows, cols)), shape=(n, len(vocabulary)), dtype=np.float32
+    )
+    matrix = matrix @ sparse.diags(idf)
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1.0
+    return sparse.csr_matrix(sparse.diags(1.0 / norms) @ matrix, dtype=np.float32)
+
+
+def top_k_neighbors(matrix: sparse.csr_matrix, k: int, chunk_rows: int = CHUNK_ROWS) -> Iterator[tuple[int, list[tuple[int, float]]]]:
+    """
+    For every row, the k other rows with the highest cosine similarity above zero, best first.
+
+    Yields:
+        (row, [(neighbor row, similarity), ...])
+    """
+    n = matrix.shape[0]
+    transposed = matrix.T.tocsc()
+    for start in range(0, n, chunk_rows):
+        end = min(start + chunk_rows, n)
+        scores = (matrix[start:end] @ transposed).toarray()
+        # a grant is not its own neighbor
+        scores[np.arange(end - start), np.arange(start, end)] = 0.0
+        if n - 1 > k:
+            candidates = np.argpartition(-scores, k, axis=1)[:, :k]
+        else:
+            candidates = np.tile(np.arange(n), (end - start, 1))
+        for offset, cols in enumerate(candidates):
+            row_scores = scores[offset, cols]
+            order = np.lexsort((cols, -row_scores))
+            yield start + offset, [
+                (int(cols[i]), float(row_scores[i])) for i in order if row_scores[i] > 0.0
+            ][:k]
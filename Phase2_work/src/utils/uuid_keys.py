@@ -0,0 +1,39 @@
+'''
+    File: uuid_keys.py
+    Version: 19 October 2026
+    Author: Colby Wirth
+    Description:
+        - Time-ordered UUID primary keys for the BINARY(16) id columns
+        - Keys are version 1 UUIDs stored with MySQL's swap flag: UUID_TO_BIN(id, 1) moves the
+          timestamp's high bits to the front, so keys created later sort later and InnoDB appends
+          new rows at the right edge of the clustered index instead of splitting pages at random
+        - Every UUID_TO_BIN/BIN_TO_UUID call in the project passes the swap flag; the helpers here
+          are the Python equivalents for code that binds raw 16-byte values
+        - new_uuid() uses a random node instead of the host's MAC address, so ids do not reveal
+          which machine created them
+'''
+
+import secrets
+import uuid
+
+# The multicast bit marks the node as random rather than a real MAC address (RFC 4122, 4.5)
+_NODE = secrets.randbits(48) | 0x010000000000
+
+
+def new_uuid() -> str:
+    """A new time-ordered UUID string, for ids created in Python before the INSERT."""
+    return str(uuid.uuid1(node=_NODE))
+
+
+def uuid_to_bin(value: str | uuid.UUID) -> bytes:
+    """Python equivalent of UUID_TO_BIN(value, 1)."""
+    raw = (value if isinstance(value, uuid.UUID) else uuid.UUID(value)).bytes
+    # time_low (0-3), time_mid (4-5), time_hi_and_version (6-7) -> time_hi, time_mid, time_low
+    return raw[6:8] + raw[4:6] + raw[0:4] + raw[8:]
+
+
+def bin_to_uuid(value: bytes) -> str:
+    """Python equivalent of BIN_TO_UUID(value, 1)."""
+    if len(value) != 16:
+        raise ValueError(f"expected 16 bytes, got {len(value)}")
+    return str(uuid.UUID(bytes=value[4:8] + value[2:4] + value[0:2] + value[8:]))
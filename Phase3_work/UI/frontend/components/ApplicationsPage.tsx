@@ -17,6 +17,7 @@ export function ApplicationsPage() {
   const [selectedGrantId, setSelectedGrantId] = useState('');
   const [creatingApp, setCreatingApp] = useState(false);
   const [createError, setCreateError] = useState<string | null>(null);
+  const [grantTitles, setGrantTitles] = useState<Record<string, string>>({});
   const userId = localStorage.getItem('user_id') || sessionStorage.getItem('user_id');
 
   useEffect(() => {
@@ -47,6 +48,28 @@ export function ApplicationsPage() {
     fetchApps();
   }, [userId, navigate]);
 
+  // grant titles for the table: one batch request for every grant in the list
+  useEffect(() => {
+    const grantIds = Array.from(new Set(applications.map((app) => app.grant_id))).slice(0, 100);
+    if (grantIds.length === 0) return;
+
+    fetch(`${API_BASE_URL}/api/public/grants/batch`, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify({ grant_ids: grantIds, fields: ['grant_title'] })
+    })
+      .then((res) => (res.ok ? res.json() : null))
+      .then((data) => {
+        if (!data) return;
+        const titles: Record<string, string> = {};
+        for (const grant of data.grants || []) {
+          titles[grant.grant_id] = grant.grant_title;
+        }
+        setGrantTitles(titles);
+      })
+      .catch((err) => console.error('Failed to fetch grant titles:', err));
+  }, [applications]);
+
   const fetchGrants = async () => {
     try {
       const res = await fetch(`${API_BASE_URL}/api/applications/grants`);
@@ -114,6 +137,7 @@ export function ApplicationsPage() {
     return (
       app.application_id.toLowerCase().includes(query) ||
       app.grant_id.toLowerCase().includes(query) ||
+      (grantTitles[app.grant_id.toLowerCase()] || '').toLowerCase().includes(query) ||
       app.status.toLowerCase().includes(query) ||
       app.application_date.toLowerCase().includes(query)
     );
@@ -185,7 +209,7 @@ export function ApplicationsPage() {
                 <thead>
                   <tr className="text-slate-700 dark:text-slate-300">
                     <th className="p-2">Application ID</th>
-                    <th className="p-2">Grant ID</th>
+                    <th className="p-2">Grant</th>
                     <th className="p-2">Status</th>
                     <th className="p-2">Date</th>
                   </tr>
@@ -194,7 +218,11 @@ export function ApplicationsPage() {
                   {filteredApplications.map((app) => (
                     <tr key={app.application_id} className="border-t dark:border-slate-700">
                       <td className="p-2 text-sm text-slate-700 dark:text-slate-200">{app.application_id}</td>
-                      <td className="p-2 text-sm text-slate-700 dark:text-slate-200">{app.grant_id}</td>
+                      <td className="p-2 text-sm text-slate-700 dark:text-slate-200">
+                        <Link to={`/grant/${app.grant_id}`} className="hover:underline">
+                          {grantTitles[app.grant_id.toLowerCase()] || app.grant_id}
+                        </Link>
+                      </td>
                       <td className="p-2 text-sm text-slate-700 dark:text-slate-200">{app.status}</td>
                       <td className="p-2 text-sm text-slate-700 dark:text-slate-200">{app.application_date}</td>
                     </tr>
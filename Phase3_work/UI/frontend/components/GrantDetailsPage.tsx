@@ -42,6 +42,7 @@ export function GrantDetailsPage() {
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
   const [isSubmitting, setIsSubmitting] = useState(false);
+  const [similar, setSimilar] = useState<Array<any>>([]);
 
   // Form State (removed applicant name/email - users track their own applications)
 
@@ -197,6 +198,12 @@ export function GrantDetailsPage() {
         setError("Failed to load grant");
       })
       .finally(() => setLoading(false));
+
+    // precomputed after each ingest; an empty list just hides the card
+    fetch(`${API_BASE_URL}/api/public/grant/${id}/similar`)
+      .then((r) => r.json())
+      .then((data) => setSimilar(data.similar || []))
+      .catch(() => setSimilar([]));
   }, [id]);
 
   if (loading) return <div className="p-6">Loading...</div>;
@@ -404,6 +411,28 @@ export function GrantDetailsPage() {
               </Card>
             );
           })()}
+
+          {similar.length > 0 && (
+            <Card className="dark:bg-slate-800 dark:border-slate-700">
+              <CardHeader>
+                <CardTitle className="dark:text-white">Similar Grants</CardTitle>
+              </CardHeader>
+              <CardContent className="space-y-2">
+                {similar.map((g) => (
+                  <Link
+                    key={g.grant_id}
+                    to={`/grant/${g.grant_id}`}
+                    className="block p-3 border rounded hover:bg-slate-50 dark:hover:bg-slate-900 dark:border-slate-700"
+                  >
+                    <div className="font-medium dark:text-white">{g.grant_title}</div>
+                    <div className="text-xs text-slate-500 mt-1">
+                      {g.provider}{g.date_closed && <> &middot; Deadline: {g.date_closed}</>}
+                    </div>
+                  </Link>
+                ))}
+              </CardContent>
+            </Card>
+          )}
         </div>
 
         {/* Right Column: Application Form */}
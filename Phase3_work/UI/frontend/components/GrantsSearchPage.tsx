@@ -11,22 +11,48 @@ import { Link } from "react-router-dom";
 
 const API_BASE_URL = "http://127.0.0.1:5000";
 
+// text with the server's [start, end) highlight offsets wrapped in <mark>
+function Highlighted({ text, ranges }: { text: string; ranges?: Array<[number, number]> }) {
+  if (!text || !ranges || ranges.length === 0) return <>{text}</>;
+  const parts: React.ReactNode[] = [];
+  let pos = 0;
+  ranges.forEach(([start, end], i) => {
+    if (start > pos) parts.push(text.slice(pos, start));
+    parts.push(<mark key={i} className="bg-yellow-200 dark:bg-yellow-700 rounded-sm">{text.slice(start, end)}</mark>);
+    pos = end;
+  });
+  parts.push(text.slice(pos));
+  return <>{parts}</>;
+}
+
 export function GrantsSearchPage() {
   const [query, setQuery] = useState("");
   const [researchField, setResearchField] = useState("");
   const [opportunityNum, setOpportunityNum] = useState(""); // <--- NEW STATE
   const [sortBy, setSortBy] = useState("title_asc");
+  // range filters: days until the deadline, and the smallest award_max_amount
+  const [closesWithin, setClosesWithin] = useState("");
+  const [minAward, setMinAward] = useState("");
   const [results, setResults] = useState<Array<any>>([]);
   const [page, setPage] = useState<number>(1);
   const [total, setTotal] = useState<number | null>(null);
+  // "1,000+" when the server only counted up to its cap
+  const [totalDisplay, setTotalDisplay] = useState<string | null>(null);
+  // cursors[i] fetches page i + 1; the server's next_cursor seeks past the last row shown
+  const [cursors, setCursors] = useState<Array<string | null>>([null]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  // research field counts over every match, fetched with the first page only
+  const [suggestions, setSuggestions] = useState<Array<{ text: string; kind: string }>>([]);
+  const [fieldFacets, setFieldFacets] = useState<Array<{ value: string | null; count: number }>>([]);
   const PAGE_SIZE = 10;
+  const [saveMessage, setSaveMessage] = useState<string | null>(null);
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState<string | null>(null);
   const [debugText, setDebugText] = useState<string | null>(null);
   const [statusCode, setStatusCode] = useState<number | null>(null);
 
   // Updated fetchResults to accept new params
-  const fetchResults = async (q = "", field = "", opNum = "", sort = "title_asc", p = 1) => {
+  const fetchResults = async (q = "", field = "", opNum = "", sort = "title_asc", p = 1, cursor: string | null = null) => {
     setError(null);
     setLoading(true);
     try {
@@ -36,7 +62,11 @@ export function GrantsSearchPage() {
       if (q) params.set("q", q);
       if (field) params.set("field", field);
       if (opNum) params.set("op_num", opNum); // <--- Add to URL params
+      if (closesWithin) params.set("closes_within", closesWithin);
+      if (minAward) params.set("award_max_gte", minAward);
       params.set("sort_by", sort);
+      if (cursor) params.set("cursor", cursor);
+      if (p === 1) params.set("facets", "research_field");
 
       const url = `${API_BASE_URL}/api/public/search_grants?${params.toString()}`;
       const res = await fetch(url);
@@ -63,7 +93,10 @@ export function GrantsSearchPage() {
 
       setResults(data.grants || []);
       setTotal(typeof data.total === "number" ? data.total : null);
-      setPage(typeof data.page === "number" ? data.page : p);
+      setTotalDisplay(typeof data.total_display === "string" ? data.total_display : null);
+      setPage(p);
+      setNextCursor(data.next_cursor || null);
+      if (p === 1) setFieldFacets(data.facets?.research_field || []);
     } catch (err) {
       console.error(err);
       setError("Search failed");
@@ -75,19 +108,83 @@ export function GrantsSearchPage() {
 
   const doSearch = (e?: React.FormEvent) => {
     e?.preventDefault();
+    setCursors([null]);
     fetchResults(query.trim(), researchField.trim(), opportunityNum.trim(), sortBy, 1);
   };
 
   const handleSortChange = (e: React.ChangeEvent<HTMLSelectElement>) => {
     const newSort = e.target.value;
     setSortBy(newSort);
+    setCursors([null]);
     fetchResults(query.trim(), researchField.trim(), opportunityNum.trim(), newSort, 1);
   };
 
+  const goToNextPage = () => {
+    setCursors((prev) => [...prev.slice(0, page), nextCursor]);
+    fetchResults(query.trim(), researchField.trim(), opportunityNum.trim(), sortBy, page + 1, nextCursor);
+  };
+
+  const goToPreviousPage = () => {
+    fetchResults(query.trim(), researchField.trim(), opportunityNum.trim(), sortBy, page - 1, cursors[page - 2] ?? null);
+  };
+
+  // saved searches are matched against new and changed grants after each ingest
+  const saveSearch = async () => {
+    const token = sessionStorage.getItem("access_token");
+    if (!token) {
+      setSaveMessage("Log in to save searches");
+      return;
+    }
+    const name = window.prompt("Name this search", query.trim() || researchField.trim() || "Saved search");
+    if (!name) return;
+    const savedQuery: Record<string, string> = {};
+    if (query.trim()) savedQuery.q = query.trim();
+    if (researchField.trim()) savedQuery.field = researchField.trim();
+    if (opportunityNum.trim()) savedQuery.op_num = opportunityNum.trim();
+    if (closesWithin) savedQuery.closes_within = closesWithin;
+    if (minAward) savedQuery.award_max_gte = minAward;
+    try {
+      const res = await fetch(`${API_BASE_URL}/api/user/saved-searches`, {
+        method: "POST",
+        headers: { "Authorization": `Bearer ${token}`, "Content-Type": "application/json" },
+        body: JSON.stringify({ name, query: savedQuery }),
+      });
+      const data = await res.json();
+      setSaveMessage(res.ok ? `Saved "${name}": new matches will appear in your inbox` : data.error || "Could not save search");
+    } catch (err) {
+      setSaveMessage("Could not save search");
+    }
+  };
+
+  const filterByField = (field: string) => {
+    setResearchField(field);
+    setCursors([null]);
+    fetchResults(query.trim(), field, opportunityNum.trim(), sortBy, 1);
+  };
+
   useEffect(() => {
     fetchResults("", "", "", "title_asc", 1);
   }, []);
 
+  // typeahead: suggestions come from the API's in-memory index, debounced per keystroke
+  useEffect(() => {
+    const prefix = query.trim();
+    if (prefix.length < 2) {
+      setSuggestions([]);
+      return;
+    }
+    const timer = setTimeout(async () => {
+      try {
+        const params = new URLSearchParams({ q: prefix, k: "8", kind: "title" });
+        const res = await fetch(`${API_BASE_URL}/api/public/suggest?${params.toString()}`);
+        if (res.ok) setSuggestions((await res.json()).suggestions || []);
+      } catch {
+        setSuggestions([]);
+      }
+    }, 120);
+    return () => clearTimeout(timer);
+  }, [query]);
+
   return (
     <div className="min-h-screen flex flex-col bg-slate-50 dark:bg-slate-950">
       <nav className="border-b bg-white/80 dark:bg-slate-900/80 backdrop-blur-sm sticky top-0 z-50 dark:border-slate-800">
@@ -121,7 +218,13 @@ export function GrantsSearchPage() {
             placeholder="Search title/desc..."
             value={query}
             onChange={(e) => setQuery(e.target.value)}
+            list="grant-suggestions"
           />
+          <datalist id="grant-suggestions">
+            {suggestions.map((s) => (
+              <option key={`${s.kind}:${s.text}`} value={s.text} />
+            ))}
+          </datalist>
           
           {/* Opportunity Number - Fixed width on Desktop */}
           <input
@@ -139,12 +242,35 @@ export function GrantsSearchPage() {
             onChange={(e) => setResearchField(e.target.value)}
           />
           
+          {/* Range filters - applied on Search */}
+          <select
+            className="w-full md:w-auto shrink-0 p-2 rounded border dark:bg-slate-900 dark:border-slate-700 cursor-pointer"
+            value={closesWithin}
+            onChange={(e) => setClosesWithin(e.target.value)}
+          >
+            <option value="">Any deadline</option>
+            <option value="7">Closes in 7 days</option>
+            <option value="30">Closes in 30 days</option>
+            <option value="90">Closes in 90 days</option>
+          </select>
+          <select
+            className="w-full md:w-auto shrink-0 p-2 rounded border dark:bg-slate-900 dark:border-slate-700 cursor-pointer"
+            value={minAward}
+            onChange={(e) => setMinAward(e.target.value)}
+          >
+            <option value="">Any award</option>
+            <option value="100000">Award ≥ $100k</option>
+            <option value="500000">Award ≥ $500k</option>
+            <option value="1000000">Award ≥ $1M</option>
+          </select>
+
           {/* Sort Dropdown - Auto width */}
           <select
             className="w-full md:w-auto shrink-0 p-2 rounded border dark:bg-slate-900 dark:border-slate-700 cursor-pointer"
             value={sortBy}
             onChange={handleSortChange}
           >
+            <option value="relevance">Relevance</option>
             <option value="title_asc">Title (A-Z)</option>
             <option value="title_desc">Title (Z-A)</option>
             <option value="posted_date_desc">Newest</option>
@@ -156,9 +282,31 @@ export function GrantsSearchPage() {
           <button className="px-6 py-2 bg-slate-700 text-white rounded hover:bg-slate-600 md:w-auto w-full" disabled={loading}>
             {loading ? "..." : "Search"}
           </button>
+          <button
+            type="button"
+            className="px-4 py-2 border rounded hover:bg-slate-100 dark:border-slate-700 dark:text-white dark:hover:bg-slate-800 md:w-auto w-full"
+            onClick={saveSearch}
+          >
+            Save search
+          </button>
         </form>
 
         {error && <div className="text-red-500 mb-4">{error}</div>}
+        {saveMessage && <div className="text-sm text-slate-600 dark:text-slate-300 mb-4">{saveMessage}</div>}
+
+        {fieldFacets.length > 1 && (
+          <div className="flex flex-wrap gap-2 mb-4">
+            {fieldFacets.filter((f) => f.value).map((f) => (
+              <button
+                key={f.value}
+                className="text-xs bg-blue-100 text-blue-800 px-2 py-1 rounded dark:bg-blue-900 dark:text-blue-200 hover:bg-blue-200 dark:hover:bg-blue-800"
+                onClick={() => filterByField(f.value as string)}
+              >
+                {f.value} ({f.count.toLocaleString()})
+              </button>
+            ))}
+          </div>
+        )}
 
         <div className="grid gap-3">
           {results.length === 0 ? (
@@ -172,7 +320,9 @@ export function GrantsSearchPage() {
             results.map((g) => (
               <Link key={g.grant_id} to={`/grant/${g.grant_id}`} className="block p-4 border rounded hover:bg-slate-50 dark:hover:bg-slate-800 transition-colors">
                 <div className="flex justify-between items-start">
-                    <div className="font-medium dark:text-white text-lg">{g.grant_title}</div>
+                    <div className="font-medium dark:text-white text-lg">
+                      <Highlighted text={g.grant_title} ranges={g.title_highlights} />
+                    </div>
                     <div className="flex flex-col items-end gap-1">
                          {/* Display Op# if matched? Optional, but helpful context */}
                          {g.opportunity_number && (
@@ -185,6 +335,11 @@ export function GrantsSearchPage() {
                         )}
                     </div>
                 </div>
+                {g.snippet && (
+                  <div className="text-sm text-slate-700 dark:text-slate-300 mt-1">
+                    <Highlighted text={g.snippet} ranges={g.snippet_highlights} />
+                  </div>
+                )}
                 <div className="text-sm text-slate-600 dark:text-slate-400 mt-1 flex gap-2 items-center flex-wrap">
                    <span className="font-semibold">{g.provider}</span> 
                    <span className="text-slate-300 dark:text-slate-600">•</span>
@@ -198,25 +353,25 @@ export function GrantsSearchPage() {
         </div>
 
         {/* Pagination controls */}
-        {total !== null && total > PAGE_SIZE && (
+        {(page > 1 || nextCursor !== null) && (
           <div className="flex items-center justify-between mt-6 pt-4 border-t dark:border-slate-800">
             <div className="text-sm text-slate-600 dark:text-slate-400">
-                Page {page} of {Math.ceil(total / PAGE_SIZE)} 
+                Page {page}{total !== null && !totalDisplay?.endsWith("+") && <> of {Math.ceil(total / PAGE_SIZE)}</>} 
                 <span className="mx-2 text-slate-300">|</span> 
-                {total} results
+                {totalDisplay ?? "Unknown number of"} results
             </div>
             <div className="flex gap-2">
               <button 
                 className="px-4 py-2 border rounded hover:bg-slate-100 dark:hover:bg-slate-800 disabled:opacity-50 disabled:hover:bg-transparent transition-colors" 
-                onClick={() => fetchResults(query.trim(), researchField.trim(), opportunityNum.trim(), sortBy, page - 1)} 
+                onClick={goToPreviousPage} 
                 disabled={page <= 1 || loading}
               >
                 Previous
               </button>
               <button 
                 className="px-4 py-2 border rounded hover:bg-slate-100 dark:hover:bg-slate-800 disabled:opacity-50 disabled:hover:bg-transparent transition-colors" 
-                onClick={() => fetchResults(query.trim(), researchField.trim(), opportunityNum.trim(), sortBy, page + 1)} 
-                disabled={page * PAGE_SIZE >= total || loading}
+                onClick={goToNextPage} 
+                disabled={!nextCursor || loading}
               >
                 Next
               </button>
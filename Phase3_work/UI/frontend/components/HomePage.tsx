@@ -50,8 +50,28 @@ interface Application {
 
 interface ApplicationUI extends Application {
   grant_name?: string;
+  // from GET /api/user/dashboard
+  grant_date_closed?: string | null;
+  task_count?: number;
+  completed_percent?: number | null;
+  next_deadline?: string | null;
+  document_count?: number;
 }
 
+interface FeedGrant {
+  grant_id: string;
+  grant_title: string;
+  provider: string | null;
+  date_closed: string | null;
+  reasons: string[];
+}
+
+const REASON_LABELS: Record<string, string> = {
+  research_field: "Your research fields",
+  history: "Like grants you applied to",
+  institution: "Your institution is eligible",
+};
+
 // ----------------------
 // HomePage Component
 // ----------------------
@@ -62,10 +82,11 @@ export function HomePage() {
   const [editingApp, setEditingApp] = useState<ApplicationUI | null>(null);
   const [status, setStatus] = useState<string>("pending");
   const [filterStatus, setFilterStatus] = useState<string>("all");
+  const [feed, setFeed] = useState<FeedGrant[]>([]);
 
   const userId = sessionStorage.getItem("user_id") || localStorage.getItem("user_id");
 
-  // Fetch user's applications on mount
+  // Fetch user's applications with their task and document counts on mount (one request)
   useEffect(() => {
     const fetchApplications = async () => {
       try {
@@ -75,7 +96,7 @@ export function HomePage() {
           return;
         }
 
-        const response = await fetch("http://127.0.0.1:5000/api/user/applications", {
+        const response = await fetch("http://127.0.0.1:5000/api/user/dashboard", {
           method: "GET",
           headers: {
             "Authorization": `Bearer ${token}`,
@@ -102,6 +123,27 @@ export function HomePage() {
     fetchApplications();
   }, [navigate]);
 
+  // Recommended grants: precomputed per user after each ingest, one indexed read per page
+  useEffect(() => {
+    const fetchFeed = async () => {
+      const token = sessionStorage.getItem("access_token");
+      if (!token) return;
+      try {
+        const response = await fetch("http://127.0.0.1:5000/api/user/feed?limit=5", {
+          headers: { "Authorization": `Bearer ${token}` },
+        });
+        if (response.ok) {
+          const data = await response.json();
+          setFeed(data.grants);
+        }
+      } catch (error) {
+        console.error("Error fetching recommended grants:", error);
+      }
+    };
+
+    fetchFeed();
+  }, []);
+
   const handleLogout = () => {
     sessionStorage.removeItem("user_id");
     sessionStorage.removeItem("access_token");
@@ -300,13 +342,16 @@ export function HomePage() {
                 <TableHead className="dark:text-slate-400">Grant Name</TableHead>
                 <TableHead className="dark:text-slate-400">Date Applied</TableHead>
                 <TableHead className="dark:text-slate-400">Status</TableHead>
+                <TableHead className="dark:text-slate-400">Tasks</TableHead>
+                <TableHead className="dark:text-slate-400">Next Deadline</TableHead>
+                <TableHead className="dark:text-slate-400">Documents</TableHead>
                 <TableHead className="text-right dark:text-slate-400">Actions</TableHead>
               </TableRow>
             </TableHeader>
             <TableBody>
               {filteredApplications.length === 0 ? (
                 <TableRow>
-                  <TableCell colSpan={4} className="text-center py-8 text-muted-foreground dark:text-slate-500">
+                  <TableCell colSpan={7} className="text-center py-8 text-muted-foreground dark:text-slate-500">
                     No applications found.
                   </TableCell>
                 </TableRow>
@@ -320,6 +365,11 @@ export function HomePage() {
                         {app.status.replace('_', ' ').toUpperCase()}
                       </Badge>
                     </TableCell>
+                    <TableCell className="dark:text-slate-300 whitespace-nowrap">
+                      {app.task_count ? `${app.completed_percent}% of ${app.task_count}` : "—"}
+                    </TableCell>
+                    <TableCell className="dark:text-slate-300 whitespace-nowrap">{app.next_deadline ?? "—"}</TableCell>
+                    <TableCell className="dark:text-slate-300 whitespace-nowrap">{app.document_count ?? 0}</TableCell>
                     <TableCell className="text-right whitespace-nowrap">
                       <Button variant="ghost" size="icon" onClick={() => handleViewDetails(app.application_id)} title={app.submission_status === "started" ? "Edit application" : "View application"}>
                         <Eye className="h-4 w-4 text-slate-500" />
@@ -338,6 +388,30 @@ export function HomePage() {
           </Table>
         </CardContent>
       </Card>
+
+      {feed.length > 0 && (
+        <Card className="mt-6 dark:bg-slate-800 dark:border-slate-700">
+          <CardHeader>
+            <CardTitle className="dark:text-white">Recommended for You</CardTitle>
+            <CardDescription className="dark:text-slate-400">Open grants matching your research fields, institution and applications.</CardDescription>
+          </CardHeader>
+          <CardContent className="grid gap-3">
+            {feed.map((grant) => (
+              <Link key={grant.grant_id} to={`/grant/${grant.grant_id}`} className="block p-3 border rounded hover:bg-slate-50 dark:border-slate-700 dark:hover:bg-slate-700 transition-colors">
+                <div className="font-medium dark:text-white">{grant.grant_title}</div>
+                <div className="text-sm text-slate-500 dark:text-slate-400">
+                  {grant.provider}{grant.date_closed ? ` · Closes ${grant.date_closed}` : ""}
+                </div>
+                <div className="flex flex-wrap gap-1 mt-1">
+                  {grant.reasons.map((reason) => (
+                    <Badge key={reason} variant="secondary">{REASON_LABELS[reason] ?? reason}</Badge>
+                  ))}
+                </div>
+              </Link>
+            ))}
+          </CardContent>
+        </Card>
+      )}
     </div>
 
 
@@ -45,6 +45,7 @@ from src.user_functions.users_operations import (
 )
 from src.user_functions.view_based_operations import Role
 from src.utils.logging_utils import log_info, log_error
+from src.utils.sql_registry import load_sql_registry
 
 
 DB_NAME = os.getenv("DB_NAME", "GrantGuruDB")
@@ -72,6 +73,9 @@ def create_app():
     app = Flask(__name__)
     app.config["JWT_SECRET_KEY"] = JWT_SECRET_KEY
 
+    # parse every src/db_crud script once so request handlers never read SQL from disk
+    load_sql_registry()
+
     CORS(
         app,
         supports_credentials=True,
@@ -83,14 +87,26 @@ def create_app():
     )
     JWTManager(app)
 
+    # gzip/brotli for large responses (see api/compression.py)
+    from api import compression
+    compression.init_app(app)
+
     from api.auth import auth_bp
     from api.public import public_bp
     from api.user import user_bp
     from api.applications import applications_bp
+    from api.admin import admin_bp
 
     app.register_blueprint(auth_bp, url_prefix="/api/auth")
     app.register_blueprint(public_bp, url_prefix="/api/public")
     app.register_blueprint(user_bp, url_prefix="/api/user")
     app.register_blueprint(applications_bp, url_prefix="/api/applications")
+    app.register_blueprint(admin_bp, url_prefix="/api/admin")
+
+    # build the in-memory grant search and suggest indexes in the background
+    # (see api/search_index.py and api/suggest_index.py)
+    from api import search_index, suggest_index
+    search_index.start()
+    suggest_index.start()
 
     return app
@@ -0,0 +1,6 @@
+# api/admin/__init__.py
+from flask import Blueprint
+
+admin_bp = Blueprint('admin', __name__)
+
+from . import routes_admin
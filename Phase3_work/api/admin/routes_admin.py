@@ -0,0 +1,86 @@
+# routes_admin.py
+
+"""
+
+    Version: 19 October 2026
+    Author: Colby Wirth
+
+    Description:
+        Operator-only routes.  A caller is an admin when the user id in their JWT is listed in
+        the GG_ADMIN_USER_IDS environment variable (comma separated).
+
+        Routes:
+            - GET  /query-stats: Top-N query fingerprints by total time (pt-query-digest style).
+                Query string: top (default 10, max 100), sort_by (total_ms, avg_ms, max_ms,
+                p95_ms, count, rows, slow).  Also reports the prepared statement cache and the
+                in-memory search index (size, tombstones, change log position) and the
+                hit rates of the named caches (api/caching.py), and how many requests the named
+                single flights coalesced, timed out or shared across workers, and how long
+                their waiters waited (api/single_flight.py).
+            - POST /query-stats/reset: Clear the collected statistics.
+
+"""
+import os
+from functools import wraps
+
+from flask import jsonify, request
+from flask_jwt_extended import jwt_required, get_jwt_identity
+
+from api import search_index, suggest_index
+from api.caching import CACHES
+from api.single_flight import FLIGHTS
+from api.query_stats import query_stats
+from src.utils.prepared_statements import statement_cache
+from . import admin_bp
+
+ADMIN_USER_IDS = {uid.strip().lower() for uid in os.getenv("GG_ADMIN_USER_IDS", "").split(",") if uid.strip()}
+
+SORT_KEYS = ("total_ms", "avg_ms", "max_ms", "p95_ms", "count", "rows", "slow")
+MAX_TOP = 100
+
+
+def admin_required(fn):
+    """Reject callers whose JWT identity is not an admin."""
+    @wraps(fn)
+    @jwt_required()
+    def wrapper(*args, **kwargs):
+        if str(get_jwt_identity()).lower() not in ADMIN_USER_IDS:
+            return jsonify({"error": "Admin access required"}), 403
+        return fn(*args, **kwargs)
+    return wrapper
+
+
+@admin_bp.route("/query-stats", methods=["GET"])
+@admin_required
+def get_query_stats():
+    """Return the statements that cost the most time since start-up (or the last reset)."""
+    sort_by = request.args.get("sort_by", "total_ms")
+    if sort_by not in SORT_KEYS:
+        return jsonify({"error": f"Invalid sort_by. Must be one of: {', '.join(SORT_KEYS)}"}), 400
+
+    try:
+        top = int(request.args.get("top", "10"))
+    except ValueError:
+        return jsonify({"error": "top must be an integer"}), 400
+    top = max(1, min(top, MAX_TOP))
+
+    return jsonify({
+        "summary": query_stats.summary(),
+        "prepared_statements": statement_cache.stats(),
+        "search_index": search_index.status(),
+        "suggest_index": suggest_index.status(),
+        "caches": {name: cache.stats() for name, cache in CACHES.items()},
+        "single_flight": {name: flight.stats() for name, flight in FLIGHTS.items()},
+        "queries": query_stats.top(top, sort_by),
+    }), 200
+
+
+@admin_bp.route("/query-stats/reset", methods=["POST"])
+@admin_required
+def reset_query_stats():
+    """Start a new measurement window."""
+    query_stats.reset()
+    statement_cache.reset_stats()
+    for flight in FLIGHTS.values():
+        flight.reset_stats()
+    return jsonify({"message": "Query statistics reset"}), 200
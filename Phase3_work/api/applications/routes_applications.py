@@ -5,7 +5,8 @@ Provides endpoints for working with Application entities.
 
 Endpoints:
 - GET /user/<user_id> : Return all applications for a given user_id
-- GET /grants : Return all available grants
+- GET /grants : Return available grants, 100 per page in grant_id order; pass the
+  response's next_cursor back as ?cursor= for the next page
 - POST /create : Create a new application
 
 Note: Authentication/session management is out-of-scope for this patch.
@@ -17,10 +18,13 @@ from datetime import datetime
 import re
 
 from flask import request, jsonify
-from mysql.connector import connect, Error as MySQLError
+from mysql.connector import Error as MySQLError
+from api.db import get_connection
+from api.pagination import CursorError, decode_cursor, encode_cursor
+from src.user_functions.view_based_operations import Role
 
 from . import applications_bp
-from api import DB_NAME, HOST, MYSQL_USER, MYSQL_PASS, PHASE2_ROOT
+from api import PHASE2_ROOT
 
 # Attempt a dynamic import of the Phase2 application operations module so static analyzers
 # do not complain about a non-resolvable 'src...' path while still allowing runtime use.
@@ -65,7 +69,7 @@ def get_applications_for_user(user_id: str):
         return jsonify({"error": "Invalid user_id format"}), 400
 
     try:
-        with connect(host=HOST, user=MYSQL_USER, password=MYSQL_PASS, database=DB_NAME) as conn:
+        with get_connection() as conn:
             with conn.cursor() as cursor:
                 result = read_applications_by_user(None, user_id, user_id, cursor)
 
@@ -93,18 +97,44 @@ def get_applications_for_user(user_id: str):
 
 @applications_bp.route("/grants", methods=["GET"])
 def get_grants():
-    """Fetch all grants from the database."""
+    """Fetch a page of grants from the database."""
+    after_id = None
+    if request.args.get("cursor"):
+        try:
+            after_id = decode_cursor(request.args["cursor"], s="grant_id").get("k")
+        except CursorError as e:
+            return jsonify({"error": f"Invalid cursor: {e}"}), 400
+        if not isinstance(after_id, str):
+            return jsonify({"error": "Invalid cursor: Malformed cursor"}), 400
+
     try:
-        with connect(host=HOST, user=MYSQL_USER, password=MYSQL_PASS, database=DB_NAME) as conn:
+        with get_connection() as conn:
             with conn.cursor() as cursor:
-                # Get grant_id (UUID binary) and program_title
-                cursor.execute("""
-                    SELECT BIN_TO_UUID(grant_id) AS grant_id, program_title
-                    FROM grants
-                    LIMIT 100
-                """)
+                # Grants has no program_title column; the grant title is returned under that key.
+                # Ordering by the primary key lets the LIMIT stop after 100 index entries, and
+                # the cursor starts the next page with a seek on the same key.
+                if after_id is None:
+                    cursor.execute("""
+                        SELECT BIN_TO_UUID(grant_id, 1) AS grant_id, grant_title AS program_title
+                        FROM Grants
+                        ORDER BY grant_id
+                        LIMIT 101
+                    """)
+                else:
+                    cursor.execute("""
+                        SELECT BIN_TO_UUID(grant_id, 1) AS grant_id, grant_title AS program_title
+                        FROM Grants
+                        WHERE grant_id > UUID_TO_BIN(%s, 1)
+                        ORDER BY grant_id
+                        LIMIT 101
+                    """, (after_id,))
                 rows = cursor.fetchall()
 
+        next_cursor = None
+        if len(rows) > 100:
+            rows = rows[:100]
+            next_cursor = encode_cursor(s="grant_id", k=rows[-1][0])
+
         grants = []
         for row in rows:
             grants.append({
@@ -112,7 +142,7 @@ def get_grants():
                 "program_title": row[1] if isinstance(row, tuple) else row.get("program_title")
             })
 
-        return jsonify({"grants": grants}), 200
+        return jsonify({"grants": grants, "next_cursor": next_cursor}), 200
 
     except MySQLError as e:
         return jsonify({"error": f"MySQL error: {str(e)}"}), 500
@@ -157,14 +187,14 @@ def create_new_application():
         return jsonify({"error": "Invalid status value"}), 400
 
     try:
-        with connect(host=HOST, user=MYSQL_USER, password=MYSQL_PASS, database=DB_NAME) as conn:
+        with get_connection() as conn:
             with conn.cursor() as cursor:
-                result = create_application(None, user_id, user_id, cursor, grant_id, status, application_date)
+                result = create_application(Role.USER, user_id, user_id, cursor, grant_id, status, application_date)
 
         if isinstance(result, (ApplicationOperationError, MySQLError)):
             return jsonify({"error": str(result)}), 500
 
-        conn.commit()
+        # a single INSERT: the pool's autocommit has already committed it
         return jsonify({"message": "Application created successfully"}), 201
 
     except MySQLError as e:
@@ -22,7 +22,8 @@
 from flask import request, jsonify
 from flask_jwt_extended import create_access_token
 from werkzeug.security import generate_password_hash, check_password_hash
-from mysql.connector import connect, Error as MySQLError
+from mysql.connector import Error as MySQLError
+from api.db import get_connection
 import re
 
 from . import auth_bp
@@ -47,7 +48,7 @@ def signup():
     - 409: JSON with 'error' if email already exists
     - 500: JSON with 'error' for other MySQL errors
     """
-    from api import create_user_entity, UserOperationError, PHASE2_ROOT, DB_NAME, HOST, MYSQL_USER, MYSQL_PASS
+    from api import create_user_entity, UserOperationError, PHASE2_ROOT
 
     data = request.get_json()
     if not data:
@@ -98,7 +99,7 @@ def signup():
     conn = None
     cursor = None
     try:
-        conn = connect(host=HOST, user=MYSQL_USER, password=MYSQL_PASS, database=DB_NAME)
+        conn = get_connection()
         cursor = conn.cursor()
 
         new_user_id = create_user_entity(cursor, user_info, PHASE2_ROOT)
@@ -146,7 +147,7 @@ def signin():
     - 500: JSON with 'error' for MySQL or unexpected errors
     """
 
-    from api import get_password_hashed, UserOperationError, PHASE2_ROOT, DB_NAME, HOST, MYSQL_USER, MYSQL_PASS, log_error
+    from api import get_password_hashed, UserOperationError, PHASE2_ROOT, log_error
 
     data = request.get_json()
     if not data:
@@ -170,7 +171,7 @@ def signin():
         return jsonify({"error": "Invalid email format"}), 400
 
     try:
-        conn = connect(host=HOST, user=MYSQL_USER, password=MYSQL_PASS, database=DB_NAME)
+        conn = get_connection()
         cursor = conn.cursor()
 
         result = get_password_hashed(cursor, email, PHASE2_ROOT)
@@ -0,0 +1,257 @@
+'''
+    File: api/caching.py
+
+    Author: Colby Wirth
+
+    Version: 19 October 2026
+
+    Description:
+        In-process caches for values derived from Grants.
+
+        - LRUTTLCache: a thread-safe mapping with a size bound (least recently used entries are
+          evicted first) and a time-to-live per entry.  Entries may carry a size in bytes; a
+          cache given max_bytes evicts until their total fits.  Named caches register in
+          CACHES so GET /api/admin/query-stats can report their sizes and hit rates.
+        - IngestGeneration: the grant data generation, i.e. the newest GrantChangeLog
+          change_id.  Every insert, update or delete of a grant (insert_cleaned_grant,
+          delete_old_grants, manual edits) moves it through the triggers on Grants, so cache
+          keys that include it are invalidated by ingest without any explicit purge; entries
+          for older generations simply stop being hit and age out of the LRU.  It is re-read
+          at most every GG_GENERATION_TTL seconds, so a new grant can take that long to show
+          up in cached values.  On a database without GrantChangeLog
+          (db_migration/add_grant_change_log.sql not run) it is None, and callers should not
+          cache.
+        - cached_response(): serves a GET route's 200 JSON responses from a cache keyed by
+          the generation, the path and the normalized query string.  Responses carry
+          X-Cache: HIT or MISS, a strong ETag and Cache-Control; a repeat request with a
+          matching If-None-Match is answered 304 Not Modified, with no body and, on a cache
+          hit, no query.  Concurrent misses of the same key are coalesced
+          (api/single_flight.py): one request runs the route and the others get its response.
+
+    Configuration (environment):
+        GG_GENERATION_TTL  seconds a generation read is reused (default 5)
+        GG_PUBLIC_MAX_AGE  max-age of cached_response() routes, in seconds (default 0: browsers
+                           revalidate every time, which costs a 304)
+'''
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+
+from flask import current_app, request
+from mysql.connector import Error as MySQLError, errorcode  # type: ignore
+
+from api.single_flight import public_flight
+from src.utils.sql_registry import get_sql
+
+GENERATION_TTL = float(os.getenv("GG_GENERATION_TTL", "5"))
+
+# cached_response() routes may be stored, but are revalidated with their ETag before each reuse
+CACHE_CONTROL = f"public, max-age={int(os.getenv('GG_PUBLIC_MAX_AGE', '0'))}, must-revalidate"
+
+_MISSING = object()
+
+# name -> cache, for the admin statistics
+CACHES: dict[str, "LRUTTLCache"] = {}
+
+
+class LRUTTLCache:
+    """Bounded mapping whose entries expire ttl seconds after they were stored."""
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl: float = 300.0,
+        name: str | None = None,
+        max_bytes: int | None = None,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        # key -> (expires, value, size in bytes)
+        self._entries: OrderedDict = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        if name:
+            CACHES[name] = self
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is not _MISSING:
+                expires, value, size = entry
+                if expires > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+                self._bytes -= size
+            self.misses += 1
+            return default
+
+    def set(self, key, value, size: int = 0) -> None:
+        """Store value; size is what it counts against max_bytes.  Values larger than max_bytes are not stored."""
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[2]
+            self._entries[key] = (time.monotonic() + self.ttl, value, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None and self._bytes > self.max_bytes
+            ):
+                _, (_, _, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "ttl_s": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+            }
+
+
+class IngestGeneration:
+    """The GrantChangeLog position, re-read from MySQL at most every ttl seconds."""
+
+    def __init__(self, ttl: float = GENERATION_TTL):
+        self.ttl = ttl
+        self._value: int | None = None
+        self._read_at = float("-inf")
+        self._lock = threading.Lock()
+
+    def current(self, conn=None) -> int | None:
+        """The generation; without conn a pooled connection is checked out only when it is re-read."""
+        with self._lock:
+            if time.monotonic() - self._read_at < self.ttl:
+                return self._value
+        if conn is None:
+            from api.db import get_connection
+
+            with get_connection() as own_conn:
+                return self.current(own_conn)
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute(get_sql("grants/select_grant_change_log_position"))
+                value = cursor.fetchone()[0]
+        except MySQLError as e:
+            if e.errno != errorcode.ER_NO_SUCH_TABLE:
+                raise
+            value = None
+        with self._lock:
+            self._value, self._read_at = value, time.monotonic()
+        return value
+
+
+ingest_generation = IngestGeneration()
+
+
+def normalized_args(casefold: tuple[str, ...] = ()) -> tuple:
+    """
+    The query string as a sorted tuple of (name, value) pairs.
+
+    Parameters named in casefold are lower-cased with their whitespace squeezed, for filters
+    MySQL compares case-insensitively; everything else (cursor tokens) is kept as sent.
+    """
+    items = []
+    for name, value in request.args.items(multi=True):
+        if name in casefold:
+            value = " ".join(value.lower().split())
+        items.append((name, value))
+    return tuple(sorted(items))
+
+
+def _etag(body: bytes) -> str:
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+def _held_variant(etag: str) -> str | None:
+    """The variant of etag (in any encoding api/compression.py may have sent) named by If-None-Match."""
+    if_none_match = request.if_none_match
+    if not if_none_match:
+        return None
+    for variant in (etag, f"{etag}-br", f"{etag}-gzip"):
+        if if_none_match.contains(variant):
+            return variant
+    return None
+
+
+def _conditional(body: bytes, etag: str, cache_status: str | None):
+    """A 200 with body, or a bodiless 304 when the client already holds this representation."""
+    held = _held_variant(etag)
+    if held is not None:
+        response = current_app.response_class(status=304)
+        response.set_etag(held)
+    else:
+        response = current_app.response_class(body, mimetype="application/json")
+        response.set_etag(etag)
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    if cache_status:
+        response.headers["X-Cache"] = cache_status
+    return response
+
+
+def cached_response(cache: LRUTTLCache, casefold: tuple[str, ...] = ()):
+    """
+    Serve a GET route's 200 JSON responses from cache until the grant data generation changes.
+
+    Every 200 gets a strong ETag (a hash of its body), and a request whose If-None-Match holds
+    it gets a 304 without a body; when the response is cached this needs no database work.
+    Concurrent misses for the same key run the route once (api/single_flight.py).
+    """
+    def decorator(fn):
+        def render(key, args, kwargs) -> tuple[int, bytes, str]:
+            response = current_app.make_response(fn(*args, **kwargs))
+            body = response.get_data()
+            if key is not None and response.status_code == 200 and response.mimetype == "application/json":
+                # stored before the flight ends, so a request arriving after it finds the cache
+                cache.set(key, (body, _etag(body)), size=len(body))
+            return response.status_code, body, response.mimetype
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            try:
+                generation = ingest_generation.current()
+            except MySQLError:
+                generation = None
+
+            key = None
+            if generation is not None:
+                key = (generation, request.path, normalized_args(casefold))
+                entry = cache.get(key)
+                if entry is not None:
+                    body, etag = entry
+                    return _conditional(body, etag, "HIT")
+                status, body, mimetype = public_flight.do(key, lambda: render(key, args, kwargs))
+            else:
+                status, body, mimetype = render(None, args, kwargs)
+
+            if status != 200 or mimetype != "application/json":
+                return current_app.response_class(body, status=status, mimetype=mimetype)
+            return _conditional(body, _etag(body), "MISS" if key is not None else None)
+        return wrapper
+    return decorator
@@ -0,0 +1,83 @@
+'''
+    File: api/compression.py
+
+    Author: Colby Wirth
+
+    Version: 19 October 2026
+
+    Description:
+        Response compression for the API, installed by create_app() with init_app().
+
+        - 200 responses of a compressible type (JSON, text) of at least GG_COMPRESS_MIN_BYTES are
+          sent with Content-Encoding br when the client accepts it and the brotli package is
+          installed, otherwise gzip when accepted.  Smaller bodies are not worth the CPU or the
+          header bytes.
+        - Compressed responses carry Vary: Accept-Encoding so shared caches keep one copy per
+          encoding.  A strong ETag names one exact byte sequence, so the encoding is appended to
+          it ("<etag>-br"); cached_response() in api/caching.py accepts those variants in
+          If-None-Match.
+
+    Configuration (environment):
+        GG_COMPRESS_MIN_BYTES  smallest body to compress (default 1024)
+        GG_COMPRESS_LEVEL      gzip level 1-9 (default 6); brotli uses quality 5
+'''
+import gzip
+import os
+
+from flask import Flask, request
+
+try:
+    import brotli  # type: ignore
+except ImportError:  # optional: without it every client gets gzip
+    brotli = None
+
+MIN_BYTES = int(os.getenv("GG_COMPRESS_MIN_BYTES", "1024"))
+GZIP_LEVEL = int(os.getenv("GG_COMPRESS_LEVEL", "6"))
+BROTLI_QUALITY = 5
+
+COMPRESSIBLE_TYPES = ("application/json", "text/html", "text/plain", "text/css", "application/javascript")
+
+# encodings offered, best first
+ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def _compress(data: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(data, quality=BROTLI_QUALITY)
+    return gzip.compress(data, compresslevel=GZIP_LEVEL)
+
+
+def choose_encoding() -> str | None:
+    """The best encoding the request accepts, or None."""
+    accepted = request.accept_encodings
+    for encoding in ENCODINGS:
+        if accepted[encoding] > 0:
+            return encoding
+    return None
+
+
+def compress_response(response):
+    if (
+        response.status_code != 200
+        or response.direct_passthrough
+        or response.is_streamed
+        or "Content-Encoding" in response.headers
+        or response.mimetype not in COMPRESSIBLE_TYPES
+    ):
+        return response
+    response.vary.add("Accept-Encoding")
+    data = response.get_data()
+    encoding = choose_encoding()
+    if encoding is None or len(data) < MIN_BYTES:
+        return response
+
+    response.set_data(_compress(data, encoding))
+    response.headers["Content-Encoding"] = encoding
+    etag, weak = response.get_etag()
+    if etag:
+        response.set_etag(f"{etag}-{encoding}", weak=weak)
+    return response
+
+
+def init_app(app: Flask) -> None:
+    app.after_request(compress_response)
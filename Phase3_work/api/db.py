@@ -0,0 +1,154 @@
+'''
+    File: api/db.py
+
+    Author: Colby Wirth
+
+    Version: 19 October 2026
+
+    Description:
+        Connection pool shared by every API route.
+
+        - Connections are created once and reused across requests instead of opening a new
+          TCP connection and MySQL session per request.
+        - pool_reset_session is off so that server-side prepared statements (see
+          src/utils/prepared_statements.py) survive between requests.  Because the session is
+          not reset, a transaction left open by the previous request is rolled back when the
+          connection is checked out.
+        - Connections run in autocommit mode, so a single-statement write needs no COMMIT round
+          trip and a read never holds a stale snapshot; routes that need several statements to
+          commit together call conn.start_transaction().
+        - FOUND_ROWS makes cursor.rowcount of an UPDATE count the rows it matched, not the rows it
+          changed, so conditional DML can use rowcount 0 to mean "not found / not owned".
+        - Routes call get_connection() and close() the result as before; closing a pooled
+          connection returns it to the pool.
+        - Connections are wrapped in api.query_stats.TimedConnection, so every statement is
+          timed and fingerprinted; prepared statement calls are timed here.
+        - The cross-worker single flight (api/single_flight.py) holds a connection while the
+          route it coalesces runs, so it takes its connections from a second, separately sized
+          pool (get_flight_connection); the route's own connection still comes from this one,
+          and a request never holds two connections of the same pool.
+
+    Configuration (environment):
+        GG_POOL_SIZE         number of pooled connections (default 8, max 32)
+        GG_POOL_TIMEOUT      seconds to wait for a free connection before failing (default 5)
+        GG_FLIGHT_POOL_SIZE  connections for single flight named locks (default GG_POOL_SIZE)
+'''
+import os
+import threading
+import time
+
+from mysql.connector import pooling, Error as MySQLError  # type: ignore
+from mysql.connector.constants import ClientFlag  # type: ignore
+from mysql.connector.errors import PoolError  # type: ignore
+
+from src.utils.prepared_statements import statement_cache
+from src.utils.sql_registry import get_script
+from api.query_stats import TimedConnection, query_stats
+
+POOL_NAME = "grantguru_api"
+POOL_SIZE = min(int(os.getenv("GG_POOL_SIZE", "8")), pooling.CNX_POOL_MAXSIZE)
+POOL_TIMEOUT = float(os.getenv("GG_POOL_TIMEOUT", "5"))
+FLIGHT_POOL_NAME = "grantguru_flights"
+FLIGHT_POOL_SIZE = min(int(os.getenv("GG_FLIGHT_POOL_SIZE", str(POOL_SIZE))), pooling.CNX_POOL_MAXSIZE)
+
+_pool = None
+_flight_pool = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> pooling.MySQLConnectionPool:
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                from api import DB_NAME, HOST, MYSQL_USER, MYSQL_PASS
+
+                _pool = pooling.MySQLConnectionPool(
+                    pool_name=POOL_NAME,
+                    pool_size=POOL_SIZE,
+                    pool_reset_session=False,
+                    autocommit=True,
+                    client_flags=[ClientFlag.FOUND_ROWS],
+                    host=HOST,
+                    user=MYSQL_USER,
+                    password=MYSQL_PASS,
+                    database=DB_NAME,
+                )
+    return _pool
+
+
+def get_connection():
+    """
+    Check a connection out of the pool.
+
+    Waits up to GG_POOL_TIMEOUT seconds when every connection is in use.
+
+    Raises:
+        PoolError: if no connection frees up in time (a MySQLError subclass, so the
+            routes' existing error handling applies).
+    """
+    pool = _get_pool()
+    deadline = time.monotonic() + POOL_TIMEOUT
+    while True:
+        try:
+            conn = pool.get_connection()
+            break
+        except PoolError:
+            if time.monotonic() >= deadline:
+                raise
+            time.sleep(0.01)
+
+    try:
+        if conn.in_transaction:
+            conn.rollback()
+    except MySQLError:
+        conn.close()
+        raise
+    return TimedConnection(conn)
+
+
+def _get_flight_pool() -> pooling.MySQLConnectionPool:
+    global _flight_pool
+    if _flight_pool is None:
+        with _pool_lock:
+            if _flight_pool is None:
+                from api import DB_NAME, HOST, MYSQL_USER, MYSQL_PASS
+
+                # the session is reset on return, which also releases any named lock left held
+                _flight_pool = pooling.MySQLConnectionPool(
+                    pool_name=FLIGHT_POOL_NAME,
+                    pool_size=FLIGHT_POOL_SIZE,
+                    autocommit=True,
+                    host=HOST,
+                    user=MYSQL_USER,
+                    password=MYSQL_PASS,
+                    database=DB_NAME,
+                )
+    return _flight_pool
+
+
+def get_flight_connection():
+    """
+    Check a connection out of the single flight pool, without waiting.
+
+    Each process has at most one leader per key, so an exhausted pool means that many
+    different misses are already running; the caller runs its route uncoalesced instead.
+
+    Raises:
+        PoolError: if every flight connection is in use.
+    """
+    return _get_flight_pool().get_connection()
+
+
+def prepared_fetchall(conn, name: str, params=()) -> list[tuple]:
+    """Run a hot registry script through the prepared statement cache and return all rows."""
+    start = time.perf_counter()
+    rows = statement_cache.fetchall(conn, name, params)
+    query_stats.record(get_script(name).sql, (time.perf_counter() - start) * 1000.0, len(rows), params)
+    return rows
+
+
+def prepared_fetchone(conn, name: str, params=()) -> tuple | None:
+    """Run a hot registry script through the prepared statement cache and return the first row."""
+    rows = prepared_fetchall(conn, name, params)
+    return rows[0] if rows else None
@@ -0,0 +1,128 @@
+'''
+    File: api/facets.py
+
+    Author: Colby Wirth
+
+    Version: 19 October 2026
+
+    Description:
+        Facet counts for /api/public/search_grants ("Health (312), Education (120)").
+
+        - Four facets: research_field, provider, status (open/closed) and award_size (buckets of
+          award_max_amount, AWARD_BUCKETS).
+        - MySQL: grouped_sql() counts every requested facet in one GROUP BY over the filtered
+          grants, one row per combination of values, and fold() adds the combinations up
+          per facet.  Adding facets adds GROUP BY columns, not queries.
+        - In-memory index: FacetCounter is called with the keys of every match while the index
+          scores the query, so facets there cost no extra pass at all.
+        - A grant is closed once date_closed is before today; grants without a close date are
+          open.  Missing research fields and providers are counted under None.
+'''
+from collections import Counter
+from datetime import date
+
+FACETS = ("research_field", "provider", "status", "award_size")
+
+# values returned per facet, largest counts first
+FACET_LIMIT = 20
+
+# (label, lower bound inclusive) of award_max_amount, ascending
+AWARD_BUCKETS = (
+    ("under_100k", 0),
+    ("100k_500k", 100_000),
+    ("500k_1m", 500_000),
+    ("1m_5m", 1_000_000),
+    ("5m_plus", 5_000_000),
+)
+
+# facet -> SQL expression over Grants
+_FACET_SQL = {
+    "research_field": "research_field",
+    "provider": "provider",
+    "status": "IF(date_closed < CURDATE(), 'closed', 'open')",
+    "award_size": "CASE {whens} ELSE NULL END".format(
+        whens=" ".join(
+            f"WHEN award_max_amount >= {bound} THEN '{label}'" for label, bound in reversed(AWARD_BUCKETS)
+        )
+    ),
+}
+
+
+def parse_facets(value: str) -> tuple[str, ...] | None:
+    """
+    The facets named in ?facets= (comma separated, or "all"), in FACETS order.
+
+    Returns:
+        () when none are requested, None when a name is unknown.
+    """
+    names = {name.strip() for name in value.split(",") if name.strip()}
+    if "all" in names:
+        return FACETS
+    if not names <= set(FACETS):
+        return None
+    return tuple(name for name in FACETS if name in names)
+
+
+def award_bucket(amount: int | None) -> str | None:
+    if amount is None:
+        return None
+    for label, bound in reversed(AWARD_BUCKETS):
+        if amount >= bound:
+            return label
+    return None
+
+
+def status_of(date_closed: str | None, today: str) -> str:
+    """open/closed for an ISO close date, as the MySQL expression computes it."""
+    return "closed" if date_closed is not None and date_closed < today else "open"
+
+
+def grouped_sql(facets: tuple[str, ...], where_clause: str) -> str:
+    """One grouped pass counting every combination of the requested facets' values."""
+    columns = ", ".join(f"{_FACET_SQL[name]} AS {name}" for name in facets)
+    group_by = ", ".join(str(i) for i in range(1, len(facets) + 1))
+    return f"SELECT {columns}, COUNT(*) FROM Grants {where_clause} GROUP BY {group_by}"
+
+
+def fold(facets: tuple[str, ...], rows) -> dict:
+    """Per-facet counts from grouped_sql() rows of (value, ..., count)."""
+    counters = {name: Counter() for name in facets}
+    for row in rows:
+        count = row[-1]
+        for name, value in zip(facets, row):
+            counters[name][value] += count
+    return _render(counters)
+
+
+class FacetCounter:
+    """Counts facet values of index matches; call it with each match's GrantKeys."""
+
+    def __init__(self, facets: tuple[str, ...]):
+        self.facets = facets
+        self.today = date.today().isoformat()
+        self.counters = {name: Counter() for name in facets}
+
+    def __call__(self, keys) -> None:
+        for name in self.facets:
+            if name == "status":
+                value = status_of(keys.date_closed, self.today)
+            else:
+                value = getattr(keys, name)
+            self.counters[name][value] += 1
+
+    def result(self) -> dict:
+        return _render(self.counters)
+
+
+def _render(counters: dict[str, Counter]) -> dict:
+    """{facet: [{"value": ..., "count": n}, ...]}, largest first, ties by value."""
+    result = {}
+    for name, counter in counters.items():
+        if name == "award_size":
+            order = [label for label, _ in AWARD_BUCKETS] + [None]
+            items = [(value, counter[value]) for value in order if counter.get(value)]
+        else:
+            items = sorted(counter.items(), key=lambda item: (-item[1], item[0] is None, item[0] or ""))
+            items = items[:FACET_LIMIT]
+        result[name] = [{"value": value, "count": count} for value, count in items]
+    return result
@@ -0,0 +1,88 @@
+'''
+    File: api/pagination.py
+
+    Author: Colby Wirth
+
+    Version: 19 October 2026
+
+    Description:
+        Keyset (seek) pagination helpers shared by the list routes.
+
+        - A cursor token is the last row's sort key plus its grant_id, as URL-safe base64 JSON.
+          Clients pass it back unchanged; it is opaque to them but not secret, and its values
+          are only ever sent as bound parameters.
+        - keyset_condition() turns a cursor into the WHERE fragment "rows after this one" for an
+          ORDER BY <column>, grant_id with both parts ascending or both descending, so MySQL
+          can start the page with one index range read instead of skipping OFFSET rows.
+        - MySQL sorts NULLs first in ascending order and last in descending order; the
+          fragment follows the same rule so no row is skipped or repeated around NULL keys.
+'''
+import base64
+import binascii
+import json
+
+
+class CursorError(ValueError):
+    """Raised for a cursor token that was not produced by encode_cursor() or does not fit the request."""
+    pass
+
+
+def encode_cursor(**fields) -> str:
+    raw = json.dumps(fields, separators=(",", ":"), default=str).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str, **expected) -> dict:
+    """
+    The fields of a cursor token.
+
+    Raises:
+        CursorError: if the token is malformed or a field differs from expected (e.g. the
+            cursor was issued for another sort order).
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        fields = json.loads(raw)
+    except (binascii.Error, ValueError):
+        raise CursorError("Malformed cursor")
+    if not isinstance(fields, dict):
+        raise CursorError("Malformed cursor")
+    for name, value in expected.items():
+        if fields.get(name) != value:
+            raise CursorError(f"Cursor does not match {name}")
+    return fields
+
+
+def keyset_condition(
+    column: str,
+    descending: bool,
+    key,
+    last_id: str,
+    column_params: tuple = (),
+    id_column: str = "grant_id",
+) -> tuple[str, list]:
+    """
+    WHERE fragment and parameters for the rows after (key, last_id).
+
+    Args:
+        column: the sort column, or an expression with its own placeholders (column_params).
+        descending: whether the ORDER BY is <column> DESC, <id_column> DESC.
+        key: the last row's sort value, or None.
+        last_id: the last row's id as a UUID string.
+    """
+    cmp = "<" if descending else ">"
+    tie = f"{id_column} {cmp} UUID_TO_BIN(%s, 1)"
+    column_params = list(column_params)
+
+    if key is None:
+        if descending:
+            # NULLs come last: only the remaining NULL rows follow
+            return f"({column} IS NULL AND {tie})", column_params + [last_id]
+        return f"(({column} IS NULL AND {tie}) OR {column} IS NOT NULL)", column_params + [last_id] + column_params
+
+    sql = f"{column} {cmp} %s OR ({column} = %s AND {tie})"
+    params = column_params + [key] + column_params + [key, last_id]
+    if descending:
+        sql += f" OR {column} IS NULL"
+        params += column_params
+    return f"({sql})", params
@@ -8,72 +8,328 @@
     Description:
         This module defines the public-facing API routes for the application.
 
+        aggregate-grants, fetch_grant_count, grant-stats, search_grants, grant/<grant_id>,
+        grant/<grant_id>/similar and analytics/* responses carry a strong ETag; a request
+        repeating it in If-None-Match gets 304 Not Modified with no body.  They are also cached in memory
+        (api/caching.py) for GG_RESPONSE_CACHE_TTL seconds, up to GG_RESPONSE_CACHE_SIZE
+        responses and GG_RESPONSE_CACHE_MB megabytes, keyed by the normalized query string and
+        the ingest generation, so a maintenance run invalidates them.  X-Cache says whether a
+        response was served from the cache.  Large responses are compressed
+        (api/compression.py).
+
         Routes:
             - /aggregate-grants: Returns the total funding of all grants.
             - /fetch_grant_count: Returns the total number of grants in the database.
+            - /grant-stats: Total, open and closed grant counts and total program funding,
+                overall and per research field.
+                These three read the running totals in GrantStats and GrantFieldStats
+                (src/utils/grant_stats.py), which the ingest and the purge keep current, rather
+                than aggregating Grants: one primary key lookup (plus one small table for
+                /grant-stats) at any number of grants.
             - /search_grants: Search grants by query string with pagination.
+                q is matched against title and description through the FULLTEXT index
+                ft_grants_title_description; mode=natural (default) ranks by natural-language
+                relevance, mode=boolean accepts MySQL boolean operators (+word -word "phrase" word*).
+                With q, each hit carries a relevance score and sort_by=relevance (the default
+                when q is given) orders by it.
+                FULLTEXT leaves out words shorter than innodb_ft_min_token_size
+                (GG_FT_MIN_TOKEN_SIZE, default 3) and InnoDB's stopwords, so in natural mode
+                such words of two or more characters ("AI", "5G", "it") are matched as whole
+                words in the title instead (grant_title REGEXP), alongside the MATCH.  That
+                reads every title, so only queries containing such words pay for it; boolean
+                mode follows MySQL's rules unchanged.
+                Natural-mode searches are answered from the in-memory BM25 index
+                (api/search_index.py) once it is built, and only the page of results is read
+                from MySQL; "source" in the response says which one answered.
+                Counting (?count=exact|approx|none, default GG_SEARCH_COUNT or exact): exact
+                counts are cached per filter until the next ingest; approx stops at
+                GG_SEARCH_COUNT_CAP matches and shows "1,000+"; none skips the count.
+                count_strategy in the response says which was used.
+                Facets (?facets=research_field,provider,status,award_size or all): "facets" in
+                the response holds value counts over every match, computed in one grouped pass
+                (or while the in-memory index scores the query) and cached like exact counts.
+                Each hit carries a snippet of its description (GG_SNIPPET_LENGTH characters around
+                the best cluster of query terms) with highlight offsets into it, and highlight
+                offsets into the title; the full description is only returned by /grant/<grant_id>.
+                Paging: every response carries next_cursor (null on the last page); passing it
+                back as cursor= returns the next page by keyset, which costs the same at any
+                depth.  page= (OFFSET paging) still works for jumping to a page number.
+                field= and op_num= match anywhere in the research field and the opportunity
+                number, case-insensitively.  The distinct research fields containing field are
+                read from Grants' research_field index alone (no grant rows, and no table that
+                can lag behind Grants), then Grants is filtered with research_field IN (...) on
+                that index.  op_num_match=prefix matches opportunity numbers from the start
+                instead, a range on their unique index; the default (contains) reads every grant.
+                Range filters (src/utils/range_filters.py): award_max_gte/lte, award_min_gte/lte,
+                funding_gte/lte, posted_from/to, closes_from/to (inclusive) and closes_within=N
+                days.  Each is a range on one indexed column, and the date indexes also carry
+                award_max_amount, so "closing soon, awards >= $500k" is answered from one index
+                range (db_migration/add_grants_range_indexes.sql).
             - /grant/<grant_id>: Get full details of a specific grant.
+            - /grants/batch (POST): Details of up to GG_BATCH_MAX_IDS grants at once, for pages
+                listing many grants (e.g. a user's applications).  The body is
+                {"grant_ids": [...], "fields": [...]}; fields (default: every field of
+                /grant/<grant_id>) trims each grant to the columns the page shows.  Grants come
+                back in request order, and ids with no grant are listed in "missing".  Grants
+                not in the per-grant cache (GG_GRANT_CACHE_SIZE entries, keyed by the ingest
+                generation) are read with one WHERE grant_id IN (...) query on the primary key.
+            - /grant/<grant_id>/similar: The k (default 5, at most 10) most similar open grants,
+                precomputed after each ingest (system_functions/compute_grant_similarities.py)
+                and read from GrantSimilarities by primary key.
+            - /suggest: Typeahead completions (q, k, optional kind) for grant titles,
+                opportunity numbers, providers and research fields, ranked by popularity and
+                served only from the in-memory prefix index (api/suggest_index.py); until it
+                is built the list is empty and "ready" is false.
+            - /analytics/monthly, /analytics/providers, /analytics/research-fields: Grant counts
+                and total program funding by month posted, and per provider (agency) or research
+                field most funding first (limit, default 20, at most ANALYTICS_LIMIT_MAX).
+                from / to (YYYY-MM, inclusive) restrict the months posted.  Served from the
+                monthly rollups in GrantRollups (src/utils/grant_rollups.py), rebuilt after each
+                ingest, so no request groups Grants; grants without a posting date are not counted.
 
 """
 
 
 # routes_public.py
 from flask import jsonify, request
-from mysql.connector import connect, Error as MySQLError # type: ignore
+from mysql.connector import Error as MySQLError # type: ignore
+from api.db import get_connection, prepared_fetchall, prepared_fetchone
+from api import search_index, suggest_index
+from api.caching import LRUTTLCache, cached_response, ingest_generation
+from api.facets import FACETS, FacetCounter, fold, grouped_sql, parse_facets
+from api.pagination import CursorError, decode_cursor, encode_cursor, keyset_condition
+import os
 import re
+from datetime import date
+from src.utils.bm25_index import TOKEN_PATTERN, tokenize
+from src.utils.grant_rollups import parse_month
+from src.utils.range_filters import parse_range_filters, sql_conditions
+from src.utils.snippets import SNIPPET_LENGTH, highlight, make_snippet, query_terms
+from src.utils.sql_registry import get_sql
 from . import public_bp
 
 
-@public_bp.route("/aggregate-grants", methods=["GET"])
-def aggregate_grants():
-
+SEARCH_MODES = {
+    "natural": "IN NATURAL LANGUAGE MODE",
+    "boolean": "IN BOOLEAN MODE",
+}
+# the FULLTEXT index covers exactly these columns; MATCH must name the same list to use it
+FULLTEXT_MATCH = "MATCH(grant_title, description) AGAINST (%s {mode})"
+
+# innodb_ft_min_token_size of the server; shorter words are not in the FULLTEXT index
+FT_MIN_TOKEN_SIZE = int(os.getenv("GG_FT_MIN_TOKEN_SIZE", "3"))
+# InnoDB's default FULLTEXT stopwords (INFORMATION_SCHEMA.INNODB_FT_DEFAULT_STOPWORD)
+FT_STOPWORDS = frozenset("""
+    a about an are as at be by com de en for from how i in is it la of on or that the this to was
+    what when where who will with und www
+""".split())
+
+# How search_grants matches op_num (?op_num_match=); field always matches substrings
+OP_NUM_MATCHES = ("contains", "prefix")
+
+# How search_grants computes "total" (?count=):
+#   exact   COUNT(*), cached per normalized filter for the current ingest generation
+#   approx  counts at most COUNT_CAP + 1 matches; anything above is reported as "1,000+"
+#   none    no count query; total is null
+COUNT_STRATEGIES = ("exact", "approx", "none")
+DEFAULT_COUNT_STRATEGY = os.getenv("GG_SEARCH_COUNT", "exact")
+if DEFAULT_COUNT_STRATEGY not in COUNT_STRATEGIES:
+    DEFAULT_COUNT_STRATEGY = "exact"
+COUNT_CAP = int(os.getenv("GG_SEARCH_COUNT_CAP", "1000"))
+
+count_cache = LRUTTLCache(
+    max_entries=int(os.getenv("GG_COUNT_CACHE_SIZE", "2048")),
+    ttl=float(os.getenv("GG_COUNT_CACHE_TTL", "600")),
+    name="search_counts",
+)
+
+# facet counts per normalized filter and ingest generation, like count_cache
+facet_cache = LRUTTLCache(
+    max_entries=int(os.getenv("GG_COUNT_CACHE_SIZE", "2048")),
+    ttl=float(os.getenv("GG_COUNT_CACHE_TTL", "600")),
+    name="search_facets",
+)
+
+# whole search_grants / get_grant responses, per normalized query string and ingest generation
+response_cache = LRUTTLCache(
+    max_entries=int(os.getenv("GG_RESPONSE_CACHE_SIZE", "5000")),
+    ttl=float(os.getenv("GG_RESPONSE_CACHE_TTL", "300")),
+    max_bytes=int(float(os.getenv("GG_RESPONSE_CACHE_MB", "64")) * 1024 * 1024),
+    name="public_responses",
+)
+# single grants for /grants/batch, per grant_id and ingest generation
+grant_cache = LRUTTLCache(
+    max_entries=int(os.getenv("GG_GRANT_CACHE_SIZE", "10000")),
+    ttl=float(os.getenv("GG_RESPONSE_CACHE_TTL", "300")),
+    name="grant_details",
+)
+# search_grants filters compared case-insensitively by MySQL and the index
+_CASEFOLD_ARGS = ("q", "field", "op_num")
+
+# sort_by -> (keyset column or expression, descending), matching sort_mapping in search_grants
+KEYSET_COLUMNS = {
+    "relevance": ("{match}", True),
+    "title_asc": ("grant_title", False),
+    "title_desc": ("grant_title", True),
+    "posted_date_desc": ("date_posted", True),
+    "posted_date_asc": ("date_posted", False),
+    "close_date_asc": ("date_closed", False),
+    "close_date_desc": ("date_closed", True),
+}
+
+# characters of description returned per search hit (see src/utils/snippets.py)
+SNIPPET_CHARS = int(os.getenv("GG_SNIPPET_LENGTH", str(SNIPPET_LENGTH)))
+
+# /analytics/*: the months covered when from / to are left out, and the most values per response
+ANALYTICS_FIRST_MONTH = date(1000, 1, 1)
+ANALYTICS_LAST_MONTH = date(9999, 12, 1)
+ANALYTICS_LIMIT_MAX = 100
+
+# grant_ids accepted by one /grants/batch request
+BATCH_MAX_IDS = int(os.getenv("GG_BATCH_MAX_IDS", "100"))
+
+# the fields of a grant returned by /grant/<grant_id> and /grants/batch, in column order of
+# select_grant_details_by_uuid.sql and select_grant_details_by_uuids.sql
+GRANT_FIELDS = (
+    "grant_id", "grant_title", "opportunity_number", "description", "research_field",
+    "expected_award_count", "eligibility", "award_max_amount", "award_min_amount",
+    "program_funding", "provider", "link_to_source", "point_of_contact",
+    "date_posted", "archive_date", "date_closed", "last_update_date",
+)
+
+UUID_PATTERN = r'^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$'
+
+# characters allowed in a boolean-mode query besides letters, digits and spaces
+_BOOLEAN_OPERATORS = set("+-<>()~*\"@'.")
+
+
+def _valid_boolean_query(q: str) -> bool:
+    """Reject input the boolean parser fails on: unknown symbols or an unbalanced quote/parenthesis."""
+    if any(not (c.isalnum() or c.isspace() or c in _BOOLEAN_OPERATORS) for c in q):
+        return False
+    if q.count('"') % 2:
+        return False
+    depth = 0
+    for c in q:
+        depth += {"(": 1, ")": -1}.get(c, 0)
+        if depth < 0:
+            return False
+    return depth == 0
+
+
+def _count_key(generation: int, mode: str, q: str, field: str, op_num: str, ranges: tuple = (),
+               op_num_match: str = "contains") -> tuple:
+    """Cache key for a count: filters compare case-insensitively, so they are lower-cased."""
+    return (generation, mode, " ".join(q.lower().split()), field.lower(), op_num.lower(), ranges, op_num_match)
+
+
+def _unindexed_words(q: str) -> list[str]:
+    """Words of q (two characters or more) that the FULLTEXT index leaves out, once each."""
+    return list(dict.fromkeys(
+        word for word in TOKEN_PATTERN.findall(q.lower())
+        if len(word) > 1 and (len(word) < FT_MIN_TOKEN_SIZE or word in FT_STOPWORDS)
+    ))
+
+
+def _title_words_pattern(words: list[str]) -> str:
+    """REGEXP matching any of words as a whole word; words are [a-z0-9]+, so nothing needs escaping."""
+    return rf"\b({'|'.join(words)})\b"
+
+
+def _like_escape(value: str) -> str:
+    """value with its LIKE wildcards escaped, so they match literally."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _like_prefix(value: str) -> str:
+    """LIKE pattern matching values that start with value."""
+    return f"{_like_escape(value)}%"
+
+
+def _like_contains(value: str) -> str:
+    """LIKE pattern matching values that contain value."""
+    return f"%{_like_escape(value)}%"
 
-    from api import DB_NAME, HOST, MYSQL_USER, MYSQL_PASS
 
+@public_bp.route("/aggregate-grants", methods=["GET"])
+@cached_response(response_cache)
+def aggregate_grants():
+    """Return the total program funding of all grants, formatted."""
     try:
-        with connect(host=HOST, user=MYSQL_USER, password=MYSQL_PASS, database=DB_NAME) as conn:
-            with conn.cursor() as cursor:
-                cursor.execute("""
-                    SELECT FORMAT(COALESCE(SUM(program_funding), 0), 0) AS total
-                    FROM grants
-                """)
-                total = cursor.fetchone()[0]
-        return jsonify({"total": total})
+        with get_connection() as conn:
+            row = prepared_fetchone(conn, "grants/select_grant_stats")
+        return jsonify({"total": f"{row[3] if row else 0:,}"})
     except MySQLError as e:
         print(e)
         return jsonify({"error": str(e)}), 500
 
 
 @public_bp.route("/fetch_grant_count", methods=["GET"])
+@cached_response(response_cache)
 def fetch_grant_count():
     """Fetch the total number of grants in the database."""
+    try:
+        with get_connection() as conn:
+            row = prepared_fetchone(conn, "grants/select_grant_stats")
 
-    from api import DB_NAME, HOST, MYSQL_USER, MYSQL_PASS
+        return jsonify({"total": row[0] if row else 0})
 
-    try:
-        with connect(host=HOST, user=MYSQL_USER, password=MYSQL_PASS, database=DB_NAME) as conn:
-            with conn.cursor() as cursor:
-                cursor.execute("SELECT COUNT(*) AS total_grants FROM grants")
-                total = cursor.fetchone()[0]
+    except MySQLError as e:
+        print(e)
+        return jsonify({"error": str(e)}), 500
 
-        return jsonify({"total": total})
 
+@public_bp.route("/grant-stats", methods=["GET"])
+@cached_response(response_cache)
+def grant_stats():
+    """Return the grant totals, open and closed counts, and the same per research field."""
+    try:
+        with get_connection() as conn:
+            totals = prepared_fetchone(conn, "grants/select_grant_stats")
+            fields = prepared_fetchall(conn, "grants/select_grant_field_stats")
     except MySQLError as e:
         print(e)
         return jsonify({"error": str(e)}), 500
 
+    grant_count, open_count, closed_count, program_funding, open_as_of = totals or (0, 0, 0, 0, None)
+    return jsonify({
+        "total_grants": grant_count,
+        "open_grants": open_count,
+        "closed_grants": closed_count,
+        "total_program_funding": program_funding,
+        "as_of": open_as_of.isoformat() if open_as_of else None,
+        "research_fields": [
+            {
+                "research_field": research_field or None,
+                "total_grants": field_count,
+                "open_grants": field_open,
+                "closed_grants": field_count - field_open,
+                "total_program_funding": field_funding,
+            }
+            for research_field, field_count, field_open, field_funding in fields
+        ],
+    })
+
 
 @public_bp.route("/search_grants", methods=["GET"])
+@cached_response(response_cache, casefold=_CASEFOLD_ARGS)
 def search_grants():
     """Search grants by query, research field, opportunity number, and sort order."""
 
-    from api import DB_NAME, HOST, MYSQL_USER, MYSQL_PASS
 
     # 1. Get Parameters and validate input lengths to prevent abuse
     q = request.args.get("q", "").strip()
     field_query = request.args.get("field", "").strip()
     op_num_query = request.args.get("op_num", "").strip()
-    sort_by = request.args.get("sort_by", "title_asc")
+    op_num_match = request.args.get("op_num_match", "contains")
+    mode = request.args.get("mode", "natural")
+    sort_by = request.args.get("sort_by", "relevance" if q else "title_asc")
+    count_strategy = request.args.get("count", DEFAULT_COUNT_STRATEGY)
+    facets = parse_facets(request.args.get("facets", ""))
+    try:
+        ranges = parse_range_filters(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
 
     # Input validation - limit query string lengths to prevent abuse
     MAX_QUERY_LENGTH = 500
@@ -83,21 +339,37 @@ def search_grants():
         return jsonify({"error": "Field query string too long"}), 400
     if len(op_num_query) > MAX_QUERY_LENGTH:
         return jsonify({"error": "Opportunity number query string too long"}), 400
+    if op_num_match not in OP_NUM_MATCHES:
+        return jsonify({"error": f"Invalid op_num_match. Must be one of: {', '.join(OP_NUM_MATCHES)}"}), 400
+    if mode not in SEARCH_MODES:
+        return jsonify({"error": f"Invalid mode. Must be one of: {', '.join(SEARCH_MODES)}"}), 400
+    if mode == "boolean" and not _valid_boolean_query(q):
+        return jsonify({"error": "Invalid boolean query"}), 400
+    if count_strategy not in COUNT_STRATEGIES:
+        return jsonify({"error": f"Invalid count. Must be one of: {', '.join(COUNT_STRATEGIES)}"}), 400
+    if facets is None:
+        return jsonify({"error": f"Invalid facets. Must be 'all' or a list of: {', '.join(FACETS)}"}), 400
 
     # 2. Define Sorting Logic - use whitelist approach for SQL injection prevention
+    # grant_id breaks ties in the same direction, so every order is total and can be paged by
+    # keyset; the (column, grant_id) indexes serve each order as one range read
     sort_mapping = {
-        "title_asc": "grant_title ASC",
-        "title_desc": "grant_title DESC",
-        "posted_date_desc": "date_posted DESC",
-        "posted_date_asc": "date_posted ASC",
-        "close_date_asc": "date_closed ASC",
-        "close_date_desc": "date_closed DESC"
+        "relevance": "score DESC, grant_id DESC",
+        "title_asc": "grant_title ASC, grant_id ASC",
+        "title_desc": "grant_title DESC, grant_id DESC",
+        "posted_date_desc": "date_posted DESC, grant_id DESC",
+        "posted_date_asc": "date_posted ASC, grant_id ASC",
+        "close_date_asc": "date_closed ASC, grant_id ASC",
+        "close_date_desc": "date_closed DESC, grant_id DESC"
     }
     
     # Validate sort_by is from allowed list - critical for SQL injection prevention
     if sort_by not in sort_mapping:
         return jsonify({"error": "Invalid sort_by parameter"}), 400
-    
+    # without a query every grant scores the same; fall back to the default listing order
+    if sort_by == "relevance" and not q:
+        sort_by = "title_asc"
+
     order_clause = sort_mapping[sort_by]
 
     # Pagination
@@ -113,80 +385,208 @@ def search_grants():
         page_size = 10
     offset = (page - 1) * page_size
 
+    # Keyset paging: a cursor from the previous response replaces page/OFFSET
+    after = None
+    cursor_token = request.args.get("cursor")
+    if cursor_token:
+        try:
+            after = decode_cursor(cursor_token, s=sort_by)
+        except CursorError as e:
+            return jsonify({"error": f"Invalid cursor: {e}"}), 400
+        if not isinstance(after.get("k"), list):
+            return jsonify({"error": "Invalid cursor: Malformed cursor"}), 400
+        offset = 0
+
+    # Natural-language keyword searches are answered by the in-memory index once it is built;
+    # MySQL then only supplies the rows of the returned page.  A cursor stays with the source
+    # that issued it, since the two rank relevance differently.
+    found = None
+    facet_counter = FacetCounter(facets) if facets else None
+    # a query of stopwords only has no index terms; MySQL answers it from the titles
+    if q and mode == "natural" and tokenize(q) and (after is None or after.get("src") == "index"):
+        # one extra hit tells whether there is a next page
+        found = search_index.search(
+            q, field_query, op_num_query, sort_by, offset, page_size + 1, after["k"] if after else None,
+            facets=facet_counter, ranges=ranges, op_num_prefix=op_num_match == "prefix",
+        )
+        if found is None and after is not None:
+            return jsonify({"error": "Cursor expired, start again from the first page"}), 400
+
+    total = facet_counts = None
+    count_cached = count_capped = False
     try:
-        with connect(host=HOST, user=MYSQL_USER, password=MYSQL_PASS, database=DB_NAME) as conn:
-            with conn.cursor() as cursor:
+        with get_connection() as conn:
+            if found is not None:
+                # the index counts every match anyway, so its total is always exact
+                total, hits = found
+                if count_strategy == "none":
+                    total = None
+                else:
+                    count_strategy = "exact"
+                next_key = hits[page_size - 1][2] if len(hits) > page_size else None
+                rows = search_index.hydrate(conn, hits[:page_size])
+                next_cursor = encode_cursor(s=sort_by, src="index", k=next_key) if next_key else None
+                if facet_counter is not None:
+                    facet_counts = facet_counter.result()
+            else:
+                with conn.cursor() as cursor:
                 
-                # 3. Build Dynamic WHERE Clause
-                conditions = []
-                params = []
-
-                if op_num_query:
-                    conditions.append("opportunity_number LIKE %s")
-                    params.append(f"%{op_num_query}%")
+                    # 3. Build Dynamic WHERE Clause
+                    conditions = []
+                    params = []
+
+                    if op_num_query:
+                        # only a prefix match can use the unique index; a leading % reads every grant
+                        conditions.append("opportunity_number LIKE %s")
+                        params.append(
+                            _like_prefix(op_num_query) if op_num_match == "prefix" else _like_contains(op_num_query)
+                        )
                     
-                if q:
-                    conditions.append("(grant_title LIKE %s OR description LIKE %s)")
-                    params.extend([f"%{q}%", f"%{q}%"])
+                    match_sql = FULLTEXT_MATCH.format(mode=SEARCH_MODES[mode])
+                    if q:
+                        short_words = _unindexed_words(q) if mode == "natural" else []
+                        if short_words:
+                            # words FULLTEXT cannot find still match whole words of the title
+                            conditions.append(f"({match_sql} OR grant_title REGEXP %s)")
+                            params.extend([q, _title_words_pattern(short_words)])
+                        else:
+                            conditions.append(match_sql)
+                            params.append(q)
                 
-                if field_query:
-                    conditions.append("research_field LIKE %s")
-                    params.append(f"%{field_query}%")
+                    if field_query:
+                        # the distinct fields containing field_query, read from the index, then an IN list on it
+                        matching_fields = [
+                            row[0] for row in prepared_fetchall(
+                                conn, "grants/select_research_fields_containing", (_like_contains(field_query),)
+                            )
+                        ]
+                        if matching_fields:
+                            conditions.append(f"research_field IN ({', '.join(['%s'] * len(matching_fields))})")
+                            params.extend(matching_fields)
+                        else:
+                            conditions.append("FALSE")
+
+                    range_conditions, range_params = sql_conditions(ranges)
+                    conditions.extend(range_conditions)
+                    params.extend(range_params)
 
                 
 
-                where_clause = ""
-                if conditions:
-                    where_clause = "WHERE " + " AND ".join(conditions)
-
-                # 4. Count Query
-                count_sql = f"SELECT COUNT(*) FROM grants {where_clause}"
-                cursor.execute(count_sql, tuple(params))
-                total = cursor.fetchone()[0] or 0
-
-                # 5. Data Query
-                # Note: order_clause is safe because it's validated against sort_mapping whitelist above
-                # Added 'opportunity_number', 'research_field', 'date_posted' to SELECT
-                data_sql = f"""
-                    SELECT
-                        BIN_TO_UUID(grant_id) AS grant_id,
-                        grant_title,
-                        description,
-                        provider,
-                        DATE_FORMAT(date_closed, '%Y-%m-%d') AS date_closed,
-                        research_field,
-                        DATE_FORMAT(date_posted, '%Y-%m-%d') AS date_posted,
-                        opportunity_number
-                    FROM grants
-                    {where_clause}
-                    ORDER BY {order_clause}
-                    LIMIT %s OFFSET %s
-                """
-                params.extend([page_size, offset])
-                
-                cursor.execute(data_sql, tuple(params))
-                rows = cursor.fetchall()
-
-        grants = [
-            {
+                    where_clause = ""
+                    if conditions:
+                        where_clause = "WHERE " + " AND ".join(conditions)
+
+                    # 4. Count Query, per count_strategy (see COUNT_STRATEGIES)
+                    if count_strategy == "exact":
+                        generation = ingest_generation.current(conn)
+                        cache_key = _count_key(generation, mode, q, field_query, op_num_query, ranges, op_num_match)
+                        total = count_cache.get(cache_key) if generation is not None else None
+                        count_cached = total is not None
+                        if total is None:
+                            count_sql = f"SELECT COUNT(*) FROM Grants {where_clause}"
+                            cursor.execute(count_sql, tuple(params))
+                            total = cursor.fetchone()[0] or 0
+                            if generation is not None:
+                                count_cache.set(cache_key, total)
+                    elif count_strategy == "approx":
+                        # the derived table stops reading after COUNT_CAP + 1 matching rows
+                        count_sql = f"SELECT COUNT(*) FROM (SELECT 1 FROM Grants {where_clause} LIMIT %s) AS capped"
+                        cursor.execute(count_sql, tuple(params + [COUNT_CAP + 1]))
+                        total = cursor.fetchone()[0] or 0
+                        if total > COUNT_CAP:
+                            total, count_capped = COUNT_CAP, True
+
+                    # 4b. Facets: one GROUP BY over the same matches, whatever facets were asked for
+                    if facets:
+                        generation = ingest_generation.current(conn)
+                        cache_key = _count_key(generation, mode, q, field_query, op_num_query, ranges, op_num_match) + (facets,)
+                        facet_counts = facet_cache.get(cache_key) if generation is not None else None
+                        if facet_counts is None:
+                            cursor.execute(grouped_sql(facets, where_clause), tuple(params))
+                            facet_counts = fold(facets, cursor.fetchall())
+                            if generation is not None:
+                                facet_cache.set(cache_key, facet_counts)
+
+                    # the count covers every match; the page starts after the cursor's row
+                    if after is not None:
+                        column, descending = KEYSET_COLUMNS[sort_by]
+                        column_params = (q,) if sort_by == "relevance" else ()
+                        if len(after["k"]) != 2:
+                            return jsonify({"error": "Invalid cursor: Malformed cursor"}), 400
+                        key, last_id = after["k"]
+                        seek_sql, seek_params = keyset_condition(
+                            column.format(match=match_sql), descending, key, last_id, column_params
+                        )
+                        where_clause = f"{where_clause} AND {seek_sql}" if where_clause else f"WHERE {seek_sql}"
+                        params = params + seek_params
+
+                    # 5. Data Query
+                    # Note: order_clause is safe because it's validated against sort_mapping whitelist above.
+                    # The score repeats the WHERE's MATCH expression, which MySQL evaluates only once.
+                    score_sql = match_sql if q else "NULL"
+                    score_params = [q] if q else []
+                    data_sql = f"""
+                        SELECT
+                            BIN_TO_UUID(grant_id, 1) AS grant_id,
+                            grant_title,
+                            description,
+                            provider,
+                            DATE_FORMAT(date_closed, '%Y-%m-%d') AS date_closed,
+                            research_field,
+                            DATE_FORMAT(date_posted, '%Y-%m-%d') AS date_posted,
+                            opportunity_number,
+                            {score_sql} AS score
+                        FROM Grants
+                        {where_clause}
+                        ORDER BY {order_clause}
+                        LIMIT %s OFFSET %s
+                    """
+                    cursor.execute(data_sql, tuple(score_params + params + [page_size + 1, offset]))
+                    rows = cursor.fetchall()
+
+                    next_cursor = None
+                    if len(rows) > page_size:
+                        rows = rows[:page_size]
+                        last = rows[-1]
+                        key = {
+                            "relevance": last[8],
+                            "title_asc": last[1], "title_desc": last[1],
+                            "posted_date_desc": last[6], "posted_date_asc": last[6],
+                            "close_date_asc": last[4], "close_date_desc": last[4],
+                        }[sort_by]
+                        next_cursor = encode_cursor(s=sort_by, src="mysql", k=[key, last[0]])
+
+        terms = query_terms(q)
+        grants = []
+        for r in rows:
+            snippet, snippet_highlights = make_snippet(r[2], terms, SNIPPET_CHARS)
+            grants.append({
                 "grant_id": r[0],
                 "grant_title": r[1],
-                "description": r[2],
+                "title_highlights": highlight(r[1], terms),
+                "snippet": snippet,
+                "snippet_highlights": snippet_highlights,
                 "provider": r[3],
                 "date_closed": r[4],
                 "research_field": r[5],
                 "date_posted": r[6],
-                "opportunity_number": r[7] # <--- Include in response
-            }
-            for r in rows
-        ]
+                "opportunity_number": r[7], # <--- Include in response
+                "score": round(float(r[8]), 4) if r[8] is not None else None
+            })
 
         return jsonify({
             "grants": grants, 
             "total": total, 
+            "total_display": None if total is None else f"{total:,}{'+' if count_capped else ''}",
+            "count_strategy": count_strategy,
+            "count_cached": count_cached,
+            "facets": facet_counts,
             "page": page, 
             "page_size": page_size,
-            "sort_by": sort_by
+            "sort_by": sort_by,
+            "mode": mode,
+            "source": "index" if found is not None else "mysql",
+            "next_cursor": next_cursor
         })
 
     except MySQLError as e:
@@ -194,59 +594,229 @@ def search_grants():
         return jsonify({"error": str(e)}), 500
 
 @public_bp.route("/grant/<grant_id>", methods=["GET"])
+@cached_response(response_cache)
 def get_grant(grant_id: str):
     """Return full grant details for a given UUID string."""
-    from api import DB_NAME, HOST, MYSQL_USER, MYSQL_PASS
 
     # Validate UUID format to prevent injection
-    uuid_pattern = r'^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$'
-    if not re.match(uuid_pattern, grant_id):
+    if not re.match(UUID_PATTERN, grant_id):
         return jsonify({"error": "Invalid grant_id format"}), 400
 
     try:
-        with connect(host=HOST, user=MYSQL_USER, password=MYSQL_PASS, database=DB_NAME) as conn:
-            with conn.cursor() as cursor:
-                cursor.execute(
-                    """
-                    SELECT
-                        BIN_TO_UUID(grant_id) as grant_id,
-                        grant_title,
-                        opportunity_number,
-                        description,
-                        research_field,
-                        expected_award_count,
-                        eligibility,
-                        award_max_amount,
-                        award_min_amount,
-                        program_funding,
-                        provider,
-                        link_to_source,
-                        point_of_contact,
-                        DATE_FORMAT(date_posted, '%Y-%m-%d') as date_posted,
-                        DATE_FORMAT(archive_date, '%Y-%m-%d') as archive_date,
-                        DATE_FORMAT(date_closed, '%Y-%m-%d') as date_closed,
-                        DATE_FORMAT(last_update_date, '%Y-%m-%d') as last_update_date
-                    FROM Grants
-                    WHERE BIN_TO_UUID(grant_id) = %s
-                    LIMIT 1
-                    """,
-                    (grant_id, ),
-                )
-                row = cursor.fetchone()
+        with get_connection() as conn:
+            row = prepared_fetchone(conn, "grants/select_grant_details_by_uuid", (grant_id,))
 
         if not row:
             return jsonify({"error": "not_found"}), 404
 
-        keys = [
-            "grant_id", "grant_title", "opportunity_number", "description", "research_field",
-            "expected_award_count", "eligibility", "award_max_amount", "award_min_amount",
-            "program_funding", "provider", "link_to_source", "point_of_contact",
-            "date_posted", "archive_date", "date_closed", "last_update_date",
-        ]
-
-        grant = {k: v for k, v in zip(keys, row)}
+        grant = {k: v for k, v in zip(GRANT_FIELDS, row)}
         return jsonify({"grant": grant})
 
     except MySQLError as e:
         print(e)
-        return jsonify({"error": str(e)}), 500
\ No newline at end of file
+        return jsonify({"error": str(e)}), 500
+
+
+def _grants_by_id(grant_ids: list[str]) -> dict[str, dict]:
+    """
+    grant_id -> every field of the grants in grant_ids (lower-case UUIDs) that exist.
+
+    Grants cached for the current ingest generation are not read again; the rest are read
+    with a single query.
+    """
+    try:
+        generation = ingest_generation.current()
+    except MySQLError:
+        generation = None
+
+    found = {}
+    if generation is not None:
+        for grant_id in grant_ids:
+            grant = grant_cache.get((generation, grant_id))
+            if grant is not None:
+                found[grant_id] = grant
+
+    wanted = [grant_id for grant_id in grant_ids if grant_id not in found]
+    if wanted:
+        placeholders = ", ".join(["UUID_TO_BIN(%s, 1)"] * len(wanted))
+        with get_connection() as conn:
+            with conn.cursor() as cursor:
+                sql = get_sql("grants/select_grant_details_by_uuids").format(placeholders=placeholders)
+                cursor.execute(sql, tuple(wanted))
+                rows = cursor.fetchall()
+        for row in rows:
+            grant = dict(zip(GRANT_FIELDS, row))
+            found[grant["grant_id"]] = grant
+            if generation is not None:
+                grant_cache.set((generation, grant["grant_id"]), grant)
+    return found
+
+
+@public_bp.route("/grants/batch", methods=["POST"])
+def get_grants_batch():
+    """Return the details of many grants, in request order, with one query at most."""
+    body = request.get_json(silent=True)
+    if not isinstance(body, dict):
+        return jsonify({"error": "Request body must be a JSON object"}), 400
+
+    grant_ids = body.get("grant_ids")
+    if not isinstance(grant_ids, list) or not grant_ids:
+        return jsonify({"error": "grant_ids must be a non-empty list"}), 400
+    if len(grant_ids) > BATCH_MAX_IDS:
+        return jsonify({"error": f"At most {BATCH_MAX_IDS} grant_ids per request"}), 400
+    if not all(isinstance(grant_id, str) and re.match(UUID_PATTERN, grant_id) for grant_id in grant_ids):
+        return jsonify({"error": "Invalid grant_id format"}), 400
+
+    fields = body.get("fields")
+    if fields is None:
+        fields = list(GRANT_FIELDS)
+    elif (
+        not isinstance(fields, list)
+        or not fields
+        or not all(isinstance(field, str) and field in GRANT_FIELDS for field in fields)
+    ):
+        return jsonify({"error": f"Invalid fields. Must be a list of: {', '.join(GRANT_FIELDS)}"}), 400
+    if "grant_id" not in fields:
+        fields = ["grant_id", *fields]
+
+    # BIN_TO_UUID returns lower case; repeated ids are answered once
+    grant_ids = list(dict.fromkeys(grant_id.lower() for grant_id in grant_ids))
+
+    try:
+        found = _grants_by_id(grant_ids)
+    except MySQLError as e:
+        print(e)
+        return jsonify({"error": str(e)}), 500
+
+    grants = [{field: found[grant_id][field] for field in fields} for grant_id in grant_ids if grant_id in found]
+    missing = [grant_id for grant_id in grant_ids if grant_id not in found]
+    return jsonify({"grants": grants, "missing": missing})
+
+
+@public_bp.route("/grant/<grant_id>/similar", methods=["GET"])
+@cached_response(response_cache)
+def get_similar_grants(grant_id: str):
+    """Return the precomputed most similar open grants of a grant, best first."""
+    if not re.match(UUID_PATTERN, grant_id):
+        return jsonify({"error": "Invalid grant_id format"}), 400
+    try:
+        k = int(request.args.get("k", "5"))
+    except ValueError:
+        return jsonify({"error": "Invalid k"}), 400
+    if not 1 <= k <= 10:
+        return jsonify({"error": "k must be between 1 and 10"}), 400
+
+    try:
+        with get_connection() as conn:
+            rows = prepared_fetchall(conn, "grants/select_similar_grants", (grant_id, k))
+
+        keys = ["grant_id", "grant_title", "provider", "research_field", "date_closed", "score"]
+        similar = [{name: value for name, value in zip(keys, row)} for row in rows]
+        for grant in similar:
+            grant["score"] = round(float(grant["score"]), 4)
+        return jsonify({"grant_id": grant_id, "similar": similar})
+
+    except MySQLError as e:
+        print(e)
+        return jsonify({"error": str(e)}), 500
+
+
+@public_bp.route("/suggest", methods=["GET"])
+def suggest():
+    """Top-k typeahead completions of q, from memory only."""
+    q = request.args.get("q", "")
+    kind = request.args.get("kind") or None
+    if len(q) > 100:
+        return jsonify({"error": "Query string too long"}), 400
+    if kind is not None and kind not in suggest_index.KINDS:
+        return jsonify({"error": f"Invalid kind. Must be one of: {', '.join(suggest_index.KINDS)}"}), 400
+    try:
+        k = int(request.args.get("k", "8"))
+    except ValueError:
+        return jsonify({"error": "Invalid k"}), 400
+    if not 1 <= k <= 20:
+        return jsonify({"error": "k must be between 1 and 20"}), 400
+
+    suggestions = suggest_index.suggest(q, k, kind)
+    return jsonify({"suggestions": suggestions or [], "ready": suggestions is not None})
+
+
+def _analytics_months() -> tuple[date, date]:
+    """The from/to months (YYYY-MM, inclusive) of an analytics request; every month by default."""
+    first = parse_month(request.args["from"]) if request.args.get("from") else ANALYTICS_FIRST_MONTH
+    last = parse_month(request.args["to"]) if request.args.get("to") else ANALYTICS_LAST_MONTH
+    if first > last:
+        raise ValueError("from must not be after to")
+    return first, last
+
+
+@public_bp.route("/analytics/monthly", methods=["GET"])
+@cached_response(response_cache)
+def analytics_monthly():
+    """Grant count and program funding of each month grants were posted in."""
+    try:
+        first, last = _analytics_months()
+    except ValueError as e:
+        return jsonify({"error": f"Invalid month range: {e}"}), 400
+
+    try:
+        with get_connection() as conn:
+            rows = prepared_fetchall(conn, "grant_rollups/select_grant_rollup_months", (first, last))
+    except MySQLError as e:
+        print(e)
+        return jsonify({"error": str(e)}), 500
+
+    return jsonify({
+        "from": request.args.get("from") or None,
+        "to": request.args.get("to") or None,
+        "months": [
+            {"month": month.strftime("%Y-%m"), "total_grants": count, "total_program_funding": funding}
+            for month, count, funding in rows
+        ],
+    })
+
+
+def _analytics_by(dimension: str, key: str):
+    """Grant count and program funding per value of dimension over the requested months."""
+    try:
+        first, last = _analytics_months()
+    except ValueError as e:
+        return jsonify({"error": f"Invalid month range: {e}"}), 400
+    try:
+        limit = int(request.args.get("limit", "20"))
+    except ValueError:
+        return jsonify({"error": "Invalid limit"}), 400
+    if not 1 <= limit <= ANALYTICS_LIMIT_MAX:
+        return jsonify({"error": f"limit must be between 1 and {ANALYTICS_LIMIT_MAX}"}), 400
+
+    try:
+        with get_connection() as conn:
+            rows = prepared_fetchall(
+                conn, "grant_rollups/select_grant_rollup_values", (dimension, first, last, limit)
+            )
+    except MySQLError as e:
+        print(e)
+        return jsonify({"error": str(e)}), 500
+
+    return jsonify({
+        "from": request.args.get("from") or None,
+        "to": request.args.get("to") or None,
+        key: [
+            {dimension: value or None, "total_grants": int(count), "total_program_funding": int(funding)}
+            for value, count, funding in rows
+        ],
+    })
+
+
+@public_bp.route("/analytics/providers", methods=["GET"])
+@cached_response(response_cache)
+def analytics_providers():
+    """The providers (agencies) with the most program funding posted in the requested months."""
+    return _analytics_by("provider", "providers")
+
+
+@public_bp.route("/analytics/research-fields", methods=["GET"])
+@cached_response(response_cache)
+def analytics_research_fields():
+    """The research fields with the most program funding posted in the requested months."""
+    return _analytics_by("research_field", "research_fields")
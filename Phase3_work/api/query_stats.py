@@ -0,0 +1,342 @@
+'''
+    File: api/query_stats.py
+
+    Author: Colby Wirth
+
+    Version: 19 October 2026
+
+    Description:
+        Per-statement timing for every query the API sends, built into the process.
+
+        - TimedConnection wraps a pooled connection; every cursor it hands out is a TimedCursor.
+        - A TimedCursor records each statement's fingerprint, duration (execute plus fetches),
+          rows returned or affected, and the Flask endpoint that issued it.
+        - Fingerprints follow pt-query-digest: comments dropped, literals and placeholders
+          replaced by ?, IN lists collapsed, whitespace squeezed, lower-cased.
+        - Statements slower than GG_SLOW_QUERY_MS go to the "api.slow_query" logger with the
+          shape (type and length) of their bound parameters, never the values.
+        - query_stats.top() feeds GET /api/admin/query-stats.
+        - capture_statements() collects the statements (with their parameters) a block of code
+          sends from the current thread; the query plan regression suite uses it per endpoint.
+
+    Configuration (environment):
+        GG_SLOW_QUERY_MS   slow-query threshold in milliseconds (default 200)
+        GG_SLOW_QUERY_LOG  file for the slow-query log (default: the Flask/root log handlers)
+'''
+import logging
+import os
+import re
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+from datetime import datetime
+
+from flask import has_request_context, request
+
+from src.utils.sql_file_parsers import strip_sql_comments
+
+SLOW_QUERY_MS = float(os.getenv("GG_SLOW_QUERY_MS", "200"))
+SLOW_QUERY_LOG = os.getenv("GG_SLOW_QUERY_LOG")
+
+# durations kept per fingerprint for the percentile columns
+SAMPLE_SIZE = 200
+
+slow_query_logger = logging.getLogger("api.slow_query")
+if SLOW_QUERY_LOG:
+    _handler = logging.FileHandler(SLOW_QUERY_LOG)
+    _handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+    slow_query_logger.addHandler(_handler)
+    slow_query_logger.setLevel(logging.WARNING)
+
+
+# ==================== FINGERPRINTS ====================
+
+_STRING_LITERAL = re.compile(r"'(?:[^'\\]|\\.|'')*'|\"(?:[^\"\\]|\\.|\"\")*\"")
+_PLACEHOLDER = re.compile(r"%\(\w+\)s|%s|\?")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_HEX = re.compile(r"\b0x[0-9a-f]+\b", re.IGNORECASE)
+_IN_LIST = re.compile(r"\bin\s*\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_VALUES_LIST = re.compile(r"\bvalues\s*(\(\s*\?(?:\s*,\s*\?)*\s*\))(?:\s*,\s*\(\s*\?(?:\s*,\s*\?)*\s*\))*")
+_WHITESPACE = re.compile(r"\s+")
+
+_fingerprint_cache: dict[str, str] = {}
+
+
+def fingerprint(sql: str) -> str:
+    """Normalize a statement so that executions differing only in values group together."""
+    cached = _fingerprint_cache.get(sql)
+    if cached is not None:
+        return cached
+
+    try:
+        text = strip_sql_comments(sql)
+    except ValueError:
+        text = sql
+    text = _STRING_LITERAL.sub("?", text)
+    text = _PLACEHOLDER.sub("?", text)
+    text = _HEX.sub("?", text)
+    text = _NUMBER.sub("?", text)
+    text = _WHITESPACE.sub(" ", text).strip().rstrip(";").strip().lower()
+    text = _IN_LIST.sub("in(?+)", text)
+    text = _VALUES_LIST.sub(r"values \1+", text)
+
+    # statements are mostly static strings from the registry, so the cache stays small
+    if len(_fingerprint_cache) < 5000:
+        _fingerprint_cache[sql] = text
+    return text
+
+
+def parameter_shape(params):
+    """Describe bound parameters by type and size only, so the slow log never holds user data."""
+    if params is None:
+        return None
+    if isinstance(params, dict):
+        return {k: parameter_shape(v) for k, v in params.items()}
+    if isinstance(params, (list, tuple)):
+        if params and all(isinstance(p, (dict, list, tuple)) for p in params):
+            # executemany batch
+            return {"rows": len(params), "row": parameter_shape(params[0])}
+        return [parameter_shape(p) for p in params]
+    if isinstance(params, (str, bytes, bytearray)):
+        return f"{type(params).__name__}({len(params)})"
+    return type(params).__name__
+
+
+def current_route() -> str:
+    if has_request_context():
+        return f"{request.method} {request.endpoint or request.path}"
+    return "-"
+
+
+# ==================== CAPTURE ====================
+
+_capture = threading.local()
+
+
+@contextmanager
+def capture_statements():
+    """
+    Collect (sql, params) for every statement recorded by this thread inside the block.
+
+    Usage:
+        with capture_statements() as statements:
+            client.get("/api/public/search_grants?q=water")
+    """
+    previous = getattr(_capture, "statements", None)
+    statements: list[tuple[str, object]] = []
+    _capture.statements = statements
+    try:
+        yield statements
+    finally:
+        _capture.statements = previous
+
+
+# ==================== AGGREGATION ====================
+
+class _FingerprintStats:
+    __slots__ = ("count", "total_ms", "max_ms", "min_ms", "rows", "slow", "routes", "samples", "example")
+
+    def __init__(self, example: str):
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.min_ms = float("inf")
+        self.rows = 0
+        self.slow = 0
+        self.routes = Counter()
+        self.samples = deque(maxlen=SAMPLE_SIZE)
+        self.example = example
+
+
+class QueryStats:
+    """Thread-safe per-fingerprint totals, in the spirit of pt-query-digest's profile."""
+
+    def __init__(self, slow_query_ms: float = SLOW_QUERY_MS):
+        self.slow_query_ms = slow_query_ms
+        self.started_at = time.time()
+        self._stats: dict[str, _FingerprintStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, sql: str, duration_ms: float, rows: int, params=None, route: str | None = None) -> None:
+        route = route or current_route()
+        captured = getattr(_capture, "statements", None)
+        if captured is not None:
+            captured.append((sql, params))
+        fp = fingerprint(sql)
+        slow = duration_ms >= self.slow_query_ms
+
+        with self._lock:
+            entry = self._stats.get(fp)
+            if entry is None:
+                entry = self._stats[fp] = _FingerprintStats(_WHITESPACE.sub(" ", sql).strip())
+            entry.count += 1
+            entry.total_ms += duration_ms
+            entry.max_ms = max(entry.max_ms, duration_ms)
+            entry.min_ms = min(entry.min_ms, duration_ms)
+            entry.rows += max(rows, 0)
+            entry.routes[route] += 1
+            entry.samples.append(duration_ms)
+            if slow:
+                entry.slow += 1
+
+        if slow:
+            slow_query_logger.warning(
+                "slow query %.1f ms rows=%d route=%s fingerprint=%s params=%s",
+                duration_ms, rows, route, fp, parameter_shape(params),
+            )
+
+    def top(self, n: int = 10, order_by: str = "total_ms") -> list[dict]:
+        """Return the n fingerprints with the highest order_by (total_ms, avg_ms, max_ms, count, rows)."""
+        report = []
+        with self._lock:
+            grand_total = sum(e.total_ms for e in self._stats.values()) or 1.0
+            for fp, e in self._stats.items():
+                samples = sorted(e.samples)
+                p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))] if samples else 0.0
+                report.append({
+                    "fingerprint": fp,
+                    "example": e.example,
+                    "count": e.count,
+                    "total_ms": round(e.total_ms, 3),
+                    "avg_ms": round(e.total_ms / e.count, 3),
+                    "min_ms": round(e.min_ms, 3),
+                    "max_ms": round(e.max_ms, 3),
+                    "p95_ms": round(p95, 3),
+                    "rows": e.rows,
+                    "rows_per_call": round(e.rows / e.count, 2),
+                    "slow": e.slow,
+                    "pct_of_total": round(100.0 * e.total_ms / grand_total, 2),
+                    "routes": dict(e.routes.most_common(5)),
+                })
+        report.sort(key=lambda r: r[order_by], reverse=True)
+        return report[:n]
+
+    def summary(self) -> dict:
+        with self._lock:
+            return {
+                "fingerprints": len(self._stats),
+                "queries": sum(e.count for e in self._stats.values()),
+                "total_ms": round(sum(e.total_ms for e in self._stats.values()), 3),
+                "slow_queries": sum(e.slow for e in self._stats.values()),
+                "slow_query_ms": self.slow_query_ms,
+                "since": datetime.fromtimestamp(self.started_at).isoformat(timespec="seconds"),
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+            self.started_at = time.time()
+
+
+query_stats = QueryStats()
+
+
+# ==================== INSTRUMENTED CURSOR / CONNECTION ====================
+
+class TimedCursor:
+    """
+    Wraps a MySQL cursor and records one entry per executed statement.
+
+    The entry is completed when the next statement runs or the cursor closes, so the time
+    spent fetching rows and the final row count are included.
+    """
+
+    def __init__(self, cursor, owner: "TimedConnection"):
+        self._cursor = cursor
+        self._owner = owner
+        self._pending = None  # [sql, params, elapsed_ms, route]
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __iter__(self):
+        return iter(self.fetchone, None)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _finish(self) -> None:
+        pending, self._pending = self._pending, None
+        if pending is None:
+            return
+        sql, params, elapsed_ms, route = pending
+        try:
+            rows = self._cursor.rowcount
+        except Exception:
+            rows = -1
+        query_stats.record(sql, elapsed_ms, rows if rows is not None else -1, params, route)
+
+    def _timed(self, method, sql, params):
+        self._finish()
+        start = time.perf_counter()
+        try:
+            return method(sql, params)
+        finally:
+            self._pending = [sql, params, (time.perf_counter() - start) * 1000.0, current_route()]
+
+    def execute(self, operation, params=None, *args, **kwargs):
+        return self._timed(lambda s, p: self._cursor.execute(s, p, *args, **kwargs), operation, params)
+
+    def executemany(self, operation, seq_params, *args, **kwargs):
+        return self._timed(lambda s, p: self._cursor.executemany(s, p, *args, **kwargs), operation, seq_params)
+
+    def _fetch(self, method, *args):
+        start = time.perf_counter()
+        try:
+            return method(*args)
+        finally:
+            if self._pending is not None:
+                self._pending[2] += (time.perf_counter() - start) * 1000.0
+
+    def fetchone(self):
+        return self._fetch(self._cursor.fetchone)
+
+    def fetchmany(self, *args, **kwargs):
+        return self._fetch(lambda: self._cursor.fetchmany(*args, **kwargs))
+
+    def fetchall(self):
+        return self._fetch(self._cursor.fetchall)
+
+    def close(self):
+        self._finish()
+        self._owner._forget(self)
+        return self._cursor.close()
+
+
+class TimedConnection:
+    """Wraps a pooled connection so that every cursor it opens is a TimedCursor."""
+
+    def __init__(self, conn):
+        self._conn = conn
+        self._cursors: list[TimedCursor] = []
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _forget(self, cursor: TimedCursor) -> None:
+        try:
+            self._cursors.remove(cursor)
+        except ValueError:
+            pass
+
+    def cursor(self, *args, **kwargs):
+        cursor = TimedCursor(self._conn.cursor(*args, **kwargs), self)
+        self._cursors.append(cursor)
+        return cursor
+
+    def close(self):
+        # complete the entries of cursors the caller never closed
+        for cursor in list(self._cursors):
+            cursor._finish()
+        self._cursors.clear()
+        return self._conn.close()
@@ -0,0 +1,266 @@
+'''
+    File: api/search_index.py
+
+    Author: Colby Wirth
+
+    Version: 19 October 2026
+
+    Description:
+        Keeps an in-memory BM25 index of every grant (src/utils/bm25_index.py) for
+        /api/public/search_grants.
+
+        - start() launches a daemon thread that builds the index from Grants, then polls
+          GrantChangeLog every GG_SEARCH_INDEX_REFRESH seconds and re-indexes only the grants
+          changed since the last change_id it applied.  The log is written by triggers on Grants,
+          so grants from the ingest pipeline show up without restarting the API.
+        - Until the first build finishes (or when it cannot run), search() returns None and the
+          route falls back to the FULLTEXT query.
+        - The index answers which grants match and in what order; the route reads only the
+          returned page of grants from MySQL (hydrate()).
+        - Title, research field, opportunity number, provider, award size, the award and funding
+          amounts and the two dates are kept per grant so the field/op_num and range filters
+          (src/utils/range_filters.py), every sort order and the facet counts (api/facets.py) are
+          applied in memory as well.
+
+    Configuration (environment):
+        GG_SEARCH_INDEX          0 disables the index; every search then goes to MySQL (default 1)
+        GG_SEARCH_INDEX_REFRESH  seconds between change log polls (default 30)
+'''
+import os
+import threading
+import time
+from typing import NamedTuple
+
+from mysql.connector import Error as MySQLError, errorcode  # type: ignore
+
+from src.utils.bm25_index import BM25Index
+from src.utils.logging_utils import log_info, log_error
+from src.utils.range_filters import RangeFilter, matches
+from src.utils.sql_registry import get_sql
+from src.utils.uuid_keys import uuid_to_bin
+from api.db import get_connection
+from api.facets import FacetCounter, award_bucket
+
+ENABLED = os.getenv("GG_SEARCH_INDEX", "1") != "0"
+REFRESH_SECONDS = float(os.getenv("GG_SEARCH_INDEX_REFRESH", "30"))
+
+# rows per fetch while building, and change log rows applied per poll round trip
+FETCH_SIZE = 2000
+CHANGE_BATCH = 5000
+
+
+class GrantKeys(NamedTuple):
+    """Filter, sort and facet values kept in the index for each grant (dates as ISO strings)."""
+    title: str | None
+    research_field: str | None
+    opportunity_number: str
+    date_posted: str | None
+    date_closed: str | None
+    # hex of UUID_TO_BIN(grant_id, 1): the ORDER BY ..., grant_id tiebreaker in byte order
+    order_id: str
+    provider: str | None
+    award_size: str | None
+    award_max_amount: int | None
+    award_min_amount: int | None
+    program_funding: int | None
+
+
+# sort_by -> (GrantKeys field, descending); relevance is the index's own order
+SORT_KEYS = {
+    "title_asc": ("title", False),
+    "title_desc": ("title", True),
+    "posted_date_desc": ("date_posted", True),
+    "posted_date_asc": ("date_posted", False),
+    "close_date_asc": ("date_closed", False),
+    "close_date_desc": ("date_closed", True),
+}
+
+# the columns search_grants returns; the IN list is one placeholder per hit on the page
+_HYDRATE_SQL = """
+    SELECT
+        BIN_TO_UUID(grant_id, 1) AS grant_id,
+        grant_title,
+        description,
+        provider,
+        DATE_FORMAT(date_closed, '%Y-%m-%d') AS date_closed,
+        research_field,
+        DATE_FORMAT(date_posted, '%Y-%m-%d') AS date_posted,
+        opportunity_number
+    FROM Grants
+    WHERE grant_id IN ({placeholders})
+"""
+
+_index: BM25Index | None = None
+_position = 0
+_thread: threading.Thread | None = None
+_start_lock = threading.Lock()
+
+
+def _add_row(index: BM25Index, row) -> None:
+    (grant_id, title, description, provider, research_field, opportunity_number, posted, closed,
+     award_max, award_min, funding) = row
+    index.add(
+        grant_id,
+        {"grant_title": title, "description": description, "provider": provider, "research_field": research_field},
+        GrantKeys(
+            title.lower() if title else title,
+            research_field,
+            (opportunity_number or "").lower(),
+            posted.isoformat() if posted else None,
+            closed.isoformat() if closed else None,
+            uuid_to_bin(grant_id).hex(),
+            provider,
+            award_bucket(award_max),
+            award_max,
+            award_min,
+            funding,
+        ),
+    )
+
+
+def build(conn) -> tuple[BM25Index, int]:
+    """A fresh index of every grant, and the change log position it is current to."""
+    index = BM25Index()
+    with conn.cursor() as cursor:
+        # read the position first: changes made during the scan are replayed by the next poll
+        cursor.execute(get_sql("grants/select_grant_change_log_position"))
+        position = cursor.fetchone()[0]
+        cursor.execute(get_sql("grants/select_grants_for_search_index"))
+        while True:
+            rows = cursor.fetchmany(FETCH_SIZE)
+            if not rows:
+                break
+            for row in rows:
+                _add_row(index, row)
+    return index, position
+
+
+def apply_changes(conn, index: BM25Index, position: int) -> tuple[int, int]:
+    """Re-index the grants changed after position; returns (new position, changes applied)."""
+    applied = 0
+    with conn.cursor() as cursor:
+        while True:
+            cursor.execute(get_sql("grants/select_grant_changes_since"), (position, CHANGE_BATCH))
+            rows = cursor.fetchall()
+            for change_id, *grant in rows:
+                # the join returns the grant's current values, or NULLs once it is deleted
+                if grant[5] is None:
+                    index.remove(grant[0])
+                else:
+                    _add_row(index, grant)
+                position = change_id
+            applied += len(rows)
+            if len(rows) < CHANGE_BATCH:
+                return position, applied
+
+
+def _refresh() -> None:
+    global _index, _position
+    with get_connection() as conn:
+        if _index is None:
+            start = time.perf_counter()
+            index, position = build(conn)
+            _index, _position = index, position
+            log_info(f"Search index built: {len(index)} grants in {time.perf_counter() - start:.1f}s")
+        else:
+            _position, applied = apply_changes(conn, _index, _position)
+            if applied:
+                log_info(f"Search index applied {applied} grant changes")
+
+
+def _run() -> None:
+    while True:
+        try:
+            _refresh()
+        except MySQLError as e:
+            if e.errno == errorcode.ER_NO_SUCH_TABLE:
+                log_error(f"Search index disabled, run db_migration/add_grant_change_log.sql: {e}")
+                return
+            log_error(f"Search index refresh failed: {e}")
+        time.sleep(REFRESH_SECONDS)
+
+
+def start() -> None:
+    """Build the index in the background and keep it current.  Safe to call more than once."""
+    global _thread
+    if not ENABLED:
+        return
+    with _start_lock:
+        if _thread is None:
+            _thread = threading.Thread(target=_run, name="grant-search-index", daemon=True)
+            _thread.start()
+
+
+def search(
+    q: str,
+    field: str = "",
+    op_num: str = "",
+    sort_by: str = "relevance",
+    offset: int = 0,
+    limit: int = 10,
+    after: list | None = None,
+    facets: FacetCounter | None = None,
+    ranges: tuple[RangeFilter, ...] = (),
+    op_num_prefix: bool = False,
+) -> tuple[int, list[tuple[str, float, tuple]]] | None:
+    """
+    (total matches, [(grant_id, score, sort key), ...] for one page), or None when the index
+    is not ready.
+
+    field and op_num are case-insensitive substring filters, like the route's; with op_num_prefix
+    op_num must match the start of the opportunity number (op_num_match=prefix).
+    ranges are the numeric and date bounds of src/utils/range_filters.py.
+    after is the sort key of the last hit of the previous page (from a cursor token).
+    facets, when given, counts the facet values of every match.
+    Sorted columns order the same way as the MySQL query (ORDER BY column, grant_id);
+    relevance ties are broken by grant_id.
+    """
+    index = _index
+    if index is None:
+        return None
+
+    field, op_num = field.lower(), op_num.lower()
+    where = None
+    if field or op_num or ranges:
+        def where(keys: GrantKeys) -> bool:
+            return (
+                field in (keys.research_field or "").lower()
+                and (keys.opportunity_number.startswith(op_num) if op_num_prefix else op_num in keys.opportunity_number)
+                and matches(ranges, keys)
+            )
+
+    sort_key, descending = None, False
+    if sort_by in SORT_KEYS:
+        name, descending = SORT_KEYS[sort_by]
+
+        # MySQL puts NULLs first in ascending order and last in descending order
+        def sort_key(keys: GrantKeys):
+            value = getattr(keys, name)
+            return (value is not None, value or "", keys.order_id)
+
+    return index.search(
+        q, offset=offset, limit=limit, where=where, sort_key=sort_key, descending=descending,
+        after=tuple(after) if after is not None else None, on_match=facets,
+    )
+
+
+def hydrate(conn, hits: list[tuple[str, float, tuple]]) -> list[tuple]:
+    """
+    The search result columns for one page of hits, in hit order, with the score appended.
+
+    Grants deleted after the index last saw them are left out.
+    """
+    if not hits:
+        return []
+    placeholders = ", ".join(["UUID_TO_BIN(%s, 1)"] * len(hits))
+    with conn.cursor() as cursor:
+        cursor.execute(_HYDRATE_SQL.format(placeholders=placeholders), tuple(hit[0] for hit in hits))
+        rows = {row[0]: row for row in cursor.fetchall()}
+    return [rows[grant_id] + (score,) for grant_id, score, _ in hits if grant_id in rows]
+
+
+def status() -> dict:
+    index = _index
+    if index is None:
+        return {"ready": False, "enabled": ENABLED}
+    return {"ready": True, "enabled": ENABLED, "change_log_position": _position, **index.stats()}
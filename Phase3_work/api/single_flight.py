@@ -0,0 +1,257 @@
+'''
+    File: api/single_flight.py
+
+    Author: Colby Wirth
+
+    Version: 19 October 2026
+
+    Description:
+        Request coalescing ("single flight") for the cached public routes (api/caching.py).
+
+        After an ingest every cached response misses at once, and concurrent identical requests
+        (the landing page statistics, the first page of a popular search) would each run the
+        same expensive queries.  cached_response() sends its misses through public_flight
+        instead, so only one of them runs:
+
+        - SingleFlight (per process): the first request for a key is the leader and runs the
+          route; identical requests arriving while it runs wait for its result instead of
+          running it again.  A waiter gives up after GG_SINGLE_FLIGHT_TIMEOUT seconds and runs
+          the route itself, so a slow or stuck leader delays others by at most that long.  An
+          exception of the leader is raised to its waiters as well.
+        - DatabaseFlight (across worker processes, when GG_SINGLE_FLIGHT_DB=1): the leader of
+          each process takes the MySQL named lock of the key (GET_LOCK) before running the
+          route, and the first to get it stores its 200 response in QueryFlights for
+          GG_SINGLE_FLIGHT_DB_TTL seconds.  The leaders of the other workers wait on the lock,
+          find the stored response and return it without running the route.  The lock is held
+          on a connection of the separate flight pool (api.db.get_flight_connection), so a
+          leader running its route holds one connection of the routes' pool, like any other
+          request.  If MySQL cannot be used for this (no QueryFlights table, no free flight
+          connection), or the lock is not granted within the timeout, the route simply runs.
+
+        Values are (status, body, mimetype) tuples, which can be handed between threads;
+        DatabaseFlight only shares 200 JSON bodies.  Named flights register in FLIGHTS so
+        GET /api/admin/query-stats can report how many requests were coalesced, how long
+        waiters waited and how many timed out.
+
+    Configuration (environment):
+        GG_SINGLE_FLIGHT_TIMEOUT  seconds a waiter waits for the leader (default 10)
+        GG_SINGLE_FLIGHT_DB       1 to coalesce across worker processes (default 0)
+        GG_SINGLE_FLIGHT_DB_TTL   seconds a shared response is kept in QueryFlights (default 30)
+'''
+import hashlib
+import math
+import os
+import threading
+import time
+
+from mysql.connector import Error as MySQLError  # type: ignore
+
+from src.utils.logging_utils import log_warning
+from src.utils.sql_registry import get_sql
+
+FLIGHT_TIMEOUT = float(os.getenv("GG_SINGLE_FLIGHT_TIMEOUT", "10"))
+SHARE_ACROSS_WORKERS = os.getenv("GG_SINGLE_FLIGHT_DB", "0") == "1"
+SHARED_TTL = int(os.getenv("GG_SINGLE_FLIGHT_DB_TTL", "30"))
+
+JSON = "application/json"
+# a bookkeeping statement MySQL refused
+UNAVAILABLE = object()
+
+# name -> flight, for the admin statistics
+FLIGHTS: dict[str, "SingleFlight"] = {}
+
+
+def flight_digest(key) -> str:
+    """32 hex characters naming key in QueryFlights and in the MySQL lock name."""
+    return hashlib.blake2b(repr(key).encode("utf-8"), digest_size=16).hexdigest()
+
+
+class _Call:
+    """One running computation and the requests waiting for it."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error: BaseException | None = None
+        self.waiters = 0
+
+
+class DatabaseFlight:
+    """Coalesces the leaders of several worker processes with MySQL named locks and QueryFlights."""
+
+    def __init__(self, timeout: float = FLIGHT_TIMEOUT, ttl: int = SHARED_TTL):
+        self.timeout = timeout
+        self.ttl = ttl
+        self._stats_lock = threading.Lock()
+        self._warned = False
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        with self._stats_lock:
+            self.remote_hits = 0
+            self.stored = 0
+            self.lock_timeouts = 0
+            self.unavailable = 0
+
+    def _count(self, name: str) -> None:
+        with self._stats_lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def _run(self, cursor, script: str, params: tuple):
+        """The first row of a bookkeeping statement (None without one), or UNAVAILABLE when MySQL refuses it."""
+        try:
+            cursor.execute(get_sql(script), params)
+            return cursor.fetchone() if cursor.with_rows else None
+        except MySQLError as e:
+            self._count("unavailable")
+            if not self._warned:
+                self._warned = True
+                log_warning(f"Single flight across workers unavailable ({e}); routes run uncoalesced.")
+            return UNAVAILABLE
+
+    def do(self, key, fn):
+        from api.db import get_flight_connection
+
+        digest = flight_digest(key)
+        lock_name = f"gg_flight_{digest}"
+        try:
+            conn = get_flight_connection()
+        except MySQLError:
+            self._count("unavailable")
+            return fn()
+        try:
+            with conn.cursor() as cursor:
+                stored = self._run(cursor, "query_flights/select_query_flight", (digest,))
+                if stored is UNAVAILABLE:
+                    return fn()
+                if stored is None:
+                    granted = self._run(
+                        cursor, "query_flights/get_query_flight_lock", (lock_name, math.ceil(self.timeout))
+                    )
+                    if granted is UNAVAILABLE or not granted or granted[0] != 1:
+                        if granted is not UNAVAILABLE:
+                            self._count("lock_timeouts")
+                        return fn()
+                    try:
+                        # another worker may have stored it while this one waited for the lock
+                        stored = self._run(cursor, "query_flights/select_query_flight", (digest,))
+                        if stored is None or stored is UNAVAILABLE:
+                            value = fn()
+                            status, body, mimetype = value
+                            if status == 200 and mimetype == JSON and stored is None:
+                                self._run(cursor, "query_flights/delete_expired_query_flights", ())
+                                if self._run(cursor, "query_flights/create_query_flight",
+                                             (digest, body, self.ttl)) is not UNAVAILABLE:
+                                    self._count("stored")
+                            return value
+                    finally:
+                        self._run(cursor, "query_flights/release_query_flight_lock", (lock_name,))
+            self._count("remote_hits")
+            return 200, bytes(stored[0]), JSON
+        finally:
+            conn.close()
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            return {
+                "remote_hits": self.remote_hits,
+                "stored": self.stored,
+                "lock_timeouts": self.lock_timeouts,
+                "unavailable": self.unavailable,
+                "ttl_s": self.ttl,
+            }
+
+
+class SingleFlight:
+    """Runs one computation per key at a time in this process; concurrent callers share its result."""
+
+    def __init__(self, timeout: float = FLIGHT_TIMEOUT, shared: DatabaseFlight | None = None,
+                 name: str | None = None):
+        self.timeout = timeout
+        self.shared = shared
+        self._calls: dict[object, _Call] = {}
+        self._lock = threading.Lock()
+        self.reset_stats()
+        if name:
+            FLIGHTS[name] = self
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.leaders = 0
+            self.coalesced = 0
+            self.timeouts = 0
+            self.shared_errors = 0
+            self.max_waiters = 0
+            self.wait_ms = 0.0
+        if self.shared is not None:
+            self.shared.reset_stats()
+
+    def do(self, key, fn):
+        """fn()'s value, computed once for all concurrent callers with the same key."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.leaders += 1
+            else:
+                call.waiters += 1
+        if leader:
+            return self._lead(key, call, fn)
+
+        start = time.monotonic()
+        finished = call.done.wait(self.timeout)
+        with self._lock:
+            self.wait_ms += (time.monotonic() - start) * 1000.0
+            if not finished:
+                self.timeouts += 1
+            elif call.error is not None:
+                self.shared_errors += 1
+            else:
+                self.coalesced += 1
+        if not finished:
+            return fn()
+        if call.error is not None:
+            raise call.error
+        return call.value
+
+    def _lead(self, key, call: _Call, fn):
+        try:
+            call.value = fn() if self.shared is None else self.shared.do(key, fn)
+            return call.value
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+                self.max_waiters = max(self.max_waiters, call.waiters)
+            call.done.set()
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
+
+    def stats(self) -> dict:
+        with self._lock:
+            waits = self.coalesced + self.timeouts + self.shared_errors
+            stats = {
+                "in_flight": len(self._calls),
+                "leaders": self.leaders,
+                "coalesced": self.coalesced,
+                "timeouts": self.timeouts,
+                "shared_errors": self.shared_errors,
+                "max_waiters": self.max_waiters,
+                "avg_wait_ms": round(self.wait_ms / waits, 3) if waits else None,
+                "timeout_s": self.timeout,
+            }
+        if self.shared is not None:
+            stats["across_workers"] = self.shared.stats()
+        return stats
+
+
+# the misses of every cached_response() route
+public_flight = SingleFlight(
+    shared=DatabaseFlight() if SHARE_ACROSS_WORKERS else None,
+    name="public_responses",
+)
@@ -0,0 +1,103 @@
+'''
+    File: api/suggest_index.py
+
+    Author: Colby Wirth
+
+    Version: 19 October 2026
+
+    Description:
+        Keeps the in-memory prefix index (src/utils/prefix_index.py) behind
+        /api/public/suggest: grant titles, opportunity numbers, providers and research fields.
+
+        - start() launches a daemon thread that builds the index, then checks the ingest
+          generation (api/caching.py) every GG_SUGGEST_REFRESH seconds and rebuilds it when
+          grants have changed.  The new index replaces the old one in a single assignment, so
+          lookups never wait for a rebuild.
+        - Without GrantChangeLog there is no generation to watch, and the index is rebuilt
+          every GG_SUGGEST_MAX_AGE seconds instead.
+        - Until the first build finishes, suggest() returns None.  Suggestions are only ever
+          read from memory; there is no per-keystroke query against MySQL.
+
+    Configuration (environment):
+        GG_SUGGEST_INDEX    0 disables the index and /suggest returns no suggestions (default 1)
+        GG_SUGGEST_REFRESH  seconds between generation checks (default 60)
+        GG_SUGGEST_MAX_AGE  seconds before a rebuild when the generation is unknown (default 3600)
+'''
+import os
+import threading
+import time
+
+from mysql.connector import Error as MySQLError  # type: ignore
+
+from src.utils.logging_utils import log_info, log_error
+from src.utils.prefix_index import PrefixIndex
+from src.utils.sql_registry import get_sql
+from api.caching import ingest_generation
+from api.db import get_connection
+
+ENABLED = os.getenv("GG_SUGGEST_INDEX", "1") != "0"
+REFRESH_SECONDS = float(os.getenv("GG_SUGGEST_REFRESH", "60"))
+MAX_AGE_SECONDS = float(os.getenv("GG_SUGGEST_MAX_AGE", "3600"))
+
+KINDS = ("title", "opportunity_number", "provider", "research_field")
+
+_index: PrefixIndex | None = None
+_generation: int | None = None
+_built_at = float("-inf")
+_thread: threading.Thread | None = None
+_start_lock = threading.Lock()
+
+
+def build(conn) -> PrefixIndex:
+    with conn.cursor() as cursor:
+        cursor.execute(get_sql("grants/select_suggest_terms"))
+        return PrefixIndex(cursor.fetchall())
+
+
+def _refresh() -> None:
+    global _index, _generation, _built_at
+    with get_connection() as conn:
+        generation = ingest_generation.current(conn)
+        stale = generation != _generation if generation is not None \
+            else time.monotonic() - _built_at >= MAX_AGE_SECONDS
+        if _index is not None and not stale:
+            return
+        start = time.perf_counter()
+        index = build(conn)
+    _index, _generation, _built_at = index, generation, time.monotonic()
+    log_info(f"Suggest index built: {len(index)} suggestions in {time.perf_counter() - start:.1f}s")
+
+
+def _run() -> None:
+    while True:
+        try:
+            _refresh()
+        except MySQLError as e:
+            log_error(f"Suggest index refresh failed: {e}")
+        time.sleep(REFRESH_SECONDS)
+
+
+def start() -> None:
+    """Build the index in the background and rebuild it after ingest.  Safe to call more than once."""
+    global _thread
+    if not ENABLED:
+        return
+    with _start_lock:
+        if _thread is None:
+            _thread = threading.Thread(target=_run, name="grant-suggest-index", daemon=True)
+            _thread.start()
+
+
+def suggest(prefix: str, k: int = 8, kind: str | None = None) -> list[dict] | None:
+    """Up to k completions of prefix, heaviest first, or None when the index is not ready."""
+    index = _index
+    if index is None:
+        return None
+    return index.suggest(prefix, k, kind)
+
+
+def status() -> dict:
+    index = _index
+    if index is None:
+        return {"ready": False, "enabled": ENABLED}
+    return {"ready": True, "enabled": ENABLED, "generation": _generation, **index.stats()}
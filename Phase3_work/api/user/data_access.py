@@ -0,0 +1,489 @@
+'''
+    File: api/user/data_access.py
+
+    Author: Colby Wirth
+
+    Version: 19 October 2026
+
+    Description:
+        Owner-scoped data access for the /api/user application, task, document, saved search,
+        feed and dashboard routes.
+
+        - The ownership check is part of the statement that does the work: reads join
+          Applications on (application_id, user_id) and writes are conditional DML whose
+          rowcount says whether the caller owned the row.  No separate COUNT(*) round trip.
+        - Ids of new rows are generated here, so nothing has to be read back after an insert.
+        - Pool connections run in autocommit mode with FOUND_ROWS, so a single statement needs
+          no COMMIT and an UPDATE that changes nothing still reports the row it matched.
+        - When a conditional write matches nothing, the reason is looked up only then, on the
+          (rare) failure path, to keep the route's error messages.
+
+        Every function raises a UserDataError subclass carrying the HTTP status to return.
+'''
+from datetime import date, datetime
+from urllib.parse import parse_qsl
+
+from mysql.connector import errorcode, Error as MySQLError  # type: ignore
+
+from api.db import prepared_fetchone, prepared_fetchall
+from src.utils.recommendations import REASONS
+from src.utils.sql_registry import get_sql
+from src.utils.uuid_keys import new_uuid
+
+APPLICATION_NOT_FOUND = "Application not found or access denied"
+
+APPLICATION_KEYS = ("application_id", "user_id", "grant_id", "submission_status", "status",
+                    "application_date", "grant_name", "internal_deadline", "notes")
+
+# request field -> column, for the updates whose SET list depends on the request body
+APPLICATION_UPDATE_COLUMNS = {
+    "status": "status",
+    "submission_status": "submission_status",
+    "submitted_at": "submitted_at",
+    "internal_deadline": "internal_deadline",
+    "notes": "notes",
+}
+TASK_UPDATE_COLUMNS = {
+    "task_name": "deadline_name",
+    "task_description": "task_description",
+    "deadline": "deadline_date",
+    "completed": "completed",
+}
+
+# the largest match_id: the inbox page "older than" bound that includes every match
+FIRST_INBOX_PAGE = 2 ** 64 - 1
+# above every score (SMALLINT UNSIGNED): the feed page "after" bound that includes every row
+FIRST_FEED_PAGE = (2 ** 16, "00000000-0000-0000-0000-000000000000")
+
+
+class UserDataError(Exception):
+    """Base error of the owner-scoped data access layer."""
+    status_code = 500
+
+
+class NotFoundError(UserDataError):
+    """The row does not exist or does not belong to the requesting user."""
+    status_code = 404
+
+
+class ConflictError(UserDataError):
+    """The write conflicts with an existing row."""
+    status_code = 409
+
+
+class InvalidStateError(UserDataError):
+    """The row exists but its state does not allow the change."""
+    status_code = 400
+
+
+def new_id() -> str:
+    """Generate the id of a new row on the client; time-ordered like the column defaults."""
+    return new_uuid()
+
+
+def _task_row_to_dict(row) -> dict:
+    return {
+        "task_id": row[0],
+        "application_id": row[1],
+        "task_name": row[2],
+        "task_description": row[3],
+        "deadline": row[4],
+        "completed": bool(row[5]),
+        "created_at": str(row[6]) if row[6] else None,
+        "updated_at": str(row[7]) if row[7] else None
+    }
+
+
+def _raise_task_write_failure(conn, application_id: str, user_id: str, submitted_message: str,
+                              deadline: date | None = None) -> None:
+    """Work out why a conditional task write matched no rows and raise the matching error."""
+    state = prepared_fetchone(conn, "applications/select_owned_application_state", (application_id, user_id))
+    if state is None:
+        raise NotFoundError(APPLICATION_NOT_FOUND)
+    submission_status, date_closed = state
+    if submission_status == "submitted":
+        raise InvalidStateError(submitted_message)
+    if deadline and date_closed and deadline > date_closed:
+        raise InvalidStateError("Task deadline cannot exceed grant deadline")
+    raise NotFoundError("Task not found")
+
+
+# ==================== APPLICATIONS ====================
+
+def get_application(conn, application_id: str, user_id: str) -> dict:
+    """Return one of the user's applications with its grant title (1 round trip)."""
+    row = prepared_fetchone(conn, "applications/select_owned_application", (application_id, user_id))
+    if row is None:
+        raise NotFoundError(APPLICATION_NOT_FOUND)
+    return dict(zip(APPLICATION_KEYS, row))
+
+
+def create_application(conn, user_id: str, grant_id: str, submission_status: str, status: str,
+                       application_date: str) -> dict:
+    """
+    Create an application for an existing grant (2 round trips: insert, read back with grant title).
+
+    Raises:
+        NotFoundError: if the grant does not exist.
+        ConflictError: if the user already applied to the grant.
+    """
+    application_id = new_id()
+    params = {
+        "application_id": application_id,
+        "user_id": user_id,
+        "grant_id": grant_id,
+        "submission_status": submission_status,
+        "status": status,
+        "application_date": application_date,
+        "submitted_at": datetime.now() if submission_status == "submitted" else None,
+    }
+
+    with conn.cursor() as cursor:
+        try:
+            cursor.execute(get_sql("applications/create_application_for_grant", params), params)
+        except MySQLError as e:
+            if e.errno == errorcode.ER_DUP_ENTRY:
+                raise ConflictError("You have already applied to this grant") from e
+            raise
+        if cursor.rowcount == 0:
+            raise NotFoundError("Grant not found")
+
+    application = get_application(conn, application_id, user_id)
+    # the create response has always omitted these
+    application.pop("internal_deadline")
+    application.pop("notes")
+    return application
+
+
+def update_application(conn, application_id: str, user_id: str, fields: dict) -> None:
+    """
+    Update columns of one of the user's applications (1 round trip).
+
+    Args:
+        fields: Validated values keyed by APPLICATION_UPDATE_COLUMNS.
+    """
+    columns = [APPLICATION_UPDATE_COLUMNS[k] for k in fields]
+    sql = f"""
+        UPDATE Applications
+        SET {', '.join(f'{column} = %s' for column in columns)}
+        WHERE application_id = UUID_TO_BIN(%s, 1) AND user_id = UUID_TO_BIN(%s, 1)
+    """
+    with conn.cursor() as cursor:
+        cursor.execute(sql, (*fields.values(), application_id, user_id))
+        if cursor.rowcount == 0:
+            raise NotFoundError(APPLICATION_NOT_FOUND)
+
+
+def delete_application(conn, application_id: str, user_id: str) -> None:
+    """Delete one of the user's applications (1 round trip)."""
+    params = {"application_id": application_id, "user_id": user_id}
+    with conn.cursor() as cursor:
+        cursor.execute(get_sql("applications/delete_owned_application", params), params)
+        if cursor.rowcount == 0:
+            raise NotFoundError(APPLICATION_NOT_FOUND)
+
+
+# ==================== TASKS ====================
+
+def list_tasks(conn, application_id: str, user_id: str) -> list[dict]:
+    """Return the tasks of one of the user's applications (1 round trip)."""
+    rows = prepared_fetchall(conn, "internal_deadlines/select_owned_internal_deadlines", (application_id, user_id))
+    if not rows:
+        raise NotFoundError(APPLICATION_NOT_FOUND)
+    # an owned application without tasks comes back as a single row of NULL task columns
+    return [_task_row_to_dict(row) for row in rows if row[0] is not None]
+
+
+def create_task(conn, application_id: str, user_id: str, task_name: str, task_description: str,
+                deadline: date) -> dict:
+    """
+    Add a task to one of the user's started applications (1 round trip).
+
+    Raises:
+        NotFoundError: if the application is not the user's.
+        InvalidStateError: if the application was submitted or the deadline is after the grant closes.
+    """
+    # TIMESTAMP columns store whole seconds; send the value so the response needs no read-back
+    created_at = datetime.now().replace(microsecond=0)
+    params = {
+        "internal_deadline_id": new_id(),
+        "application_id": application_id,
+        "user_id": user_id,
+        "deadline_name": task_name,
+        "task_description": task_description,
+        "deadline_date": deadline,
+        "created_at": created_at,
+    }
+    with conn.cursor() as cursor:
+        cursor.execute(get_sql("internal_deadlines/create_owned_internal_deadline", params), params)
+        inserted = cursor.rowcount
+
+    if inserted == 0:
+        _raise_task_write_failure(
+            conn, application_id, user_id,
+            "Cannot add tasks to a submitted application. Tasks can only be added to applications with 'started' status.",
+            deadline=deadline,
+        )
+
+    return _task_row_to_dict((
+        params["internal_deadline_id"], application_id, task_name, task_description,
+        deadline.isoformat(), False, created_at, created_at,
+    ))
+
+
+def update_task(conn, application_id: str, task_id: str, user_id: str, fields: dict) -> None:
+    """
+    Update a task of one of the user's started applications (1 round trip).
+
+    Args:
+        fields: Values keyed by TASK_UPDATE_COLUMNS.
+    """
+    columns = [TASK_UPDATE_COLUMNS[k] for k in fields]
+    sql = f"""
+        UPDATE InternalDeadlines d
+        JOIN Applications a ON a.application_id = d.application_id
+        SET {', '.join(f'd.{column} = %s' for column in columns)}
+        WHERE d.internal_deadline_id = UUID_TO_BIN(%s, 1)
+          AND d.application_id = UUID_TO_BIN(%s, 1)
+          AND a.user_id = UUID_TO_BIN(%s, 1)
+          AND a.submission_status = 'started'
+    """
+    with conn.cursor() as cursor:
+        cursor.execute(sql, (*fields.values(), task_id, application_id, user_id))
+        updated = cursor.rowcount
+
+    if updated == 0:
+        _raise_task_write_failure(
+            conn, application_id, user_id,
+            "Cannot modify tasks of a submitted application. Tasks can only be modified for applications with 'started' status.",
+        )
+
+
+def delete_task(conn, application_id: str, task_id: str, user_id: str) -> None:
+    """Delete a task of one of the user's started applications (1 round trip)."""
+    params = {"internal_deadline_id": task_id, "application_id": application_id, "user_id": user_id}
+    with conn.cursor() as cursor:
+        cursor.execute(get_sql("internal_deadlines/delete_owned_internal_deadline", params), params)
+        deleted = cursor.rowcount
+
+    if deleted == 0:
+        _raise_task_write_failure(
+            conn, application_id, user_id,
+            "Cannot delete tasks from a submitted application. Tasks can only be deleted from applications with 'started' status.",
+        )
+
+
+# ==================== DOCUMENTS ====================
+
+def require_application(conn, application_id: str, user_id: str) -> str:
+    """Return the submission status of one of the user's applications (1 round trip)."""
+    state = prepared_fetchone(conn, "applications/select_owned_application_state", (application_id, user_id))
+    if state is None:
+        raise NotFoundError(APPLICATION_NOT_FOUND)
+    return state[0]
+
+
+def add_documents(conn, documents: list[dict]) -> None:
+    """
+    Insert document rows prepared by the caller (1 round trip for any number of files).
+
+    Args:
+        documents: Dicts with document_id, document_name, document_type, document_size,
+            upload_date and application_id.
+    """
+    if not documents:
+        return
+    sql = get_sql("documents/create_documents_with_id", documents[0])
+    with conn.cursor() as cursor:
+        # executemany turns INSERT ... VALUES into a single multi-row INSERT
+        cursor.executemany(sql, documents)
+
+
+def list_documents(conn, application_id: str, user_id: str) -> list[dict]:
+    """Return the documents of one of the user's applications (1 round trip)."""
+    rows = prepared_fetchall(conn, "documents/select_owned_documents", (application_id, user_id))
+    if not rows:
+        raise NotFoundError(APPLICATION_NOT_FOUND)
+    return [
+        {
+            "document_id": row[0],
+            "document_name": row[1],
+            "document_type": row[2],
+            "document_size": row[3],
+            "upload_date": str(row[4]) if row[4] else None
+        }
+        for row in rows if row[0] is not None
+    ]
+
+
+def get_document_name(conn, application_id: str, document_id: str, user_id: str) -> str:
+    """Return the name of a document of one of the user's applications (1 round trip)."""
+    row = prepared_fetchone(conn, "documents/select_owned_document", (document_id, application_id, user_id))
+    if row is None:
+        raise NotFoundError("Document not found")
+    return str(row[0])
+
+
+def delete_document(conn, application_id: str, document_id: str, user_id: str) -> str:
+    """
+    Delete a document of one of the user's applications (2 round trips: the name is needed
+    to remove the file, then the delete).
+
+    Returns:
+        The deleted document's name.
+    """
+    document_name = get_document_name(conn, application_id, document_id, user_id)
+    params = {"document_id": document_id, "application_id": application_id, "user_id": user_id}
+    with conn.cursor() as cursor:
+        cursor.execute(get_sql("documents/delete_owned_document", params), params)
+        if cursor.rowcount == 0:
+            # deleted by a concurrent request between the two statements
+            raise NotFoundError("Document not found")
+    return document_name
+
+
+# ==================== SAVED SEARCHES ====================
+
+def _saved_search_row_to_dict(row) -> dict:
+    return {
+        "search_id": row[0],
+        "name": row[1],
+        "query": dict(parse_qsl(row[2])),
+        "created_at": str(row[3]) if row[3] else None,
+    }
+
+
+def list_saved_searches(conn, user_id: str) -> list[dict]:
+    """Return the user's saved searches, newest first (1 round trip)."""
+    rows = prepared_fetchall(conn, "saved_searches/select_saved_searches_by_user", (user_id,))
+    return [_saved_search_row_to_dict(row) for row in rows]
+
+
+def create_saved_search(conn, user_id: str, name: str, query_string: str) -> dict:
+    """
+    Save a search for the user (1 round trip).  It is matched against grants changed after
+    this point by src/system_functions/percolate_saved_searches.py.
+
+    Args:
+        query_string: The search as normalized by src.utils.percolator.normalize_query().
+    """
+    created_at = datetime.now().replace(microsecond=0)
+    params = {"search_id": new_id(), "user_id": user_id, "name": name, "query_string": query_string}
+    with conn.cursor() as cursor:
+        cursor.execute(get_sql("saved_searches/create_saved_search", params), params)
+    return _saved_search_row_to_dict((params["search_id"], name, query_string, created_at))
+
+
+def delete_saved_search(conn, search_id: str, user_id: str) -> None:
+    """Delete one of the user's saved searches and its inbox entries (1 round trip)."""
+    params = {"search_id": search_id, "user_id": user_id}
+    with conn.cursor() as cursor:
+        cursor.execute(get_sql("saved_searches/delete_owned_saved_search", params), params)
+        if cursor.rowcount == 0:
+            raise NotFoundError("Saved search not found")
+
+
+def list_saved_search_matches(conn, user_id: str, before: int | None, limit: int) -> list[dict]:
+    """
+    Return a page of the user's saved search inbox, newest match first (1 round trip).
+
+    Args:
+        before: The match_id of the last row of the previous page, or None for the first page.
+    """
+    rows = prepared_fetchall(
+        conn, "saved_searches/select_saved_search_inbox",
+        (user_id, FIRST_INBOX_PAGE if before is None else before, limit),
+    )
+    return [
+        {
+            "match_id": row[0],
+            "search_id": row[1],
+            "search_name": row[2],
+            "grant_id": row[3],
+            "grant_title": row[4],
+            "provider": row[5],
+            "date_closed": row[6],
+            "matched_at": str(row[7]) if row[7] else None,
+        }
+        for row in rows
+    ]
+
+
+# ==================== GRANT FEED ====================
+
+def list_feed(conn, user_id: str, after: tuple[int, str] | None, limit: int) -> list[dict]:
+    """
+    Return a page of the user's recommended grants, best first (1 round trip).
+
+    Args:
+        after: (score, grant_id) of the last row of the previous page, or None for the first page.
+    """
+    score, grant_id = after if after is not None else FIRST_FEED_PAGE
+    rows = prepared_fetchall(conn, "user_grant_feed/select_user_grant_feed", (user_id, score, score, grant_id, limit))
+    return [
+        {
+            "grant_id": row[0],
+            "score": row[1],
+            "reasons": [name for bit, name in REASONS.items() if row[2] & bit],
+            "grant_title": row[3],
+            "provider": row[4],
+            "research_field": row[5],
+            "date_closed": row[6],
+            "award_max_amount": row[7],
+        }
+        for row in rows
+    ]
+
+
+# ==================== DASHBOARD ====================
+
+def build_dashboard(application_rows, task_rows, document_rows) -> dict:
+    """Merge the dashboard statements' rows into the applications and their totals."""
+    tasks = {row[0]: row[1:] for row in task_rows}
+    documents = {row[0]: row[1:] for row in document_rows}
+    applications = []
+    for row in application_rows:
+        task_count, completed, overdue, next_deadline = tasks.get(row[0], (0, 0, 0, None))
+        document_count, last_upload = documents.get(row[0], (0, None))
+        task_count, completed, overdue = int(task_count), int(completed or 0), int(overdue or 0)
+        applications.append({
+            "application_id": row[0],
+            "grant_id": row[1],
+            "submission_status": row[2],
+            "status": row[3],
+            "application_date": row[4],
+            "internal_deadline": row[5],
+            "grant_name": row[6],
+            "grant_date_closed": row[7],
+            "task_count": task_count,
+            "completed_tasks": completed,
+            "overdue_tasks": overdue,
+            "completed_percent": round(100 * completed / task_count) if task_count else None,
+            "next_deadline": next_deadline,
+            "document_count": int(document_count),
+            "last_upload": str(last_upload) if last_upload else None,
+        })
+
+    deadlines = [app["next_deadline"] for app in applications if app["next_deadline"]]
+    return {
+        "applications": applications,
+        "summary": {
+            "applications": len(applications),
+            "open_tasks": sum(app["task_count"] - app["completed_tasks"] for app in applications),
+            "overdue_tasks": sum(app["overdue_tasks"] for app in applications),
+            "next_deadline": min(deadlines) if deadlines else None,
+            "documents": sum(app["document_count"] for app in applications),
+        },
+    }
+
+
+def get_dashboard(conn, user_id: str) -> dict:
+    """
+    Return every application of the user with its grant, task and document counts (3 round trips,
+    however many applications there are).
+    """
+    return build_dashboard(
+        prepared_fetchall(conn, "applications/select_dashboard_applications", (user_id,)),
+        prepared_fetchall(conn, "internal_deadlines/select_dashboard_task_counts", (user_id,)),
+        prepared_fetchall(conn, "documents/select_dashboard_document_counts", (user_id,)),
+    )
@@ -6,11 +6,15 @@
 # routes_user.py
 from flask import Blueprint, request, jsonify, current_app
 from flask_jwt_extended import jwt_required, get_jwt_identity
-from mysql.connector import connect, Error as MySQLError
+from mysql.connector import Error as MySQLError
+from api.db import get_connection, prepared_fetchall
+from . import data_access as dal
 from api import PHASE2_ROOT
+from api.pagination import CursorError, decode_cursor, encode_cursor
+from src.utils.percolator import normalize_query
 import os
 import re
-from datetime import datetime
+from datetime import date, datetime
 
 user_bp = Blueprint("user", __name__)
 
@@ -22,7 +26,7 @@ os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 @jwt_required()
 def update_personal_info():
 
-    from api import update_users_fields, Role, UserOperationError, HOST, MYSQL_USER, MYSQL_PASS, DB_NAME
+    from api import update_users_fields, Role, UserOperationError
 
     user_id = get_jwt_identity()
     current_app.logger.info(f"Updating personal info for user_id: {user_id}")
@@ -62,7 +66,7 @@ def update_personal_info():
         return jsonify({"error": "No valid fields to update"}), 400
 
     try:
-        conn = connect(host=HOST, user=MYSQL_USER, password=MYSQL_PASS, database=DB_NAME)
+        conn = get_connection()
         cursor = conn.cursor()
 
         result = update_users_fields(
@@ -96,8 +100,8 @@ def update_personal_info():
 @user_bp.route("/email", methods=["PUT"])
 @jwt_required()
 def update_email():
-    from api import update_users_email, Role, UserOperationError, HOST, MYSQL_USER, MYSQL_PASS, DB_NAME, PHASE2_ROOT
-    from mysql.connector import connect, Error as MySQLError
+    from api import update_users_email, Role, UserOperationError, PHASE2_ROOT
+    from mysql.connector import Error as MySQLError
 
     user_id = get_jwt_identity()
     current_app.logger.info(f"Updating email for user_id: {user_id}")
@@ -120,7 +124,7 @@ def update_email():
         return jsonify({"error": "Invalid email format"}), 400
 
     try:
-        conn = connect(host=HOST, user=MYSQL_USER, password=MYSQL_PASS, database=DB_NAME)
+        conn = get_connection()
         cursor = conn.cursor()
 
         result = update_users_email(
@@ -156,8 +160,8 @@ def update_email():
 @user_bp.route("/password", methods=["PUT"])
 @jwt_required()
 def update_password():
-    from api import update_users_password, Role, UserOperationError, HOST, MYSQL_USER, MYSQL_PASS, DB_NAME, PHASE2_ROOT
-    from mysql.connector import connect, Error as MySQLError
+    from api import update_users_password, Role, UserOperationError, PHASE2_ROOT
+    from mysql.connector import Error as MySQLError
 
     user_id = get_jwt_identity()
     current_app.logger.info(f"Updating password for user_id: {user_id}")
@@ -178,7 +182,7 @@ def update_password():
         return jsonify({"error": "New password must be at least 8 characters"}), 400
 
     try:
-        conn = connect(host=HOST, user=MYSQL_USER, password=MYSQL_PASS, database=DB_NAME)
+        conn = get_connection()
         cursor = conn.cursor()
 
         result = update_users_password(
@@ -216,35 +220,15 @@ def update_password():
 @jwt_required()
 def get_user_applications():
     """Fetch all applications for the authenticated user with grant details."""
-    from api import HOST, MYSQL_USER, MYSQL_PASS, DB_NAME
 
     user_id = get_jwt_identity()
     current_app.logger.info(f"Fetching applications for user_id: {user_id}")
 
     try:
-        conn = connect(host=HOST, user=MYSQL_USER, password=MYSQL_PASS, database=DB_NAME)
-        cursor = conn.cursor()
+        conn = get_connection()
 
         # Join applications with grants to get grant details
-        cursor.execute(
-            """
-            SELECT
-                BIN_TO_UUID(a.application_id) AS application_id,
-                BIN_TO_UUID(a.user_id) AS user_id,
-                BIN_TO_UUID(a.grant_id) AS grant_id,
-                a.submission_status,
-                a.status,
-                DATE_FORMAT(a.application_date, '%Y-%m-%d') AS application_date,
-                g.grant_title AS grant_name
-            FROM Applications a
-            JOIN Grants g ON a.grant_id = g.grant_id
-            WHERE a.user_id = UUID_TO_BIN(%s)
-            ORDER BY a.application_date DESC
-            """,
-            (user_id,)
-        )
-
-        rows = cursor.fetchall()
+        rows = prepared_fetchall(conn, "applications/select_applications_with_grant_by_user", (user_id,))
 
         applications = [
             {
@@ -269,7 +253,34 @@ def get_user_applications():
         return jsonify({"error": "Internal server error"}), 500
     finally:
         try:
-            cursor.close()
+            conn.close()
+        except Exception:
+            pass
+
+
+@user_bp.route("/dashboard", methods=["GET"])
+@jwt_required()
+def get_dashboard():
+    """
+    Get the user's applications with the grant title and close date, task counts, completed
+    percentage, next open deadline and document counts, plus totals, for the home page.
+    Three grouped queries over the user's rows, however many applications they have.
+    """
+
+    user_id = get_jwt_identity()
+
+    try:
+        conn = get_connection()
+        return jsonify(dal.get_dashboard(conn, user_id)), 200
+
+    except MySQLError as e:
+        current_app.logger.error(f"Database error fetching dashboard: {e}")
+        return jsonify({"error": "Database error"}), 500
+    except Exception as e:
+        current_app.logger.exception("Unexpected error fetching dashboard")
+        return jsonify({"error": "Internal server error"}), 500
+    finally:
+        try:
             conn.close()
         except Exception:
             pass
@@ -279,8 +290,7 @@ def get_user_applications():
 @jwt_required()
 def create_application():
     """Create a new application for a grant."""
-    from api import HOST, MYSQL_USER, MYSQL_PASS, DB_NAME
-    from datetime import date, datetime
+    from datetime import date
 
     user_id = get_jwt_identity()
     data = request.get_json()
@@ -296,64 +306,14 @@ def create_application():
     current_app.logger.info(f"Creating application for user_id: {user_id}, grant_id: {grant_id}, submission_status: {submission_status}")
 
     try:
-        conn = connect(host=HOST, user=MYSQL_USER, password=MYSQL_PASS, database=DB_NAME)
-        cursor = conn.cursor()
+        conn = get_connection()
 
-        # Check if user already applied to this grant
-        cursor.execute(
-            """
-            SELECT COUNT(*) FROM Applications
-            WHERE user_id = UUID_TO_BIN(%s) AND grant_id = UUID_TO_BIN(%s)
-            """,
-            (user_id, grant_id)
-        )
-
-        if cursor.fetchone()[0] > 0:
-            return jsonify({"error": "You have already applied to this grant"}), 409
-
-        # Insert new application with submission_status
-        submitted_at = datetime.now() if submission_status == "submitted" else None
-        cursor.execute(
-            """
-            INSERT INTO Applications (user_id, grant_id, submission_status, status, application_date, submitted_at)
-            VALUES (UUID_TO_BIN(%s), UUID_TO_BIN(%s), %s, %s, %s, %s)
-            """,
-            (user_id, grant_id, submission_status, status, application_date, submitted_at)
-        )
-
-        conn.commit()
-
-        # Get the created application with grant details
-        cursor.execute(
-            """
-            SELECT
-                BIN_TO_UUID(a.application_id) AS application_id,
-                BIN_TO_UUID(a.user_id) AS user_id,
-                BIN_TO_UUID(a.grant_id) AS grant_id,
-                a.submission_status,
-                a.status,
-                DATE_FORMAT(a.application_date, '%Y-%m-%d') AS application_date,
-                g.grant_title AS grant_name
-            FROM Applications a
-            JOIN Grants g ON a.grant_id = g.grant_id
-            WHERE a.user_id = UUID_TO_BIN(%s) AND a.grant_id = UUID_TO_BIN(%s)
-            """,
-            (user_id, grant_id)
-        )
-
-        row = cursor.fetchone()
-        application = {
-            "application_id": row[0],
-            "user_id": row[1],
-            "grant_id": row[2],
-            "submission_status": row[3],
-            "status": row[4],
-            "application_date": row[5],
-            "grant_name": row[6]
-        }
+        application = dal.create_application(conn, user_id, grant_id, submission_status, status, application_date)
 
         return jsonify({"message": "Application created successfully", "application": application}), 201
 
+    except dal.UserDataError as e:
+        return jsonify({"error": str(e)}), e.status_code
     except MySQLError as e:
         current_app.logger.error(f"Database error creating application: {e}")
         return jsonify({"error": "Database error"}), 500
@@ -362,7 +322,6 @@ def create_application():
         return jsonify({"error": "Internal server error"}), 500
     finally:
         try:
-            cursor.close()
             conn.close()
         except Exception:
             pass
@@ -372,54 +331,19 @@ def create_application():
 @jwt_required()
 def get_single_application(application_id: str):
     """Get a single application with grant details."""
-    from api import HOST, MYSQL_USER, MYSQL_PASS, DB_NAME
 
     user_id = get_jwt_identity()
     current_app.logger.info(f"Fetching application {application_id} for user_id: {user_id}")
 
     try:
-        conn = connect(host=HOST, user=MYSQL_USER, password=MYSQL_PASS, database=DB_NAME)
-        cursor = conn.cursor()
-
-        # Fetch application with grant details
-        cursor.execute(
-            """
-            SELECT
-                BIN_TO_UUID(a.application_id) AS application_id,
-                BIN_TO_UUID(a.user_id) AS user_id,
-                BIN_TO_UUID(a.grant_id) AS grant_id,
-                a.submission_status,
-                a.status,
-                DATE_FORMAT(a.application_date, '%Y-%m-%d') AS application_date,
-                g.grant_title AS grant_name,
-                DATE_FORMAT(a.internal_deadline, '%Y-%m-%d') AS internal_deadline,
-                a.notes
-            FROM Applications a
-            JOIN Grants g ON a.grant_id = g.grant_id
-            WHERE a.application_id = UUID_TO_BIN(%s) AND a.user_id = UUID_TO_BIN(%s)
-            """,
-            (application_id, user_id)
-        )
+        conn = get_connection()
 
-        row = cursor.fetchone()
-
-        if not row:
-            return jsonify({"error": "Application not found or access denied"}), 404
-
-        application = {
-            "application_id": row[0],
-            "user_id": row[1],
-            "grant_id": row[2],
-            "submission_status": row[3],
-            "status": row[4],
-            "application_date": row[5],
-            "grant_name": row[6],
-            "internal_deadline": row[7],
-            "notes": row[8]
-        }
+        application = dal.get_application(conn, application_id, user_id)
 
         return jsonify({"application": application}), 200
 
+    except dal.UserDataError as e:
+        return jsonify({"error": str(e)}), e.status_code
     except MySQLError as e:
         current_app.logger.error(f"Database error fetching application: {e}")
         return jsonify({"error": "Database error"}), 500
@@ -428,7 +352,6 @@ def get_single_application(application_id: str):
         return jsonify({"error": "Internal server error"}), 500
     finally:
         try:
-            cursor.close()
             conn.close()
         except Exception:
             pass
@@ -438,7 +361,6 @@ def get_single_application(application_id: str):
 @jwt_required()
 def update_application_status(application_id: str):
     """Update a user's application (status, internal_deadline, notes)."""
-    from api import HOST, MYSQL_USER, MYSQL_PASS, DB_NAME
 
     user_id = get_jwt_identity()
     data = request.get_json()
@@ -447,73 +369,46 @@ def update_application_status(application_id: str):
         return jsonify({"error": "Missing request body"}), 400
 
     # Build update fields dynamically
-    update_fields = []
-    params = []
+    fields = {}
 
     if "status" in data:
         new_status = data["status"]
         valid_statuses = ["pending", "in_review", "approved", "rejected"]
         if new_status not in valid_statuses:
             return jsonify({"error": f"Invalid status. Must be one of: {', '.join(valid_statuses)}"}), 400
-        update_fields.append("status = %s")
-        params.append(new_status)
+        fields["status"] = new_status
 
     if "submission_status" in data:
         new_submission_status = data["submission_status"]
         valid_submission_statuses = ["started", "submitted"]
         if new_submission_status not in valid_submission_statuses:
             return jsonify({"error": f"Invalid submission_status. Must be one of: {', '.join(valid_submission_statuses)}"}), 400
-        update_fields.append("submission_status = %s")
-        params.append(new_submission_status)
+        fields["submission_status"] = new_submission_status
 
         # If changing to submitted, set submitted_at timestamp
         if new_submission_status == "submitted":
-            from datetime import datetime
-            update_fields.append("submitted_at = %s")
-            params.append(datetime.now())
+            fields["submitted_at"] = datetime.now()
 
     if "internal_deadline" in data:
-        update_fields.append("internal_deadline = %s")
-        params.append(data["internal_deadline"] if data["internal_deadline"] else None)
+        fields["internal_deadline"] = data["internal_deadline"] if data["internal_deadline"] else None
 
     if "notes" in data:
-        update_fields.append("notes = %s")
-        params.append(data["notes"] if data["notes"] else None)
+        fields["notes"] = data["notes"] if data["notes"] else None
 
-    if not update_fields:
+    if not fields:
         return jsonify({"error": "No fields to update"}), 400
 
     current_app.logger.info(f"Updating application {application_id} for user_id: {user_id}")
 
     try:
-        conn = connect(host=HOST, user=MYSQL_USER, password=MYSQL_PASS, database=DB_NAME)
-        cursor = conn.cursor()
+        conn = get_connection()
 
-        # Verify the application belongs to the user
-        cursor.execute(
-            """
-            SELECT COUNT(*) FROM Applications
-            WHERE application_id = UUID_TO_BIN(%s) AND user_id = UUID_TO_BIN(%s)
-            """,
-            (application_id, user_id)
-        )
-
-        if cursor.fetchone()[0] == 0:
-            return jsonify({"error": "Application not found or access denied"}), 404
-
-        # Update the application
-        params.extend([application_id, user_id])
-        update_query = f"""
-            UPDATE Applications
-            SET {', '.join(update_fields)}
-            WHERE application_id = UUID_TO_BIN(%s) AND user_id = UUID_TO_BIN(%s)
-        """
-        cursor.execute(update_query, tuple(params))
-
-        conn.commit()
+        dal.update_application(conn, application_id, user_id, fields)
 
         return jsonify({"message": "Application updated successfully"}), 200
 
+    except dal.UserDataError as e:
+        return jsonify({"error": str(e)}), e.status_code
     except MySQLError as e:
         current_app.logger.error(f"Database error updating application: {e}")
         return jsonify({"error": "Database error"}), 500
@@ -522,7 +417,6 @@ def update_application_status(application_id: str):
         return jsonify({"error": "Internal server error"}), 500
     finally:
         try:
-            cursor.close()
             conn.close()
         except Exception:
             pass
@@ -532,40 +426,19 @@ def update_application_status(application_id: str):
 @jwt_required()
 def delete_application(application_id: str):
     """Delete a user's application."""
-    from api import HOST, MYSQL_USER, MYSQL_PASS, DB_NAME
 
     user_id = get_jwt_identity()
     current_app.logger.info(f"Deleting application {application_id} for user_id: {user_id}")
 
     try:
-        conn = connect(host=HOST, user=MYSQL_USER, password=MYSQL_PASS, database=DB_NAME)
-        cursor = conn.cursor()
-
-        # Verify the application belongs to the user before deleting
-        cursor.execute(
-            """
-            SELECT COUNT(*) FROM Applications
-            WHERE application_id = UUID_TO_BIN(%s) AND user_id = UUID_TO_BIN(%s)
-            """,
-            (application_id, user_id)
-        )
-
-        if cursor.fetchone()[0] == 0:
-            return jsonify({"error": "Application not found or access denied"}), 404
-
-        # Delete the application
-        cursor.execute(
-            """
-            DELETE FROM Applications
-            WHERE application_id = UUID_TO_BIN(%s) AND user_id = UUID_TO_BIN(%s)
-            """,
-            (application_id, user_id)
-        )
+        conn = get_connection()
 
-        conn.commit()
+        dal.delete_application(conn, application_id, user_id)
 
         return jsonify({"message": "Application deleted successfully"}), 200
 
+    except dal.UserDataError as e:
+        return jsonify({"error": str(e)}), e.status_code
     except MySQLError as e:
         current_app.logger.error(f"Database error deleting application: {e}")
         return jsonify({"error": "Database error"}), 500
@@ -574,7 +447,6 @@ def delete_application(application_id: str):
         return jsonify({"error": "Internal server error"}), 500
     finally:
         try:
-            cursor.close()
             conn.close()
         except Exception:
             pass
@@ -586,63 +458,19 @@ def delete_application(application_id: str):
 @jwt_required()
 def get_application_tasks(application_id: str):
     """Get all tasks for a specific application."""
-    from api import HOST, MYSQL_USER, MYSQL_PASS, DB_NAME
 
     user_id = get_jwt_identity()
     current_app.logger.info(f"Fetching tasks for application {application_id}, user_id: {user_id}")
 
     try:
-        conn = connect(host=HOST, user=MYSQL_USER, password=MYSQL_PASS, database=DB_NAME)
-        cursor = conn.cursor()
+        conn = get_connection()
 
-        # Verify the application belongs to the user
-        cursor.execute(
-            """
-            SELECT COUNT(*) FROM Applications
-            WHERE application_id = UUID_TO_BIN(%s) AND user_id = UUID_TO_BIN(%s)
-            """,
-            (application_id, user_id)
-        )
-
-        if cursor.fetchone()[0] == 0:
-            return jsonify({"error": "Application not found or access denied"}), 404
-
-        # Fetch all tasks for this application
-        cursor.execute(
-            """
-            SELECT
-                BIN_TO_UUID(internal_deadline_id) AS task_id,
-                BIN_TO_UUID(application_id) AS application_id,
-                deadline_name,
-                task_description,
-                DATE_FORMAT(deadline_date, '%Y-%m-%d') AS deadline,
-                completed,
-                created_at,
-                updated_at
-            FROM InternalDeadlines
-            WHERE application_id = UUID_TO_BIN(%s)
-            ORDER BY deadline_date ASC
-            """,
-            (application_id,)
-        )
-
-        rows = cursor.fetchall()
-        tasks = [
-            {
-                "task_id": row[0],
-                "application_id": row[1],
-                "task_name": row[2],
-                "task_description": row[3],
-                "deadline": row[4],
-                "completed": bool(row[5]),
-                "created_at": str(row[6]) if row[6] else None,
-                "updated_at": str(row[7]) if row[7] else None
-            }
-            for row in rows
-        ]
+        tasks = dal.list_tasks(conn, application_id, user_id)
 
         return jsonify({"tasks": tasks}), 200
 
+    except dal.UserDataError as e:
+        return jsonify({"error": str(e)}), e.status_code
     except MySQLError as e:
         current_app.logger.error(f"Database error fetching tasks: {e}")
         return jsonify({"error": "Database error"}), 500
@@ -651,17 +479,25 @@ def get_application_tasks(application_id: str):
         return jsonify({"error": "Internal server error"}), 500
     finally:
         try:
-            cursor.close()
             conn.close()
         except Exception:
             pass
 
 
+def _parse_deadline(value) -> date:
+    """A task deadline sent as YYYY-MM-DD; ValueError when it is not a date in that form."""
+    if not isinstance(value, str):
+        raise ValueError("Invalid deadline. Use YYYY-MM-DD")
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise ValueError("Invalid deadline. Use YYYY-MM-DD") from None
+
+
 @user_bp.route("/applications/<application_id>/tasks", methods=["POST"])
 @jwt_required()
 def create_task(application_id: str):
     """Create a new task for an application."""
-    from api import HOST, MYSQL_USER, MYSQL_PASS, DB_NAME
 
     user_id = get_jwt_identity()
     data = request.get_json()
@@ -671,91 +507,22 @@ def create_task(application_id: str):
 
     task_name = data["task_name"]
     task_description = data.get("task_description", "")
-    deadline = data["deadline"]
+    try:
+        deadline = _parse_deadline(data["deadline"])
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
 
     current_app.logger.info(f"Creating task for application {application_id}, user_id: {user_id}")
 
     try:
-        conn = connect(host=HOST, user=MYSQL_USER, password=MYSQL_PASS, database=DB_NAME)
-        cursor = conn.cursor()
-
-        # Verify the application belongs to the user and is started
-        cursor.execute(
-            """
-            SELECT submission_status, grant_id FROM Applications
-            WHERE application_id = UUID_TO_BIN(%s) AND user_id = UUID_TO_BIN(%s)
-            """,
-            (application_id, user_id)
-        )
-
-        result = cursor.fetchone()
-        if not result:
-            return jsonify({"error": "Application not found or access denied"}), 404
-
-        submission_status = result[0]
-        grant_id_bin = result[1]
+        conn = get_connection()
 
-        if submission_status == "submitted":
-            return jsonify({"error": "Cannot add tasks to a submitted application. Tasks can only be added to applications with 'started' status."}), 400
-
-        # Get grant deadline to validate task deadline
-        cursor.execute(
-            """
-            SELECT date_closed FROM Grants WHERE grant_id = %s
-            """,
-            (grant_id_bin,)
-        )
-        grant_result = cursor.fetchone()
-        if grant_result and grant_result[0]:
-            grant_deadline = grant_result[0]
-            if deadline > str(grant_deadline):
-                return jsonify({"error": "Task deadline cannot exceed grant deadline"}), 400
-
-        # Insert new task
-        cursor.execute(
-            """
-            INSERT INTO InternalDeadlines (application_id, deadline_name, task_description, deadline_date)
-            VALUES (UUID_TO_BIN(%s), %s, %s, %s)
-            """,
-            (application_id, task_name, task_description, deadline)
-        )
-
-        conn.commit()
-
-        # Get the created task
-        task_id = cursor.lastrowid
-        cursor.execute(
-            """
-            SELECT
-                BIN_TO_UUID(internal_deadline_id) AS task_id,
-                BIN_TO_UUID(application_id) AS application_id,
-                deadline_name,
-                task_description,
-                DATE_FORMAT(deadline_date, '%Y-%m-%d') AS deadline,
-                completed,
-                created_at,
-                updated_at
-            FROM InternalDeadlines
-            WHERE application_id = UUID_TO_BIN(%s)
-            ORDER BY created_at DESC LIMIT 1
-            """,
-            (application_id,)
-        )
-
-        row = cursor.fetchone()
-        task = {
-            "task_id": row[0],
-            "application_id": row[1],
-            "task_name": row[2],
-            "task_description": row[3],
-            "deadline": row[4],
-            "completed": bool(row[5]),
-            "created_at": str(row[6]) if row[6] else None,
-            "updated_at": str(row[7]) if row[7] else None
-        }
+        task = dal.create_task(conn, application_id, user_id, task_name, task_description, deadline)
 
         return jsonify({"message": "Task created successfully", "task": task}), 201
 
+    except dal.UserDataError as e:
+        return jsonify({"error": str(e)}), e.status_code
     except MySQLError as e:
         current_app.logger.error(f"Database error creating task: {e}")
         return jsonify({"error": "Database error"}), 500
@@ -764,7 +531,6 @@ def create_task(application_id: str):
         return jsonify({"error": "Internal server error"}), 500
     finally:
         try:
-            cursor.close()
             conn.close()
         except Exception:
             pass
@@ -774,7 +540,6 @@ def create_task(application_id: str):
 @jwt_required()
 def update_task(application_id: str, task_id: str):
     """Update a task (name, description, deadline, completed status)."""
-    from api import HOST, MYSQL_USER, MYSQL_PASS, DB_NAME
 
     user_id = get_jwt_identity()
     data = request.get_json()
@@ -782,63 +547,24 @@ def update_task(application_id: str, task_id: str):
     if not data:
         return jsonify({"error": "Missing request body"}), 400
 
-    try:
-        conn = connect(host=HOST, user=MYSQL_USER, password=MYSQL_PASS, database=DB_NAME)
-        cursor = conn.cursor()
-
-        # Verify the application belongs to the user
-        cursor.execute(
-            """
-            SELECT submission_status FROM Applications
-            WHERE application_id = UUID_TO_BIN(%s) AND user_id = UUID_TO_BIN(%s)
-            """,
-            (application_id, user_id)
-        )
-
-        result = cursor.fetchone()
-        if not result:
-            return jsonify({"error": "Application not found or access denied"}), 404
-
-        submission_status = result[0]
-        if submission_status == "submitted":
-            return jsonify({"error": "Cannot modify tasks of a submitted application. Tasks can only be modified for applications with 'started' status."}), 400
-
-        # Build update fields dynamically
-        update_fields = []
-        params = []
-
-        if "task_name" in data:
-            update_fields.append("deadline_name = %s")
-            params.append(data["task_name"])
-
-        if "task_description" in data:
-            update_fields.append("task_description = %s")
-            params.append(data["task_description"])
-
-        if "deadline" in data:
-            update_fields.append("deadline_date = %s")
-            params.append(data["deadline"])
-
-        if "completed" in data:
-            update_fields.append("completed = %s")
-            params.append(data["completed"])
-
-        if not update_fields:
-            return jsonify({"error": "No fields to update"}), 400
+    fields = {key: data[key] for key in dal.TASK_UPDATE_COLUMNS if key in data}
+    if not fields:
+        return jsonify({"error": "No fields to update"}), 400
+    if "deadline" in fields:
+        try:
+            fields["deadline"] = _parse_deadline(fields["deadline"])
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
 
-        # Update the task
-        params.extend([task_id, application_id])
-        update_query = f"""
-            UPDATE InternalDeadlines
-            SET {', '.join(update_fields)}
-            WHERE internal_deadline_id = UUID_TO_BIN(%s) AND application_id = UUID_TO_BIN(%s)
-        """
-        cursor.execute(update_query, tuple(params))
+    try:
+        conn = get_connection()
 
-        conn.commit()
+        dal.update_task(conn, application_id, task_id, user_id, fields)
 
         return jsonify({"message": "Task updated successfully"}), 200
 
+    except dal.UserDataError as e:
+        return jsonify({"error": str(e)}), e.status_code
     except MySQLError as e:
         current_app.logger.error(f"Database error updating task: {e}")
         return jsonify({"error": "Database error"}), 500
@@ -847,7 +573,6 @@ def update_task(application_id: str, task_id: str):
         return jsonify({"error": "Internal server error"}), 500
     finally:
         try:
-            cursor.close()
             conn.close()
         except Exception:
             pass
@@ -857,44 +582,18 @@ def update_task(application_id: str, task_id: str):
 @jwt_required()
 def delete_task(application_id: str, task_id: str):
     """Delete a task from an application."""
-    from api import HOST, MYSQL_USER, MYSQL_PASS, DB_NAME
 
     user_id = get_jwt_identity()
 
     try:
-        conn = connect(host=HOST, user=MYSQL_USER, password=MYSQL_PASS, database=DB_NAME)
-        cursor = conn.cursor()
+        conn = get_connection()
 
-        # Verify the application belongs to the user and is started
-        cursor.execute(
-            """
-            SELECT submission_status FROM Applications
-            WHERE application_id = UUID_TO_BIN(%s) AND user_id = UUID_TO_BIN(%s)
-            """,
-            (application_id, user_id)
-        )
-
-        result = cursor.fetchone()
-        if not result:
-            return jsonify({"error": "Application not found or access denied"}), 404
-
-        submission_status = result[0]
-        if submission_status == "submitted":
-            return jsonify({"error": "Cannot delete tasks from a submitted application. Tasks can only be deleted from applications with 'started' status."}), 400
-
-        # Delete the task
-        cursor.execute(
-            """
-            DELETE FROM InternalDeadlines
-            WHERE internal_deadline_id = UUID_TO_BIN(%s) AND application_id = UUID_TO_BIN(%s)
-            """,
-            (task_id, application_id)
-        )
-
-        conn.commit()
+        dal.delete_task(conn, application_id, task_id, user_id)
 
         return jsonify({"message": "Task deleted successfully"}), 200
 
+    except dal.UserDataError as e:
+        return jsonify({"error": str(e)}), e.status_code
     except MySQLError as e:
         current_app.logger.error(f"Database error deleting task: {e}")
         return jsonify({"error": "Database error"}), 500
@@ -903,7 +602,6 @@ def delete_task(application_id: str, task_id: str):
         return jsonify({"error": "Internal server error"}), 500
     finally:
         try:
-            cursor.close()
             conn.close()
         except Exception:
             pass
@@ -911,33 +609,41 @@ def delete_task(application_id: str, task_id: str):
 
 # ==================== DOCUMENT UPLOAD ENDPOINTS ====================
 
+def _document_file_path(application_id: str, document_id: str, document_name: str) -> str | None:
+    """
+    Locate the stored file of a document.
+
+    Files are saved as "<document_id>_<name>".  Files uploaded before document ids were
+    generated client-side carry a random prefix instead and are matched on the name suffix.
+    """
+    app_folder = os.path.join(UPLOAD_FOLDER, application_id)
+    file_path = os.path.join(app_folder, f"{document_id}_{document_name}")
+    if os.path.exists(file_path):
+        return file_path
+
+    if not os.path.exists(app_folder):
+        return None
+    for filename in os.listdir(app_folder):
+        if filename.endswith(document_name):
+            return os.path.join(app_folder, filename)
+    return None
+
+
 @user_bp.route("/applications/<application_id>/documents", methods=["POST"])
 @jwt_required()
 def upload_documents(application_id: str):
     """Upload documents for an application."""
-    from api import HOST, MYSQL_USER, MYSQL_PASS, DB_NAME
     from werkzeug.utils import secure_filename
-    import uuid
 
     user_id = get_jwt_identity()
     current_app.logger.info(f"Uploading documents for application {application_id}, user_id: {user_id}")
 
+    saved_paths = []
     try:
-        conn = connect(host=HOST, user=MYSQL_USER, password=MYSQL_PASS, database=DB_NAME)
-        cursor = conn.cursor()
+        conn = get_connection()
 
         # Verify the application belongs to the user
-        cursor.execute(
-            """
-            SELECT submission_status FROM Applications
-            WHERE application_id = UUID_TO_BIN(%s) AND user_id = UUID_TO_BIN(%s)
-            """,
-            (application_id, user_id)
-        )
-
-        result = cursor.fetchone()
-        if not result:
-            return jsonify({"error": "Application not found or access denied"}), 404
+        dal.require_application(conn, application_id, user_id)
 
         # Check if files were uploaded
         if 'files' not in request.files:
@@ -949,59 +655,48 @@ def upload_documents(application_id: str):
         if not files or all(f.filename == '' for f in files):
             return jsonify({"error": "No files selected"}), 400
 
-        uploaded_documents = []
-
         # Create application-specific folder
         app_folder = os.path.join(UPLOAD_FOLDER, application_id)
         os.makedirs(app_folder, exist_ok=True)
 
+        documents = []
+        upload_date = datetime.now()
         for file in files:
             if file and file.filename:
-                # Secure the filename and add unique identifier
+                # The document id prefixes the stored file name so it can be found without a scan
+                document_id = dal.new_id()
                 original_filename = secure_filename(file.filename)
-                unique_filename = f"{uuid.uuid4()}_{original_filename}"
-                file_path = os.path.join(app_folder, unique_filename)
+                file_path = os.path.join(app_folder, f"{document_id}_{original_filename}")
 
                 # Save file to disk
                 file.save(file_path)
-                file_size = os.path.getsize(file_path)
-
-                # Insert document record into database
-                cursor.execute(
-                    """
-                    INSERT INTO Documents (document_name, document_type, document_size, upload_date, application_id)
-                    VALUES (%s, %s, %s, %s, UUID_TO_BIN(%s))
-                    """,
-                    (original_filename, document_type, file_size, datetime.now(), application_id)
-                )
-
-                # Get the created document ID
-                cursor.execute("SELECT LAST_INSERT_ID()")
-                last_id = cursor.fetchone()[0]
-
-                cursor.execute(
-                    """
-                    SELECT BIN_TO_UUID(document_id) FROM Documents WHERE application_id = UUID_TO_BIN(%s)
-                    ORDER BY upload_date DESC LIMIT 1
-                    """,
-                    (application_id,)
-                )
-                document_id = cursor.fetchone()[0]
-
-                uploaded_documents.append({
+                saved_paths.append(file_path)
+
+                documents.append({
                     "document_id": document_id,
                     "document_name": original_filename,
                     "document_type": document_type,
-                    "document_size": file_size
+                    "document_size": os.path.getsize(file_path),
+                    "upload_date": upload_date,
+                    "application_id": application_id,
                 })
 
-        conn.commit()
+        # One multi-row INSERT for every file
+        dal.add_documents(conn, documents)
+        saved_paths = []
+
+        uploaded_documents = [
+            {key: doc[key] for key in ("document_id", "document_name", "document_type", "document_size")}
+            for doc in documents
+        ]
 
         return jsonify({
             "message": f"{len(uploaded_documents)} document(s) uploaded successfully",
             "documents": uploaded_documents
         }), 201
 
+    except dal.UserDataError as e:
+        return jsonify({"error": str(e)}), e.status_code
     except MySQLError as e:
         current_app.logger.error(f"Database error uploading documents: {e}")
         return jsonify({"error": "Database error"}), 500
@@ -1009,8 +704,13 @@ def upload_documents(application_id: str):
         current_app.logger.exception("Unexpected error uploading documents")
         return jsonify({"error": str(e)}), 500
     finally:
+        # files whose rows were never inserted
+        for path in saved_paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
         try:
-            cursor.close()
             conn.close()
         except Exception:
             pass
@@ -1020,57 +720,19 @@ def upload_documents(application_id: str):
 @jwt_required()
 def get_application_documents(application_id: str):
     """Get all documents for a specific application."""
-    from api import HOST, MYSQL_USER, MYSQL_PASS, DB_NAME
 
     user_id = get_jwt_identity()
     current_app.logger.info(f"Fetching documents for application {application_id}, user_id: {user_id}")
 
     try:
-        conn = connect(host=HOST, user=MYSQL_USER, password=MYSQL_PASS, database=DB_NAME)
-        cursor = conn.cursor()
-
-        # Verify the application belongs to the user
-        cursor.execute(
-            """
-            SELECT COUNT(*) FROM Applications
-            WHERE application_id = UUID_TO_BIN(%s) AND user_id = UUID_TO_BIN(%s)
-            """,
-            (application_id, user_id)
-        )
-
-        if cursor.fetchone()[0] == 0:
-            return jsonify({"error": "Application not found or access denied"}), 404
-
-        # Fetch all documents for this application
-        cursor.execute(
-            """
-            SELECT
-                BIN_TO_UUID(document_id) AS document_id,
-                document_name,
-                document_type,
-                document_size,
-                upload_date
-            FROM Documents
-            WHERE application_id = UUID_TO_BIN(%s)
-            ORDER BY upload_date DESC
-            """,
-            (application_id,)
-        )
+        conn = get_connection()
 
-        rows = cursor.fetchall()
-        documents = []
-        for row in rows:
-            doc = {
-                "document_id": row[0],
-                "document_name": row[1],
-                "document_type": row[2],
-                "document_size": row[3],
-                "upload_date": str(row[4]) if row[4] else None
-            }
-            documents.append(doc)
+        documents = dal.list_documents(conn, application_id, user_id)
 
         return jsonify({"documents": documents}), 200
 
+    except dal.UserDataError as e:
+        return jsonify({"error": str(e)}), e.status_code
     except MySQLError as e:
         current_app.logger.error(f"Database error fetching documents: {e}")
         return jsonify({"error": "Database error"}), 500
@@ -1079,7 +741,6 @@ def get_application_documents(application_id: str):
         return jsonify({"error": "Internal server error"}), 500
     finally:
         try:
-            cursor.close()
             conn.close()
         except Exception:
             pass
@@ -1089,68 +750,27 @@ def get_application_documents(application_id: str):
 @jwt_required()
 def delete_document(application_id: str, document_id: str):
     """Delete a document from an application."""
-    from api import HOST, MYSQL_USER, MYSQL_PASS, DB_NAME
 
     user_id = get_jwt_identity()
     current_app.logger.info(f"Deleting document {document_id} for application {application_id}, user_id: {user_id}")
 
     try:
-        conn = connect(host=HOST, user=MYSQL_USER, password=MYSQL_PASS, database=DB_NAME)
-        cursor = conn.cursor()
-
-        # Verify the application belongs to the user
-        cursor.execute(
-            """
-            SELECT COUNT(*) FROM Applications
-            WHERE application_id = UUID_TO_BIN(%s) AND user_id = UUID_TO_BIN(%s)
-            """,
-            (application_id, user_id)
-        )
-
-        if cursor.fetchone()[0] == 0:
-            return jsonify({"error": "Application not found or access denied"}), 404
+        conn = get_connection()
 
-        # Get document info before deleting (for file deletion)
-        cursor.execute(
-            """
-            SELECT document_name FROM Documents
-            WHERE document_id = UUID_TO_BIN(%s) AND application_id = UUID_TO_BIN(%s)
-            """,
-            (document_id, application_id)
-        )
-
-        doc_row = cursor.fetchone()
-        if not doc_row:
-            return jsonify({"error": "Document not found"}), 404
-
-        document_name = doc_row[0]  # type: ignore
-
-        # Delete from database
-        cursor.execute(
-            """
-            DELETE FROM Documents
-            WHERE document_id = UUID_TO_BIN(%s) AND application_id = UUID_TO_BIN(%s)
-            """,
-            (document_id, application_id)
-        )
-
-        conn.commit()
+        document_name = dal.delete_document(conn, application_id, document_id, user_id)
 
         # Try to delete physical file (optional - don't fail if file doesn't exist)
         try:
-            app_folder = os.path.join(UPLOAD_FOLDER, application_id)
-            if os.path.exists(app_folder):
-                # Find and delete the file with UUID prefix
-                for filename in os.listdir(app_folder):
-                    if filename.endswith(str(document_name)):  # type: ignore
-                        file_path = os.path.join(app_folder, filename)
-                        os.remove(file_path)
-                        break
+            file_path = _document_file_path(application_id, document_id, document_name)
+            if file_path:
+                os.remove(file_path)
         except Exception as file_err:
             current_app.logger.warning(f"Could not delete physical file: {file_err}")
 
         return jsonify({"message": "Document deleted successfully"}), 200
 
+    except dal.UserDataError as e:
+        return jsonify({"error": str(e)}), e.status_code
     except MySQLError as e:
         current_app.logger.error(f"Database error deleting document: {e}")
         return jsonify({"error": "Database error"}), 500
@@ -1159,7 +779,6 @@ def delete_document(application_id: str, document_id: str):
         return jsonify({"error": "Internal server error"}), 500
     finally:
         try:
-            cursor.close()
             conn.close()
         except Exception:
             pass
@@ -1169,65 +788,30 @@ def delete_document(application_id: str, document_id: str):
 @jwt_required()
 def download_document(application_id: str, document_id: str):
     """Download a document file."""
-    from api import HOST, MYSQL_USER, MYSQL_PASS, DB_NAME
     from flask import send_file
 
     user_id = get_jwt_identity()
     current_app.logger.info(f"Downloading document {document_id} for application {application_id}, user_id: {user_id}")
 
     try:
-        conn = connect(host=HOST, user=MYSQL_USER, password=MYSQL_PASS, database=DB_NAME)
-        cursor = conn.cursor()
-
-        # Verify the application belongs to the user
-        cursor.execute(
-            """
-            SELECT COUNT(*) FROM Applications
-            WHERE application_id = UUID_TO_BIN(%s) AND user_id = UUID_TO_BIN(%s)
-            """,
-            (application_id, user_id)
-        )
-
-        if cursor.fetchone()[0] == 0:
-            return jsonify({"error": "Application not found or access denied"}), 404
-
-        # Get document info
-        cursor.execute(
-            """
-            SELECT document_name FROM Documents
-            WHERE document_id = UUID_TO_BIN(%s) AND application_id = UUID_TO_BIN(%s)
-            """,
-            (document_id, application_id)
-        )
-
-        doc_row = cursor.fetchone()
-        if not doc_row:
-            return jsonify({"error": "Document not found"}), 404
-
-        document_name = doc_row[0]  # type: ignore
+        conn = get_connection()
 
-        # Find the file in the uploads folder
-        app_folder = os.path.join(UPLOAD_FOLDER, application_id)
-        if not os.path.exists(app_folder):
-            return jsonify({"error": "Document file not found"}), 404
-
-        # Find the file with UUID prefix
-        file_path = None
-        for filename in os.listdir(app_folder):
-            if filename.endswith(str(document_name)):  # type: ignore
-                file_path = os.path.join(app_folder, filename)
-                break
+        document_name = dal.get_document_name(conn, application_id, document_id, user_id)
 
-        if not file_path or not os.path.exists(file_path):
+        # The file is only looked up after the owner-scoped query found the document
+        file_path = _document_file_path(application_id, document_id, document_name)
+        if not file_path:
             return jsonify({"error": "Document file not found"}), 404
 
         # Send the file
         return send_file(
             file_path,
             as_attachment=True,
-            download_name=str(document_name)  # type: ignore
+            download_name=document_name
         )
 
+    except dal.UserDataError as e:
+        return jsonify({"error": str(e)}), e.status_code
     except MySQLError as e:
         current_app.logger.error(f"Database error downloading document: {e}")
         return jsonify({"error": "Database error"}), 500
@@ -1236,7 +820,238 @@ def download_document(application_id: str, document_id: str):
         return jsonify({"error": "Internal server error"}), 500
     finally:
         try:
-            cursor.close()
+            conn.close()
+        except Exception:
+            pass
+
+
+# ==================== SAVED SEARCHES ENDPOINTS ====================
+
+SAVED_SEARCH_NAME_MAX = 100
+INBOX_PAGE_SIZE = 20
+INBOX_PAGE_SIZE_MAX = 100
+
+
+@user_bp.route("/saved-searches", methods=["GET"])
+@jwt_required()
+def get_saved_searches():
+    """Get all of the user's saved searches."""
+
+    user_id = get_jwt_identity()
+    current_app.logger.info(f"Fetching saved searches for user_id: {user_id}")
+
+    try:
+        conn = get_connection()
+
+        saved_searches = dal.list_saved_searches(conn, user_id)
+
+        return jsonify({"saved_searches": saved_searches}), 200
+
+    except MySQLError as e:
+        current_app.logger.error(f"Database error fetching saved searches: {e}")
+        return jsonify({"error": "Database error"}), 500
+    except Exception as e:
+        current_app.logger.exception("Unexpected error fetching saved searches")
+        return jsonify({"error": "Internal server error"}), 500
+    finally:
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+@user_bp.route("/saved-searches", methods=["POST"])
+@jwt_required()
+def create_saved_search():
+    """
+    Save a search.  The body is {"name": ..., "query": {...}} where query holds the
+    /api/public/search_grants parameters (q, mode, field, op_num, op_num_match and the range
+    filters).
+    Grants added or changed after this are delivered to GET /saved-searches/inbox.
+    """
+
+    user_id = get_jwt_identity()
+    data = request.get_json(silent=True)
+
+    if not isinstance(data, dict) or not isinstance(data.get("query"), dict):
+        return jsonify({"error": "Missing required fields: name, query"}), 400
+
+    name = str(data.get("name") or "").strip()
+    if not name:
+        return jsonify({"error": "Missing required fields: name, query"}), 400
+    if len(name) > SAVED_SEARCH_NAME_MAX:
+        return jsonify({"error": f"name must be at most {SAVED_SEARCH_NAME_MAX} characters"}), 400
+
+    try:
+        query_string = normalize_query(data["query"])
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    current_app.logger.info(f"Saving search for user_id: {user_id}")
+
+    try:
+        conn = get_connection()
+
+        saved_search = dal.create_saved_search(conn, user_id, name, query_string)
+
+        return jsonify({"message": "Search saved successfully", "saved_search": saved_search}), 201
+
+    except MySQLError as e:
+        current_app.logger.error(f"Database error saving search: {e}")
+        return jsonify({"error": "Database error"}), 500
+    except Exception as e:
+        current_app.logger.exception("Unexpected error saving search")
+        return jsonify({"error": "Internal server error"}), 500
+    finally:
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+@user_bp.route("/saved-searches/<search_id>", methods=["DELETE"])
+@jwt_required()
+def delete_saved_search(search_id: str):
+    """Delete a saved search and its inbox entries."""
+
+    user_id = get_jwt_identity()
+    current_app.logger.info(f"Deleting saved search {search_id} for user_id: {user_id}")
+
+    try:
+        conn = get_connection()
+
+        dal.delete_saved_search(conn, search_id, user_id)
+
+        return jsonify({"message": "Saved search deleted successfully"}), 200
+
+    except dal.UserDataError as e:
+        return jsonify({"error": str(e)}), e.status_code
+    except MySQLError as e:
+        current_app.logger.error(f"Database error deleting saved search: {e}")
+        return jsonify({"error": "Database error"}), 500
+    except Exception as e:
+        current_app.logger.exception("Unexpected error deleting saved search")
+        return jsonify({"error": "Internal server error"}), 500
+    finally:
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+@user_bp.route("/saved-searches/inbox", methods=["GET"])
+@jwt_required()
+def get_saved_search_inbox():
+    """
+    Get the grants matched by the user's saved searches, newest match first.
+    Pass the response's next_cursor back as ?cursor= for the next page; ?limit= is 1-100.
+    """
+
+    user_id = get_jwt_identity()
+
+    try:
+        limit = int(request.args.get("limit", INBOX_PAGE_SIZE))
+    except ValueError:
+        return jsonify({"error": "limit must be an integer"}), 400
+    if not 1 <= limit <= INBOX_PAGE_SIZE_MAX:
+        return jsonify({"error": f"limit must be between 1 and {INBOX_PAGE_SIZE_MAX}"}), 400
+
+    before = None
+    if request.args.get("cursor"):
+        try:
+            before = decode_cursor(request.args["cursor"], s="match_id").get("k")
+        except CursorError as e:
+            return jsonify({"error": f"Invalid cursor: {e}"}), 400
+        if not isinstance(before, int) or isinstance(before, bool):
+            return jsonify({"error": "Invalid cursor: Malformed cursor"}), 400
+
+    try:
+        conn = get_connection()
+
+        # one row more than the page tells whether there is a next page
+        matches = dal.list_saved_search_matches(conn, user_id, before, limit + 1)
+
+        next_cursor = None
+        if len(matches) > limit:
+            matches = matches[:limit]
+            next_cursor = encode_cursor(s="match_id", k=matches[-1]["match_id"])
+
+        return jsonify({"matches": matches, "next_cursor": next_cursor}), 200
+
+    except MySQLError as e:
+        current_app.logger.error(f"Database error fetching saved search inbox: {e}")
+        return jsonify({"error": "Database error"}), 500
+    except Exception as e:
+        current_app.logger.exception("Unexpected error fetching saved search inbox")
+        return jsonify({"error": "Internal server error"}), 500
+    finally:
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+# ==================== GRANT FEED ENDPOINTS ====================
+
+FEED_PAGE_SIZE = 20
+FEED_PAGE_SIZE_MAX = 100
+FEED_CURSOR_ID = r"[0-9a-f]{8}-(?:[0-9a-f]{4}-){3}[0-9a-f]{12}"
+
+
+@user_bp.route("/feed", methods=["GET"])
+@jwt_required()
+def get_feed():
+    """
+    Get the user's recommended open grants, best first, scored against their research fields,
+    institution and past applications.  The feed is precomputed after each ingest
+    (src/system_functions/refresh_user_grant_feed.py).
+    Pass the response's next_cursor back as ?cursor= for the next page; ?limit= is 1-100.
+    """
+
+    user_id = get_jwt_identity()
+
+    try:
+        limit = int(request.args.get("limit", FEED_PAGE_SIZE))
+    except ValueError:
+        return jsonify({"error": "limit must be an integer"}), 400
+    if not 1 <= limit <= FEED_PAGE_SIZE_MAX:
+        return jsonify({"error": f"limit must be between 1 and {FEED_PAGE_SIZE_MAX}"}), 400
+
+    after = None
+    if request.args.get("cursor"):
+        try:
+            fields = decode_cursor(request.args["cursor"], s="feed")
+        except CursorError as e:
+            return jsonify({"error": f"Invalid cursor: {e}"}), 400
+        score, grant_id = fields.get("k"), fields.get("id")
+        if (
+            not isinstance(score, int) or isinstance(score, bool)
+            or not isinstance(grant_id, str) or not re.fullmatch(FEED_CURSOR_ID, grant_id)
+        ):
+            return jsonify({"error": "Invalid cursor: Malformed cursor"}), 400
+        after = (score, grant_id)
+
+    try:
+        conn = get_connection()
+
+        # one row more than the page tells whether there is a next page
+        grants = dal.list_feed(conn, user_id, after, limit + 1)
+
+        next_cursor = None
+        if len(grants) > limit:
+            grants = grants[:limit]
+            next_cursor = encode_cursor(s="feed", k=grants[-1]["score"], id=grants[-1]["grant_id"])
+
+        return jsonify({"grants": grants, "next_cursor": next_cursor}), 200
+
+    except MySQLError as e:
+        current_app.logger.error(f"Database error fetching grant feed: {e}")
+        return jsonify({"error": "Database error"}), 500
+    except Exception as e:
+        current_app.logger.exception("Unexpected error fetching grant feed")
+        return jsonify({"error": "Internal server error"}), 500
+    finally:
+        try:
             conn.close()
         except Exception:
             pass